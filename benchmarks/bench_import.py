@@ -0,0 +1,85 @@
+"""
+Measure import throughput in rows per second: per-row add_task versus insert_many,
+and upsert_many over a table that already holds half of the titles.
+
+Usage:
+    uv run python benchmarks/bench_import.py --rows 100000 --per-row-rows 5000
+"""
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from raztodo.infrastructure.sqlite.connection import sqlite_connection_factory
+from raztodo.infrastructure.sqlite.task_repository import SQLiteTaskRepository
+
+
+def write_export(path: Path, rows: int) -> None:
+    tasks = [
+        {
+            "title": f"Task {i}",
+            "description": f"Description {i}",
+            "priority": "LMH"[i % 3],
+            "tags": ["bench", f"t{i % 10}"],
+            "done": i % 2 == 0,
+        }
+        for i in range(rows)
+    ]
+    path.write_text(json.dumps(tasks), encoding="utf-8")
+
+
+def per_row(repo: SQLiteTaskRepository, path: Path) -> int:
+    # What import_tasks did before insert_many: one transaction per task, plus
+    # a second one for the done flag.
+    count = 0
+    for item in json.loads(path.read_text(encoding="utf-8")):
+        task_id = repo.add_task(
+            item["title"], item["description"], item["priority"], None, item["tags"]
+        )
+        if task_id:
+            repo.mark_done(task_id, item["done"])
+            count += 1
+    return count
+
+
+def bulk(repo: SQLiteTaskRepository, path: Path) -> int:
+    return repo.import_tasks(str(path))["inserted"]
+
+
+def upsert(repo: SQLiteTaskRepository, path: Path) -> int:
+    with open(path, encoding="utf-8") as f:
+        counts = repo.upsert_many(json.load(f))
+    return counts["inserted"] + counts["updated"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--per-row-rows", type=int, default=5_000)
+    args = parser.parse_args()
+
+    print(f"{'method':>10}  {'rows':>10}  {'seconds':>10}  {'rows/s':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, fn, rows in (
+            ("per-row", per_row, args.per_row_rows),
+            ("bulk", bulk, args.rows),
+            ("upsert", upsert, args.rows),
+        ):
+            export = Path(tmp) / f"{name}.json"
+            repo = SQLiteTaskRepository(sqlite_connection_factory(Path(tmp) / f"{name}.db"))
+            if fn is upsert:
+                # The first half of the titles already exist, so half the rows are updates
+                write_export(export, rows // 2)
+                repo.import_tasks(str(export))
+            write_export(export, rows)
+            start = time.perf_counter()
+            imported = fn(repo, export)
+            elapsed = time.perf_counter() - start
+            repo.close()
+            print(f"{name:>10}  {imported:>10}  {elapsed:>10.3f}  {imported / elapsed:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
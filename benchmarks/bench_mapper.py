@@ -0,0 +1,111 @@
+"""
+Compare row mapping over a full SELECT of the tasks table: sqlite3.Row plus
+row_to_task, the positional task_row_factory, and a columnar TaskBatch. Also
+reports the memory each result holds per task.
+
+Usage:
+    uv run python benchmarks/bench_mapper.py --rows 100000 --repeat 5
+"""
+
+import argparse
+import json
+import sqlite3
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+from raztodo.infrastructure.sqlite.task_dao import TASK_COLUMNS, TaskDAO
+from raztodo.infrastructure.sqlite.task_mapper import row_to_task, rows_to_batch, task_row_factory
+
+QUERY = f"SELECT {TASK_COLUMNS} FROM tasks ORDER BY id"
+
+
+def populate(conn: sqlite3.Connection, rows: int) -> None:
+    with conn:
+        conn.executemany(
+            "INSERT INTO tasks (title, description, priority, due_date, tags, project) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                (
+                    f"Task {i}",
+                    f"Description {i}",
+                    "LMH"[i % 3],
+                    "2025-01-01" if i % 4 == 0 else None,
+                    json.dumps(["bench", f"t{i % 10}"]) if i % 2 else "",
+                    f"project{i % 5}" if i % 3 else None,
+                )
+                for i in range(rows)
+            ),
+        )
+
+
+def with_row(conn: sqlite3.Connection) -> object:
+    cur = conn.cursor()
+    cur.row_factory = sqlite3.Row
+    return [row_to_task(r) for r in cur.execute(QUERY)]
+
+
+def with_factory(conn: sqlite3.Connection) -> object:
+    cur = conn.cursor()
+    cur.row_factory = task_row_factory
+    return cur.execute(QUERY).fetchall()
+
+
+def as_batch(conn: sqlite3.Connection) -> object:
+    cur = conn.cursor()
+    cur.row_factory = None
+    return rows_to_batch(cur.execute(QUERY))
+
+
+def retained(fn: Callable[[], object]) -> int:
+    # Bytes still allocated while the result is held, i.e. the result's size
+    tracemalloc.start()
+    try:
+        result = fn()
+        size = tracemalloc.get_traced_memory()[0]
+        del result
+        return size
+    finally:
+        tracemalloc.stop()
+
+
+def best_of(repeat: int, fn: Callable[[], object]) -> float:
+    timings: list[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = sqlite3.connect(str(Path(tmp) / "bench.db"))
+        TaskDAO(conn)  # creates the schema
+        populate(conn, args.rows)
+
+        print(f"{'mapper':>12}  {'rows':>10}  {'seconds':>10}  {'rows/s':>12}  {'bytes/task':>10}")
+        for name, fn in (
+            ("row_to_task", with_row),
+            ("row_factory", with_factory),
+            ("batch", as_batch),
+        ):
+            elapsed = best_of(args.repeat, lambda fn=fn: fn(conn))
+            size = retained(lambda fn=fn: fn(conn)) / args.rows
+            print(
+                f"{name:>12}  {args.rows:>10}  {elapsed:>10.3f}  {args.rows / elapsed:>12,.0f}"
+                f"  {size:>10,.0f}"
+            )
+
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
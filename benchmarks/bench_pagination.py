@@ -0,0 +1,66 @@
+"""
+Compare deep-page latency of OFFSET paging against keyset (cursor) paging.
+
+Usage:
+    uv run python benchmarks/bench_pagination.py --rows 500000 --page-size 50
+"""
+
+import argparse
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+
+from raztodo.domain.pagination import Cursor
+from raztodo.infrastructure.sqlite.task_dao import TaskDAO
+
+
+def populate(conn: sqlite3.Connection, rows: int) -> None:
+    with conn:
+        conn.executemany(
+            "INSERT INTO tasks (title, description, priority) VALUES (?, ?, ?)",
+            ((f"Task {i}", f"Description {i}", "LMH"[i % 3]) for i in range(rows)),
+        )
+
+
+def best_of(repeat: int, fn) -> float:
+    timings: list[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = sqlite3.connect(str(Path(tmp) / "bench.db"))
+        conn.row_factory = sqlite3.Row
+        dao = TaskDAO(conn)
+        populate(conn, args.rows)
+
+        print(f"{'depth':>10}  {'offset ms':>10}  {'cursor ms':>10}")
+        for fraction in (0.0, 0.25, 0.5, 0.75, 0.99):
+            depth = int((args.rows - args.page_size) * fraction)
+            # Ids are dense from 1, so the row just before `depth` has id == depth.
+            cursor = Cursor(key=depth, id=depth) if depth else None
+
+            offset_s = best_of(
+                args.repeat, lambda d=depth: dao.fetch_all(limit=args.page_size, offset=d)
+            )
+            cursor_s = best_of(
+                args.repeat, lambda c=cursor: dao.fetch_all(limit=args.page_size, after=c)
+            )
+            print(f"{depth:>10}  {offset_s * 1000:>10.3f}  {cursor_s * 1000:>10.3f}")
+
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
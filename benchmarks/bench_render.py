@@ -0,0 +1,80 @@
+"""
+Time human-readable rendering of a large listing: one format_task call per
+task, the buffered card layout of format_tasks_list, and its compact rows.
+Output goes to an in-memory stream, so the timings exclude the terminal.
+
+Usage:
+    uv run python benchmarks/bench_render.py --tasks 50000 --repeat 5
+"""
+
+import argparse
+import io
+import time
+from collections.abc import Callable
+from contextlib import redirect_stdout
+
+from raztint import tint
+
+from raztodo.domain.task_entity import TaskEntity
+from raztodo.presentation.cli.helpers import format_task, format_tasks_list
+
+
+def make_tasks(count: int) -> list[TaskEntity]:
+    return [
+        TaskEntity(
+            id=i,
+            title=f"Task {i}",
+            description=f"Description {i}" if i % 2 else "",
+            done=i % 3 == 0,
+            created_at="2025-01-01 12:00:00",
+            priority="LMH"[i % 3],
+            due_date="2025-02-01" if i % 4 == 0 else None,
+            tags=["bench", f"t{i % 10}"] if i % 2 else [],
+            project=f"project{i % 5}" if i % 3 else None,
+        )
+        for i in range(count)
+    ]
+
+
+def per_task(tasks: list[TaskEntity]) -> None:
+    for task in tasks:
+        format_task(task)
+
+
+def cards(tasks: list[TaskEntity]) -> None:
+    format_tasks_list(tasks)
+
+
+def rows(tasks: list[TaskEntity]) -> None:
+    format_tasks_list(tasks, compact=True)
+
+
+def best_of(repeat: int, fn: Callable[[], None]) -> float:
+    timings: list[float] = []
+    for _ in range(repeat):
+        with redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            fn()
+            timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    tasks = make_tasks(args.tasks)
+    tint.set_color(True)
+
+    print(f"{'layout':>10}  {'tasks':>10}  {'ms':>10}  {'tasks/s':>12}")
+    for name, fn in (("per_task", per_task), ("cards", cards), ("compact", rows)):
+        elapsed = best_of(args.repeat, lambda fn=fn: fn(tasks))
+        print(
+            f"{name:>10}  {args.tasks:>10}  {elapsed * 1000:>10.1f}  {args.tasks / elapsed:>12,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
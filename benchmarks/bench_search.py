@@ -0,0 +1,88 @@
+"""
+Measure keyword search latency through the FTS index as the table grows.
+
+Usage:
+    uv run python benchmarks/bench_search.py --sizes 10000 100000 --repeat 20
+"""
+
+import argparse
+import random
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+
+from raztodo.infrastructure.sqlite.task_dao import TaskDAO
+
+WORDS = [
+    "alpha",
+    "bravo",
+    "charlie",
+    "delta",
+    "echo",
+    "foxtrot",
+    "golf",
+    "hotel",
+    "india",
+    "juliet",
+    "kilo",
+    "lima",
+]
+
+
+def populate(conn: sqlite3.Connection, start: int, stop: int) -> None:
+    rng = random.Random(start)
+    with conn:
+        conn.executemany(
+            "INSERT INTO tasks (title, description) VALUES (?, ?)",
+            (
+                (f"Task {i} {rng.choice(WORDS)}", " ".join(rng.choices(WORDS, k=8)))
+                for i in range(start, stop)
+            ),
+        )
+
+
+def best_of(repeat: int, fn) -> float:
+    timings: list[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def like_search(conn: sqlite3.Connection, keyword: str) -> list[sqlite3.Row]:
+    pattern = f"%{keyword}%"
+    return conn.execute(
+        "SELECT id FROM tasks WHERE title LIKE ? OR description LIKE ? ORDER BY id",
+        (pattern, pattern),
+    ).fetchall()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = sqlite3.connect(str(Path(tmp) / "bench.db"))
+        conn.row_factory = sqlite3.Row
+        dao = TaskDAO(conn)
+
+        print(f"{'rows':>10}  {'fts ms':>10}  {'like ms':>10}")
+        rows = 0
+        for size in sorted(args.sizes):
+            populate(conn, rows, size)
+            rows = size
+            # A task number matches a handful of rows, keeping result size flat
+            keyword = f"{size // 2}"
+            fts_s = best_of(args.repeat, lambda k=keyword: dao.search(k))
+            like_s = best_of(args.repeat, lambda k=keyword: like_search(conn, k))
+            print(f"{rows:>10}  {fts_s * 1000:>10.3f}  {like_s * 1000:>10.3f}")
+
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
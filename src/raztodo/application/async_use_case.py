@@ -0,0 +1,57 @@
+from collections.abc import AsyncIterator, Callable, Iterable
+from functools import partial
+from typing import Any, Protocol, TypeVar
+
+from raztodo.domain.task_repository import TaskRepository
+
+T = TypeVar("T")
+
+
+class RepositoryRunner(Protocol):
+    """Runs repository work off the event loop."""
+
+    async def run(self, fn: Callable[[TaskRepository], T], write: bool = False) -> T:
+        pass
+
+    def iterate(
+        self, fn: Callable[[TaskRepository], Iterable[T]], write: bool = False
+    ) -> AsyncIterator[T]:
+        pass
+
+
+class AsyncUseCase:
+    """
+    Awaitable wrapper around a synchronous query or use case.
+
+    Every method of the wrapped use case becomes a coroutine that builds the
+    use case on a repository supplied by the runner and calls the method
+    there, e.g. ``await uc.execute(task_id)``. ``stream`` is iterated
+    instead: ``async for chunk in uc.stream(...)``.
+    """
+
+    def __init__(
+        self,
+        create: Callable[[TaskRepository], Any],
+        runner: RepositoryRunner,
+        write: bool = False,
+    ) -> None:
+        self._create = create
+        self._runner = runner
+        self._write = write
+
+    async def call(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        return await self._runner.run(
+            lambda repo: getattr(self._create(repo), method)(*args, **kwargs),
+            write=self._write,
+        )
+
+    def stream(self, *args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+        return self._runner.iterate(
+            lambda repo: self._create(repo).stream(*args, **kwargs),
+            write=self._write,
+        )
+
+    def __getattr__(self, method: str) -> Callable[..., Any]:
+        if method.startswith("_"):
+            raise AttributeError(method)
+        return partial(self.call, method)
@@ -19,6 +19,15 @@ class UseCaseFactory(Protocol):
     def create_update_task(self, repo: TaskRepository) -> Any:
         pass
 
+    def create_get_task(self, repo: TaskRepository) -> Any:
+        pass
+
+    def create_get_change_counter(self, repo: TaskRepository) -> Any:
+        pass
+
+    def create_list_changes(self, repo: TaskRepository) -> Any:
+        pass
+
     def create_search_tasks(self, repo: TaskRepository) -> Any:
         pass
 
@@ -34,12 +43,21 @@ class UseCaseFactory(Protocol):
     def create_migrate(self, connection_factory: Callable[..., Any]) -> Any:
         pass
 
+    def create_backup(self, connection_factory: Callable[..., Any]) -> Any:
+        pass
+
+    def create_restore(self, connection_factory: Callable[..., Any]) -> Any:
+        pass
+
     def create_clear_tasks(self, repo: TaskRepository) -> Any:
         pass
 
     def create_explain_task(self, repo: TaskRepository) -> Any:
         pass
 
+    def create_async_explain_task(self, runner: Any) -> Any:
+        pass
+
 
 class DefaultUseCaseFactory:
     """Default implementation of UseCaseFactory with lazy imports."""
@@ -64,6 +82,21 @@ class DefaultUseCaseFactory:
 
         return UpdateTaskUseCase(repo)
 
+    def create_get_task(self, repo: TaskRepository) -> Any:
+        from raztodo.application.queries.get_task import GetTaskUseCase
+
+        return GetTaskUseCase(repo)
+
+    def create_get_change_counter(self, repo: TaskRepository) -> Any:
+        from raztodo.application.queries.get_change_counter import GetChangeCounterUseCase
+
+        return GetChangeCounterUseCase(repo)
+
+    def create_list_changes(self, repo: TaskRepository) -> Any:
+        from raztodo.application.queries.list_changes import ListChangesUseCase
+
+        return ListChangesUseCase(repo)
+
     def create_search_tasks(self, repo: TaskRepository) -> Any:
         from raztodo.application.queries.search_tasks import SearchTasksUseCase
 
@@ -89,6 +122,16 @@ class DefaultUseCaseFactory:
 
         return MigrateUseCase(connection_factory)
 
+    def create_backup(self, connection_factory: Callable[..., Any]) -> Any:
+        from raztodo.application.use_cases.backup_database import BackupDatabaseUseCase
+
+        return BackupDatabaseUseCase(connection_factory)
+
+    def create_restore(self, connection_factory: Callable[..., Any]) -> Any:
+        from raztodo.application.use_cases.restore_database import RestoreDatabaseUseCase
+
+        return RestoreDatabaseUseCase(connection_factory)
+
     def create_clear_tasks(self, repo: TaskRepository) -> Any:
         from raztodo.application.use_cases.clear_tasks import ClearTasksUseCase
 
@@ -98,3 +141,9 @@ class DefaultUseCaseFactory:
         from raztodo.application.queries.explain_task import ExplainTaskUseCase
 
         return ExplainTaskUseCase(repo)
+
+    def create_async_explain_task(self, runner: Any) -> Any:
+        from raztodo.application.async_use_case import AsyncUseCase
+        from raztodo.application.queries.explain_task import AsyncExplainTaskUseCase
+
+        return AsyncExplainTaskUseCase(AsyncUseCase(self.create_explain_task, runner))
@@ -1,9 +1,15 @@
 import json
-from collections.abc import Generator
+from collections.abc import AsyncIterator, Generator
 
+from raztodo.application.async_use_case import AsyncUseCase
 from raztodo.domain.exceptions import RazTodoException
 from raztodo.domain.task_repository import TaskRepository
-from raztodo.infrastructure.llm.client import OllamaClientError, chat, stream_chat
+from raztodo.infrastructure.llm.client import (
+    OllamaClientError,
+    astream_chat,
+    chat,
+    stream_chat,
+)
 from raztodo.infrastructure.logger import get_logger
 
 logger = get_logger(__name__)
@@ -32,7 +38,8 @@ class ExplainTaskUseCase:
     def __init__(self, repo: TaskRepository) -> None:
         self.repo = repo
 
-    def _get_prompt(self, task_id: int, mode: str) -> str:
+    def prompt(self, task_id: int, mode: str) -> str:
+        """Build the LLM prompt for a task; the only step that reads the repository."""
         if mode not in MODE_PROMPTS:
             raise RazTodoException(f"Unknown explain mode '{mode}'. Choose: short, deep, plan")
         task = self.repo.get_task(task_id)
@@ -42,7 +49,7 @@ class ExplainTaskUseCase:
 
     def execute(self, task_id: int, mode: str = "short") -> str:
         """Blocking — used by the CLI."""
-        prompt = self._get_prompt(task_id, mode)
+        prompt = self.prompt(task_id, mode)
         logger.info("Explaining task id=%d mode=%s (blocking)", task_id, mode)
         try:
             return chat(prompt)
@@ -51,7 +58,7 @@ class ExplainTaskUseCase:
 
     def stream(self, task_id: int, mode: str = "short") -> Generator[str, None, None]:
         """Streaming — used by the web endpoint; yields tokens as they arrive."""
-        prompt = self._get_prompt(task_id, mode)
+        prompt = self.prompt(task_id, mode)
         logger.info("Explaining task id=%d mode=%s (streaming)", task_id, mode)
         try:
             yield from stream_chat(prompt)
@@ -59,6 +66,23 @@ class ExplainTaskUseCase:
             raise RazTodoException(f"OllamaError: {exc}") from exc
 
 
+class AsyncExplainTaskUseCase:
+    """Explains a task from asyncio code without holding a thread while Ollama generates."""
+
+    def __init__(self, explain: AsyncUseCase) -> None:
+        self.explain = explain
+
+    async def stream(self, task_id: int, mode: str = "short") -> AsyncIterator[str]:
+        """Streaming — used by the web endpoint; yields tokens as they arrive."""
+        prompt = await self.explain.prompt(task_id, mode)
+        logger.info("Explaining task id=%d mode=%s (async streaming)", task_id, mode)
+        try:
+            async for token in astream_chat(prompt):
+                yield token
+        except OllamaClientError as exc:
+            raise RazTodoException(f"OllamaError: {exc}") from exc
+
+
 def _task_to_json(task: object) -> str:
     data = {
         "id": getattr(task, "id", None),
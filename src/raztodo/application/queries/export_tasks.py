@@ -1,3 +1,5 @@
+from collections.abc import Iterator
+
 from raztodo.domain.exceptions import RazTodoException
 from raztodo.domain.task_repository import TaskRepository
 
@@ -23,10 +25,14 @@ class ExportTasksUseCase:
 
         self.repo: TaskRepository = repo
 
-    def execute(self, filepath: str) -> bool:
-        success: bool = self.repo.export_tasks(filepath)
+    def execute(self, filepath: str, file_format: str | None = None) -> bool:
+        success: bool = self.repo.export_tasks(filepath, file_format=file_format)
         if not success:
             raise RazTodoException(
                 f"Failed to export tasks to '{filepath}'. Check file permissions and disk space."
             )
         return True
+
+    def stream(self, file_format: str = "json") -> Iterator[str]:
+        """Streaming — used by the web endpoint; yields text chunks as rows are read."""
+        return self.repo.iter_export(file_format)
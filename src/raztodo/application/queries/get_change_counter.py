@@ -0,0 +1,23 @@
+from raztodo.domain.task_repository import TaskRepository
+
+
+class GetChangeCounterUseCase:
+    """
+    Reads the counter that advances whenever any task changes.
+    """
+
+    def __init__(self, repo: TaskRepository) -> None:
+        self.repo: TaskRepository = repo
+
+    def execute(self) -> int:
+        """
+        Return the current change counter.
+
+        Read it before the tasks it describes: rows read afterwards are at
+        least as new as the counter, so it never vouches for stale data.
+
+        Returns:
+            The counter value; equal values mean no task has changed.
+        """
+
+        return self.repo.change_counter()
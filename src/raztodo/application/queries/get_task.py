@@ -0,0 +1,24 @@
+from raztodo.domain.task_entity import TaskEntity
+from raztodo.domain.task_repository import TaskRepository
+
+
+class GetTaskUseCase:
+    """
+    Retrieves a single task by its ID.
+    """
+
+    def __init__(self, repo: TaskRepository) -> None:
+        self.repo: TaskRepository = repo
+
+    def execute(self, task_id: int) -> TaskEntity | None:
+        """
+        Look up a task by primary key.
+
+        Args:
+            task_id: ID of the task to retrieve.
+
+        Returns:
+            The matching task, or None if no task has that ID.
+        """
+
+        return self.repo.get_task(task_id)
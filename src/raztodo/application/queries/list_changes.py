@@ -0,0 +1,26 @@
+from raztodo.domain.task_change import DEFAULT_CHANGES_LIMIT, ChangeFeed
+from raztodo.domain.task_repository import TaskRepository
+
+
+class ListChangesUseCase:
+    """
+    Lists the task changes recorded after a known changelog position.
+    """
+
+    def __init__(self, repo: TaskRepository) -> None:
+        self.repo: TaskRepository = repo
+
+    def execute(self, since: int | None = None, limit: int = DEFAULT_CHANGES_LIMIT) -> ChangeFeed:
+        """
+        Read the changelog after a position.
+
+        Args:
+            since: Position from an earlier call; None only reports the current one.
+            limit: Maximum number of changes to return.
+
+        Returns:
+            The changes, the position to resume from, and whether the caller
+            fell too far behind and must reload every task instead.
+        """
+
+        return self.repo.get_changes(since, limit)
@@ -1,3 +1,7 @@
+from collections.abc import Iterator
+
+from raztodo.domain.json_stream import encode_json_array
+from raztodo.domain.task_batch import TaskBatch
 from raztodo.domain.task_entity import TaskEntity
 from raztodo.domain.task_repository import TaskRepository
 
@@ -20,6 +24,10 @@ class ListTasksUseCase:
         tags: list[str] | None = None,
         due_before: str | None = None,
         due_after: str | None = None,
+        all_tags: bool = False,
+        cursor: str | None = None,
+        order_by: str = "id",
+        descending: bool = False,
     ) -> list[TaskEntity]:
         """
         List tasks with optional filters.
@@ -33,6 +41,11 @@ class ListTasksUseCase:
             tags: Filter by tags.
             due_before: Filter tasks due before this date.
             due_after: Filter tasks due after this date.
+            all_tags: Require every tag instead of any of them.
+            cursor: Opaque token returned for the previous page; when given,
+                listing resumes right after that page.
+            order_by: Field to sort by (id, title, created_at, done, priority, due_date).
+            descending: Sort in descending order.
 
         Returns:
             List of TaskEntity objects matching the filters.
@@ -47,4 +60,114 @@ class ListTasksUseCase:
             tags=tags,
             due_before=due_before,
             due_after=due_after,
+            all_tags=all_tags,
+            cursor=cursor,
+            order_by=order_by,
+            descending=descending,
+        )
+
+    def execute_batch(
+        self,
+        limit: int | None = None,
+        offset: int | None = None,
+        priority: str | None = None,
+        project: str | None = None,
+        done: bool | None = None,
+        tags: list[str] | None = None,
+        due_before: str | None = None,
+        due_after: str | None = None,
+        all_tags: bool = False,
+        cursor: str | None = None,
+        order_by: str = "id",
+        descending: bool = False,
+    ) -> TaskBatch:
+        """
+        List tasks like execute, as a columnar TaskBatch for bulk consumers.
+
+        Returns:
+            TaskBatch holding the tasks matching the filters.
+        """
+
+        return self.repo.get_task_batch(
+            limit=limit,
+            offset=offset,
+            priority=priority,
+            project=project,
+            done=done,
+            tags=tags,
+            due_before=due_before,
+            due_after=due_after,
+            all_tags=all_tags,
+            cursor=cursor,
+            order_by=order_by,
+            descending=descending,
+        )
+
+    def iterate(
+        self,
+        limit: int | None = None,
+        offset: int | None = None,
+        priority: str | None = None,
+        project: str | None = None,
+        done: bool | None = None,
+        tags: list[str] | None = None,
+        due_before: str | None = None,
+        due_after: str | None = None,
+        all_tags: bool = False,
+        cursor: str | None = None,
+        order_by: str = "id",
+        descending: bool = False,
+    ) -> Iterator[TaskEntity]:
+        """
+        List tasks like execute, yielding them as they are read.
+
+        Returns:
+            Iterator of the TaskEntity objects matching the filters.
+        """
+
+        return self.repo.iter_tasks(
+            limit=limit,
+            offset=offset,
+            priority=priority,
+            project=project,
+            done=done,
+            tags=tags,
+            due_before=due_before,
+            due_after=due_after,
+            all_tags=all_tags,
+            cursor=cursor,
+            order_by=order_by,
+            descending=descending,
+        )
+
+    def stream(
+        self,
+        limit: int | None = None,
+        offset: int | None = None,
+        priority: str | None = None,
+        project: str | None = None,
+        done: bool | None = None,
+        tags: list[str] | None = None,
+        due_before: str | None = None,
+        due_after: str | None = None,
+        all_tags: bool = False,
+        cursor: str | None = None,
+        order_by: str = "id",
+        descending: bool = False,
+    ) -> Iterator[str]:
+        """Streaming — used by the web endpoint; yields the JSON array in text chunks."""
+        tasks = self.iterate(
+            limit=limit,
+            offset=offset,
+            priority=priority,
+            project=project,
+            done=done,
+            tags=tags,
+            due_before=due_before,
+            due_after=due_after,
+            all_tags=all_tags,
+            cursor=cursor,
+            order_by=order_by,
+            descending=descending,
         )
+        return encode_json_array((t.to_dict() for t in tasks), indent=None)
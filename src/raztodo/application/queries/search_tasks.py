@@ -1,3 +1,7 @@
+from collections.abc import Iterator
+
+from raztodo.domain.json_stream import encode_json_array
+from raztodo.domain.search import DEFAULT_DESCRIPTION_WEIGHT, DEFAULT_TITLE_WEIGHT, SearchHit
 from raztodo.domain.task_entity import TaskEntity
 from raztodo.domain.task_repository import TaskRepository
 
@@ -16,6 +20,12 @@ class SearchTasksUseCase:
         priority: str | None = None,
         project: str | None = None,
         tags: list[str] | None = None,
+        all_tags: bool = False,
+        done: bool | None = None,
+        due_before: str | None = None,
+        due_after: str | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
     ) -> list[TaskEntity]:
         """
         Search tasks matching a keyword and optional filters.
@@ -25,11 +35,137 @@ class SearchTasksUseCase:
             priority: Optional filter by task priority.
             project: Optional filter by project name.
             tags: Optional filter by tags.
+            all_tags: Require every tag instead of any of them.
+            done: Optional filter by completion status.
+            due_before: Filter tasks due before this date.
+            due_after: Filter tasks due after this date.
+            limit: Maximum number of tasks to return.
+            cursor: Opaque token returned for the previous page; when given,
+                results resume right after that page.
+
+        Returns:
+            List of TaskEntity objects matching the search criteria, ordered by id.
+        """
+
+        if not keyword.strip():
+            return []
+        return self.repo.search_tasks(
+            keyword,
+            priority=priority,
+            project=project,
+            tags=tags,
+            all_tags=all_tags,
+            done=done,
+            due_before=due_before,
+            due_after=due_after,
+            limit=limit,
+            cursor=cursor,
+        )
+
+    def iterate(
+        self,
+        keyword: str,
+        priority: str | None = None,
+        project: str | None = None,
+        tags: list[str] | None = None,
+        all_tags: bool = False,
+        done: bool | None = None,
+        due_before: str | None = None,
+        due_after: str | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> Iterator[TaskEntity]:
+        """
+        Search like execute, yielding matches as they are read.
+
+        Returns:
+            Iterator of the matching TaskEntity objects, ordered by id.
+        """
+
+        if not keyword.strip():
+            return iter(())
+        return self.repo.iter_search(
+            keyword,
+            priority=priority,
+            project=project,
+            tags=tags,
+            all_tags=all_tags,
+            done=done,
+            due_before=due_before,
+            due_after=due_after,
+            limit=limit,
+            cursor=cursor,
+        )
+
+    def stream(
+        self,
+        keyword: str,
+        priority: str | None = None,
+        project: str | None = None,
+        tags: list[str] | None = None,
+        all_tags: bool = False,
+        done: bool | None = None,
+        due_before: str | None = None,
+        due_after: str | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> Iterator[str]:
+        """Streaming — used by the web endpoint; yields the JSON array in text chunks."""
+        tasks = self.iterate(
+            keyword,
+            priority=priority,
+            project=project,
+            tags=tags,
+            all_tags=all_tags,
+            done=done,
+            due_before=due_before,
+            due_after=due_after,
+            limit=limit,
+            cursor=cursor,
+        )
+        return encode_json_array((t.to_dict() for t in tasks), indent=None)
+
+    def ranked(
+        self,
+        keyword: str,
+        limit: int = 10,
+        title_weight: float = DEFAULT_TITLE_WEIGHT,
+        description_weight: float = DEFAULT_DESCRIPTION_WEIGHT,
+        priority: str | None = None,
+        project: str | None = None,
+        done: bool | None = None,
+        tags: list[str] | None = None,
+        all_tags: bool = False,
+    ) -> list[SearchHit]:
+        """
+        Return the top matches for a keyword ordered by BM25 relevance.
+
+        Args:
+            keyword: Text to search in task titles/descriptions.
+            limit: Maximum number of hits to return.
+            title_weight: Relevance weight of title matches.
+            description_weight: Relevance weight of description matches.
+            priority: Optional filter by task priority.
+            project: Optional filter by project name.
+            done: Optional filter by completion status.
+            tags: Optional filter by tags.
+            all_tags: Require every tag instead of any of them.
 
         Returns:
-            List of TaskEntity objects matching the search criteria.
+            List of SearchHit objects, each holding the task, its score, and
+            highlight offsets for the title and a description snippet.
         """
 
         if not keyword.strip():
             return []
-        return self.repo.search_tasks(keyword, priority=priority, project=project, tags=tags)
+        return self.repo.search_ranked(
+            keyword,
+            limit=limit,
+            title_weight=title_weight,
+            description_weight=description_weight,
+            priority=priority,
+            project=project,
+            done=done,
+            tags=tags,
+            all_tags=all_tags,
+        )
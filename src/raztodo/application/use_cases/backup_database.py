@@ -0,0 +1,45 @@
+from collections.abc import Callable
+from pathlib import Path
+from sqlite3 import Connection, Error
+
+from raztodo.domain.exceptions import RazTodoException
+from raztodo.infrastructure.sqlite.backup import backup_database
+
+
+class BackupDatabaseUseCase:
+    """
+    Handles taking a consistent snapshot of the live database file.
+    """
+
+    def __init__(self, connection_factory: Callable[[], Connection]) -> None:
+        self._connection_factory: Callable[[], Connection] = connection_factory
+
+    def execute(
+        self, filepath: str, progress: Callable[[int], None] | None = None
+    ) -> dict[str, object]:
+        """
+        Copy the database to a file with the SQLite online backup API.
+
+        Pages are copied in steps, so other connections can keep writing while
+        the backup runs; no task is serialized through Python.
+
+        Args:
+            filepath: Destination path of the snapshot; replaced if it exists.
+            progress: Optional callback receiving the number of pages copied so far.
+
+        Returns:
+            A dictionary with the snapshot 'path', its 'pages' and its size in 'bytes'.
+
+        Raises:
+            RazTodoException: If the snapshot cannot be written.
+        """
+
+        conn: Connection = self._connection_factory()
+        try:
+            pages: int = backup_database(conn, Path(filepath), progress=progress)
+        except (Error, OSError) as e:
+            raise RazTodoException(f"Failed to back up database to '{filepath}': {e}") from e
+        finally:
+            conn.close()
+        path = Path(filepath).resolve()
+        return {"path": str(path), "pages": pages, "bytes": path.stat().st_size}
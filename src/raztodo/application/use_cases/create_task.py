@@ -1,4 +1,5 @@
 from raztodo.domain.exceptions import RazTodoException
+from raztodo.domain.task_entity import TaskEntity
 from raztodo.domain.task_repository import TaskRepository
 
 MAX_TITLE_LENGTH = 60
@@ -39,16 +40,7 @@ class CreateTaskUseCase:
             RazTodoException: If validation fails or task creation fails.
         """
 
-        title_stripped: str = title.strip() if title else ""
-        if not title_stripped:
-            raise RazTodoException("Task title cannot be empty")
-
-        if len(title_stripped) > MAX_TITLE_LENGTH:
-            raise RazTodoException(
-                f"Task title too long. Maximum {MAX_TITLE_LENGTH} characters, "
-                f"provided {len(title_stripped)}"
-            )
-
+        title_stripped: str = self._validate_title(title)
         task_id: int | None = self.repo.add_task(
             title_stripped, description, priority, due_date, tags, project
         )
@@ -58,3 +50,48 @@ class CreateTaskUseCase:
             )
 
         return task_id
+
+    def execute_returning(
+        self,
+        title: str,
+        description: str = "",
+        priority: str = "",
+        due_date: str | None = None,
+        tags: list[str] | None = None,
+        project: str | None = None,
+    ) -> TaskEntity:
+        """
+        Create a task and return it as stored, without a follow-up lookup.
+
+        Args:
+            title: Task title (required, max 60 chars).
+            description: Optional task description.
+            priority: Optional task priority.
+            due_date: Optional due date in string format.
+            tags: Optional list of tags.
+            project: Optional project name.
+
+        Returns:
+            The newly created task.
+
+        Raises:
+            RazTodoException: If validation fails or task creation fails.
+        """
+
+        title_stripped: str = self._validate_title(title)
+        return self.repo.add_task_returning(
+            title_stripped, description, priority, due_date, tags, project
+        )
+
+    @staticmethod
+    def _validate_title(title: str) -> str:
+        title_stripped: str = title.strip() if title else ""
+        if not title_stripped:
+            raise RazTodoException("Task title cannot be empty")
+
+        if len(title_stripped) > MAX_TITLE_LENGTH:
+            raise RazTodoException(
+                f"Task title too long. Maximum {MAX_TITLE_LENGTH} characters, "
+                f"provided {len(title_stripped)}"
+            )
+        return title_stripped
@@ -1,10 +1,12 @@
+import csv
 import json
 import os
-from typing import Any
+from collections.abc import Callable
 
-from raztodo.domain.exceptions import RazTodoException
-from raztodo.domain.task_entity import TaskEntity
+from raztodo.domain.exceptions import InvalidFileFormatError, RazTodoException
+from raztodo.domain.file_formats import detect_format, iter_task_items
 from raztodo.domain.task_repository import TaskRepository
+from raztodo.infrastructure.file_io import open_task_file
 
 
 class ImportTasksUseCase:
@@ -15,16 +17,30 @@ class ImportTasksUseCase:
     def __init__(self, repo: TaskRepository) -> None:
         self.repo: TaskRepository = repo
 
-    def execute(self, filepath: str, upsert: bool = False) -> int | dict[str, int]:
+    def execute(
+        self,
+        filepath: str,
+        upsert: bool = False,
+        progress: Callable[[int], None] | None = None,
+        file_format: str | None = None,
+    ) -> int | dict[str, int]:
         """
         Import tasks from a file, optionally updating existing tasks.
 
+        The file is read incrementally, as a JSON array, one task per line for
+        NDJSON, or one task per row for CSV. Files ending in .gz or .zst are
+        decompressed on the fly.
+
         Args:
-            filepath: Path to the JSON file containing tasks.
+            filepath: Path to the JSON, NDJSON or CSV file containing tasks.
             upsert: If True, update existing tasks with matching titles.
+            progress: Optional callback receiving the number of items read so far.
+            file_format: "json", "ndjson" or "csv"; detected from the file
+                extension if None.
 
         Returns:
-            Number of tasks imported, or a dict with counts of inserted and updated tasks if upsert is True.
+            A dict with counts of inserted, skipped and failed items, plus
+            updated tasks if upsert is True.
 
         Raises:
             RazTodoException: If file is missing, unreadable, JSON is invalid, or import fails.
@@ -37,72 +53,22 @@ class ImportTasksUseCase:
             if not os.access(filepath, os.R_OK):
                 raise RazTodoException(f"Permission denied: Cannot read '{filepath}'")
 
+            fmt = detect_format(filepath, file_format)
             if not upsert:
-                return self.repo.import_tasks(filepath)
-
-            with open(filepath, encoding="utf-8") as f:
-                data: Any = json.load(f)
-
-            if not isinstance(data, list):
-                raise RazTodoException(
-                    f"Expected JSON array in '{filepath}', got {type(data).__name__}"
-                )
-
-            inserted: int = 0
-            updated: int = 0
-            for item in data:
-                if not isinstance(item, dict):
-                    continue
-
-                title: str = item.get("title", "").strip()
-                if not title:
-                    continue
-
-                desc: str = item.get("description", "")
-                priority: str = item.get("priority") or ""
-                due_date: str | None = item.get("due_date")
-                tags: list[str] = item.get("tags") or []
-                project: str | None = item.get("project")
-
-                try:
-                    inserted_id: int | None = self.repo.add_task(
-                        title, desc, priority, due_date, tags, project
-                    )
-                    if inserted_id:
-                        if "done" in item:
-                            self.repo.mark_done(inserted_id, bool(item["done"]))
-                        inserted += 1
-                        continue
-                except RazTodoException:
-                    # In upsert mode, add_task may fail (for example, on duplicates);
-                    # fall through to search and update an existing task instead.
-                    pass
-
-                matches: list[TaskEntity] = [
-                    t for t in self.repo.search_tasks(title) if t.title == title
-                ]
-                if matches:
-                    task = matches[0]
-                    self.repo.update_task(
-                        task.id,
-                        title=title,
-                        description=desc,
-                        priority=priority or None,
-                        due_date=due_date,
-                        tags=tags if tags else None,
-                        project=project,
-                    )
-                    if "done" in item:
-                        self.repo.mark_done(task.id, bool(item["done"]))
-                    updated += 1
+                return self.repo.import_tasks(filepath, progress=progress, file_format=fmt)
 
-            return {"inserted": inserted, "updated": updated}
+            with open_task_file(filepath, "r", fmt) as f:
+                return self.repo.upsert_many(iter_task_items(f, fmt), progress=progress)
 
+        except InvalidFileFormatError as e:
+            raise RazTodoException(f"{e} in '{filepath}'") from e
         except json.JSONDecodeError as e:
             raise RazTodoException(
                 f"Invalid JSON format in '{filepath}': {e.msg} at line {e.lineno}"
             ) from e
+        except csv.Error as e:
+            raise RazTodoException(f"Invalid CSV format in '{filepath}': {e}") from e
         except UnicodeDecodeError as e:
             raise RazTodoException(f"File encoding error in '{filepath}': {e}") from e
-        except OSError as e:
+        except (OSError, EOFError) as e:
             raise RazTodoException(f"I/O error while accessing '{filepath}': {e}") from e
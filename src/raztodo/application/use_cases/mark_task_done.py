@@ -1,4 +1,5 @@
-from raztodo.domain.exceptions import RazTodoException
+from raztodo.domain.exceptions import RazTodoException, TaskNotFoundError
+from raztodo.domain.task_entity import TaskEntity
 from raztodo.domain.task_repository import TaskRepository
 
 
@@ -29,3 +30,45 @@ class MarkDoneUseCase:
         if not updated:
             raise RazTodoException(f"No task found with id {task_id}")
         return True
+
+    def execute_many(self, task_ids: list[int], done: bool = True) -> list[int]:
+        """
+        Update the completion status of several tasks at once.
+
+        Args:
+            task_ids: IDs of the tasks to update.
+            done: True to mark as done, False to mark as not done.
+
+        Returns:
+            IDs of the tasks that were updated, in request order.
+
+        Raises:
+            RazTodoException: If none of the given IDs exist.
+        """
+
+        if not task_ids:
+            raise RazTodoException("No task ids provided")
+        updated: list[int] = self.repo.mark_done_many(task_ids, done)
+        if not updated:
+            raise RazTodoException(f"No task found with ids {', '.join(str(i) for i in task_ids)}")
+        matched = set(updated)
+        return [i for i in dict.fromkeys(task_ids) if i in matched]
+
+    def toggle(self, task_id: int) -> TaskEntity:
+        """
+        Flip a task's completion status.
+
+        Args:
+            task_id: ID of the task to toggle.
+
+        Returns:
+            The task with its new status.
+
+        Raises:
+            TaskNotFoundError: If no task with the given ID exists.
+        """
+
+        task: TaskEntity | None = self.repo.toggle_done(task_id)
+        if task is None:
+            raise TaskNotFoundError(task_id)
+        return task
@@ -2,27 +2,39 @@ from collections.abc import Callable
 from sqlite3 import Connection
 
 from raztodo.infrastructure.sqlite.migrations import (
+    backfill_task_tags,
+    check_fts,
     create_unique_title_index,
     deduplicate_titles,
+    rebuild_fts,
 )
 
 
 class MigrateUseCase:
     """
-    Handles database migration tasks such as deduplicating titles and creating indexes.
+    Handles database migration tasks such as deduplicating titles, creating indexes,
+    and backfilling the normalized task_tags table.
     """
 
     def __init__(self, connection_factory: Callable[[], Connection]) -> None:
         self._connection_factory: Callable[[], Connection] = connection_factory
 
-    def execute(self) -> dict[str, object]:
+    def execute(self, rebuild_fts_index: bool = False) -> dict[str, object]:
         """
-        Perform migration: fix duplicate task titles and create unique title index.
+        Perform migration: fix duplicate task titles, create unique title index,
+        and rebuild task_tags from the tags stored on each task.
+
+        Args:
+            rebuild_fts_index: Also rebuild and optimize the full-text search index.
 
         Returns:
             A dictionary with migration results:
                 - 'duplicates_fixed': number of duplicate titles corrected
                 - 'unique_index': True if the unique index was created
+                - 'tags_backfilled': number of task_tags rows written
+                - 'fts_rebuilt': number of rows indexed (only with rebuild_fts_index)
+                - 'fts_drift': tasks missing from the search index, negative
+                  for stale entries (only without rebuild_fts_index)
 
         Raises:
             Any exceptions from database operations are propagated.
@@ -32,6 +44,16 @@ class MigrateUseCase:
         try:
             updated: int = deduplicate_titles(conn)
             create_unique_title_index(conn)
-            return {"duplicates_fixed": updated, "unique_index": True}
+            tags_backfilled: int = backfill_task_tags(conn)
+            result: dict[str, object] = {
+                "duplicates_fixed": updated,
+                "unique_index": True,
+                "tags_backfilled": tags_backfilled,
+            }
+            if rebuild_fts_index:
+                result["fts_rebuilt"] = rebuild_fts(conn)
+            else:
+                result["fts_drift"] = check_fts(conn)
+            return result
         finally:
             conn.close()
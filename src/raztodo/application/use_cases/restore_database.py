@@ -0,0 +1,43 @@
+from collections.abc import Callable
+from pathlib import Path
+from sqlite3 import Connection, Error
+
+from raztodo.domain.exceptions import RazTodoException
+from raztodo.infrastructure.sqlite.backup import restore_database
+
+
+class RestoreDatabaseUseCase:
+    """
+    Handles replacing the live database with a snapshot taken by 'rt backup'.
+    """
+
+    def __init__(self, connection_factory: Callable[[], Connection]) -> None:
+        self._connection_factory: Callable[[], Connection] = connection_factory
+
+    def execute(
+        self, filepath: str, progress: Callable[[int], None] | None = None
+    ) -> dict[str, object]:
+        """
+        Overwrite the database with a snapshot using the SQLite online backup API.
+
+        The snapshot is integrity-checked before any page is copied.
+
+        Args:
+            filepath: Path of the snapshot to restore.
+            progress: Optional callback receiving the number of pages copied so far.
+
+        Returns:
+            A dictionary with the snapshot 'path' and the number of 'pages' restored.
+
+        Raises:
+            RazTodoException: If the snapshot is missing, invalid, or cannot be copied.
+        """
+
+        conn: Connection = self._connection_factory()
+        try:
+            pages: int = restore_database(conn, Path(filepath), progress=progress)
+        except (Error, OSError) as e:
+            raise RazTodoException(f"Failed to restore database from '{filepath}': {e}") from e
+        finally:
+            conn.close()
+        return {"path": str(Path(filepath).resolve()), "pages": pages}
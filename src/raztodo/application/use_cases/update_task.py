@@ -1,4 +1,5 @@
 from raztodo.domain.exceptions import RazTodoException
+from raztodo.domain.task_entity import TaskEntity
 from raztodo.domain.task_repository import TaskRepository
 
 
@@ -45,3 +46,39 @@ class UpdateTaskUseCase:
         if not updated:
             raise RazTodoException(f"No task found with id {task_id} or no changes provided")
         return True
+
+    def execute_returning(
+        self,
+        task_id: int,
+        title: str | None = None,
+        description: str | None = None,
+        priority: str | None = None,
+        due_date: str | None = None,
+        tags: list[str] | None = None,
+        project: str | None = None,
+    ) -> TaskEntity:
+        """
+        Update task fields by ID and return the updated task.
+
+        Args:
+            task_id: ID of the task to update.
+            title: Optional new title.
+            description: Optional new description.
+            priority: Optional new priority.
+            due_date: Optional new due date.
+            tags: Optional new list of tags.
+            project: Optional new project name.
+
+        Returns:
+            The task as stored after the update.
+
+        Raises:
+            RazTodoException: If the task does not exist or no changes were provided.
+        """
+
+        task: TaskEntity | None = self.repo.update_task_returning(
+            task_id, title, description, priority, due_date, tags, project
+        )
+        if task is None:
+            raise RazTodoException(f"No task found with id {task_id} or no changes provided")
+        return task
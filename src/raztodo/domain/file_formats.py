@@ -0,0 +1,171 @@
+import csv
+import io
+import json
+from collections.abc import Iterable, Iterator
+from pathlib import PurePath
+from typing import Any, TextIO
+
+from raztodo.domain.exceptions import TaskValidationError
+from raztodo.domain.json_stream import (
+    CHUNK_SIZE,
+    encode_json_array,
+    encode_ndjson,
+    is_ndjson_path,
+    iter_json_items,
+)
+
+FILE_FORMATS: tuple[str, ...] = ("json", "ndjson", "csv")
+"""Task file formats understood by export and import."""
+
+CSV_FIELDS: tuple[str, ...] = (
+    "id",
+    "title",
+    "description",
+    "done",
+    "created_at",
+    "priority",
+    "due_date",
+    "tags",
+    "project",
+)
+"""Column order of exported CSV files."""
+
+_TRUE_VALUES = {"1", "true", "yes", "y"}
+
+
+def validate_format(file_format: str) -> str:
+    """
+    Ensures a task file format is supported.
+
+    Args:
+        file_format (str): Requested format.
+
+    Returns:
+        str: The validated format.
+
+    Raises:
+        TaskValidationError: If the format is not one of FILE_FORMATS.
+    """
+
+    if file_format not in FILE_FORMATS:
+        raise TaskValidationError(
+            field="format",
+            message=f"Unknown format '{file_format}'. Choose: {', '.join(FILE_FORMATS)}",
+        )
+    return file_format
+
+
+def detect_format(path: str | PurePath, file_format: str | None = None) -> str:
+    """
+    Resolves the task file format, from the explicit choice or the file extension.
+
+    Compression suffixes are ignored, so ``tasks.csv.gz`` is CSV.
+
+    Args:
+        path (str | PurePath): File path.
+        file_format (str | None): Explicit format; detected from the path if None.
+
+    Returns:
+        str: One of FILE_FORMATS.
+
+    Raises:
+        TaskValidationError: If an explicit format is not one of FILE_FORMATS.
+    """
+
+    if file_format is not None:
+        return validate_format(file_format)
+    if is_ndjson_path(path):
+        return "ndjson"
+    if ".csv" in PurePath(path).suffixes:
+        return "csv"
+    return "json"
+
+
+def encode_tasks(
+    items: Iterable[dict[str, Any]], file_format: str = "json", chunk_size: int = CHUNK_SIZE
+) -> Iterator[str]:
+    """
+    Encodes task dicts in the given format, yielding the text in chunks.
+
+    Args:
+        items (Iterable[dict[str, Any]]): Tasks keyed by CSV_FIELDS, consumed lazily.
+        file_format (str): One of FILE_FORMATS.
+        chunk_size (int): Characters buffered before a chunk is yielded.
+
+    Yields:
+        str: Consecutive pieces of the document.
+    """
+
+    if file_format == "ndjson":
+        return encode_ndjson(items, chunk_size)
+    if file_format == "csv":
+        return _encode_csv(items, chunk_size)
+    return encode_json_array(items, chunk_size=chunk_size)
+
+
+def _encode_csv(items: Iterable[dict[str, Any]], chunk_size: int) -> Iterator[str]:
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(CSV_FIELDS)
+    for item in items:
+        row = []
+        for field in CSV_FIELDS:
+            value = item.get(field)
+            if field == "tags":
+                value = json.dumps(value, ensure_ascii=False) if value else ""
+            elif field == "done":
+                value = "true" if value else "false"
+            row.append("" if value is None else value)
+        writer.writerow(row)
+        if buf.tell() >= chunk_size:
+            yield buf.getvalue()
+            buf.seek(0)
+            buf.truncate()
+    if buf.tell():
+        yield buf.getvalue()
+
+
+def iter_task_items(stream: TextIO, file_format: str = "json") -> Iterator[Any]:
+    """
+    Yields the task items of a JSON array, NDJSON or CSV stream.
+
+    CSV rows become dicts with ``done`` as a bool, ``tags`` as a list (a JSON
+    array or comma-separated) and empty ``due_date``/``project`` as None.
+
+    Args:
+        stream (TextIO): Text stream to read.
+        file_format (str): One of FILE_FORMATS.
+
+    Yields:
+        Any: Each decoded item, in order.
+    """
+
+    if file_format == "csv":
+        return _iter_csv(stream)
+    return iter_json_items(stream, ndjson=file_format == "ndjson")
+
+
+def _iter_csv(stream: TextIO) -> Iterator[dict[str, Any]]:
+    for row in csv.DictReader(stream):
+        item: dict[str, Any] = {k: v for k, v in row.items() if k is not None}
+        if "done" in item:
+            item["done"] = (item["done"] or "").strip().lower() in _TRUE_VALUES
+        if "tags" in item:
+            item["tags"] = _parse_tags(item["tags"] or "")
+        for field in ("due_date", "project"):
+            if field in item and not item[field]:
+                item[field] = None
+        yield item
+
+
+def _parse_tags(value: str) -> list[str]:
+    value = value.strip()
+    if value.startswith("["):
+        try:
+            tags = json.loads(value)
+        except json.JSONDecodeError:
+            pass
+        else:
+            if isinstance(tags, list):
+                return [str(t) for t in tags]
+    return [t.strip() for t in value.split(",") if t.strip()]
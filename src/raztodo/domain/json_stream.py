@@ -0,0 +1,253 @@
+import json
+from collections.abc import Iterable, Iterator
+from pathlib import PurePath
+from typing import Any, TextIO
+
+from raztodo.domain.exceptions import InvalidFileFormatError
+
+CHUNK_SIZE = 64 * 1024
+"""Characters read from the stream per refill while parsing a JSON array."""
+
+NDJSON_SUFFIXES: tuple[str, ...] = (".ndjson", ".jsonl")
+"""File extensions read as newline-delimited JSON, one value per line."""
+
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = _WHITESPACE + ",]"
+
+
+def is_ndjson_path(path: str | PurePath) -> bool:
+    """
+    Tells whether a file should be read as NDJSON based on its extension.
+
+    Args:
+        path (str | PurePath): File path, possibly with a compression suffix.
+
+    Returns:
+        bool: True for .ndjson and .jsonl files.
+    """
+
+    return any(suffix in NDJSON_SUFFIXES for suffix in PurePath(path).suffixes)
+
+
+def iter_json_array(stream: TextIO, chunk_size: int = CHUNK_SIZE) -> Iterator[Any]:
+    """
+    Yields the elements of a top-level JSON array one at a time.
+
+    Only the element being decoded and one chunk of look-ahead are held in
+    memory, so the array can be far larger than available RAM.
+
+    Args:
+        stream (TextIO): Text stream positioned at the start of the document.
+        chunk_size (int): Characters read per refill.
+
+    Yields:
+        Any: Each decoded array element, in order.
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON; line numbers
+            refer to the whole stream.
+        InvalidFileFormatError: If the top-level value is not an array.
+    """
+
+    decoder = json.JSONDecoder()
+    buf = ""
+    pos = 0
+    eof = False
+    # Position of buf[0] in the whole stream, so errors point at the file
+    dropped_chars = dropped_lines = column_offset = 0
+
+    def fill() -> bool:
+        nonlocal buf, pos, eof, dropped_chars, dropped_lines, column_offset
+        if eof:
+            return False
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            eof = True
+            return False
+        newlines = buf.count("\n", 0, pos)
+        if newlines:
+            dropped_lines += newlines
+            column_offset = pos - buf.rfind("\n", 0, pos) - 1
+        else:
+            column_offset += pos
+        dropped_chars += pos
+        buf = buf[pos:] + chunk
+        pos = 0
+        return True
+
+    def relocate(error: json.JSONDecodeError) -> json.JSONDecodeError:
+        if error.lineno == 1:
+            error.colno += column_offset
+        error.lineno += dropped_lines
+        error.pos += dropped_chars
+        error.args = (f"{error.msg}: line {error.lineno} column {error.colno} (char {error.pos})",)
+        return error
+
+    def fail(message: str) -> json.JSONDecodeError:
+        return relocate(json.JSONDecodeError(message, buf, pos))
+
+    def next_char() -> str:
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in _WHITESPACE:
+                pos += 1
+            if pos < len(buf):
+                return buf[pos]
+            if not fill():
+                return ""
+
+    first = next_char()
+    if first != "[":
+        # Not an array: decode the rest so syntax errors are reported as such
+        value = json.loads(buf[pos:] + stream.read())
+        raise InvalidFileFormatError(
+            format_type="JSON", message=f"Expected JSON array, got {type(value).__name__}"
+        )
+    pos += 1
+
+    if next_char() == "]":
+        pos += 1
+    else:
+        while True:
+            if not next_char():
+                raise fail("Expecting value")
+            while True:
+                try:
+                    value, end = decoder.raw_decode(buf, pos)
+                except json.JSONDecodeError as e:
+                    if fill():
+                        continue
+                    raise relocate(e) from None
+                # A number cut by the chunk boundary ("1." or "1e") decodes early;
+                # an element is only complete once its delimiter is in the buffer.
+                if (end == len(buf) or buf[end] not in _DELIMITERS) and fill():
+                    continue
+                break
+            pos = end
+            yield value
+
+            separator = next_char()
+            pos += 1
+            if separator == "]":
+                break
+            if separator != ",":
+                pos -= 1
+                raise fail("Expecting ',' delimiter")
+
+    if next_char():
+        raise fail("Extra data")
+
+
+def iter_ndjson(stream: TextIO) -> Iterator[Any]:
+    """
+    Yields one decoded value per non-blank line of a newline-delimited JSON stream.
+
+    Args:
+        stream (TextIO): Text stream of NDJSON lines.
+
+    Yields:
+        Any: Each decoded line, in order.
+
+    Raises:
+        json.JSONDecodeError: If a line is not valid JSON; lineno is the line
+            number in the stream.
+    """
+
+    for lineno, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as e:
+            e.lineno = lineno
+            e.args = (f"{e.msg}: line {lineno} column {e.colno}",)
+            raise
+
+
+def encode_json_array(
+    items: Iterable[Any], indent: int | None = 2, chunk_size: int = CHUNK_SIZE
+) -> Iterator[str]:
+    """
+    Encodes items as one JSON array, yielding the text in chunks.
+
+    The output is identical to ``json.dumps(list(items), ensure_ascii=False,
+    indent=indent)``, but only one chunk is held in memory at a time.
+
+    Args:
+        items (Iterable[Any]): JSON-serializable values, consumed lazily.
+        indent (int | None): Indentation as in json.dumps.
+        chunk_size (int): Characters buffered before a chunk is yielded.
+
+    Yields:
+        str: Consecutive pieces of the document.
+    """
+
+    if indent is None:
+        opening, separator, closing, newline = "[", ", ", "]", "\n"
+    else:
+        pad = " " * indent
+        opening, separator, closing, newline = f"[\n{pad}", f",\n{pad}", "\n]", f"\n{pad}"
+
+    encode = json.JSONEncoder(ensure_ascii=False, indent=indent).encode
+    buf: list[str] = []
+    size = 0
+    started = False
+    for item in items:
+        text = encode(item)
+        if indent is not None:
+            text = text.replace("\n", newline)
+        buf.append(separator if started else opening)
+        buf.append(text)
+        started = True
+        size += len(text)
+        if size >= chunk_size:
+            yield "".join(buf)
+            buf = []
+            size = 0
+    if not started:
+        yield "[]"
+        return
+    buf.append(closing)
+    yield "".join(buf)
+
+
+def encode_ndjson(items: Iterable[Any], chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    """
+    Encodes items as newline-delimited JSON, yielding the text in chunks.
+
+    Args:
+        items (Iterable[Any]): JSON-serializable values, consumed lazily.
+        chunk_size (int): Characters buffered before a chunk is yielded.
+
+    Yields:
+        str: Consecutive pieces of the stream, one compact value per line.
+    """
+
+    encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+    buf: list[str] = []
+    size = 0
+    for item in items:
+        text = encode(item) + "\n"
+        buf.append(text)
+        size += len(text)
+        if size >= chunk_size:
+            yield "".join(buf)
+            buf = []
+            size = 0
+    if buf:
+        yield "".join(buf)
+
+
+def iter_json_items(stream: TextIO, ndjson: bool = False) -> Iterator[Any]:
+    """
+    Yields the items of a JSON array or NDJSON stream.
+
+    Args:
+        stream (TextIO): Text stream to read.
+        ndjson (bool): Read one value per line instead of a single array.
+
+    Yields:
+        Any: Each decoded item, in order.
+    """
+
+    return iter_ndjson(stream) if ndjson else iter_json_array(stream)
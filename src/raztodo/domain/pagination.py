@@ -0,0 +1,135 @@
+import base64
+import binascii
+import json
+from typing import Any, NamedTuple
+
+from raztodo.domain.exceptions import TaskValidationError
+from raztodo.domain.task_entity import TaskEntity
+
+SORT_FIELDS: tuple[str, ...] = ("id", "title", "created_at", "done", "priority", "due_date")
+"""Fields a task listing can be ordered by; ties are always broken by id."""
+
+PRIORITY_RANK: dict[str, int] = {"H": 3, "M": 2, "L": 1}
+"""Sort rank of each priority level; tasks without a priority rank 0."""
+
+
+class Cursor(NamedTuple):
+    """
+    Position of the last row of a page in a keyset-paginated listing.
+
+    Attributes:
+        key (Any): Sort-column value of the last row on the page.
+        id (int): Identifier of the last row, used as the tie-breaker.
+        order_by (str): Field the listing is ordered by.
+        descending (bool): Whether the listing is in descending order.
+    """
+
+    key: Any
+    id: int
+    order_by: str = "id"
+    descending: bool = False
+
+
+def validate_order_by(order_by: str) -> str:
+    """
+    Ensures a listing can be ordered by the given field.
+
+    Args:
+        order_by (str): Requested sort field.
+
+    Returns:
+        str: The validated sort field.
+
+    Raises:
+        TaskValidationError: If the field is not one of SORT_FIELDS.
+    """
+
+    if order_by not in SORT_FIELDS:
+        raise TaskValidationError(
+            field="order_by",
+            message=f"Cannot sort by '{order_by}'. Choose: {', '.join(SORT_FIELDS)}",
+        )
+    return order_by
+
+
+def sort_key(task: TaskEntity, order_by: str = "id") -> Any:
+    """
+    Returns the value a task is ordered by for the given sort field.
+
+    Args:
+        task (TaskEntity): Task to read the value from.
+        order_by (str): Sort field.
+
+    Returns:
+        Any: The task's sort value, matching the storage-side ordering.
+    """
+
+    if order_by == "done":
+        return 1 if task.done else 0
+    if order_by == "priority":
+        return PRIORITY_RANK.get((task.priority or "").upper(), 0)
+    if order_by == "due_date":
+        return task.due_date or None
+    return getattr(task, validate_order_by(order_by))
+
+
+def encode_cursor(task: TaskEntity, order_by: str = "id", descending: bool = False) -> str:
+    """
+    Builds the opaque token that resumes a listing right after the given task.
+
+    Args:
+        task (TaskEntity): Last task of the current page.
+        order_by (str): Field the listing is ordered by.
+        descending (bool): Whether the listing is in descending order.
+
+    Returns:
+        str: URL-safe cursor token.
+    """
+
+    payload = json.dumps(
+        {"k": sort_key(task, order_by), "id": task.id, "o": order_by, "d": descending},
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str, order_by: str = "id", descending: bool = False) -> Cursor:
+    """
+    Parses a cursor token produced by encode_cursor.
+
+    Args:
+        token (str): Opaque cursor token.
+        order_by (str): Field the requested listing is ordered by.
+        descending (bool): Whether the requested listing is in descending order.
+
+    Returns:
+        Cursor: The decoded position.
+
+    Raises:
+        TaskValidationError: If the token is malformed or was issued for a
+            different ordering.
+    """
+
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        task_id = data["id"]
+        if not isinstance(task_id, int) or isinstance(task_id, bool):
+            raise TypeError("cursor id must be an integer")
+        cursor = Cursor(
+            key=data["k"],
+            id=task_id,
+            order_by=data.get("o", "id"),
+            descending=bool(data.get("d", False)),
+        )
+    except (ValueError, TypeError, KeyError, AttributeError, UnicodeError, binascii.Error) as e:
+        raise TaskValidationError(
+            field="cursor", message=f"Invalid pagination cursor: {token!r}"
+        ) from e
+
+    if cursor.order_by != order_by or cursor.descending != descending:
+        raise TaskValidationError(
+            field="cursor",
+            message="Pagination cursor was issued for a different sort order",
+        )
+    return cursor
@@ -0,0 +1,63 @@
+from dataclasses import dataclass, field
+
+from raztodo.domain.task_entity import TaskEntity
+
+MATCH_START = "\x02"
+"""Marker the storage layer places before each matched term."""
+
+MATCH_END = "\x03"
+"""Marker the storage layer places after each matched term."""
+
+DEFAULT_TITLE_WEIGHT = 10.0
+"""BM25 weight of title matches; titles are short, so each hit counts more."""
+
+DEFAULT_DESCRIPTION_WEIGHT = 1.0
+"""BM25 weight of description matches."""
+
+
+@dataclass
+class SearchHit:
+    """
+    A task returned by a relevance-ranked search, with its match context.
+
+    Attributes:
+        task (TaskEntity): The matching task.
+        score (float): BM25 relevance; higher is more relevant.
+        snippet (str): Excerpt of the description around the best match.
+        title_highlights (list[tuple[int, int]]): [start, end) offsets of
+            matched terms in task.title.
+        snippet_highlights (list[tuple[int, int]]): [start, end) offsets of
+            matched terms in snippet.
+    """
+
+    task: TaskEntity
+    score: float = 0.0
+    snippet: str = ""
+    title_highlights: list[tuple[int, int]] = field(default_factory=list)
+    snippet_highlights: list[tuple[int, int]] = field(default_factory=list)
+
+
+def split_highlights(marked: str | None) -> tuple[str, list[tuple[int, int]]]:
+    """
+    Removes match markers from text and records where they were.
+
+    Args:
+        marked (str | None): Text with matched terms wrapped in MATCH_START
+            and MATCH_END.
+
+    Returns:
+        tuple[str, list[tuple[int, int]]]: The plain text and the [start, end)
+            offsets of each matched term within it.
+    """
+
+    text: list[str] = []
+    spans: list[tuple[int, int]] = []
+    length = 0
+    for i, chunk in enumerate((marked or "").split(MATCH_START)):
+        # Every chunk after the first opens with a matched term
+        before, sep, after = chunk.partition(MATCH_END)
+        if i and sep:
+            spans.append((length, length + len(before)))
+        text.append(before + after)
+        length += len(before) + len(after)
+    return "".join(text), spans
@@ -0,0 +1,130 @@
+import sys
+from array import array
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from raztodo.domain.task_entity import TaskEntity
+
+
+class TaskBatch:
+    """
+    Columnar list of tasks for consumers that read many tasks at once.
+
+    Each field is held in its own column rather than in one TaskEntity per
+    task: ids in an int64 array, done flags in a bytearray, tags as shared
+    tuples, and priorities and projects as interned strings, so a large
+    result set is a handful of containers instead of thousands of objects
+    for the garbage collector to track. Indexing or iterating builds
+    TaskEntity objects on demand.
+    """
+
+    __slots__ = (
+        "created_at",
+        "descriptions",
+        "done",
+        "due_dates",
+        "ids",
+        "priorities",
+        "projects",
+        "tags",
+        "titles",
+    )
+
+    def __init__(self) -> None:
+        self.ids = array("q")
+        self.titles: list[str] = []
+        self.descriptions: list[str] = []
+        self.done = bytearray()
+        self.created_at: list[str] = []
+        self.priorities: list[str] = []
+        self.due_dates: list[str | None] = []
+        self.tags: list[tuple[str, ...]] = []
+        self.projects: list[str | None] = []
+
+    @classmethod
+    def from_tasks(cls, tasks: Iterable[TaskEntity]) -> "TaskBatch":
+        batch = cls()
+        for t in tasks:
+            batch.append(
+                t.id,
+                t.title,
+                t.description,
+                t.done,
+                t.created_at,
+                t.priority,
+                t.due_date,
+                t.tags,
+                t.project,
+            )
+        return batch
+
+    def append(
+        self,
+        task_id: int,
+        title: str,
+        description: str = "",
+        done: bool = False,
+        created_at: str = "",
+        priority: str = "",
+        due_date: str | None = None,
+        tags: Iterable[str] | None = None,
+        project: str | None = None,
+    ) -> None:
+        self.ids.append(task_id)
+        self.titles.append(title)
+        self.descriptions.append(description)
+        self.done.append(1 if done else 0)
+        self.created_at.append(created_at)
+        self.priorities.append(sys.intern(priority))
+        self.due_dates.append(due_date)
+        self.tags.append(tuple(tags) if tags else ())
+        self.projects.append(sys.intern(project) if project else None)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, index: int) -> TaskEntity:
+        return TaskEntity(
+            self.ids[index],
+            self.titles[index],
+            self.descriptions[index],
+            bool(self.done[index]),
+            self.created_at[index],
+            self.priorities[index],
+            self.due_dates[index],
+            list(self.tags[index]),
+            self.projects[index],
+        )
+
+    def __iter__(self) -> Iterator[TaskEntity]:
+        for i in range(len(self.ids)):
+            yield self[i]
+
+    def to_dicts(self) -> list[dict[str, Any]]:
+        """Return one dict per task, keyed like the TaskEntity fields."""
+        rows = zip(
+            self.ids,
+            self.titles,
+            self.descriptions,
+            self.done,
+            self.created_at,
+            self.priorities,
+            self.due_dates,
+            self.tags,
+            self.projects,
+            strict=True,
+        )
+        return [
+            {
+                "id": task_id,
+                "title": title,
+                "description": description,
+                "done": bool(done),
+                "created_at": created_at,
+                "priority": priority,
+                "due_date": due_date,
+                "tags": list(tags),
+                "project": project,
+            }
+            for task_id, title, description, done, created_at, priority, due_date, tags, project in rows
+        ]
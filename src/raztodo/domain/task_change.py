@@ -0,0 +1,41 @@
+from dataclasses import dataclass, field
+
+CHANGE_OPERATIONS: tuple[str, ...] = ("insert", "update", "delete")
+"""Operations recorded in the task changelog."""
+
+DEFAULT_CHANGES_LIMIT = 1000
+"""Most changelog entries returned by one read."""
+
+
+@dataclass
+class TaskChange:
+    """
+    A single entry of the task changelog.
+
+    Attributes:
+        seq (int): Position in the changelog; increases with every change.
+        task_id (int): Identifier of the changed task.
+        op (str): One of CHANGE_OPERATIONS.
+    """
+
+    seq: int
+    task_id: int
+    op: str
+
+
+@dataclass
+class ChangeFeed:
+    """
+    A run of changelog entries following a known position.
+
+    Attributes:
+        changes (list[TaskChange]): Entries in changelog order.
+        last_seq (int): Position to resume from; pass it as `since` next time.
+        reset (bool): True if entries after `since` are no longer kept (or
+            `since` is ahead of the changelog), so the caller must reload
+            every task instead of applying changes.
+    """
+
+    changes: list[TaskChange] = field(default_factory=list)
+    last_seq: int = 0
+    reset: bool = False
@@ -1,12 +1,16 @@
 from dataclasses import dataclass
+from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskEntity:
     """
     Represents a task item with metadata including status, priority, deadlines,
     and optional categorization attributes such as tags and project association.
 
+    Instances use __slots__ instead of a per-instance __dict__, which keeps
+    large result sets smaller; TaskBatch is the columnar form for bulk reads.
+
     Attributes:
         id (int): Unique identifier for the task.
         title (str): Short title describing the task.
@@ -36,3 +40,18 @@ class TaskEntity:
         """
 
         self.tags = list(self.tags) if self.tags else []
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns the fields as a JSON-serializable dict, in declaration order."""
+
+        return {
+            "id": self.id,
+            "title": self.title,
+            "description": self.description,
+            "done": self.done,
+            "created_at": self.created_at,
+            "priority": self.priority,
+            "due_date": self.due_date,
+            "tags": self.tags,
+            "project": self.project,
+        }
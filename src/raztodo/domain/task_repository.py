@@ -1,5 +1,10 @@
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
 
+from raztodo.domain.search import DEFAULT_DESCRIPTION_WEIGHT, DEFAULT_TITLE_WEIGHT, SearchHit
+from raztodo.domain.task_batch import TaskBatch
+from raztodo.domain.task_change import DEFAULT_CHANGES_LIMIT, ChangeFeed
 from raztodo.domain.task_entity import TaskEntity
 
 
@@ -35,6 +40,32 @@ class TaskRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def add_task_returning(
+        self,
+        title: str,
+        description: str = "",
+        priority: str = "",
+        due_date: str | None = None,
+        tags: list[str] | None = None,
+        project: str | None = None,
+    ) -> TaskEntity:
+        """
+        Creates a new task and returns it as stored, in a single round trip.
+
+        Args:
+            title (str): Title of the task.
+            description (str): Optional description text.
+            priority (str): Task priority level.
+            due_date (str | None): Due date value.
+            tags (list[str] | None): Associated tags.
+            project (str | None): Project name.
+
+        Returns:
+            TaskEntity: The persisted task, including generated fields.
+        """
+        pass
+
     @abstractmethod
     def get_tasks(
         self,
@@ -46,6 +77,10 @@ class TaskRepository(ABC):
         tags: list[str] | None = None,
         due_before: str | None = None,
         due_after: str | None = None,
+        all_tags: bool = False,
+        cursor: str | None = None,
+        order_by: str = "id",
+        descending: bool = False,
     ) -> list[TaskEntity]:
         """
         Retrieves a list of tasks with optional filtering and pagination.
@@ -59,12 +94,73 @@ class TaskRepository(ABC):
             tags (list[str] | None): Filter by associated tags.
             due_before (str | None): Filter tasks with due dates before this value.
             due_after (str | None): Filter tasks with due dates after this value.
+            all_tags (bool): Require every tag in `tags` instead of any of them.
+            cursor (str | None): Opaque token from encode_cursor; resumes the
+                listing right after the task it was built from.
+            order_by (str): Field to sort by (one of SORT_FIELDS); ties are
+                broken by id.
+            descending (bool): Sort in descending order.
 
         Returns:
             list[TaskEntity]: A list of matching TaskEntity objects.
         """
         pass
 
+    @abstractmethod
+    def get_task_batch(
+        self,
+        limit: int | None = None,
+        offset: int | None = None,
+        priority: str | None = None,
+        project: str | None = None,
+        done: bool | None = None,
+        tags: list[str] | None = None,
+        due_before: str | None = None,
+        due_after: str | None = None,
+        all_tags: bool = False,
+        cursor: str | None = None,
+        order_by: str = "id",
+        descending: bool = False,
+    ) -> TaskBatch:
+        """
+        Retrieves the same tasks as get_tasks as one columnar TaskBatch.
+
+        Meant for bulk consumers: no TaskEntity is built unless the batch
+        is indexed or iterated.
+
+        Returns:
+            TaskBatch: The matching tasks, in listing order.
+        """
+        pass
+
+    @abstractmethod
+    def iter_tasks(
+        self,
+        limit: int | None = None,
+        offset: int | None = None,
+        priority: str | None = None,
+        project: str | None = None,
+        done: bool | None = None,
+        tags: list[str] | None = None,
+        due_before: str | None = None,
+        due_after: str | None = None,
+        all_tags: bool = False,
+        cursor: str | None = None,
+        order_by: str = "id",
+        descending: bool = False,
+    ) -> Iterator[TaskEntity]:
+        """
+        Yields the same tasks as get_tasks, reading them from storage in batches.
+
+        Memory and the time to the first task depend on the batch size, not
+        on how many tasks match. The storage connection must stay open until
+        the iterator is exhausted or closed.
+
+        Yields:
+            TaskEntity: The matching tasks, in listing order.
+        """
+        pass
+
     @abstractmethod
     def get_task(self, task_id: int) -> TaskEntity | None:
         """
@@ -78,6 +174,35 @@ class TaskRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def change_counter(self) -> int:
+        """
+        Returns a counter that increases whenever any task is created, changed
+        or deleted, by this process or another one.
+
+        Returns:
+            int: The current value; equal values mean the tasks are unchanged.
+        """
+        pass
+
+    @abstractmethod
+    def get_changes(
+        self, since: int | None = None, limit: int = DEFAULT_CHANGES_LIMIT
+    ) -> ChangeFeed:
+        """
+        Returns the changelog entries recorded after a known position.
+
+        Args:
+            since (int | None): Position returned by an earlier call; None
+                returns no entries, only the current position.
+            limit (int): Maximum number of entries to return.
+
+        Returns:
+            ChangeFeed: The entries, the position to resume from, and whether
+                entries after `since` were lost, so the caller must reload.
+        """
+        pass
+
     @abstractmethod
     def update_task(
         self,
@@ -106,6 +231,35 @@ class TaskRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def update_task_returning(
+        self,
+        task_id: int,
+        title: str | None = None,
+        description: str | None = None,
+        priority: str | None = None,
+        due_date: str | None = None,
+        tags: list[str] | None = None,
+        project: str | None = None,
+    ) -> TaskEntity | None:
+        """
+        Updates fields of an existing task and returns the updated task.
+
+        Args:
+            task_id (int): Unique identifier of the task to update.
+            title (str | None): Updated title.
+            description (str | None): Updated description.
+            priority (str | None): Updated priority.
+            due_date (str | None): Updated due date.
+            tags (list[str] | None): Updated tags.
+            project (str | None): Updated project association.
+
+        Returns:
+            TaskEntity | None: The updated task, or None if the task does not
+                exist or no changes were provided.
+        """
+        pass
+
     @abstractmethod
     def remove_task(self, task_id: int) -> int:
         """
@@ -133,6 +287,33 @@ class TaskRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def toggle_done(self, task_id: int) -> TaskEntity | None:
+        """
+        Atomically flips the completion status of a task.
+
+        Args:
+            task_id (int): Identifier of the task.
+
+        Returns:
+            TaskEntity | None: The task with its new status, or None if not found.
+        """
+        pass
+
+    @abstractmethod
+    def mark_done_many(self, task_ids: list[int], done: bool = True) -> list[int]:
+        """
+        Updates the completion status of several tasks in one transaction.
+
+        Args:
+            task_ids (list[int]): Identifiers of the tasks; duplicates are ignored.
+            done (bool): Completion flag.
+
+        Returns:
+            list[int]: Identifiers of the tasks that exist and were updated.
+        """
+        pass
+
     @abstractmethod
     def search_tasks(
         self,
@@ -140,6 +321,12 @@ class TaskRepository(ABC):
         priority: str | None = None,
         project: str | None = None,
         tags: list[str] | None = None,
+        all_tags: bool = False,
+        done: bool | None = None,
+        due_before: str | None = None,
+        due_after: str | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
     ) -> list[TaskEntity]:
         """
         Performs a keyword-based search in task titles and descriptions,
@@ -150,19 +337,97 @@ class TaskRepository(ABC):
             priority (str | None): Filter by priority.
             project (str | None): Filter by project.
             tags (list[str] | None): Filter by tags.
+            all_tags (bool): Require every tag in `tags` instead of any of them.
+            done (bool | None): Filter by completion status.
+            due_before (str | None): Filter tasks with due dates before this value.
+            due_after (str | None): Filter tasks with due dates after this value.
+            limit (int | None): Maximum number of tasks to return.
+            cursor (str | None): Opaque token from encode_cursor; resumes the
+                id-ordered results right after the task it was built from.
 
         Returns:
-            list[TaskEntity]: Matching tasks.
+            list[TaskEntity]: Matching tasks, ordered by id.
         """
         pass
 
     @abstractmethod
-    def export_tasks(self, filepath: str) -> bool:
+    def iter_search(
+        self,
+        keyword: str,
+        priority: str | None = None,
+        project: str | None = None,
+        tags: list[str] | None = None,
+        all_tags: bool = False,
+        done: bool | None = None,
+        due_before: str | None = None,
+        due_after: str | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> Iterator[TaskEntity]:
         """
-        Exports tasks to an external file.
+        Yields the same tasks as search_tasks, reading them from storage in batches.
+
+        Yields:
+            TaskEntity: Matching tasks, ordered by id.
+        """
+        pass
+
+    @abstractmethod
+    def search_ranked(
+        self,
+        keyword: str,
+        limit: int = 10,
+        title_weight: float = DEFAULT_TITLE_WEIGHT,
+        description_weight: float = DEFAULT_DESCRIPTION_WEIGHT,
+        priority: str | None = None,
+        project: str | None = None,
+        done: bool | None = None,
+        tags: list[str] | None = None,
+        all_tags: bool = False,
+    ) -> list[SearchHit]:
+        """
+        Returns the most relevant matches for a keyword, best first, with the
+        matched terms located in each task's title and description.
+
+        Args:
+            keyword (str): Search term.
+            limit (int): Maximum number of hits to return.
+            title_weight (float): Relevance weight of title matches.
+            description_weight (float): Relevance weight of description matches.
+            priority (str | None): Filter by priority.
+            project (str | None): Filter by project.
+            done (bool | None): Filter by completion status.
+            tags (list[str] | None): Filter by tags.
+            all_tags (bool): Require every tag in `tags` instead of any of them.
+
+        Returns:
+            list[SearchHit]: Ranked hits.
+        """
+        pass
+
+    @abstractmethod
+    def iter_export(self, file_format: str = "json") -> Iterator[str]:
+        """
+        Encodes all tasks in the given format, reading them from storage in batches.
+
+        Args:
+            file_format (str): "json", "ndjson" or "csv".
+
+        Yields:
+            str: Consecutive chunks of the document, suitable for writing to a
+                file or a socket as they arrive.
+        """
+        pass
+
+    @abstractmethod
+    def export_tasks(self, filepath: str, file_format: str | None = None) -> bool:
+        """
+        Exports tasks to an external file, compressed if it ends in .gz or .zst.
 
         Args:
             filepath (str): Path to the output file.
+            file_format (str | None): "json", "ndjson" or "csv"; detected from
+                the file extension if None.
 
         Returns:
             bool: True if export succeeds; False otherwise.
@@ -170,15 +435,53 @@ class TaskRepository(ABC):
         pass
 
     @abstractmethod
-    def import_tasks(self, filepath: str) -> int:
+    def import_tasks(
+        self,
+        filepath: str,
+        progress: Callable[[int], None] | None = None,
+        file_format: str | None = None,
+    ) -> dict[str, int]:
+        """
+        Imports tasks from a JSON array, NDJSON or CSV file, streaming it in batches.
+
+        Args:
+            filepath (str): Path to the input file, optionally .gz or .zst compressed.
+            progress (Callable[[int], None] | None): Called periodically with
+                the number of items read so far.
+            file_format (str | None): "json", "ndjson" or "csv"; detected from
+                the file extension if None.
+
+        Returns:
+            dict[str, int]: Counts of ``inserted`` tasks, ``skipped`` malformed
+                items and ``failed`` items rejected by validation or storage.
+        """
+        pass
+
+    @abstractmethod
+    def upsert_many(
+        self, items: Iterable[Any], progress: Callable[[int], None] | None = None
+    ) -> dict[str, int]:
         """
-        Imports tasks from a file.
+        Inserts tasks, or updates the existing task with the same title, in one transaction.
+
+        Items that are not objects or have an empty title are skipped; items
+        that fail validation or that the database rejects are counted as
+        failed, without aborting the rest of the import.
+        On update, a missing or empty priority or tags keeps the stored value;
+        a missing due_date or project keeps the stored value, while an empty
+        one clears it. ``done`` is only written when the item has it.
 
         Args:
-            filepath (str): Path to the input file.
+            items (Iterable[Any]): Decoded task objects, read lazily.
+            progress (Callable[[int], None] | None): Called periodically with
+                the number of items read so far.
 
         Returns:
-            int: Count of successfully imported tasks.
+            dict[str, int]: Counts of ``inserted`` and ``updated`` tasks, and of
+                ``skipped`` and ``failed`` items.
+
+        Raises:
+            RazTodoException: If items failed and none was inserted or updated.
         """
         pass
 
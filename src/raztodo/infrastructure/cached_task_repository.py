@@ -0,0 +1,453 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any, TypeVar
+
+from raztodo.domain.search import DEFAULT_DESCRIPTION_WEIGHT, DEFAULT_TITLE_WEIGHT, SearchHit
+from raztodo.domain.task_batch import TaskBatch
+from raztodo.domain.task_change import DEFAULT_CHANGES_LIMIT, ChangeFeed
+from raztodo.domain.task_entity import TaskEntity
+from raztodo.domain.task_repository import TaskRepository
+
+T = TypeVar("T")
+
+DEFAULT_CACHE_SIZE = 256
+DEFAULT_CACHE_TTL = 10
+
+
+class TaskCache:
+    """
+    Thread-safe LRU cache of query results with a time-to-live per entry.
+
+    Entries are keyed ("task", id) for single tasks and ("list", ...) for
+    listings. A load that overlaps an invalidation is returned but not
+    stored, so a reader racing a writer never caches the old rows.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_CACHE_SIZE,
+        ttl: float = DEFAULT_CACHE_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self._max_size = max_size
+        self._ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[tuple[Any, ...], tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._counter: int | None = None
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_load(self, key: tuple[Any, ...], load: Callable[[], T]) -> T:
+        """Return the cached value for key, or load it and cache anything but None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires, value = entry
+                if expires > self._clock():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+            generation = self._generation
+
+        value = load()
+        if value is None:
+            return value
+        with self._lock:
+            if generation == self._generation:
+                self._entries[key] = (self._clock() + self._ttl, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self._max_size:
+                    self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, task_ids: Iterable[int] = ()) -> None:
+        """Drop every listing and the given tasks."""
+        with self._lock:
+            self._generation += 1
+            for task_id in task_ids:
+                self._entries.pop(("task", task_id), None)
+            for key in [k for k in self._entries if k[0] == "list"]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def sync(self, counter: int) -> None:
+        """Empty the cache if the database change counter moved since last seen."""
+        with self._lock:
+            if counter != self._counter:
+                self._counter = counter
+                self._generation += 1
+                self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+
+class CachedTaskRepository(TaskRepository):
+    """
+    Read-through cache in front of another TaskRepository.
+
+    get_task, get_tasks and get_task_batch are served from a TaskCache shared by every
+    wrapped repository; writes go straight through and then invalidate the
+    affected tasks and all cached listings, since any write may change
+    which tasks a listing holds. Bulk writes clear the cache. Searches,
+    exports and iterators are never cached. Reading change_counter() empties the cache
+    when the database changed since the last read, which is how writes by
+    other processes are noticed.
+
+    Cached entities are shared between callers and must not be mutated.
+    Without change_counter() calls, writes made by other processes show up
+    once their entries expire.
+    """
+
+    def __init__(self, repo: TaskRepository, cache: TaskCache) -> None:
+        self._repo = repo
+        self._cache = cache
+
+    def _write(self, task_ids: Iterable[int], fn: Callable[[], T]) -> T:
+        try:
+            return fn()
+        finally:
+            self._cache.invalidate(task_ids)
+
+    def _write_all(self, fn: Callable[[], T]) -> T:
+        try:
+            return fn()
+        finally:
+            self._cache.clear()
+
+    def add_task(
+        self,
+        title: str,
+        description: str = "",
+        priority: str = "",
+        due_date: str | None = None,
+        tags: list[str] | None = None,
+        project: str | None = None,
+    ) -> int | None:
+        return self._write(
+            (),
+            lambda: self._repo.add_task(title, description, priority, due_date, tags, project),
+        )
+
+    def add_task_returning(
+        self,
+        title: str,
+        description: str = "",
+        priority: str = "",
+        due_date: str | None = None,
+        tags: list[str] | None = None,
+        project: str | None = None,
+    ) -> TaskEntity:
+        return self._write(
+            (),
+            lambda: self._repo.add_task_returning(
+                title, description, priority, due_date, tags, project
+            ),
+        )
+
+    def get_tasks(
+        self,
+        limit: int | None = None,
+        offset: int | None = None,
+        priority: str | None = None,
+        project: str | None = None,
+        done: bool | None = None,
+        tags: list[str] | None = None,
+        due_before: str | None = None,
+        due_after: str | None = None,
+        all_tags: bool = False,
+        cursor: str | None = None,
+        order_by: str = "id",
+        descending: bool = False,
+    ) -> list[TaskEntity]:
+        key = (
+            "list",
+            limit,
+            offset,
+            priority,
+            project,
+            done,
+            tuple(tags) if tags else None,
+            due_before,
+            due_after,
+            all_tags,
+            cursor,
+            order_by,
+            descending,
+        )
+        tasks = self._cache.get_or_load(
+            key,
+            lambda: self._repo.get_tasks(
+                limit=limit,
+                offset=offset,
+                priority=priority,
+                project=project,
+                done=done,
+                tags=tags,
+                due_before=due_before,
+                due_after=due_after,
+                all_tags=all_tags,
+                cursor=cursor,
+                order_by=order_by,
+                descending=descending,
+            ),
+        )
+        # A fresh list, so callers cannot reorder or extend the cached one
+        return list(tasks)
+
+    def get_task_batch(
+        self,
+        limit: int | None = None,
+        offset: int | None = None,
+        priority: str | None = None,
+        project: str | None = None,
+        done: bool | None = None,
+        tags: list[str] | None = None,
+        due_before: str | None = None,
+        due_after: str | None = None,
+        all_tags: bool = False,
+        cursor: str | None = None,
+        order_by: str = "id",
+        descending: bool = False,
+    ) -> TaskBatch:
+        # Under a "list" key, so writes invalidate batches like listings
+        key = (
+            "list",
+            "batch",
+            limit,
+            offset,
+            priority,
+            project,
+            done,
+            tuple(tags) if tags else None,
+            due_before,
+            due_after,
+            all_tags,
+            cursor,
+            order_by,
+            descending,
+        )
+        return self._cache.get_or_load(
+            key,
+            lambda: self._repo.get_task_batch(
+                limit=limit,
+                offset=offset,
+                priority=priority,
+                project=project,
+                done=done,
+                tags=tags,
+                due_before=due_before,
+                due_after=due_after,
+                all_tags=all_tags,
+                cursor=cursor,
+                order_by=order_by,
+                descending=descending,
+            ),
+        )
+
+    def iter_tasks(
+        self,
+        limit: int | None = None,
+        offset: int | None = None,
+        priority: str | None = None,
+        project: str | None = None,
+        done: bool | None = None,
+        tags: list[str] | None = None,
+        due_before: str | None = None,
+        due_after: str | None = None,
+        all_tags: bool = False,
+        cursor: str | None = None,
+        order_by: str = "id",
+        descending: bool = False,
+    ) -> Iterator[TaskEntity]:
+        return self._repo.iter_tasks(
+            limit=limit,
+            offset=offset,
+            priority=priority,
+            project=project,
+            done=done,
+            tags=tags,
+            due_before=due_before,
+            due_after=due_after,
+            all_tags=all_tags,
+            cursor=cursor,
+            order_by=order_by,
+            descending=descending,
+        )
+
+    def get_task(self, task_id: int) -> TaskEntity | None:
+        return self._cache.get_or_load(("task", task_id), lambda: self._repo.get_task(task_id))
+
+    def change_counter(self) -> int:
+        # Never cached: callers read it first and trust the rows that follow,
+        # so a change made elsewhere empties the cache here
+        counter = self._repo.change_counter()
+        self._cache.sync(counter)
+        return counter
+
+    def get_changes(
+        self, since: int | None = None, limit: int = DEFAULT_CHANGES_LIMIT
+    ) -> ChangeFeed:
+        return self._repo.get_changes(since, limit)
+
+    def update_task(
+        self,
+        task_id: int,
+        title: str | None = None,
+        description: str | None = None,
+        priority: str | None = None,
+        due_date: str | None = None,
+        tags: list[str] | None = None,
+        project: str | None = None,
+    ) -> int:
+        return self._write(
+            (task_id,),
+            lambda: self._repo.update_task(
+                task_id, title, description, priority, due_date, tags, project
+            ),
+        )
+
+    def update_task_returning(
+        self,
+        task_id: int,
+        title: str | None = None,
+        description: str | None = None,
+        priority: str | None = None,
+        due_date: str | None = None,
+        tags: list[str] | None = None,
+        project: str | None = None,
+    ) -> TaskEntity | None:
+        return self._write(
+            (task_id,),
+            lambda: self._repo.update_task_returning(
+                task_id, title, description, priority, due_date, tags, project
+            ),
+        )
+
+    def remove_task(self, task_id: int) -> int:
+        return self._write((task_id,), lambda: self._repo.remove_task(task_id))
+
+    def mark_done(self, task_id: int, done: bool = True) -> int:
+        return self._write((task_id,), lambda: self._repo.mark_done(task_id, done))
+
+    def toggle_done(self, task_id: int) -> TaskEntity | None:
+        return self._write((task_id,), lambda: self._repo.toggle_done(task_id))
+
+    def mark_done_many(self, task_ids: list[int], done: bool = True) -> list[int]:
+        return self._write(task_ids, lambda: self._repo.mark_done_many(task_ids, done))
+
+    def search_tasks(
+        self,
+        keyword: str,
+        priority: str | None = None,
+        project: str | None = None,
+        tags: list[str] | None = None,
+        all_tags: bool = False,
+        done: bool | None = None,
+        due_before: str | None = None,
+        due_after: str | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> list[TaskEntity]:
+        return self._repo.search_tasks(
+            keyword,
+            priority=priority,
+            project=project,
+            tags=tags,
+            all_tags=all_tags,
+            done=done,
+            due_before=due_before,
+            due_after=due_after,
+            limit=limit,
+            cursor=cursor,
+        )
+
+    def iter_search(
+        self,
+        keyword: str,
+        priority: str | None = None,
+        project: str | None = None,
+        tags: list[str] | None = None,
+        all_tags: bool = False,
+        done: bool | None = None,
+        due_before: str | None = None,
+        due_after: str | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> Iterator[TaskEntity]:
+        return self._repo.iter_search(
+            keyword,
+            priority=priority,
+            project=project,
+            tags=tags,
+            all_tags=all_tags,
+            done=done,
+            due_before=due_before,
+            due_after=due_after,
+            limit=limit,
+            cursor=cursor,
+        )
+
+    def search_ranked(
+        self,
+        keyword: str,
+        limit: int = 10,
+        title_weight: float = DEFAULT_TITLE_WEIGHT,
+        description_weight: float = DEFAULT_DESCRIPTION_WEIGHT,
+        priority: str | None = None,
+        project: str | None = None,
+        done: bool | None = None,
+        tags: list[str] | None = None,
+        all_tags: bool = False,
+    ) -> list[SearchHit]:
+        return self._repo.search_ranked(
+            keyword,
+            limit=limit,
+            title_weight=title_weight,
+            description_weight=description_weight,
+            priority=priority,
+            project=project,
+            done=done,
+            tags=tags,
+            all_tags=all_tags,
+        )
+
+    def iter_export(self, file_format: str = "json") -> Iterator[str]:
+        return self._repo.iter_export(file_format)
+
+    def export_tasks(self, filepath: str, file_format: str | None = None) -> bool:
+        return self._repo.export_tasks(filepath, file_format)
+
+    def import_tasks(
+        self,
+        filepath: str,
+        progress: Callable[[int], None] | None = None,
+        file_format: str | None = None,
+    ) -> dict[str, int]:
+        return self._write_all(
+            lambda: self._repo.import_tasks(filepath, progress=progress, file_format=file_format)
+        )
+
+    def upsert_many(
+        self, items: Iterable[Any], progress: Callable[[int], None] | None = None
+    ) -> dict[str, int]:
+        return self._write_all(lambda: self._repo.upsert_many(items, progress=progress))
+
+    def clear_all_tasks(self) -> int:
+        return self._write_all(self._repo.clear_all_tasks)
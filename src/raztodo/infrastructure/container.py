@@ -1,22 +1,34 @@
+import threading
 from collections.abc import Callable
 from typing import Any
 
+from raztodo.infrastructure.cached_task_repository import TaskCache
 from raztodo.infrastructure.logger import get_logger
 from raztodo.infrastructure.settings import Settings
 from raztodo.infrastructure.sqlite.connection import sqlite_connection_factory
+from raztodo.infrastructure.sqlite.executor import DatabaseExecutor
+from raztodo.infrastructure.sqlite.pool import ConnectionPool
 from raztodo.infrastructure.sqlite.task_repository import SQLiteTaskRepository
+from raztodo.infrastructure.sqlite.task_schema import ensure_schema
 
 
 class AppContainer:
     _repo_singleton: SQLiteTaskRepository | None
     _connection_factory: Callable[..., Any]
+    _pool: ConnectionPool | None
+    _executor: DatabaseExecutor | None
 
     def __init__(self, db_name: str | None = None) -> None:
         self.config = Settings()
         self.logger = get_logger("raztodo")
 
-        self._connection_factory = sqlite_connection_factory(self.config.resolve_db_path(db_name))
+        self._connection_factory = sqlite_connection_factory(
+            self.config.resolve_db_path(db_name), self.config.connection_profile()
+        )
         self._repo_singleton = None
+        self._pool = None
+        self._executor = None
+        self._pool_lock = threading.Lock()
 
     def repo_singleton(self) -> SQLiteTaskRepository:
         if self._repo_singleton is None:
@@ -26,6 +38,42 @@ class AppContainer:
     def connection_factory(self) -> Callable[..., Any]:
         return self._connection_factory
 
+    def connection_pool(self) -> ConnectionPool:
+        with self._pool_lock:
+            if self._pool is None:
+                pool = ConnectionPool(
+                    self._connection_factory, max_readers=self.config.db_pool_size
+                )
+                # Readers are query-only, so the schema is created up front
+                with pool.writer() as conn:
+                    ensure_schema(conn)
+                self._pool = pool
+            return self._pool
+
+    def db_executor(self) -> DatabaseExecutor:
+        pool = self.connection_pool()
+        with self._pool_lock:
+            if self._executor is None:
+                cache = None
+                if self.config.cache_size:
+                    cache = TaskCache(self.config.cache_size, self.config.cache_ttl)
+                self._executor = DatabaseExecutor(pool, cache)
+            return self._executor
+
+    def close_pool(self) -> None:
+        with self._pool_lock:
+            # The executor goes first: its threads may still hold leases
+            if self._executor:
+                if self._executor.cache is not None:
+                    self.logger.debug(
+                        "Task cache: %(hits)d hits, %(misses)d misses", self._executor.cache.stats()
+                    )
+                self._executor.shutdown()
+                self._executor = None
+            if self._pool:
+                self._pool.close()
+                self._pool = None
+
     def close_singleton(self) -> None:
         if self._repo_singleton:
             self._repo_singleton.close()
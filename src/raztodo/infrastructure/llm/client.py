@@ -1,5 +1,5 @@
 import json
-from collections.abc import Generator
+from collections.abc import AsyncIterator, Generator
 from http.client import HTTPConnection, HTTPSConnection
 from urllib.parse import urlparse
 
@@ -26,6 +26,42 @@ def _build_messages(prompt: str, system_message: str) -> list[dict[str, str]]:
     return messages
 
 
+def _payload(cfg: OllamaConfig, prompt: str, system: str, stream: bool) -> bytes:
+    return json.dumps(
+        {
+            "model": cfg.model,
+            "messages": _build_messages(prompt, system or cfg.system_prompt),
+            "stream": stream,
+        },
+        ensure_ascii=False,
+    ).encode("utf-8")
+
+
+def _connect_error(cfg: OllamaConfig) -> "OllamaClientError":
+    return OllamaClientError(
+        f"Cannot connect to Ollama at '{cfg.host}'. Make sure Ollama is running: https://ollama.com"
+    )
+
+
+def _status_error(cfg: OllamaConfig, status: int, raw: str) -> "OllamaClientError":
+    if status == 404:
+        return OllamaClientError(
+            f"Model '{cfg.model}' not found on Ollama. "
+            f"Run 'ollama list' to see available models, "
+            f"or 'ollama pull {cfg.model}' to download it."
+        )
+    return OllamaClientError(f"Ollama returned HTTP {status}: {raw[:200]}")
+
+
+def _token(line: bytes) -> tuple[str, bool]:
+    """Decode one streamed NDJSON line into (token, done); malformed lines are skipped."""
+    try:
+        chunk = json.loads(line.decode("utf-8"))
+    except json.JSONDecodeError:
+        return "", False
+    return chunk.get("message", {}).get("content", ""), bool(chunk.get("done"))
+
+
 def _open_response(cfg: OllamaConfig, payload: bytes):
     """Open HTTP connection, send request, return (conn, response)."""
     conn, path_prefix = _get_connection(cfg.host)
@@ -54,23 +90,12 @@ def _open_response(cfg: OllamaConfig, payload: bytes):
         response = conn.getresponse()
     except OSError as exc:
         conn.close()
-        raise OllamaClientError(
-            f"Cannot connect to Ollama at '{cfg.host}'. "
-            "Make sure Ollama is running: https://ollama.com"
-        ) from exc
-
-    if response.status == 404:
-        conn.close()
-        raise OllamaClientError(
-            f"Model '{cfg.model}' not found on Ollama. "
-            f"Run 'ollama list' to see available models, "
-            f"or 'ollama pull {cfg.model}' to download it."
-        )
+        raise _connect_error(cfg) from exc
 
     if response.status != 200:
-        raw = response.read().decode("utf-8")
+        raw = "" if response.status == 404 else response.read().decode("utf-8")
         conn.close()
-        raise OllamaClientError(f"Ollama returned HTTP {response.status}: {raw[:200]}")
+        raise _status_error(cfg, response.status, raw)
 
     return conn, response
 
@@ -84,16 +109,7 @@ def chat(prompt: str, system: str = "", cfg: OllamaConfig | None = None) -> str:
     if cfg is None:
         cfg = load_config()
 
-    payload = json.dumps(
-        {
-            "model": cfg.model,
-            "messages": _build_messages(prompt, system or cfg.system_prompt),
-            "stream": False,
-        },
-        ensure_ascii=False,
-    ).encode("utf-8")
-
-    conn, response = _open_response(cfg, payload)
+    conn, response = _open_response(cfg, _payload(cfg, prompt, system, stream=False))
     try:
         raw = response.read().decode("utf-8")
     finally:
@@ -124,36 +140,74 @@ def stream_chat(
     if cfg is None:
         cfg = load_config()
 
-    payload = json.dumps(
-        {
-            "model": cfg.model,
-            "messages": _build_messages(prompt, system or cfg.system_prompt),
-            "stream": True,
-        },
-        ensure_ascii=False,
-    ).encode("utf-8")
-
-    conn, response = _open_response(cfg, payload)
+    conn, response = _open_response(cfg, _payload(cfg, prompt, system, stream=True))
 
     try:
         while True:
             line = response.readline()
             if not line:
                 break
-            try:
-                chunk = json.loads(line.decode("utf-8"))
-            except json.JSONDecodeError:
-                continue
-
-            token = chunk.get("message", {}).get("content", "")
+            token, done = _token(line)
             if token:
                 yield token
-
-            if chunk.get("done"):
+            if done:
                 break
     finally:
         conn.close()
 
 
+async def astream_chat(
+    prompt: str,
+    system: str = "",
+    cfg: OllamaConfig | None = None,
+) -> AsyncIterator[str]:
+    """
+    Async counterpart of stream_chat, used by the web streaming endpoint.
+
+    Streams through httpx2 (shipped with the web extra), so a request waiting
+    on the model holds no thread.
+
+    Yields:
+        Individual content tokens (strings) as produced by the model.
+
+    Raises:
+        OllamaClientError: On connection failure, bad response status or timeout.
+    """
+    import httpx2
+
+    if cfg is None:
+        cfg = load_config()
+
+    payload = _payload(cfg, prompt, system, stream=True)
+    try:
+        async with (
+            httpx2.AsyncClient(timeout=cfg.timeout) as client,
+            client.stream(
+                "POST",
+                _chat_url(cfg.host),
+                content=payload,
+                headers={"Content-Type": "application/json"},
+            ) as response,
+        ):
+            if response.status_code != 200:
+                raw = (await response.aread()).decode("utf-8", errors="replace")
+                raise _status_error(cfg, response.status_code, raw)
+            async for line in response.aiter_lines():
+                token, done = _token(line.encode("utf-8"))
+                if token:
+                    yield token
+                if done:
+                    break
+    except httpx2.TimeoutException as exc:
+        raise OllamaClientError(f"Ollama did not respond within {cfg.timeout}s") from exc
+    except httpx2.TransportError as exc:
+        raise _connect_error(cfg) from exc
+
+
+def _chat_url(host: str) -> str:
+    base = host if "://" in host else f"http://{host}"
+    return f"{base.rstrip('/')}/api/chat"
+
+
 class OllamaClientError(Exception):
     """Raised when the Ollama client encounters an error."""
@@ -1,8 +1,27 @@
+import dataclasses
 import os
 import sys
 import tempfile
 from pathlib import Path
 
+from raztodo.infrastructure.cached_task_repository import DEFAULT_CACHE_SIZE, DEFAULT_CACHE_TTL
+from raztodo.infrastructure.logger import get_logger
+from raztodo.infrastructure.sqlite.connection import (
+    CONNECTION_PROFILES,
+    DEFAULT_PROFILE,
+    ConnectionProfile,
+)
+from raztodo.infrastructure.sqlite.pool import DEFAULT_MAX_READERS
+
+logger = get_logger(__name__)
+
+# Integer PRAGMAs that can be overridden on top of the chosen profile
+PROFILE_OVERRIDES = {
+    "RAZTODO_DB_CACHE_SIZE": "cache_size",
+    "RAZTODO_DB_MMAP_SIZE": "mmap_size",
+    "RAZTODO_DB_BUSY_TIMEOUT": "busy_timeout",
+}
+
 
 def resolve_data_dir() -> Path:
     """
@@ -23,6 +42,20 @@ def resolve_data_dir() -> Path:
     return path
 
 
+def _int_env(name: str, default: int, minimum: int = 1) -> int:
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        number = minimum - 1
+    if number < minimum:
+        logger.warning("Invalid %s=%r, using %d", name, value, default)
+        return default
+    return number
+
+
 class Settings:
     """
     Lightweight environment-based settings holder.
@@ -30,6 +63,11 @@ class Settings:
 
     def __init__(self) -> None:
         self.db_name = os.getenv("RAZTODO_DB", "tasks.db")
+        self.db_profile = os.getenv("RAZTODO_DB_PROFILE", DEFAULT_PROFILE).strip().lower()
+        self.db_pool_size = _int_env("RAZTODO_DB_POOL_SIZE", DEFAULT_MAX_READERS)
+        # 0 disables the web server's task cache
+        self.cache_size = _int_env("RAZTODO_CACHE_SIZE", DEFAULT_CACHE_SIZE, minimum=0)
+        self.cache_ttl = _int_env("RAZTODO_CACHE_TTL", DEFAULT_CACHE_TTL)
 
     @property
     def data_dir(self) -> Path:
@@ -42,3 +80,25 @@ class Settings:
 
         path = Path(db_name)
         return path if path.is_absolute() else self.data_dir / path
+
+    def connection_profile(self) -> ConnectionProfile:
+        """
+        Resolve the SQLite connection profile from RAZTODO_DB_PROFILE and overrides.
+        """
+        profile = CONNECTION_PROFILES.get(self.db_profile)
+        if profile is None:
+            logger.warning(
+                "Unknown RAZTODO_DB_PROFILE=%r, using %r", self.db_profile, DEFAULT_PROFILE
+            )
+            profile = CONNECTION_PROFILES[DEFAULT_PROFILE]
+
+        overrides: dict[str, int] = {}
+        for env, field in PROFILE_OVERRIDES.items():
+            value = os.getenv(env)
+            if not value:
+                continue
+            try:
+                overrides[field] = int(value)
+            except ValueError:
+                logger.warning("Invalid %s=%r, ignoring", env, value)
+        return dataclasses.replace(profile, **overrides)
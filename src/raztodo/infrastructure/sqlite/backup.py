@@ -0,0 +1,132 @@
+import os
+import sqlite3
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+
+from raztodo.domain.exceptions import RazTodoException
+from raztodo.infrastructure.sqlite.task_schema import (
+    advance_change_counter,
+    ensure_schema,
+    read_change_counter,
+    read_changelog_seq,
+    reset_changelog,
+)
+
+# Pages copied per backup step; between steps other connections may write
+BACKUP_STEP_PAGES = 1024
+
+
+def database_file(conn: sqlite3.Connection) -> Path | None:
+    """Return the file behind the connection's main database, or None if in memory."""
+    for _, name, filename in conn.execute("PRAGMA database_list"):
+        if name == "main":
+            return Path(filename).resolve() if filename else None
+    return None
+
+
+def _copy(
+    source: sqlite3.Connection,
+    target: sqlite3.Connection,
+    pages: int,
+    progress: Callable[[int], None] | None,
+) -> int:
+    def report(status: int, remaining: int, total: int) -> None:
+        if progress:
+            progress(total - remaining)
+
+    source.backup(target, pages=pages, progress=report)
+    return target.execute("PRAGMA page_count").fetchone()[0]
+
+
+def backup_database(
+    conn: sqlite3.Connection,
+    dest: Path,
+    pages: int = BACKUP_STEP_PAGES,
+    progress: Callable[[int], None] | None = None,
+) -> int:
+    """
+    Copy the live database to dest with the SQLite online backup API.
+
+    The copy is written to a temporary file next to dest and renamed into
+    place once complete, so dest never holds a partial snapshot.
+
+    Returns:
+        The number of pages in the snapshot.
+    """
+    dest = dest.resolve()
+    if dest == database_file(conn):
+        raise RazTodoException(
+            f"FileOperationError: Cannot back up the database onto itself: {dest}"
+        )
+    dest.parent.mkdir(parents=True, exist_ok=True)
+
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{dest.name}.", suffix=".tmp", dir=dest.parent)
+    os.close(fd)
+    try:
+        target = sqlite3.connect(tmp_name)
+        try:
+            page_count = _copy(conn, target, pages, progress)
+            # The copy inherits WAL mode from a WAL source; keep it one file
+            target.execute("PRAGMA journal_mode = DELETE")
+        finally:
+            target.close()
+        os.replace(tmp_name, dest)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+    return page_count
+
+
+def restore_database(
+    conn: sqlite3.Connection,
+    source: Path,
+    pages: int = BACKUP_STEP_PAGES,
+    progress: Callable[[int], None] | None = None,
+) -> int:
+    """
+    Replace the live database with the snapshot at source.
+
+    The snapshot is opened read-only and checked before anything is copied:
+    it must pass PRAGMA quick_check and contain a tasks table.
+
+    Returns:
+        The number of pages restored.
+    """
+    source = source.resolve()
+    if not source.is_file():
+        raise RazTodoException(f"TaskFileNotFoundError: {source}")
+    if source == database_file(conn):
+        raise RazTodoException(
+            f"FileOperationError: Cannot restore the database onto itself: {source}"
+        )
+
+    snapshot = sqlite3.connect(f"{source.as_uri()}?mode=ro", uri=True)
+    try:
+        try:
+            check = snapshot.execute("PRAGMA quick_check").fetchone()[0]
+            has_tasks = snapshot.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'tasks'"
+            ).fetchone()
+        except sqlite3.DatabaseError as e:
+            raise RazTodoException(
+                f"InvalidFileFormatError: {source} is not a SQLite database: {e}"
+            ) from e
+        if check != "ok":
+            raise RazTodoException(
+                f"InvalidFileFormatError: {source} failed integrity check: {check}"
+            )
+        if not has_tasks:
+            raise RazTodoException(f"InvalidFileFormatError: {source} has no tasks table")
+        previous_counter = read_change_counter(conn)
+        previous_seq = read_changelog_seq(conn)
+        page_count = _copy(snapshot, conn, pages, progress)
+    finally:
+        snapshot.close()
+    # Older snapshots may lack newer tables, and neither the change counter nor
+    # the changelog may step back to a position clients already hold
+    ensure_schema(conn)
+    advance_change_counter(conn, previous_counter)
+    reset_changelog(conn, previous_seq)
+    return page_count
@@ -1,11 +1,68 @@
 import sqlite3
 from collections.abc import Callable
+from dataclasses import dataclass
 from pathlib import Path
 
 
+@dataclass(frozen=True)
+class ConnectionProfile:
+    """
+    PRAGMA settings applied to every new connection.
+
+    cache_size follows SQLite's convention: negative values are KiB,
+    positive values are pages.
+    """
+
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    cache_size: int = -16_000
+    mmap_size: int = 64 * 1024 * 1024
+    temp_store: str = "MEMORY"
+    busy_timeout: int = 5_000
+
+    def pragmas(self, in_memory: bool = False) -> list[tuple[str, str | int]]:
+        pragmas: list[tuple[str, str | int]] = [
+            # Set first so it also covers waiting for the WAL switch below
+            ("busy_timeout", self.busy_timeout),
+            ("synchronous", self.synchronous),
+            ("cache_size", self.cache_size),
+            ("temp_store", self.temp_store),
+        ]
+        if not in_memory:
+            # Neither applies to :memory:, which has no file to share or map
+            pragmas.insert(1, ("journal_mode", self.journal_mode))
+            pragmas.append(("mmap_size", self.mmap_size))
+        return pragmas
+
+
+CONNECTION_PROFILES: dict[str, ConnectionProfile] = {
+    # Every commit is fsynced, including the WAL itself
+    "durable": ConnectionProfile(synchronous="FULL", cache_size=-8_000, mmap_size=0),
+    # WAL with fsync at checkpoints only: a power loss may drop the last
+    # commits but never corrupts the database
+    "balanced": ConnectionProfile(),
+    # No fsync at all; for scratch databases and bulk imports
+    "fast": ConnectionProfile(synchronous="OFF", cache_size=-64_000, mmap_size=256 * 1024 * 1024),
+}
+"""Named connection profiles selectable with RAZTODO_DB_PROFILE."""
+
+DEFAULT_PROFILE = "balanced"
+
+
 def sqlite_connection_factory(
     db_path: Path | None,
+    profile: ConnectionProfile | None = None,
 ) -> Callable[[], sqlite3.Connection]:
+    """
+    Build a factory of connections to db_path tuned by the given profile.
+
+    WAL lets the web server and CLI invocations read while another process
+    writes, and busy_timeout makes writers wait for each other instead of
+    failing immediately with "database is locked".
+    """
+
+    profile = profile or CONNECTION_PROFILES[DEFAULT_PROFILE]
+    pragmas = profile.pragmas(in_memory=db_path is None)
 
     def factory() -> sqlite3.Connection:
         if db_path is None:
@@ -13,6 +70,8 @@ def sqlite_connection_factory(
         else:
             conn = sqlite3.connect(str(db_path), check_same_thread=False)
 
+        for name, value in pragmas:
+            conn.execute(f"PRAGMA {name} = {value}")
         conn.row_factory = sqlite3.Row
         return conn
 
@@ -0,0 +1,153 @@
+import asyncio
+import threading
+import weakref
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager
+from sqlite3 import Connection
+from typing import Any, TypeVar
+
+from raztodo.domain.task_repository import TaskRepository
+from raztodo.infrastructure.cached_task_repository import CachedTaskRepository, TaskCache
+from raztodo.infrastructure.sqlite.pool import ConnectionPool
+from raztodo.infrastructure.sqlite.task_repository import SQLiteTaskRepository
+
+T = TypeVar("T")
+
+_DONE = object()
+
+
+class DatabaseExecutor:
+    """
+    Runs repository calls for asyncio code on dedicated database threads.
+
+    Each call leases a pooled connection (a reader, or the writer when
+    write=True) for its duration only, so awaiting callers hold neither a
+    thread nor a connection. Callers queue for a connection on the event
+    loop rather than in a thread, so a thread is only taken once a lease is
+    free; one thread per pooled connection is then always enough.
+
+    Given a TaskCache, every repository reads through it, so all pooled
+    connections share one cache.
+    """
+
+    def __init__(self, pool: ConnectionPool, cache: TaskCache | None = None) -> None:
+        self._pool = pool
+        self._cache = cache
+        self._executor = ThreadPoolExecutor(
+            max_workers=pool.max_readers + 1, thread_name_prefix="raztodo-db"
+        )
+        # asyncio primitives belong to one event loop: (readers, writer) per loop
+        self._gates: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, tuple[asyncio.Semaphore, asyncio.Semaphore]
+        ] = weakref.WeakKeyDictionary()
+        # One repository per pooled connection, built on first use
+        self._repos: dict[Connection, TaskRepository] = {}
+        self._repos_lock = threading.Lock()
+
+    @property
+    def cache(self) -> TaskCache | None:
+        return self._cache
+
+    def _gate(self, write: bool) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        gates = self._gates.get(loop)
+        if gates is None:
+            gates = self._gates[loop] = (
+                asyncio.Semaphore(self._pool.max_readers),
+                asyncio.Semaphore(1),
+            )
+        return gates[1] if write else gates[0]
+
+    def _lease(self, write: bool) -> AbstractContextManager[Connection]:
+        return self._pool.writer() if write else self._pool.reader()
+
+    def _repository(self, conn: Connection) -> TaskRepository:
+        with self._repos_lock:
+            repo = self._repos.get(conn)
+            if repo is None:
+                repo = SQLiteTaskRepository(connection_factory=lambda: conn)
+                if self._cache is not None:
+                    repo = CachedTaskRepository(repo, self._cache)
+                self._repos[conn] = repo
+            return repo
+
+    def _call(self, fn: Callable[[TaskRepository], T], write: bool) -> T:
+        with self._lease(write) as conn:
+            return fn(self._repository(conn))
+
+    async def _submit(self, fn: Callable[..., T], *args: Any) -> T:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+
+    async def run(self, fn: Callable[[TaskRepository], T], write: bool = False) -> T:
+        """Call fn with a repository on a leased connection and return its result."""
+        async with self._gate(write):
+            return await self._submit(self._call, fn, write)
+
+    async def iterate(
+        self, fn: Callable[[TaskRepository], Iterable[T]], write: bool = False
+    ) -> AsyncIterator[T]:
+        """
+        Iterate what fn returns, pulling each item on a database thread.
+
+        The connection stays leased until the iteration ends or the async
+        iterator is closed, so cursors opened by fn remain valid.
+        """
+        loop = asyncio.get_running_loop()
+        async with self._gate(write):
+            # Never awaited unshielded or in `finally`: a cancelled request must
+            # still hand its lease back, so release is chained to the future
+            pending: asyncio.Future = loop.run_in_executor(self._executor, self._open, fn, write)
+            try:
+                lease, iterator = await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                pending.add_done_callback(self._close_opened)
+                raise
+            try:
+                while True:
+                    pending = loop.run_in_executor(self._executor, next, iterator, _DONE)
+                    item = await pending
+                    if item is _DONE:
+                        break
+                    yield item
+            finally:
+                self._close_after(pending, lease, iterator)
+
+    def _open(
+        self, fn: Callable[[TaskRepository], Iterable[T]], write: bool
+    ) -> tuple[AbstractContextManager[Connection], Iterator[T]]:
+        lease = self._lease(write)
+        conn = lease.__enter__()
+        try:
+            return lease, iter(fn(self._repository(conn)))
+        except BaseException:
+            lease.__exit__(None, None, None)
+            raise
+
+    @staticmethod
+    def _close(lease: AbstractContextManager[Connection], iterator: Iterator[Any]) -> None:
+        try:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+        finally:
+            lease.__exit__(None, None, None)
+
+    def _close_after(
+        self,
+        pending: asyncio.Future,
+        lease: AbstractContextManager[Connection],
+        iterator: Iterator[Any],
+    ) -> None:
+        # Wait for a next() still running in its thread before closing
+        if pending.done():
+            self._executor.submit(self._close, lease, iterator)
+        else:
+            pending.add_done_callback(lambda _: self._executor.submit(self._close, lease, iterator))
+
+    def _close_opened(self, opening: asyncio.Future) -> None:
+        if not opening.cancelled() and opening.exception() is None:
+            self._executor.submit(self._close, *opening.result())
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
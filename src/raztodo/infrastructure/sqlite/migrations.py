@@ -1,5 +1,16 @@
 from sqlite3 import Connection
 
+from raztodo.infrastructure.sqlite.task_mapper import decode_tags
+from raztodo.infrastructure.sqlite.task_schema import (
+    CREATE_FTS_TABLE,
+    CREATE_INDEX_TASK_TAGS_TAG,
+    CREATE_TABLE_TASK_TAGS,
+    FTS_TRIGGERS,
+    OPTIMIZE_FTS,
+    REBUILD_FTS,
+    fts_drift,
+)
+
 
 def deduplicate_titles(conn: Connection) -> int:
     updated: int = 0
@@ -42,6 +53,45 @@ def deduplicate_titles(conn: Connection) -> int:
     return updated
 
 
+def backfill_task_tags(conn: Connection) -> int:
+    """Rebuild task_tags from tasks.tags and return the number of tag rows written."""
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(tasks)")}
+    with conn:
+        conn.execute(CREATE_TABLE_TASK_TAGS)
+        conn.execute(CREATE_INDEX_TASK_TAGS_TAG)
+        conn.execute("DELETE FROM task_tags")
+        if "tags" not in columns:
+            return 0
+
+        rows = conn.execute("SELECT id, tags FROM tasks WHERE tags IS NOT NULL AND tags != ''")
+        pairs = [
+            (task_id, tag.strip())
+            for task_id, tags in rows
+            for tag in decode_tags(tags)
+            if isinstance(tag, str) and tag.strip()
+        ]
+        conn.executemany("INSERT OR IGNORE INTO task_tags (task_id, tag) VALUES (?, ?)", pairs)
+    return conn.execute("SELECT COUNT(*) FROM task_tags").fetchone()[0]
+
+
+def rebuild_fts(conn: Connection) -> int:
+    """Rebuild and optimize tasks_fts from tasks and return the number of indexed rows."""
+    with conn:
+        conn.execute(CREATE_FTS_TABLE)
+        for trigger_sql in FTS_TRIGGERS.values():
+            conn.execute(trigger_sql)
+        conn.execute(REBUILD_FTS)
+        conn.execute(OPTIMIZE_FTS)
+    return conn.execute("SELECT COUNT(*) FROM tasks_fts_docsize").fetchone()[0]
+
+
+def check_fts(conn: Connection) -> int:
+    """Return how many tasks are missing from tasks_fts; see task_schema.fts_drift."""
+    with conn:
+        conn.execute(CREATE_FTS_TABLE)
+    return fts_drift(conn)
+
+
 def create_unique_title_index(conn: Connection) -> None:
     conn.execute("""
         CREATE UNIQUE INDEX IF NOT EXISTS idx_tasks_title_unique
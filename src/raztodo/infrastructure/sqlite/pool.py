@@ -0,0 +1,124 @@
+import sqlite3
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
+from raztodo.domain.exceptions import RazTodoException
+from raztodo.infrastructure.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_READERS = 8
+DEFAULT_POOL_TIMEOUT = 30.0
+
+
+class ConnectionPool:
+    """
+    A bounded set of read-only connections plus one writer connection.
+
+    Readers are opened lazily up to max_readers and handed out one per
+    caller, so concurrent reads run on separate connections; under WAL they
+    never wait for the writer. All writes share a single connection guarded
+    by a lock, mirroring SQLite's one-writer-at-a-time rule without
+    busy-waiting on the file lock.
+
+    The pool needs a file database: every :memory: connection is a separate,
+    empty database.
+    """
+
+    def __init__(
+        self,
+        connection_factory: Callable[[], sqlite3.Connection],
+        max_readers: int = DEFAULT_MAX_READERS,
+        timeout: float = DEFAULT_POOL_TIMEOUT,
+    ) -> None:
+        if max_readers < 1:
+            raise ValueError("max_readers must be at least 1")
+        self._connection_factory = connection_factory
+        self._max_readers = max_readers
+        self._timeout = timeout
+        self._idle: list[sqlite3.Connection] = []
+        self._opened = 0
+        self._available = threading.Condition(threading.Lock())
+        self._writer: sqlite3.Connection | None = None
+        self._writer_lock = threading.Lock()
+        self._closed = False
+
+    @property
+    def max_readers(self) -> int:
+        return self._max_readers
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """Lease a read-only connection, waiting up to timeout for a free one."""
+        conn = self._acquire_reader()
+        try:
+            yield conn
+        finally:
+            self._release_reader(conn)
+
+    @contextmanager
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        """Lease the writer connection, waiting up to timeout for other writers."""
+        if not self._writer_lock.acquire(timeout=self._timeout):
+            raise RazTodoException("DatabaseError: Timed out waiting for the database writer")
+        try:
+            if self._closed:
+                raise RazTodoException("DatabaseError: Connection pool is closed")
+            if self._writer is None:
+                self._writer = self._connection_factory()
+            yield self._writer
+        finally:
+            if self._writer is not None and self._writer.in_transaction:
+                # Never hand the next caller a transaction left open by this one
+                self._writer.rollback()
+            self._writer_lock.release()
+
+    def _acquire_reader(self) -> sqlite3.Connection:
+        with self._available:
+            ready = self._available.wait_for(
+                lambda: self._closed or self._idle or self._opened < self._max_readers,
+                timeout=self._timeout,
+            )
+            if self._closed:
+                raise RazTodoException("DatabaseError: Connection pool is closed")
+            if not ready:
+                raise RazTodoException("DatabaseError: Timed out waiting for a database reader")
+            if self._idle:
+                return self._idle.pop()
+            self._opened += 1
+
+        try:
+            conn = self._connection_factory()
+            conn.execute("PRAGMA query_only = ON")
+        except BaseException:
+            with self._available:
+                self._opened -= 1
+                self._available.notify()
+            raise
+        logger.debug("Opened pooled reader connection %d/%d", self._opened, self._max_readers)
+        return conn
+
+    def _release_reader(self, conn: sqlite3.Connection) -> None:
+        if conn.in_transaction:
+            conn.rollback()
+        with self._available:
+            if self._closed:
+                self._opened -= 1
+                conn.close()
+            else:
+                self._idle.append(conn)
+            self._available.notify()
+
+    def close(self) -> None:
+        """Close idle connections now and leased ones as they are returned."""
+        with self._available:
+            self._closed = True
+            while self._idle:
+                self._idle.pop().close()
+                self._opened -= 1
+            self._available.notify_all()
+        with self._writer_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
@@ -1,16 +1,121 @@
 import json
-from collections.abc import Callable
-from sqlite3 import Connection, Row
-from typing import Any
+from collections.abc import Callable, Iterable, Iterator
+from itertools import islice
+from sqlite3 import Connection, Error, OperationalError, Row
+from sqlite3 import Cursor as SQLiteCursor
+from typing import Any, cast
 
-from raztodo.infrastructure.sqlite.task_schema import ensure_schema
+from raztodo.domain.pagination import Cursor
+from raztodo.domain.search import (
+    DEFAULT_DESCRIPTION_WEIGHT,
+    DEFAULT_TITLE_WEIGHT,
+    MATCH_END,
+    MATCH_START,
+)
+from raztodo.infrastructure.sqlite.task_schema import (
+    BACKFILL_TASK_TAGS_AFTER_ID,
+    PRIORITY_RANK_SQL,
+    ensure_schema,
+    read_change_counter,
+    read_changelog_seq,
+)
+
+# ORDER BY expression for each sort field; must match the sort indexes in task_schema
+SORT_EXPRESSIONS: dict[str, str] = {
+    "id": "id",
+    "title": "title COLLATE NOCASE",
+    "created_at": "created_at",
+    "done": "done",
+    "priority": PRIORITY_RANK_SQL,
+    "due_date": "due_date",
+}
+NULLABLE_SORT_FIELDS = {"due_date"}
+
+TASK_COLUMNS = "id, title, description, done, created_at, priority, due_date, tags, project"
+
+# Builds a task row from the TASK_COLUMNS tuple, as a sqlite3 row_factory
+TaskRowFactory = Callable[[SQLiteCursor, tuple[Any, ...]], Any]
+
+# A row of TASK_COLUMNS: a sqlite3.Row, or whatever the DAO's task_factory builds
+TaskRow = Any
+
+# Ids bound per IN (...) list, well under SQLite's host-parameter limit
+IDS_PER_STATEMENT = 500
+
+# Rows per executemany batch in insert_many
+INSERT_BATCH_SIZE = 1000
+
+# Rows per fetchmany call when streaming a result set
+FETCH_BATCH_SIZE = 1000
+
+# (title, description, priority, due_date, tags, project, done)
+NewTaskRow = tuple[str, str, str, str | None, list[str] | None, str | None, bool]
+
+# As NewTaskRow, but done is None when the stored value should be kept
+UpsertTaskRow = tuple[str, str, str, str | None, list[str] | None, str | None, bool | None]
+
+# An empty due_date is stored as NULL, as every write path does: sorts and
+# keyset cursors treat a missing due date as NULL (see ensure_schema)
+INSERT_TASK = (
+    "INSERT INTO tasks (title, description, priority, due_date, tags, project, done) "
+    "VALUES (?, ?, ?, NULLIF(?, ''), ?, ?, ?)"
+)
+
+# Insert, or update the task with the same title (idx_tasks_title_unique). Empty
+# or missing fields keep the stored value; an empty due_date/project clears it,
+# so both branches store an empty due_date as NULL.
+UPSERT_TASK = """
+INSERT INTO tasks (title, description, priority, due_date, tags, project, done)
+VALUES (
+    :title, :description, :priority, NULLIF(:due_date, ''), :tags, :project, COALESCE(:done, 0)
+)
+ON CONFLICT(title) DO UPDATE SET
+    description = excluded.description,
+    priority = CASE WHEN excluded.priority != '' THEN excluded.priority ELSE priority END,
+    due_date = CASE WHEN :due_date IS NULL THEN due_date ELSE NULLIF(:due_date, '') END,
+    tags = CASE WHEN excluded.tags != '' THEN excluded.tags ELSE tags END,
+    project = CASE WHEN :project IS NULL THEN project ELSE NULLIF(:project, '') END,
+    done = COALESCE(:done, done)
+"""
+
+# Re-index the tags of the tasks whose titles are in a JSON array parameter
+DELETE_TAGS_BY_TITLE = (
+    "DELETE FROM task_tags WHERE task_id IN "
+    "(SELECT id FROM tasks WHERE title IN (SELECT value FROM json_each(?)))"
+)
+BACKFILL_TASK_TAGS_BY_TITLE = """
+INSERT OR IGNORE INTO task_tags (task_id, tag)
+SELECT t.id, trim(j.value)
+FROM tasks t, json_each(t.tags) j
+WHERE t.title IN (SELECT value FROM json_each(?))
+  AND json_valid(t.tags) AND json_type(t.tags) = 'array'
+  AND j.type = 'text' AND trim(j.value) != ''
+"""
+
+SNIPPET_TOKENS = 16
 
 
 class TaskDAO:
-    def __init__(self, conn: Connection):
+    """
+    SQL for the tasks table.
+
+    Queries that select TASK_COLUMNS build their rows with task_factory when
+    one is given, e.g. task_mapper.task_row_factory to get TaskEntity
+    objects without an intermediate sqlite3.Row; otherwise they return the
+    connection's rows. Other queries always return the connection's rows.
+    """
+
+    def __init__(self, conn: Connection, task_factory: TaskRowFactory | None = None):
         self._conn = conn
+        self._task_factory = task_factory
         ensure_schema(self._conn)
 
+    def _task_cursor(self) -> SQLiteCursor:
+        cur = self._conn.cursor()
+        if self._task_factory is not None:
+            cur.row_factory = self._task_factory
+        return cur
+
     def insert(
         self,
         title: str,
@@ -20,14 +125,177 @@ class TaskDAO:
         tags: list[str] | None = None,
         project: str | None = None,
     ) -> int:
+        row = self._insert(
+            self._conn.cursor(), title, description, priority, due_date, tags, project
+        )
+        return row[0] if row else 0
+
+    def insert_returning(
+        self,
+        title: str,
+        description: str = "",
+        priority: str = "",
+        due_date: str | None = None,
+        tags: list[str] | None = None,
+        project: str | None = None,
+    ) -> TaskRow | None:
+        return self._insert(
+            self._task_cursor(), title, description, priority, due_date, tags, project
+        )
+
+    def _insert(
+        self,
+        cur: SQLiteCursor,
+        title: str,
+        description: str,
+        priority: str,
+        due_date: str | None,
+        tags: list[str] | None,
+        project: str | None,
+    ) -> Any:
+        # RETURNING hands back the stored row, defaults included, without a re-read
         tags_str = json.dumps(tags) if tags else ""
         with self._conn:
-            cur = self._conn.execute(
+            rows = cur.execute(
                 "INSERT INTO tasks (title, description, priority, due_date, tags, project) "
-                "VALUES (?, ?, ?, ?, ?, ?)",
+                f"VALUES (?, ?, ?, NULLIF(?, ''), ?, ?) RETURNING {TASK_COLUMNS}",
                 (title, description, priority, due_date, tags_str, project),
+            ).fetchall()
+            if rows and tags:
+                self._write_tags(cast(int, cur.lastrowid), tags)
+            return rows[0] if rows else None
+
+    def insert_many(
+        self, rows: Iterable[NewTaskRow], batch_size: int = INSERT_BATCH_SIZE
+    ) -> tuple[int, list[tuple[int, str]]]:
+        """
+        Insert already-validated rows in one transaction.
+
+        Each batch goes through a single executemany under its own savepoint. If
+        any row in it is rejected, the batch is rolled back and replayed row by
+        row so that only the offending rows are dropped.
+
+        Returns:
+            The number of inserted rows and a list of (position, error) pairs
+            for the rejected rows, positions counting from 0 in `rows`.
+        """
+        inserted = 0
+        failures: list[tuple[int, str]] = []
+        iterator = iter(rows)
+        position = 0
+        with self._conn:
+            if not self._conn.in_transaction:
+                self._conn.execute("BEGIN")
+            while batch := list(islice(iterator, batch_size)):
+                params = [
+                    (title, desc, prio, due, json.dumps(tags) if tags else "", proj, int(done))
+                    for title, desc, prio, due, tags, proj, done in batch
+                ]
+                last_id = self._conn.execute("SELECT COALESCE(MAX(id), 0) FROM tasks").fetchone()[0]
+                self._conn.execute("SAVEPOINT insert_batch")
+                try:
+                    self._conn.executemany(INSERT_TASK, params)
+                    inserted += len(params)
+                except Error:
+                    self._conn.execute("ROLLBACK TO insert_batch")
+                    for offset, row in enumerate(params):
+                        self._conn.execute("SAVEPOINT insert_row")
+                        try:
+                            self._conn.execute(INSERT_TASK, row)
+                            inserted += 1
+                        except Error as e:
+                            self._conn.execute("ROLLBACK TO insert_row")
+                            failures.append((position + offset, str(e)))
+                        self._conn.execute("RELEASE insert_row")
+                self._conn.execute("RELEASE insert_batch")
+                # New rows are exactly those above the previous max id; index
+                # their tags set-based instead of one _write_tags per row.
+                self._conn.execute(BACKFILL_TASK_TAGS_AFTER_ID, (last_id,))
+                position += len(batch)
+        return inserted, failures
+
+    def upsert_many(
+        self, rows: Iterable[UpsertTaskRow], batch_size: int = INSERT_BATCH_SIZE
+    ) -> tuple[int, int, list[tuple[int, str]]]:
+        """
+        Insert rows, or update the existing task with the same title, in one
+        transaction.
+
+        Each batch is a single executemany of UPSERT_TASK under its own
+        savepoint. If any row in it is rejected, the batch is rolled back and
+        replayed row by row so that only the offending rows are dropped; an
+        OperationalError (e.g. a missing title index) aborts the whole call.
+        The rowcount covers both inserted and updated rows; ids are
+        AUTOINCREMENT, so the inserted ones are exactly those above the max id
+        seen before the batch.
+
+        Returns:
+            The number of inserted and updated rows, and a list of
+            (position, error) pairs for the rejected rows, positions counting
+            from 0 in `rows`.
+        """
+        inserted = updated = 0
+        failures: list[tuple[int, str]] = []
+        iterator = iter(rows)
+        position = 0
+        with self._conn:
+            if not self._conn.in_transaction:
+                self._conn.execute("BEGIN")
+            while batch := list(islice(iterator, batch_size)):
+                params = [
+                    {
+                        "title": title,
+                        "description": desc,
+                        "priority": prio,
+                        "due_date": due,
+                        "tags": json.dumps(tags) if tags else "",
+                        "project": proj,
+                        "done": None if done is None else int(done),
+                    }
+                    for title, desc, prio, due, tags, proj, done in batch
+                ]
+                last_id = self._conn.execute("SELECT COALESCE(MAX(id), 0) FROM tasks").fetchone()[0]
+                self._conn.execute("SAVEPOINT upsert_batch")
+                try:
+                    changed = self._conn.executemany(UPSERT_TASK, params).rowcount
+                except OperationalError:
+                    raise
+                except Error:
+                    self._conn.execute("ROLLBACK TO upsert_batch")
+                    changed = 0
+                    for offset, row in enumerate(params):
+                        self._conn.execute("SAVEPOINT upsert_row")
+                        try:
+                            changed += self._conn.execute(UPSERT_TASK, row).rowcount
+                        except OperationalError:
+                            raise
+                        except Error as e:
+                            self._conn.execute("ROLLBACK TO upsert_row")
+                            failures.append((position + offset, str(e)))
+                        self._conn.execute("RELEASE upsert_row")
+                self._conn.execute("RELEASE upsert_batch")
+                added = self._conn.execute(
+                    "SELECT COUNT(*) FROM tasks WHERE id > ?", (last_id,)
+                ).fetchone()[0]
+                inserted += added
+                updated += changed - added
+
+                # Rows without tags keep their stored ones, so only re-index
+                # the titles that came with tags.
+                tagged = json.dumps([p["title"] for p in params if p["tags"]])
+                self._conn.execute(DELETE_TAGS_BY_TITLE, (tagged,))
+                self._conn.execute(BACKFILL_TASK_TAGS_BY_TITLE, (tagged,))
+                position += len(batch)
+        return inserted, updated, failures
+
+    def _write_tags(self, task_id: int, tags: list[str] | None) -> None:
+        # Mirror tasks.tags into task_tags; callers hold the write transaction
+        self._conn.execute("DELETE FROM task_tags WHERE task_id = ?", (task_id,))
+        if tags:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO task_tags (task_id, tag) VALUES (?, ?)",
+                [(task_id, tag) for tag in tags],
             )
-            return cur.lastrowid or 0
 
     def _add_filter(
         self,
@@ -42,11 +310,84 @@ class TaskDAO:
             params.append(transform(value))
 
     def _add_tags_filter(
-        self, query_parts: list[str], params: list[Any], tags: list[str] | None
+        self,
+        query_parts: list[str],
+        params: list[Any],
+        tags: list[str] | None,
+        all_tags: bool = False,
+        id_column: str = "id",
     ) -> None:
-        if tags:
-            query_parts.append("(" + " OR ".join("tags LIKE ?" for _ in tags) + ")")
-            params.extend(f'%"{tag}"%' for tag in tags)
+        # Each lookup is a seek on idx_task_tags_tag(tag, task_id): ANY is one
+        # IN list, ALL intersects the per-tag task id sets.
+        if not tags:
+            return
+        if all_tags:
+            subquery = " INTERSECT ".join(
+                "SELECT task_id FROM task_tags WHERE tag = ?" for _ in tags
+            )
+        else:
+            placeholders = ", ".join("?" for _ in tags)
+            subquery = f"SELECT task_id FROM task_tags WHERE tag IN ({placeholders})"
+        query_parts.append(f"{id_column} IN ({subquery})")
+        params.extend(tags)
+
+    def _add_task_filters(
+        self,
+        query_parts: list[str],
+        params: list[Any],
+        priority: str | None = None,
+        project: str | None = None,
+        done: bool | None = None,
+        tags: list[str] | None = None,
+        all_tags: bool = False,
+        due_before: str | None = None,
+        due_after: str | None = None,
+        table: str = "",
+    ) -> None:
+        # `table` qualifies columns ("t.") in queries that join tasks_fts
+        self._add_filter(query_parts, params, f"{table}priority", priority)
+        self._add_filter(query_parts, params, f"{table}project", project)
+        self._add_filter(query_parts, params, f"{table}done", done, lambda x: 1 if x else 0)
+        if due_before:
+            query_parts.append(f"{table}due_date IS NOT NULL AND {table}due_date <= ?")
+            params.append(due_before)
+        if due_after:
+            query_parts.append(f"{table}due_date IS NOT NULL AND {table}due_date >= ?")
+            params.append(due_after)
+        self._add_tags_filter(query_parts, params, tags, all_tags, id_column=f"{table}id")
+
+    def _add_keyset_filter(
+        self,
+        query_parts: list[str],
+        params: list[Any],
+        after: Cursor,
+        order_by: str,
+        descending: bool,
+    ) -> None:
+        # Seek past the previous page through the sort index instead of scanning
+        # and discarding OFFSET rows. The leading single-column bound lets SQLite
+        # range-scan expression and collated indexes; the row value breaks ties.
+        if order_by == "id":
+            query_parts.append("id < ?" if descending else "id > ?")
+            params.append(after.id)
+            return
+
+        expr = SORT_EXPRESSIONS[order_by]
+        if after.key is None:
+            # NULL keys sort first ascending and last descending
+            if descending:
+                query_parts.append(f"({expr} IS NULL AND id < ?)")
+            else:
+                query_parts.append(f"(({expr} IS NULL AND id > ?) OR {expr} IS NOT NULL)")
+            params.append(after.id)
+            return
+
+        op, bound = ("<", "<=") if descending else (">", ">=")
+        seek = f"{expr} {bound} ? AND ({expr}, id) {op} (?, ?)"
+        if descending and order_by in NULLABLE_SORT_FIELDS:
+            seek = f"({seek} OR {expr} IS NULL)"
+        query_parts.append(seek)
+        params.extend([after.key, after.key, after.id])
 
     def fetch_all(
         self,
@@ -58,24 +399,136 @@ class TaskDAO:
         tags: list[str] | None = None,
         due_before: str | None = None,
         due_after: str | None = None,
-    ) -> list[Row]:
-        query_parts = [
-            "SELECT id, title, description, done, created_at, priority, due_date, tags, project FROM tasks WHERE 1=1"
-        ]
+        all_tags: bool = False,
+        after: Cursor | None = None,
+        order_by: str = "id",
+        descending: bool = False,
+    ) -> list[TaskRow]:
+        query, params = self._list_query(
+            limit,
+            offset,
+            priority,
+            project,
+            done,
+            tags,
+            due_before,
+            due_after,
+            all_tags,
+            after,
+            order_by,
+            descending,
+        )
+        return self._task_cursor().execute(query, params).fetchall()
+
+    def iter_rows(
+        self,
+        limit: int | None = None,
+        offset: int | None = None,
+        priority: str | None = None,
+        project: str | None = None,
+        done: bool | None = None,
+        tags: list[str] | None = None,
+        due_before: str | None = None,
+        due_after: str | None = None,
+        all_tags: bool = False,
+        after: Cursor | None = None,
+        order_by: str = "id",
+        descending: bool = False,
+        batch_size: int = FETCH_BATCH_SIZE,
+    ) -> Iterator[tuple[Any, ...]]:
+        """As fetch_all, as plain TASK_COLUMNS tuples read in fetchmany chunks."""
+        query, params = self._list_query(
+            limit,
+            offset,
+            priority,
+            project,
+            done,
+            tags,
+            due_before,
+            due_after,
+            all_tags,
+            after,
+            order_by,
+            descending,
+        )
+        cur = self._conn.cursor()
+        cur.row_factory = None
+        yield from self._drain(cur.execute(query, params), batch_size)
+
+    def iter_tasks(
+        self,
+        limit: int | None = None,
+        offset: int | None = None,
+        priority: str | None = None,
+        project: str | None = None,
+        done: bool | None = None,
+        tags: list[str] | None = None,
+        due_before: str | None = None,
+        due_after: str | None = None,
+        all_tags: bool = False,
+        after: Cursor | None = None,
+        order_by: str = "id",
+        descending: bool = False,
+        batch_size: int = FETCH_BATCH_SIZE,
+    ) -> Iterator[TaskRow]:
+        """As fetch_all, read lazily in fetchmany chunks."""
+        query, params = self._list_query(
+            limit,
+            offset,
+            priority,
+            project,
+            done,
+            tags,
+            due_before,
+            due_after,
+            all_tags,
+            after,
+            order_by,
+            descending,
+        )
+        yield from self._drain(self._task_cursor().execute(query, params), batch_size)
+
+    def _list_query(
+        self,
+        limit: int | None,
+        offset: int | None,
+        priority: str | None,
+        project: str | None,
+        done: bool | None,
+        tags: list[str] | None,
+        due_before: str | None,
+        due_after: str | None,
+        all_tags: bool,
+        after: Cursor | None,
+        order_by: str,
+        descending: bool,
+    ) -> tuple[str, list[Any]]:
+        if order_by not in SORT_EXPRESSIONS:
+            raise ValueError(f"Unsupported sort field: {order_by!r}")
+
+        query_parts = [f"SELECT {TASK_COLUMNS} FROM tasks WHERE 1=1"]
         params: list[Any] = []
 
-        self._add_filter(query_parts, params, "priority", priority)
-        self._add_filter(query_parts, params, "project", project)
-        self._add_filter(query_parts, params, "done", done, lambda x: 1 if x else 0)
-        if due_before:
-            query_parts.append("due_date IS NOT NULL AND due_date <= ?")
-            params.append(due_before)
-        if due_after:
-            query_parts.append("due_date IS NOT NULL AND due_date >= ?")
-            params.append(due_after)
-        self._add_tags_filter(query_parts, params, tags)
+        self._add_task_filters(
+            query_parts,
+            params,
+            priority=priority,
+            project=project,
+            done=done,
+            tags=tags,
+            all_tags=all_tags,
+            due_before=due_before,
+            due_after=due_after,
+        )
+        if after is not None:
+            self._add_keyset_filter(query_parts, params, after, order_by, descending)
 
-        query = " AND ".join(query_parts) + " ORDER BY id"
+        direction = "DESC" if descending else "ASC"
+        query = " AND ".join(query_parts)
+        if order_by == "id":
+            query += f" ORDER BY id {direction}"
+        else:
+            query += f" ORDER BY {SORT_EXPRESSIONS[order_by]} {direction}, id {direction}"
 
         if limit is not None and offset is not None:
             query += " LIMIT ? OFFSET ?"
@@ -86,21 +539,45 @@ class TaskDAO:
         elif offset is not None:
             query += " LIMIT -1 OFFSET ?"
             params.append(offset)
+        return query, params
 
-        cur = self._conn.execute(query, params)
-        return cur.fetchall()
+    def iter_all(self, batch_size: int = FETCH_BATCH_SIZE) -> Iterator[TaskRow]:
+        cur = self._task_cursor().execute(f"SELECT {TASK_COLUMNS} FROM tasks ORDER BY id")
+        yield from self._drain(cur, batch_size)
 
-    def fetch_by_id(self, task_id: int) -> Row | None:
-        cur = self._conn.execute(
-            "SELECT id, title, description, done, created_at, priority, due_date, tags, project "
-            "FROM tasks WHERE id = ?",
-            (task_id,),
+    @staticmethod
+    def _drain(cur: SQLiteCursor, batch_size: int) -> Iterator[Any]:
+        # A dedicated cursor drained in fetchmany chunks, so memory is bounded
+        # by the batch size rather than the table size.
+        try:
+            while rows := cur.fetchmany(batch_size):
+                yield from rows
+        finally:
+            cur.close()
+
+    def fetch_by_id(self, task_id: int) -> TaskRow | None:
+        cur = self._task_cursor().execute(
+            f"SELECT {TASK_COLUMNS} FROM tasks WHERE id = ?", (task_id,)
         )
         return cur.fetchone()
 
-    def update(
-        self,
-        task_id: int,
+    def change_counter(self) -> int:
+        return read_change_counter(self._conn)
+
+    def fetch_changes(self, since: int, limit: int) -> list[Row]:
+        cur = self._conn.execute(
+            "SELECT seq, task_id, op FROM tasks_changelog WHERE seq > ? ORDER BY seq LIMIT ?",
+            (since, limit),
+        )
+        return cur.fetchall()
+
+    def changelog_bounds(self) -> tuple[int | None, int]:
+        """Return the oldest kept changelog position (None if empty) and the latest."""
+        oldest = self._conn.execute("SELECT MIN(seq) FROM tasks_changelog").fetchone()[0]
+        return oldest, read_changelog_seq(self._conn)
+
+    @staticmethod
+    def _update_assignments(
         title: str | None = None,
         description: str | None = None,
         done: bool | None = None,
@@ -108,7 +585,7 @@ class TaskDAO:
         due_date: str | None = None,
         tags: list[str] | None = None,
         project: str | None = None,
-    ) -> int:
+    ) -> tuple[list[str], list[Any]]:
         updates: list[str] = []
         params: list[Any] = []
 
@@ -130,7 +607,7 @@ class TaskDAO:
         add_update("description", description)
         add_update("done", done, transform=lambda x: 1 if x else 0)
         add_update("priority", priority)
-        add_update("due_date", due_date)
+        add_update("due_date", due_date, transform=lambda x: x or None)
         if tags is not None:
             if tags:
                 updates.append("tags = ?")
@@ -138,81 +615,280 @@ class TaskDAO:
             else:
                 updates.append("tags = NULL")
         add_update("project", project)
+        return updates, params
 
+    def update(
+        self,
+        task_id: int,
+        title: str | None = None,
+        description: str | None = None,
+        done: bool | None = None,
+        priority: str | None = None,
+        due_date: str | None = None,
+        tags: list[str] | None = None,
+        project: str | None = None,
+    ) -> int:
+        updates, params = self._update_assignments(
+            title, description, done, priority, due_date, tags, project
+        )
         if not updates:
             return 0
 
         params.append(task_id)
         with self._conn:
             cur = self._conn.execute(f"UPDATE tasks SET {', '.join(updates)} WHERE id = ?", params)
+            if tags is not None and cur.rowcount:
+                self._write_tags(task_id, tags)
             return cur.rowcount
 
+    def update_returning(
+        self,
+        task_id: int,
+        title: str | None = None,
+        description: str | None = None,
+        done: bool | None = None,
+        priority: str | None = None,
+        due_date: str | None = None,
+        tags: list[str] | None = None,
+        project: str | None = None,
+    ) -> TaskRow | None:
+        """Apply an update and return the fresh row, or None if nothing matched."""
+        updates, params = self._update_assignments(
+            title, description, done, priority, due_date, tags, project
+        )
+        if not updates:
+            return None
+
+        params.append(task_id)
+        with self._conn:
+            rows = (
+                self._task_cursor()
+                .execute(
+                    f"UPDATE tasks SET {', '.join(updates)} WHERE id = ? RETURNING {TASK_COLUMNS}",
+                    params,
+                )
+                .fetchall()
+            )
+            if tags is not None and rows:
+                self._write_tags(task_id, tags)
+            return rows[0] if rows else None
+
+    def toggle_done(self, task_id: int) -> TaskRow | None:
+        # Flip in SQL so concurrent toggles serialize on the write lock
+        with self._conn:
+            rows = (
+                self._task_cursor()
+                .execute(
+                    f"UPDATE tasks SET done = 1 - done WHERE id = ? RETURNING {TASK_COLUMNS}",
+                    (task_id,),
+                )
+                .fetchall()
+            )
+            return rows[0] if rows else None
+
+    def mark_done_many(self, task_ids: list[int], done: bool = True) -> list[int]:
+        """Set done on every given task in one transaction; returns the ids that matched."""
+        updated: list[int] = []
+        with self._conn:
+            for start in range(0, len(task_ids), IDS_PER_STATEMENT):
+                chunk = task_ids[start : start + IDS_PER_STATEMENT]
+                placeholders = ", ".join("?" for _ in chunk)
+                cur = self._conn.execute(
+                    f"UPDATE tasks SET done = ? WHERE id IN ({placeholders}) RETURNING id",
+                    [1 if done else 0, *chunk],
+                )
+                updated.extend(row[0] for row in cur.fetchall())
+        return updated
+
     def delete(self, task_id: int) -> int:
         with self._conn:
+            self._conn.execute("DELETE FROM task_tags WHERE task_id = ?", (task_id,))
             cur = self._conn.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
             return cur.rowcount
 
     def clear_all(self) -> int:
         """Delete all tasks from the database."""
         with self._conn:
+            self._conn.execute("DELETE FROM task_tags")
             cur = self._conn.execute("DELETE FROM tasks")
             return cur.rowcount
 
-    def search(
+    @staticmethod
+    def _fts_query(keyword: str) -> str:
+        # Quote the keyword as one phrase so FTS5 operators in user input are
+        # matched literally, and prefix-match its last token
+        return '"' + keyword.replace('"', '""') + '"*'
+
+    def search_ranked(
         self,
         keyword: str,
+        limit: int = 10,
+        title_weight: float = DEFAULT_TITLE_WEIGHT,
+        description_weight: float = DEFAULT_DESCRIPTION_WEIGHT,
         priority: str | None = None,
         project: str | None = None,
+        done: bool | None = None,
         tags: list[str] | None = None,
+        all_tags: bool = False,
     ) -> list[Row]:
-        # Use FTS5 for O(log n) search performance
-        # Escape special FTS5 characters and use phrase search for exact matching
-        keyword_escaped = keyword.replace('"', '""')
-        fts_query = f'"{keyword_escaped}"*'  # Prefix search for better performance
+        # Rank, highlight and excerpt inside FTS5 so only the top `limit` rows
+        # leave SQLite. Rows carry the task columns plus score, title_marked and
+        # snippet_marked, with matches wrapped in MATCH_START/MATCH_END.
+        query_parts = [
+            """SELECT t.id, t.title, t.description, t.done, t.created_at,
+               t.priority, t.due_date, t.tags, t.project,
+               -bm25(tasks_fts, 0.0, ?, ?) AS score,
+               highlight(tasks_fts, 1, ?, ?) AS title_marked,
+               snippet(tasks_fts, 2, ?, ?, '…', ?) AS snippet_marked
+               FROM tasks t
+               INNER JOIN tasks_fts ON t.id = tasks_fts.rowid
+               WHERE tasks_fts MATCH ?"""
+        ]
+        params: list[Any] = [
+            title_weight,
+            description_weight,
+            MATCH_START,
+            MATCH_END,
+            MATCH_START,
+            MATCH_END,
+            SNIPPET_TOKENS,
+            self._fts_query(keyword),
+        ]
+        self._add_task_filters(
+            query_parts,
+            params,
+            priority=priority,
+            project=project,
+            done=done,
+            tags=tags,
+            all_tags=all_tags,
+            table="t.",
+        )
+
+        query = " AND ".join(query_parts) + " ORDER BY score DESC, t.id LIMIT ?"
+        params.append(limit)
 
-        # Build query using FTS5 for O(log n) search
+        try:
+            return self._conn.execute(query, params).fetchall()
+        except OperationalError:
+            # Without FTS5 there is no relevance to rank by: return the first
+            # LIKE matches unranked and without match context
+            pattern = f"%{keyword}%"
+            query_parts = [
+                "SELECT id, title, description, done, created_at, priority, due_date, tags, project, "
+                "0.0 AS score, title AS title_marked, '' AS snippet_marked "
+                "FROM tasks WHERE (title LIKE ? OR description LIKE ?)"
+            ]
+            params = [pattern, pattern]
+            self._add_task_filters(
+                query_parts,
+                params,
+                priority=priority,
+                project=project,
+                done=done,
+                tags=tags,
+                all_tags=all_tags,
+            )
+
+            query = " AND ".join(query_parts) + " ORDER BY id LIMIT ?"
+            params.append(limit)
+            return self._conn.execute(query, params).fetchall()
+
+    def search(
+        self,
+        keyword: str,
+        priority: str | None = None,
+        project: str | None = None,
+        tags: list[str] | None = None,
+        all_tags: bool = False,
+        done: bool | None = None,
+        due_before: str | None = None,
+        due_after: str | None = None,
+        limit: int | None = None,
+        after_id: int | None = None,
+    ) -> list[TaskRow]:
+        filters: dict[str, Any] = {
+            "priority": priority,
+            "project": project,
+            "done": done,
+            "tags": tags,
+            "all_tags": all_tags,
+            "due_before": due_before,
+            "due_after": due_after,
+        }
+        cur = self._execute_search(self._task_cursor(), keyword, filters, limit, after_id)
+        return cur.fetchall()
+
+    def iter_search(
+        self,
+        keyword: str,
+        priority: str | None = None,
+        project: str | None = None,
+        tags: list[str] | None = None,
+        all_tags: bool = False,
+        done: bool | None = None,
+        due_before: str | None = None,
+        due_after: str | None = None,
+        limit: int | None = None,
+        after_id: int | None = None,
+        batch_size: int = FETCH_BATCH_SIZE,
+    ) -> Iterator[TaskRow]:
+        """As search, read lazily in fetchmany chunks."""
+        filters: dict[str, Any] = {
+            "priority": priority,
+            "project": project,
+            "done": done,
+            "tags": tags,
+            "all_tags": all_tags,
+            "due_before": due_before,
+            "due_after": due_after,
+        }
+        cur = self._execute_search(self._task_cursor(), keyword, filters, limit, after_id)
+        yield from self._drain(cur, batch_size)
+
+    def _execute_search(
+        self,
+        cur: SQLiteCursor,
+        keyword: str,
+        filters: dict[str, Any],
+        limit: int | None,
+        after_id: int | None,
+    ) -> SQLiteCursor:
+        # Use FTS5 for O(log n) search performance
         query_parts = [
             """SELECT t.id, t.title, t.description, t.done, t.created_at,
                t.priority, t.due_date, t.tags, t.project
                FROM tasks t
-               INNER JOIN tasks_fts fts ON t.id = fts.rowid
-               WHERE fts MATCH ?"""
+               INNER JOIN tasks_fts ON t.id = tasks_fts.rowid
+               WHERE tasks_fts MATCH ?"""
         ]
-        params: list[Any] = [fts_query]
-
-        # Add additional filters on the main table
-        filter_parts: list[str] = []
-        if priority is not None:
-            filter_parts.append("t.priority = ?")
-            params.append(priority)
-        if project is not None:
-            filter_parts.append("t.project = ?")
-            params.append(project)
-        if tags:
-            tag_filters = " OR ".join("t.tags LIKE ?" for _ in tags)
-            filter_parts.append(f"({tag_filters})")
-            params.extend(f"%{tag}%" for tag in tags)
-
-        if filter_parts:
-            query_parts[0] += " AND " + " AND ".join(filter_parts)
+        params: list[Any] = [self._fts_query(keyword)]
+        self._add_task_filters(query_parts, params, **filters, table="t.")
+        if after_id is not None:
+            query_parts.append("t.id > ?")
+            params.append(after_id)
 
-        query = query_parts[0] + " ORDER BY t.id"
+        query = " AND ".join(query_parts) + " ORDER BY t.id"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
 
         try:
-            cur = self._conn.execute(query, params)
-            return cur.fetchall()
-        except Exception:
+            return cur.execute(query, params)
+        except OperationalError:
             # Fallback to LIKE if FTS5 is not available (backward compatibility)
             pattern = f"%{keyword}%"
             query_parts = [
-                "SELECT id, title, description, done, created_at, priority, due_date, tags, project FROM tasks WHERE (title LIKE ? OR description LIKE ?)"
+                f"SELECT {TASK_COLUMNS} FROM tasks WHERE (title LIKE ? OR description LIKE ?)"
             ]
             params = [pattern, pattern]
-
-            self._add_filter(query_parts, params, "priority", priority)
-            self._add_filter(query_parts, params, "project", project)
-            self._add_tags_filter(query_parts, params, tags)
+            self._add_task_filters(query_parts, params, **filters)
+            if after_id is not None:
+                query_parts.append("id > ?")
+                params.append(after_id)
 
             query = " AND ".join(query_parts) + " ORDER BY id"
-            cur = self._conn.execute(query, params)
-            return cur.fetchall()
+            if limit is not None:
+                query += " LIMIT ?"
+                params.append(limit)
+            return cur.execute(query, params)
@@ -1,23 +1,76 @@
 import json
+import sqlite3
+from collections.abc import Iterable
+from functools import lru_cache
 from typing import Any
 
+from raztodo.domain.search import SearchHit, split_highlights
+from raztodo.domain.task_batch import TaskBatch
 from raztodo.domain.task_entity import TaskEntity
 
 
+def decode_tags(tags_str: str | None) -> list[str]:
+    """Decode the tags column: a JSON array, or a legacy comma-separated string."""
+    if not tags_str:
+        return []
+    try:
+        tags = json.loads(tags_str)
+    except (json.JSONDecodeError, TypeError):
+        return [t.strip() for t in tags_str.split(",") if t.strip()]
+    return tags if isinstance(tags, list) else []
+
+
+@lru_cache(maxsize=4096)
+def _decode_tags_cached(tags_str: str) -> tuple[str, ...]:
+    # Tag sets repeat across rows, so each distinct column value is parsed once.
+    # A tuple, so no caller can change what other rows share
+    return tuple(decode_tags(tags_str))
+
+
+def task_row_factory(cursor: sqlite3.Cursor, row: tuple[Any, ...]) -> TaskEntity:
+    """
+    Row factory for queries selecting TaskDAO.TASK_COLUMNS, in that order.
+
+    Builds the TaskEntity straight from the row tuple by position, skipping
+    the sqlite3.Row and the per-column name lookups of row_to_task.
+    """
+    task_id, title, description, done, created_at, priority, due_date, tags, project = row
+    return TaskEntity(
+        task_id,
+        title,
+        description or "",
+        bool(done),
+        created_at or "",
+        priority or "",
+        due_date or None,
+        _decode_tags_cached(tags) if tags and tags != "[]" else None,
+        project or None,
+    )
+
+
+def rows_to_batch(rows: Iterable[tuple[Any, ...]]) -> TaskBatch:
+    """Collect TaskDAO.TASK_COLUMNS tuples into a TaskBatch, without TaskEntity objects."""
+    batch = TaskBatch()
+    append = batch.append
+    for task_id, title, description, done, created_at, priority, due_date, tags, project in rows:
+        append(
+            task_id,
+            title,
+            description or "",
+            bool(done),
+            created_at or "",
+            priority or "",
+            due_date or None,
+            _decode_tags_cached(tags) if tags and tags != "[]" else None,
+            project or None,
+        )
+    return batch
+
+
 def row_to_task(row: Any) -> TaskEntity:
     """Convert a SQLite row to TaskEntity."""
-    tags: list[str] = []
-
     row_keys = row.keys()
-    if "tags" in row_keys:
-        tags_str = row["tags"]
-        if tags_str:
-            try:
-                tags = json.loads(tags_str)
-                if not isinstance(tags, list):
-                    tags = []
-            except (json.JSONDecodeError, TypeError):
-                tags = [t.strip() for t in tags_str.split(",") if t.strip()]
+    tags = decode_tags(row["tags"]) if "tags" in row_keys else []
 
     description = row["description"] if "description" in row_keys and row["description"] else ""
     done = bool(row["done"]) if "done" in row_keys else False
@@ -37,3 +90,16 @@ def row_to_task(row: Any) -> TaskEntity:
         tags=tags,
         project=project,
     )
+
+
+def row_to_search_hit(row: Any) -> SearchHit:
+    """Convert a ranked search row from TaskDAO.search_ranked to SearchHit."""
+    _, title_highlights = split_highlights(row["title_marked"])
+    snippet, snippet_highlights = split_highlights(row["snippet_marked"])
+    return SearchHit(
+        task=row_to_task(row),
+        score=float(row["score"] or 0.0),
+        snippet=snippet,
+        title_highlights=title_highlights,
+        snippet_highlights=snippet_highlights,
+    )
@@ -1,17 +1,33 @@
-import json
+import csv
 import os
-from collections.abc import Callable
+from bisect import bisect_right
+from collections.abc import Callable, Iterable, Iterator
 from pathlib import Path
 from sqlite3 import Connection, Error, IntegrityError
 from types import TracebackType
 from typing import Any, cast
 
-from raztodo.domain.exceptions import RazTodoException
+from raztodo.domain.exceptions import InvalidFileFormatError, RazTodoException
+from raztodo.domain.file_formats import (
+    detect_format,
+    encode_tasks,
+    iter_task_items,
+    validate_format,
+)
+from raztodo.domain.pagination import decode_cursor, validate_order_by
+from raztodo.domain.search import DEFAULT_DESCRIPTION_WEIGHT, DEFAULT_TITLE_WEIGHT, SearchHit
+from raztodo.domain.task_batch import TaskBatch
+from raztodo.domain.task_change import DEFAULT_CHANGES_LIMIT, ChangeFeed, TaskChange
 from raztodo.domain.task_entity import TaskEntity
 from raztodo.domain.task_repository import TaskRepository
+from raztodo.infrastructure.file_io import open_task_file
 from raztodo.infrastructure.logger import get_logger
-from raztodo.infrastructure.sqlite.task_dao import TaskDAO
-from raztodo.infrastructure.sqlite.task_mapper import row_to_task
+from raztodo.infrastructure.sqlite.task_dao import NewTaskRow, TaskDAO, UpsertTaskRow
+from raztodo.infrastructure.sqlite.task_mapper import (
+    row_to_search_hit,
+    rows_to_batch,
+    task_row_factory,
+)
 
 logger = get_logger(__name__)
 
@@ -19,6 +35,11 @@ MAX_TITLE_LENGTH = 60
 MAX_DESCRIPTION_LENGTH = 200
 VALID_PRIORITIES = {"", "L", "M", "H"}
 
+# Items read between progress callbacks during import
+PROGRESS_INTERVAL = 1000
+# Per-item error messages kept for the failure report
+MAX_REPORTED_ERRORS = 3
+
 
 def validate_length(field_name: str, value: str | None, max_length: int) -> str:
     value = (value or "").strip()
@@ -54,6 +75,50 @@ def normalize_tags(tags: list[str] | None) -> list[str]:
     return [t.strip() for t in (tags or []) if t.strip()]
 
 
+def normalize_new_task(
+    title: str, description: str, priority: str, tags: list[str] | None
+) -> tuple[str, str, str, list[str]]:
+    return (
+        validate_length("title", title, MAX_TITLE_LENGTH),
+        validate_length("description", description, MAX_DESCRIPTION_LENGTH),
+        normalize_priority(priority),
+        normalize_tags(tags),
+    )
+
+
+def normalize_update(
+    title: str | None = None,
+    description: str | None = None,
+    priority: str | None = None,
+    due_date: str | None = None,
+    tags: list[str] | None = None,
+    project: str | None = None,
+) -> dict[str, Any]:
+    # Empty strings clear optional columns; the DAO maps "__CLEAR__" to NULL
+    if title is not None:
+        title = validate_length("title", title, MAX_TITLE_LENGTH)
+    if description is not None:
+        description = validate_length("description", description, MAX_DESCRIPTION_LENGTH)
+    if priority is not None:
+        priority = normalize_priority(priority)
+        if priority == "":
+            priority = "__CLEAR__"
+    if tags is not None:
+        tags = normalize_tags(tags)
+    if due_date is not None and due_date == "":
+        due_date = "__CLEAR__"
+    if project is not None and project == "":
+        project = "__CLEAR__"
+    return {
+        "title": title,
+        "description": description,
+        "priority": priority,
+        "due_date": due_date,
+        "tags": tags,
+        "project": project,
+    }
+
+
 def ensure_writable_path(filepath: str) -> Path:
     file_path = Path(filepath).resolve()
     dir_path = file_path.parent
@@ -72,7 +137,7 @@ class SQLiteTaskRepository(TaskRepository):
     def __init__(self, connection_factory: Callable[[], Connection]):
         self._connection_factory = connection_factory
         self._conn: Connection | None = self._connection_factory()
-        self._dao = TaskDAO(self._conn)
+        self._dao = TaskDAO(self._conn, task_factory=task_row_factory)
 
     def __enter__(self) -> TaskRepository:
         return self
@@ -94,10 +159,7 @@ class SQLiteTaskRepository(TaskRepository):
         tags: list[str] | None = None,
         project: str | None = None,
     ) -> int | None:
-        title = validate_length("title", title, MAX_TITLE_LENGTH)
-        description = validate_length("description", description, MAX_DESCRIPTION_LENGTH)
-        priority = normalize_priority(priority)
-        tags = normalize_tags(tags)
+        title, description, priority, tags = normalize_new_task(title, description, priority, tags)
 
         try:
             task_id = self._dao.insert(title, description, priority, due_date, tags, project)
@@ -110,6 +172,29 @@ class SQLiteTaskRepository(TaskRepository):
         except Error as e:
             raise RazTodoException(f"DatabaseError during add_task: {e}") from e
 
+    def add_task_returning(
+        self,
+        title: str,
+        description: str = "",
+        priority: str = "",
+        due_date: str | None = None,
+        tags: list[str] | None = None,
+        project: str | None = None,
+    ) -> TaskEntity:
+        title, description, priority, tags = normalize_new_task(title, description, priority, tags)
+
+        try:
+            task = self._dao.insert_returning(title, description, priority, due_date, tags, project)
+        except IntegrityError as e:
+            raise RazTodoException(f"DuplicateTaskError: {e}") from e
+        except Error as e:
+            raise RazTodoException(f"DatabaseError during add_task: {e}") from e
+        if task is None:
+            raise RazTodoException(f"DuplicateTaskError: Task '{title}' already exists")
+
+        logger.info("Task created: id=%d, title=%r", task.id, title)
+        return task
+
     def get_tasks(
         self,
         limit: int | None = None,
@@ -120,8 +205,77 @@ class SQLiteTaskRepository(TaskRepository):
         tags: list[str] | None = None,
         due_before: str | None = None,
         due_after: str | None = None,
+        all_tags: bool = False,
+        cursor: str | None = None,
+        order_by: str = "id",
+        descending: bool = False,
     ) -> list[TaskEntity]:
-        rows = self._dao.fetch_all(
+        validate_order_by(order_by)
+        return self._dao.fetch_all(
+            limit=limit,
+            offset=offset,
+            priority=priority,
+            project=project,
+            done=done,
+            tags=tags,
+            due_before=due_before,
+            due_after=due_after,
+            all_tags=all_tags,
+            after=decode_cursor(cursor, order_by, descending) if cursor else None,
+            order_by=order_by,
+            descending=descending,
+        )
+
+    def get_task_batch(
+        self,
+        limit: int | None = None,
+        offset: int | None = None,
+        priority: str | None = None,
+        project: str | None = None,
+        done: bool | None = None,
+        tags: list[str] | None = None,
+        due_before: str | None = None,
+        due_after: str | None = None,
+        all_tags: bool = False,
+        cursor: str | None = None,
+        order_by: str = "id",
+        descending: bool = False,
+    ) -> TaskBatch:
+        validate_order_by(order_by)
+        return rows_to_batch(
+            self._dao.iter_rows(
+                limit=limit,
+                offset=offset,
+                priority=priority,
+                project=project,
+                done=done,
+                tags=tags,
+                due_before=due_before,
+                due_after=due_after,
+                all_tags=all_tags,
+                after=decode_cursor(cursor, order_by, descending) if cursor else None,
+                order_by=order_by,
+                descending=descending,
+            )
+        )
+
+    def iter_tasks(
+        self,
+        limit: int | None = None,
+        offset: int | None = None,
+        priority: str | None = None,
+        project: str | None = None,
+        done: bool | None = None,
+        tags: list[str] | None = None,
+        due_before: str | None = None,
+        due_after: str | None = None,
+        all_tags: bool = False,
+        cursor: str | None = None,
+        order_by: str = "id",
+        descending: bool = False,
+    ) -> Iterator[TaskEntity]:
+        validate_order_by(order_by)
+        rows = self._dao.iter_tasks(
             limit=limit,
             offset=offset,
             priority=priority,
@@ -130,12 +284,42 @@ class SQLiteTaskRepository(TaskRepository):
             tags=tags,
             due_before=due_before,
             due_after=due_after,
+            all_tags=all_tags,
+            after=decode_cursor(cursor, order_by, descending) if cursor else None,
+            order_by=order_by,
+            descending=descending,
         )
-        return [row_to_task(r) for r in rows]
+        return self._iter_rows(rows, "iter_tasks")
+
+    @staticmethod
+    def _iter_rows(rows: Iterator[TaskEntity], operation: str) -> Iterator[TaskEntity]:
+        # Arguments are checked when the method is called; query errors surface
+        # on iteration, as domain errors like those of the list methods
+        try:
+            yield from rows
+        except Error as e:
+            raise RazTodoException(f"DatabaseError during {operation}: {e}") from e
 
     def get_task(self, task_id: int) -> TaskEntity | None:
-        row = self._dao.fetch_by_id(task_id)
-        return row_to_task(row) if row else None
+        return self._dao.fetch_by_id(task_id)
+
+    def change_counter(self) -> int:
+        return self._dao.change_counter()
+
+    def get_changes(
+        self, since: int | None = None, limit: int = DEFAULT_CHANGES_LIMIT
+    ) -> ChangeFeed:
+        if since is None:
+            return ChangeFeed(last_seq=self._dao.changelog_bounds()[1])
+        rows = self._dao.fetch_changes(since, limit)
+        # Read after the rows: pruning in between can only raise the oldest
+        # position, so lost entries are reported rather than silently skipped
+        oldest, latest = self._dao.changelog_bounds()
+        lost = since < latest and (oldest is None or since < oldest - 1)
+        if since > latest or lost:
+            return ChangeFeed(last_seq=latest, reset=True)
+        changes = [TaskChange(seq=r[0], task_id=r[1], op=r[2]) for r in rows]
+        return ChangeFeed(changes=changes, last_seq=changes[-1].seq if changes else since)
 
     def update_task(
         self,
@@ -147,36 +331,32 @@ class SQLiteTaskRepository(TaskRepository):
         tags: list[str] | None = None,
         project: str | None = None,
     ) -> int:
-        if title is not None:
-            title = validate_length("title", title, MAX_TITLE_LENGTH)
-        if description is not None:
-            description = validate_length("description", description, MAX_DESCRIPTION_LENGTH)
-        if priority is not None:
-            priority = normalize_priority(priority)
-            if priority == "":
-                priority = "__CLEAR__"
-        if tags is not None:
-            tags = normalize_tags(tags)
-        if due_date is not None and due_date == "":
-            due_date = "__CLEAR__"
-        if project is not None and project == "":
-            project = "__CLEAR__"
-
+        fields = normalize_update(title, description, priority, due_date, tags, project)
         try:
-            affected = self._dao.update(
-                task_id,
-                title=title,
-                description=description,
-                priority=priority,
-                due_date=due_date,
-                tags=tags,
-                project=project,
-            )
+            affected = self._dao.update(task_id, **fields)
             logger.info("Task updated: id=%d, rows_affected=%d", task_id, affected)
             return affected
         except Error as e:
             raise RazTodoException(f"DatabaseError during update_task {task_id}: {e}") from e
 
+    def update_task_returning(
+        self,
+        task_id: int,
+        title: str | None = None,
+        description: str | None = None,
+        priority: str | None = None,
+        due_date: str | None = None,
+        tags: list[str] | None = None,
+        project: str | None = None,
+    ) -> TaskEntity | None:
+        fields = normalize_update(title, description, priority, due_date, tags, project)
+        try:
+            task = self._dao.update_returning(task_id, **fields)
+        except Error as e:
+            raise RazTodoException(f"DatabaseError during update_task {task_id}: {e}") from e
+        logger.info("Task updated: id=%d, found=%s", task_id, task is not None)
+        return task
+
     def remove_task(self, task_id: int) -> int:
         affected = self._dao.delete(task_id)
         logger.info("Task removed: id=%d, rows_affected=%d", task_id, affected)
@@ -188,6 +368,12 @@ class SQLiteTaskRepository(TaskRepository):
         priority: str | None = None,
         project: str | None = None,
         tags: list[str] | None = None,
+        all_tags: bool = False,
+        done: bool | None = None,
+        due_before: str | None = None,
+        due_after: str | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
     ) -> list[TaskEntity]:
         if not keyword or not keyword.strip():
             return []
@@ -200,95 +386,286 @@ class SQLiteTaskRepository(TaskRepository):
             tags,
         )
 
-        rows = self._dao.search(keyword.strip(), priority=priority, project=project, tags=tags)
+        tasks = self._dao.search(
+            keyword.strip(),
+            priority=priority,
+            project=project,
+            tags=tags,
+            all_tags=all_tags,
+            done=done,
+            due_before=due_before,
+            due_after=due_after,
+            limit=limit,
+            after_id=decode_cursor(cursor).id if cursor else None,
+        )
+
+        logger.info("Search for %r returned %d result(s)", keyword.strip(), len(tasks))
+        return tasks
+
+    def iter_search(
+        self,
+        keyword: str,
+        priority: str | None = None,
+        project: str | None = None,
+        tags: list[str] | None = None,
+        all_tags: bool = False,
+        done: bool | None = None,
+        due_before: str | None = None,
+        due_after: str | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> Iterator[TaskEntity]:
+        if not keyword or not keyword.strip():
+            return iter(())
+        logger.info("Streaming search: keyword=%r", keyword.strip())
+        rows = self._dao.iter_search(
+            keyword.strip(),
+            priority=priority,
+            project=project,
+            tags=tags,
+            all_tags=all_tags,
+            done=done,
+            due_before=due_before,
+            due_after=due_after,
+            limit=limit,
+            after_id=decode_cursor(cursor).id if cursor else None,
+        )
+        return self._iter_rows(rows, "iter_search")
+
+    def search_ranked(
+        self,
+        keyword: str,
+        limit: int = 10,
+        title_weight: float = DEFAULT_TITLE_WEIGHT,
+        description_weight: float = DEFAULT_DESCRIPTION_WEIGHT,
+        priority: str | None = None,
+        project: str | None = None,
+        done: bool | None = None,
+        tags: list[str] | None = None,
+        all_tags: bool = False,
+    ) -> list[SearchHit]:
+        if not keyword or not keyword.strip():
+            return []
+        if limit < 1:
+            raise RazTodoException(f"TaskValidationError: 'limit' must be positive, got {limit}")
+
+        try:
+            rows = self._dao.search_ranked(
+                keyword.strip(),
+                limit=limit,
+                title_weight=title_weight,
+                description_weight=description_weight,
+                priority=priority,
+                project=project,
+                done=done,
+                tags=tags,
+                all_tags=all_tags,
+            )
+        except Error as e:
+            raise RazTodoException(f"DatabaseError during search_ranked: {e}") from e
 
-        logger.info("Search for %r returned %d result(s)", keyword.strip(), len(rows))
-        return [row_to_task(r) for r in rows]
+        logger.info("Ranked search for %r returned %d hit(s)", keyword.strip(), len(rows))
+        return [row_to_search_hit(r) for r in rows]
 
     def mark_done(self, task_id: int, done: bool = True) -> int:
         affected = self._dao.update(task_id, done=done)
         logger.info("Task %d marked as done=%s, rows_affected=%d", task_id, done, affected)
         return affected
 
-    def export_tasks(self, filepath: str) -> bool:
+    def toggle_done(self, task_id: int) -> TaskEntity | None:
+        try:
+            task = self._dao.toggle_done(task_id)
+        except Error as e:
+            raise RazTodoException(f"DatabaseError during toggle_done {task_id}: {e}") from e
+        if task is None:
+            return None
+        logger.info("Task %d toggled to done=%s", task_id, task.done)
+        return task
+
+    def mark_done_many(self, task_ids: list[int], done: bool = True) -> list[int]:
+        unique_ids = list(dict.fromkeys(task_ids))
+        try:
+            updated = self._dao.mark_done_many(unique_ids, done)
+        except Error as e:
+            raise RazTodoException(f"DatabaseError during mark_done_many: {e}") from e
+        logger.info("Marked %d of %d task(s) as done=%s", len(updated), len(unique_ids), done)
+        return updated
+
+    def iter_export(self, file_format: str = "json") -> Iterator[str]:
+        def items() -> Iterator[dict[str, Any]]:
+            for t in self._dao.iter_tasks():
+                yield t.to_dict()
+
+        try:
+            yield from encode_tasks(items(), validate_format(file_format))
+        except Error as e:
+            raise RazTodoException(f"DatabaseError during iter_export: {e}") from e
+
+    def export_tasks(self, filepath: str, file_format: str | None = None) -> bool:
         file_path = ensure_writable_path(filepath)
+        fmt = detect_format(file_path, file_format)
         try:
-            tasks = self.get_tasks()
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(
-                    [
-                        {
-                            "id": t.id,
-                            "title": t.title,
-                            "description": t.description,
-                            "done": getattr(t, "done", False),
-                            "created_at": getattr(t, "created_at", ""),
-                            "priority": getattr(t, "priority", ""),
-                            "due_date": getattr(t, "due_date", None),
-                            "tags": getattr(t, "tags", []),
-                            "project": getattr(t, "project", None),
-                        }
-                        for t in tasks
-                    ],
-                    f,
-                    ensure_ascii=False,
-                    indent=2,
-                )
-            logger.info("Exported %d tasks to %s", len(tasks), filepath)
+            with open_task_file(file_path, "w", fmt) as f:
+                for chunk in self.iter_export(fmt):
+                    f.write(chunk)
+            logger.info("Exported tasks to %s", filepath)
             return True
         except Exception as e:
             raise RazTodoException(f"FileOperationError during export_tasks: {e}") from e
 
-    def import_tasks(self, filepath: str) -> int:
+    def import_tasks(
+        self,
+        filepath: str,
+        progress: Callable[[int], None] | None = None,
+        file_format: str | None = None,
+    ) -> dict[str, int]:
         file_path = Path(filepath)
+        fmt = detect_format(file_path, file_format)
         if not file_path.exists():
             raise RazTodoException(f"TaskFileNotFoundError: {filepath}")
         if not os.access(filepath, os.R_OK):
             raise RazTodoException(f"FilePermissionError: Cannot read {filepath}")
 
+        skipped, failed = 0, 0
+        errors: list[str] = []
+        # Row positions at which an item was dropped before reaching the DAO;
+        # maps DAO row positions back to item numbers without a per-row list.
+        gaps: list[int] = []
+
+        def reject(idx: int, message: str) -> None:
+            nonlocal failed
+            failed += 1
+            if len(errors) < MAX_REPORTED_ERRORS:
+                errors.append(f"Item {idx}: {message}")
+
+        def rows(items: Iterator[Any]) -> Iterator[NewTaskRow]:
+            nonlocal skipped
+            idx = 0
+            for idx, item in enumerate(items, start=1):
+                if progress and idx % PROGRESS_INTERVAL == 0:
+                    progress(idx)
+                if not isinstance(item, dict) or "title" not in item:
+                    logger.warning("Skipping item %d: not a dict or missing 'title' key", idx)
+                    skipped += 1
+                    gaps.append(idx - 1 - len(gaps))
+                    continue
+
+                task_data = cast(dict[str, Any], item)
+                try:
+                    title, description, priority, tags = normalize_new_task(
+                        task_data["title"],
+                        task_data.get("description", ""),
+                        task_data.get("priority", ""),
+                        task_data.get("tags", []),
+                    )
+                except Exception as e:
+                    reject(idx, str(e))
+                    gaps.append(idx - 1 - len(gaps))
+                    continue
+                yield (
+                    title,
+                    description,
+                    priority,
+                    task_data.get("due_date"),
+                    tags,
+                    task_data.get("project"),
+                    bool(task_data.get("done", False)),
+                )
+            if progress:
+                progress(idx)
+
         try:
-            data = json.loads(file_path.read_text(encoding="utf-8"))
-        except Exception as e:
+            with open_task_file(file_path, "r", fmt) as f:
+                inserted, failures = self._dao.insert_many(rows(iter_task_items(f, fmt)))
+        except InvalidFileFormatError as e:
+            raise RazTodoException(f"InvalidFileFormatError: {e} in {filepath}") from e
+        except (ValueError, OSError, EOFError, csv.Error) as e:
             raise RazTodoException(f"InvalidFileFormatError: {e}") from e
+        except Error as e:
+            raise RazTodoException(f"DatabaseError during import_tasks: {e}") from e
+        for pos, message in failures:
+            reject(pos + 1 + bisect_right(gaps, pos), message)
 
-        if not isinstance(data, list):
-            raise RazTodoException(f"InvalidFileFormatError: Expected JSON array in {filepath}")
-
-        count, errors = 0, []
-        for idx, item in enumerate(data, start=1):
-            if not isinstance(item, dict) or "title" not in item:
-                logger.warning("Skipping item %d: not a dict or missing 'title' key", idx)
-                continue
-
-            task_data = cast(dict[str, Any], item)
+        if failed and inserted == 0:
+            raise RazTodoException(f"Failed to import any tasks from {filepath}: {errors}")
 
-            try:
-                new_id = self.add_task(
-                    task_data["title"],
-                    task_data.get("description", ""),
-                    task_data.get("priority", ""),
+        logger.info(
+            "Imported %d tasks from %s (%d skipped, %d failed)",
+            inserted,
+            filepath,
+            skipped,
+            failed,
+        )
+        return {"inserted": inserted, "skipped": skipped, "failed": failed}
+
+    def upsert_many(
+        self, items: Iterable[Any], progress: Callable[[int], None] | None = None
+    ) -> dict[str, int]:
+        skipped, failed = 0, 0
+        errors: list[str] = []
+        # As in import_tasks: maps DAO row positions back to item numbers
+        gaps: list[int] = []
+
+        def reject(idx: int, message: str) -> None:
+            nonlocal failed
+            failed += 1
+            if len(errors) < MAX_REPORTED_ERRORS:
+                errors.append(f"Item {idx}: {message}")
+
+        def rows() -> Iterator[UpsertTaskRow]:
+            nonlocal skipped
+            idx = 0
+            for idx, item in enumerate(items, start=1):
+                if progress and idx % PROGRESS_INTERVAL == 0:
+                    progress(idx)
+                if not isinstance(item, dict) or not str(item.get("title") or "").strip():
+                    logger.warning("Skipping item %d: not a dict or empty 'title'", idx)
+                    skipped += 1
+                    gaps.append(idx - 1 - len(gaps))
+                    continue
+
+                task_data = cast(dict[str, Any], item)
+                try:
+                    title, description, priority, tags = normalize_new_task(
+                        task_data["title"],
+                        task_data.get("description", ""),
+                        task_data.get("priority") or "",
+                        task_data.get("tags") or [],
+                    )
+                except Exception as e:
+                    reject(idx, str(e))
+                    gaps.append(idx - 1 - len(gaps))
+                    continue
+                yield (
+                    title,
+                    description,
+                    priority,
                     task_data.get("due_date"),
-                    task_data.get("tags", []),
+                    tags,
                     task_data.get("project"),
+                    bool(task_data["done"]) if "done" in task_data else None,
                 )
-                if new_id and "done" in task_data:
-                    try:
-                        self._dao.update(new_id, done=bool(task_data["done"]))
-                    except Error as e:
-                        logger.warning("Failed to set done flag for task %d: %s", new_id, e)
-                count += 1
-            except RazTodoException as e:
-                errors.append(f"Item {idx}: {e}")
-                continue
-            except Exception as e:
-                errors.append(f"Item {idx}: {e}")
-                continue
-
-        if errors and count == 0:
-            raise RazTodoException(f"Failed to import any tasks from {filepath}: {errors[:3]}")
-
-        logger.info("Imported %d tasks from %s", count, filepath)
-        return count
+            if progress:
+                progress(idx)
+
+        try:
+            inserted, updated, failures = self._dao.upsert_many(rows())
+        except Error as e:
+            raise RazTodoException(f"DatabaseError during upsert_many: {e}") from e
+        for pos, message in failures:
+            reject(pos + 1 + bisect_right(gaps, pos), message)
+
+        if failed and inserted + updated == 0:
+            raise RazTodoException(f"Failed to import any tasks: {errors}")
+
+        logger.info(
+            "Upserted tasks: %d inserted, %d updated (%d skipped, %d failed)",
+            inserted,
+            updated,
+            skipped,
+            failed,
+        )
+        return {"inserted": inserted, "updated": updated, "skipped": skipped, "failed": failed}
 
     def clear_all_tasks(self) -> int:
         try:
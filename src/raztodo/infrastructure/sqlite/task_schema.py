@@ -53,6 +53,10 @@ TRIGGERS = {
         """,
 }
 
+# Sort rank of a task's priority (H > M > L > none). Queries must repeat this
+# expression verbatim for SQLite to match it against the rank indexes below.
+PRIORITY_RANK_SQL = "CASE priority WHEN 'H' THEN 3 WHEN 'M' THEN 2 WHEN 'L' THEN 1 ELSE 0 END"
+
 INDEXES = [
     "CREATE INDEX IF NOT EXISTS idx_tasks_priority ON tasks(priority)",
     "CREATE INDEX IF NOT EXISTS idx_tasks_due_date ON tasks(due_date)",
@@ -60,8 +64,54 @@ INDEXES = [
     "CREATE INDEX IF NOT EXISTS idx_tasks_done ON tasks(done)",
     "CREATE INDEX IF NOT EXISTS idx_tasks_title_search ON tasks(title)",
     "CREATE INDEX IF NOT EXISTS idx_tasks_description_search ON tasks(description)",
+    # Sort indexes: each matches an ORDER BY used by TaskDAO.fetch_all
+    f"CREATE INDEX IF NOT EXISTS idx_tasks_priority_rank ON tasks({PRIORITY_RANK_SQL}, id)",
+    f"CREATE INDEX IF NOT EXISTS idx_tasks_done_priority_rank ON tasks(done, {PRIORITY_RANK_SQL}, id)",
+    "CREATE INDEX IF NOT EXISTS idx_tasks_done_due_date ON tasks(done, due_date, id)",
+    "CREATE INDEX IF NOT EXISTS idx_tasks_created_at ON tasks(created_at, id)",
+    "CREATE INDEX IF NOT EXISTS idx_tasks_title_nocase ON tasks(title COLLATE NOCASE, id)",
 ]
 
+# Writes store an empty due_date as NULL, so due_date sorts and keyset cursors
+# see one "no due date" value; this converts rows written before that
+HAS_EMPTY_DUE_DATES = "SELECT 1 FROM tasks WHERE due_date = '' LIMIT 1"
+CLEAR_EMPTY_DUE_DATES = "UPDATE tasks SET due_date = NULL WHERE due_date = ''"
+
+# One row per (task, tag) so tag filters are index lookups instead of LIKE scans
+# over the JSON in tasks.tags. NOCASE keeps the old case-insensitive matching.
+CREATE_TABLE_TASK_TAGS = """
+CREATE TABLE IF NOT EXISTS task_tags (
+    task_id INTEGER NOT NULL REFERENCES tasks(id) ON DELETE CASCADE,
+    tag TEXT NOT NULL COLLATE NOCASE,
+    PRIMARY KEY (task_id, tag)
+) WITHOUT ROWID
+"""
+
+CREATE_INDEX_TASK_TAGS_TAG = """
+CREATE INDEX IF NOT EXISTS idx_task_tags_tag
+ON task_tags(tag, task_id)
+"""
+
+# Seeds task_tags from the JSON arrays TaskDAO writes to tasks.tags; the full
+# resync (including legacy comma-separated values) is migrations.backfill_task_tags
+BACKFILL_TASK_TAGS = """
+INSERT OR IGNORE INTO task_tags (task_id, tag)
+SELECT t.id, trim(j.value)
+FROM tasks t, json_each(t.tags) j
+WHERE json_valid(t.tags) AND json_type(t.tags) = 'array'
+  AND j.type = 'text' AND trim(j.value) != ''
+"""
+
+# As BACKFILL_TASK_TAGS, for the tasks with an id above the bound parameter
+BACKFILL_TASK_TAGS_AFTER_ID = """
+INSERT OR IGNORE INTO task_tags (task_id, tag)
+SELECT t.id, trim(j.value)
+FROM tasks t, json_each(t.tags) j
+WHERE t.id > ?
+  AND json_valid(t.tags) AND json_type(t.tags) = 'array'
+  AND j.type = 'text' AND trim(j.value) != ''
+"""
+
 CREATE_FTS_TABLE = """
 CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
     id UNINDEXED,
@@ -72,6 +122,195 @@ CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
 )
 """
 
+# External-content FTS5 tables are not updated automatically; these triggers
+# mirror every change to the indexed columns of tasks into tasks_fts.
+FTS_TRIGGERS = {
+    "fts_insert": """
+        CREATE TRIGGER IF NOT EXISTS trg_tasks_fts_insert
+        AFTER INSERT ON tasks
+        BEGIN
+            INSERT INTO tasks_fts(rowid, id, title, description)
+            VALUES (NEW.id, NEW.id, NEW.title, NEW.description);
+        END;
+        """,
+    "fts_delete": """
+        CREATE TRIGGER IF NOT EXISTS trg_tasks_fts_delete
+        AFTER DELETE ON tasks
+        BEGIN
+            INSERT INTO tasks_fts(tasks_fts, rowid, id, title, description)
+            VALUES ('delete', OLD.id, OLD.id, OLD.title, OLD.description);
+        END;
+        """,
+    "fts_update": """
+        CREATE TRIGGER IF NOT EXISTS trg_tasks_fts_update
+        AFTER UPDATE OF title, description ON tasks
+        BEGIN
+            INSERT INTO tasks_fts(tasks_fts, rowid, id, title, description)
+            VALUES ('delete', OLD.id, OLD.id, OLD.title, OLD.description);
+            INSERT INTO tasks_fts(rowid, id, title, description)
+            VALUES (NEW.id, NEW.id, NEW.title, NEW.description);
+        END;
+        """,
+}
+
+# A counter bumped by every change to tasks, so readers can tell whether
+# anything changed without reading the tasks (e.g. to answer HTTP ETags).
+# It is seeded from the clock, so a recreated database never repeats the
+# values handed out for an older one.
+CHANGE_COUNTER_KEY = "change_counter"
+
+CREATE_TABLE_META = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+) WITHOUT ROWID
+"""
+
+SEED_CHANGE_COUNTER = f"""
+INSERT OR IGNORE INTO meta (key, value)
+VALUES ('{CHANGE_COUNTER_KEY}', CAST(strftime('%s', 'now') AS INTEGER) * 1000)
+"""
+
+CHANGE_COUNTER_TRIGGERS = {
+    event: f"""
+        CREATE TRIGGER IF NOT EXISTS trg_tasks_change_{event.lower()}
+        AFTER {event} ON tasks
+        BEGIN
+            UPDATE meta SET value = value + 1 WHERE key = '{CHANGE_COUNTER_KEY}';
+        END;
+        """
+    for event in ("INSERT", "UPDATE", "DELETE")
+}
+
+# One row per changed task, so clients can catch up on what changed since
+# a known position instead of reloading every task. Only the most recent
+# CHANGELOG_RETAIN entries are kept; older ones are pruned in batches.
+CHANGELOG_RETAIN = 10_000
+CHANGELOG_PRUNE_EVERY = 1_000
+
+CREATE_TABLE_CHANGELOG = """
+CREATE TABLE IF NOT EXISTS tasks_changelog (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    task_id INTEGER NOT NULL,
+    op TEXT NOT NULL CHECK(op IN ('insert', 'update', 'delete'))
+)
+"""
+
+CHANGELOG_TRIGGERS = {
+    "insert": """
+        CREATE TRIGGER IF NOT EXISTS trg_tasks_changelog_insert
+        AFTER INSERT ON tasks
+        BEGIN
+            INSERT INTO tasks_changelog (task_id, op) VALUES (NEW.id, 'insert');
+        END;
+        """,
+    "update": """
+        CREATE TRIGGER IF NOT EXISTS trg_tasks_changelog_update
+        AFTER UPDATE ON tasks
+        BEGIN
+            INSERT INTO tasks_changelog (task_id, op) VALUES (NEW.id, 'update');
+        END;
+        """,
+    "delete": """
+        CREATE TRIGGER IF NOT EXISTS trg_tasks_changelog_delete
+        AFTER DELETE ON tasks
+        BEGIN
+            INSERT INTO tasks_changelog (task_id, op) VALUES (OLD.id, 'delete');
+        END;
+        """,
+    "prune": f"""
+        CREATE TRIGGER IF NOT EXISTS trg_tasks_changelog_prune
+        AFTER INSERT ON tasks_changelog
+        WHEN NEW.seq % {CHANGELOG_PRUNE_EVERY} = 0
+        BEGIN
+            DELETE FROM tasks_changelog WHERE seq <= NEW.seq - {CHANGELOG_RETAIN};
+        END;
+        """,
+}
+
+REBUILD_FTS = "INSERT INTO tasks_fts(tasks_fts) VALUES ('rebuild')"
+OPTIMIZE_FTS = "INSERT INTO tasks_fts(tasks_fts) VALUES ('optimize')"
+
+
+def fts_drift(conn: sqlite3.Connection) -> int:
+    """
+    Return how many tasks are missing from the FTS index.
+
+    Negative values mean the index holds entries for deleted tasks.
+    """
+    indexed = int(conn.execute("SELECT COUNT(*) FROM tasks_fts_docsize").fetchone()[0])
+    total = int(conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0])
+    return total - indexed
+
+
+def read_change_counter(conn: sqlite3.Connection) -> int:
+    """Return the change counter, or 0 if the database predates it."""
+    try:
+        row = conn.execute("SELECT value FROM meta WHERE key = ?", (CHANGE_COUNTER_KEY,)).fetchone()
+    except sqlite3.OperationalError:
+        return 0
+    return int(row[0]) if row else 0
+
+
+def advance_change_counter(conn: sqlite3.Connection, floor: int) -> None:
+    """Move the change counter past floor, e.g. after restoring an older snapshot."""
+    with conn:
+        conn.execute(
+            "UPDATE meta SET value = max(value, ?) + 1 WHERE key = ?", (floor, CHANGE_COUNTER_KEY)
+        )
+
+
+def read_changelog_seq(conn: sqlite3.Connection) -> int:
+    """Return the position of the latest changelog entry ever written, kept or pruned."""
+    try:
+        row = conn.execute(
+            "SELECT seq FROM sqlite_sequence WHERE name = 'tasks_changelog'"
+        ).fetchone()
+    except sqlite3.OperationalError:
+        return 0
+    return int(row[0]) if row else 0
+
+
+def reset_changelog(conn: sqlite3.Connection, floor: int) -> None:
+    """
+    Empty the changelog and move its position past floor.
+
+    Readers holding an older position then find nothing to apply and are
+    told to reload, e.g. after the database was replaced by a snapshot.
+    """
+    seq = max(floor, read_changelog_seq(conn)) + 1
+    with conn:
+        conn.execute("DELETE FROM tasks_changelog")
+        conn.execute("DELETE FROM sqlite_sequence WHERE name = 'tasks_changelog'")
+        conn.execute(
+            "INSERT INTO sqlite_sequence (name, seq) VALUES ('tasks_changelog', ?)", (seq,)
+        )
+
+
+def _ensure_fts_sync(conn: sqlite3.Connection) -> None:
+    """
+    Install the FTS sync triggers, seeding the index when they are first added.
+
+    Drift is not checked here: counting both tables is O(n) on every start,
+    so 'rt migrate' reports it on demand instead.
+    """
+    try:
+        installed = {
+            row[0]
+            for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'trg_tasks_fts_%'"
+            )
+        }
+        for trigger_sql in FTS_TRIGGERS.values():
+            conn.execute(trigger_sql)
+
+        # Nothing wrote the index before the triggers existed, so seed it once
+        if len(installed) < len(FTS_TRIGGERS):
+            conn.execute(REBUILD_FTS)
+            logger.info("FTS sync triggers installed; index rebuilt")
+    except sqlite3.Error as e:
+        logger.warning("Failed to set up FTS sync: %s", e)
+
 
 def ensure_schema(conn: sqlite3.Connection) -> None:
     """Ensure that the tasks table, indexes, and triggers exist."""
@@ -98,6 +337,14 @@ def ensure_schema(conn: sqlite3.Connection) -> None:
             except sqlite3.Error as e:
                 logger.warning("Failed to create index: %s | sql=%r", e, idx_sql)
 
+        # Empty due dates; checked first, since pooled readers are query-only
+        try:
+            if conn.execute(HAS_EMPTY_DUE_DATES).fetchone():
+                cleared = conn.execute(CLEAR_EMPTY_DUE_DATES).rowcount
+                logger.info("Stored %d empty due date(s) as NULL", cleared)
+        except sqlite3.Error as e:
+            logger.warning("Failed to normalize empty due dates: %s", e)
+
         # Triggers
         for name, trigger_sql in TRIGGERS.items():
             try:
@@ -105,11 +352,48 @@ def ensure_schema(conn: sqlite3.Connection) -> None:
             except sqlite3.Error as e:
                 logger.warning("Failed to create trigger %r: %s", name, e)
 
+        # Normalized tags
+        try:
+            is_new = not conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'task_tags'"
+            ).fetchone()
+            conn.execute(CREATE_TABLE_TASK_TAGS)
+            conn.execute(CREATE_INDEX_TASK_TAGS_TAG)
+            if is_new:
+                backfilled = conn.execute(BACKFILL_TASK_TAGS).rowcount
+                logger.info("task_tags table created; backfilled %d tag(s)", backfilled)
+        except sqlite3.Error as e:
+            logger.warning("Failed to set up task_tags (run 'rt migrate' to rebuild): %s", e)
+
+        # Change counter; the seed is skipped when the table exists, since
+        # pooled readers are query-only and may not even attempt a write
+        try:
+            is_new = not conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'meta'"
+            ).fetchone()
+            if is_new:
+                conn.execute(CREATE_TABLE_META)
+                conn.execute(SEED_CHANGE_COUNTER)
+            for trigger_sql in CHANGE_COUNTER_TRIGGERS.values():
+                conn.execute(trigger_sql)
+        except sqlite3.Error as e:
+            logger.warning("Failed to set up the change counter: %s", e)
+
+        # Changelog
+        try:
+            conn.execute(CREATE_TABLE_CHANGELOG)
+            for trigger_sql in CHANGELOG_TRIGGERS.values():
+                conn.execute(trigger_sql)
+        except sqlite3.Error as e:
+            logger.warning("Failed to set up the task changelog: %s", e)
+
         # FTS5 virtual table
         try:
             conn.execute(CREATE_FTS_TABLE)
             logger.debug("FTS5 virtual table ensured")
         except sqlite3.Error as e:
             logger.warning("Failed to create FTS5 table: %s", e)
+        else:
+            _ensure_fts_sync(conn)
 
     logger.info("Schema ensured successfully")
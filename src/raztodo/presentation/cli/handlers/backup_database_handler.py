@@ -0,0 +1,60 @@
+import argparse
+from typing import Any
+
+from raztodo.presentation.cli.formatters import CLIHelpFormatter
+from raztodo.presentation.cli.helpers import (
+    clear_progress,
+    handle_command_error,
+    output_success,
+    progress_printer,
+)
+
+
+def add_parser(sub: Any) -> None:
+    """Add the 'backup' subcommand to the CLI parser."""
+    backup = sub.add_parser(
+        "backup",
+        help="Copy the database to a snapshot file",
+        description=(
+            "Take a consistent copy of the whole database with the SQLite online backup\n"
+            "API. Pages are copied in steps, so the web server and other commands can\n"
+            "keep writing while it runs. Restore the snapshot with 'rt restore'.\n\n"
+            "Examples:\n"
+            "  rt backup ~/backups/tasks.db\n"
+            "  rt backup ~/backups/tasks-2026-10-17.db --json"
+        ),
+        formatter_class=CLIHelpFormatter,
+    )
+    backup.add_argument("filepath", metavar="FILE", help="Path of the snapshot to write (required)")
+    backup.add_argument(
+        "--json",
+        action="store_true",
+        help="Output result as JSON instead of human-readable format",
+    )
+
+
+class BackupDatabaseHandler:
+    """Callable class that executes the 'backup' command."""
+
+    def __init__(self, uc: Any) -> None:
+        self.uc = uc
+
+    def __call__(self, args: argparse.Namespace) -> int:
+        try:
+            json_mode: bool = getattr(args, "json", False)
+            try:
+                result = self.uc.execute(
+                    args.filepath,
+                    progress=None if json_mode else progress_printer("Backing up", "page(s)"),
+                )
+            finally:
+                if not json_mode:
+                    clear_progress()
+            output_success(
+                f"Database backed up to {result['path']} ({result['bytes']:,} bytes)",
+                json_mode=json_mode,
+                **result,
+            )
+            return 0
+        except Exception as e:
+            return handle_command_error(e, args, filepath=args.filepath)
@@ -1,7 +1,9 @@
 import sys
 
 # Precompute a static command list for instant completions
-COMMANDS = "add list update done remove search export import migrate clear completion"
+COMMANDS = (
+    "add list update done remove search export import migrate backup restore clear completion"
+)
 
 
 class CompletionHandler:
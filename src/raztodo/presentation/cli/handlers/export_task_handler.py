@@ -1,6 +1,7 @@
 import argparse
 from typing import Any
 
+from raztodo.domain.file_formats import FILE_FORMATS
 from raztodo.presentation.cli.formatters import CLIHelpFormatter
 from raztodo.presentation.cli.helpers import handle_command_error, output_success
 
@@ -9,16 +10,26 @@ def add_parser(sub: Any) -> None:
     """Add the 'export' subcommand to the CLI parser."""
     export = sub.add_parser(
         "export",
-        help="Export tasks to a JSON file",
+        help="Export tasks to a JSON, NDJSON or CSV file",
         description=(
-            "Export all tasks to a JSON file for backup or transfer.\n\n"
+            "Export all tasks to a file for backup or transfer. The format follows the\n"
+            "extension (.json, .ndjson/.jsonl, .csv) unless --format is given, and a\n"
+            ".gz or .zst suffix compresses the output.\n\n"
             "Examples:\n"
             "  rt export tasks_backup.json\n"
+            "  rt export ~/backups/tasks.ndjson.gz\n"
+            "  rt export tasks.txt --format csv\n"
             "  rt export ~/backups/tasks_2024.json --json"
         ),
         formatter_class=CLIHelpFormatter,
     )
-    export.add_argument("filepath", metavar="FILE", help="Path to the output JSON file (required)")
+    export.add_argument("filepath", metavar="FILE", help="Path to the output file (required)")
+    export.add_argument(
+        "--format",
+        dest="file_format",
+        choices=FILE_FORMATS,
+        help="File format (default: from the file extension, else json)",
+    )
     export.add_argument(
         "--json",
         action="store_true",
@@ -34,7 +45,9 @@ class ExportTasksHandler:
 
     def __call__(self, args: argparse.Namespace) -> int:
         try:
-            success: bool = self.uc.execute(args.filepath)
+            success: bool = self.uc.execute(
+                args.filepath, file_format=getattr(args, "file_format", None)
+            )
             if success:
                 output_success(
                     f"Tasks exported successfully to {args.filepath}",
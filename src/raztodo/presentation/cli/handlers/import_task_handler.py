@@ -1,11 +1,14 @@
 import argparse
 from typing import Any
 
+from raztodo.domain.file_formats import FILE_FORMATS
 from raztodo.presentation.cli.formatters import CLIHelpFormatter
 from raztodo.presentation.cli.helpers import (
+    clear_progress,
     handle_command_error,
     output_json,
     output_success,
+    progress_printer,
 )
 
 
@@ -13,17 +16,27 @@ def add_parser(sub: Any) -> None:
     """Add the 'import' subcommand to the CLI parser."""
     import_ = sub.add_parser(
         "import",
-        help="Import tasks from a JSON file",
+        help="Import tasks from a JSON, NDJSON or CSV file",
         description=(
-            "Import tasks from a JSON file (exported by the export command).\n\n"
+            "Import tasks from a JSON file (exported by the export command), an NDJSON\n"
+            "file (.ndjson/.jsonl) with one task per line, or a CSV file with a header\n"
+            "row. The format follows the extension unless --format is given, and .gz or\n"
+            ".zst files are decompressed on the fly. The file is streamed, so memory use\n"
+            "does not grow with its size.\n\n"
             "Examples:\n"
             "  rt import tasks_backup.json\n"
+            "  rt import tasks.ndjson\n"
+            "  rt import ~/backups/tasks.csv.gz\n"
             "  rt import ~/backups/tasks.json --upsert --json"
         ),
         formatter_class=CLIHelpFormatter,
     )
+    import_.add_argument("filepath", metavar="FILE", help="Path to the file to import (required)")
     import_.add_argument(
-        "filepath", metavar="FILE", help="Path to the JSON file to import (required)"
+        "--format",
+        dest="file_format",
+        choices=FILE_FORMATS,
+        help="File format (default: from the file extension, else json)",
     )
     import_.add_argument(
         "--upsert",
@@ -45,8 +58,17 @@ class ImportTasksHandler:
 
     def __call__(self, args: argparse.Namespace) -> int:
         try:
-            res = self.uc.execute(args.filepath, upsert=getattr(args, "upsert", False))
             json_mode: bool = getattr(args, "json", False)
+            try:
+                res = self.uc.execute(
+                    args.filepath,
+                    upsert=getattr(args, "upsert", False),
+                    progress=None if json_mode else progress_printer("Importing"),
+                    file_format=getattr(args, "file_format", None),
+                )
+            finally:
+                if not json_mode:
+                    clear_progress()
 
             if json_mode:
                 if isinstance(res, dict):
@@ -58,6 +80,10 @@ class ImportTasksHandler:
                     inserted = res.get("inserted", 0)
                     updated = res.get("updated", 0)
                     total = inserted + updated
+                    rejected = [
+                        f"{res[key]} {key}" for key in ("skipped", "failed") if res.get(key)
+                    ]
+                    suffix = f" ({', '.join(rejected)})" if rejected else ""
                     if total > 0:
                         msg_parts = []
                         if inserted > 0:
@@ -65,11 +91,13 @@ class ImportTasksHandler:
                         if updated > 0:
                             msg_parts.append(f"{updated} updated")
                         output_success(
-                            f"Imported {', '.join(msg_parts)} task(s) from {args.filepath}",
+                            f"Imported {', '.join(msg_parts)} task(s) from {args.filepath}{suffix}",
                             json_mode=False,
                         )
                     else:
-                        output_success("Import completed (no changes made)", json_mode=False)
+                        output_success(
+                            f"Import completed (no changes made){suffix}", json_mode=False
+                        )
                 else:
                     output_success(
                         f"Imported {res} task(s) successfully from {args.filepath}",
@@ -1,9 +1,13 @@
 import argparse
 import sys
+from collections.abc import Iterator
+from itertools import chain
 from typing import Any
 
-from raztint import warn
+from raztint import info, warn
 
+from raztodo.domain.pagination import encode_cursor
+from raztodo.domain.task_entity import TaskEntity
 from raztodo.presentation.cli.formatters import CLIHelpFormatter
 from raztodo.presentation.cli.helpers import format_tasks_list, parse_tags
 
@@ -19,7 +23,9 @@ def add_parser(sub: Any) -> None:
             "  rt list --pending --priority H\n"
             "  rt list --project work --sort priority --desc\n"
             "  rt list --tags urgent,important --due-before 2024-12-31\n"
-            "  rt list --limit 10 --offset 20"
+            "  rt list --limit 10 --offset 20\n"
+            "  rt list --limit 10 --after <CURSOR>\n"
+            "  rt list --pending --compact"
         ),
         formatter_class=CLIHelpFormatter,
     )
@@ -41,6 +47,11 @@ def add_parser(sub: Any) -> None:
         metavar="TAGS",
         help="Filter by tags (comma-separated, e.g., 'work,urgent')",
     )
+    listp.add_argument(
+        "--all-tags",
+        action="store_true",
+        help="Require every tag given in --tags (default: match any of them)",
+    )
     listp.add_argument(
         "--due-before",
         metavar="DATE",
@@ -65,6 +76,12 @@ def add_parser(sub: Any) -> None:
         default=None,
         help="Offset for pagination (number of tasks to skip)",
     )
+    listp.add_argument(
+        "--after",
+        metavar="CURSOR",
+        default=None,
+        help="Resume listing after the cursor printed for the previous page",
+    )
     listp.add_argument(
         "--sort",
         choices=["id", "title", "created_at", "done", "priority", "due_date"],
@@ -82,6 +99,16 @@ def add_parser(sub: Any) -> None:
         action="store_true",
         help="Output results as JSON array instead of human-readable format",
     )
+    listp.add_argument(
+        "--ndjson",
+        action="store_true",
+        help="Output one JSON object per line (NDJSON) instead of a JSON array",
+    )
+    listp.add_argument(
+        "--compact",
+        action="store_true",
+        help="Show one line per task instead of the detailed layout",
+    )
 
 
 class ListTasksHandler:
@@ -104,43 +131,61 @@ class ListTasksHandler:
         elif getattr(args, "pending", False):
             done = False
 
-        tasks = self.uc.execute(
-            limit=getattr(args, "limit", None),
-            offset=getattr(args, "offset", None),
-            priority=getattr(args, "priority", None),
-            project=getattr(args, "project", None),
-            done=done,
-            tags=tags,
-            due_before=getattr(args, "due_before", None),
-            due_after=getattr(args, "due_after", None),
-        )
-
         key: str = getattr(args, "sort", "id")
         reverse: bool = getattr(args, "desc", False)
 
-        def sort_key(t: Any) -> Any:
-            if key == "id":
-                return getattr(t, "id", 0)
-            if key == "title":
-                return getattr(t, "title", "").lower()
-            if key == "created_at":
-                return getattr(t, "created_at", "")
-            if key == "done":
-                return 1 if getattr(t, "done", False) else 0
-            if key == "priority":
-                priority = getattr(t, "priority", "") or ""
-                priority_map = {"H": 3, "M": 2, "L": 1, "": 0}
-                return priority_map.get(priority.upper(), 0)
-            if key == "due_date":
-                due = getattr(t, "due_date", None) or ""
-                return due
-            return getattr(t, "id", 0)
-
-        tasks = sorted(tasks, key=sort_key, reverse=reverse)
-
-        if not tasks:
-            print(f"{warn()} No tasks found")
-            return 0
-
-        format_tasks_list(tasks, json_mode=getattr(args, "json", False))
+        filters: dict[str, Any] = {
+            "limit": getattr(args, "limit", None),
+            "offset": getattr(args, "offset", None),
+            "priority": getattr(args, "priority", None),
+            "project": getattr(args, "project", None),
+            "done": done,
+            "tags": tags,
+            "due_before": getattr(args, "due_before", None),
+            "due_after": getattr(args, "due_after", None),
+            "all_tags": getattr(args, "all_tags", False),
+            "cursor": getattr(args, "after", None),
+            "order_by": key,
+            "descending": reverse,
+        }
+
+        json_mode: bool = getattr(args, "json", False)
+        ndjson: bool = getattr(args, "ndjson", False)
+        tasks: Iterator[TaskEntity]
+        if json_mode or ndjson:
+            # Written as rows are read, so a huge listing starts at once; an
+            # empty listing is still a valid document ("[]" or no lines)
+            tasks = self.uc.iterate(**filters)
+        else:
+            tasks = iter(self.uc.execute(**filters))
+            first: TaskEntity | None = next(tasks, None)
+            if first is None:
+                print(f"{warn()} No tasks found")
+                return 0
+            tasks = chain((first,), tasks)
+
+        count = 0
+        last: TaskEntity | None = None
+
+        def counted() -> Iterator[TaskEntity]:
+            nonlocal count, last
+            for task in tasks:
+                count += 1
+                last = task
+                yield task
+
+        format_tasks_list(
+            counted(),
+            json_mode=json_mode,
+            ndjson=ndjson,
+            compact=getattr(args, "compact", False),
+        )
+
+        limit: int | None = filters["limit"]
+        if limit and count == limit and last is not None:
+            next_cursor: str = encode_cursor(last, key, reverse)
+            print(
+                f"{info()} More tasks may follow; continue with --after {next_cursor}",
+                file=sys.stderr,
+            )
         return 0
@@ -1,34 +1,39 @@
 import argparse
 from typing import Any
 
+from raztint import paint
+
 from raztodo.presentation.cli.formatters import CLIHelpFormatter
-from raztodo.presentation.cli.helpers import handle_command_error, output_success
+from raztodo.presentation.cli.helpers import handle_command_error, output_json, output_success
 
 
 def add_parser(sub: Any) -> None:
     """Add the 'done' subcommand to the CLI parser."""
     done = sub.add_parser(
         "done",
-        help="Mark a task as done or undone",
+        help="Mark tasks as done or undone",
         description=(
-            "Mark a task as completed or mark it as pending again (using --undo).\n\n"
+            "Mark one or more tasks as completed or mark them as pending again (using --undo).\n"
+            "Several IDs are updated in a single transaction.\n\n"
             "Examples:\n"
             "  rt done 1\n"
+            "  rt done 1 2 3\n"
             "  rt done 5 --undo\n"
             "  rt done 3 --json"
         ),
         formatter_class=CLIHelpFormatter,
     )
     done.add_argument(
-        "id",
+        "ids",
         type=int,
+        nargs="+",
         metavar="ID",
-        help="ID of the task to mark as done or undone (required)",
+        help="ID(s) of the task(s) to mark as done or undone (required)",
     )
     done.add_argument(
         "--undo",
         action="store_true",
-        help="Unmark the task (mark as pending/incomplete instead of done)",
+        help="Unmark the tasks (mark as pending/incomplete instead of done)",
     )
     done.add_argument(
         "--json",
@@ -44,14 +49,19 @@ class DoneTaskHandler:
         self.uc = uc
 
     def __call__(self, args: argparse.Namespace) -> int:
+        ids: list[int] = list(dict.fromkeys(args.ids))
+        if len(ids) > 1:
+            return self._many(args, ids)
+
+        task_id: int = ids[0]
         try:
-            success: bool = self.uc.execute(args.id, done=not getattr(args, "undo", False))
+            success: bool = self.uc.execute(task_id, done=not getattr(args, "undo", False))
             if success:
                 action: str = "undone" if getattr(args, "undo", False) else "completed"
                 output_success(
-                    f"Task marked as {action} (ID: {args.id})",
+                    f"Task marked as {action} (ID: {task_id})",
                     json_mode=getattr(args, "json", False),
-                    id=args.id,
+                    id=task_id,
                     done=not getattr(args, "undo", False),
                 )
                 return 0
@@ -59,7 +69,34 @@ class DoneTaskHandler:
             from raztodo.domain.exceptions import TaskNotFoundError
 
             raise TaskNotFoundError(
-                task_id=args.id, message="Task not found or no changes provided"
+                task_id=task_id, message="Task not found or no changes provided"
             )
         except Exception as e:
-            return handle_command_error(e, args)
+            return handle_command_error(e, args, id=task_id)
+
+    def _many(self, args: argparse.Namespace, ids: list[int]) -> int:
+        done: bool = not getattr(args, "undo", False)
+        json_mode: bool = getattr(args, "json", False)
+        try:
+            updated: list[int] = self.uc.execute_many(ids, done=done)
+        except Exception as e:
+            return handle_command_error(e, args, ids=ids)
+
+        matched: set[int] = set(updated)
+        missing: list[int] = [i for i in ids if i not in matched]
+        action: str = "completed" if done else "undone"
+        if json_mode:
+            output_json({"ok": not missing, "ids": updated, "missing": missing, "done": done})
+        else:
+            output_success(
+                f"{len(updated)} task(s) marked as {action} "
+                f"(IDs: {', '.join(str(i) for i in updated)})"
+            )
+            if missing:
+                print(
+                    paint(
+                        f"No task found with id(s): {', '.join(str(i) for i in missing)}",
+                        intent="error",
+                    )
+                )
+        return 1 if missing else 0
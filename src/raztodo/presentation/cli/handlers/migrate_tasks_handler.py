@@ -1,6 +1,9 @@
 import argparse
+import sys
 from typing import Any
 
+from raztint import warn
+
 from raztodo.presentation.cli.formatters import CLIHelpFormatter
 
 
@@ -12,13 +15,20 @@ def add_parser(
         "migrate",
         help="Run database migration",
         description=(
-            "Run database migration to deduplicate task titles and enforce unique index.\n"
+            "Run database migration to deduplicate task titles, enforce unique index,\n"
+            "and rebuild the tag lookup table, and check the search index.\n"
             "This command should be run when upgrading from an older version.\n\n"
-            "Example:\n"
-            "  rt migrate"
+            "Examples:\n"
+            "  rt migrate\n"
+            "  rt migrate --rebuild-fts"
         ),
         formatter_class=CLIHelpFormatter,
     )
+    p.add_argument(
+        "--rebuild-fts",
+        action="store_true",
+        help="Rebuild and optimize the full-text search index used by 'rt search'",
+    )
     p.set_defaults(command="migrate")
     return p
 
@@ -30,9 +40,22 @@ class MigrateHandler:
         self.uc = uc
 
     def __call__(self, args: argparse.Namespace) -> int:
-        result: dict[str, int] = self.uc.execute()
-        print(
+        result: dict[str, int] = self.uc.execute(
+            rebuild_fts_index=getattr(args, "rebuild_fts", False)
+        )
+        summary = (
             f"Migration completed: fixed={result.get('duplicates_fixed', 0)}, "
-            f"unique_index={result.get('unique_index', 0)}"
+            f"unique_index={result.get('unique_index', 0)}, "
+            f"tags_backfilled={result.get('tags_backfilled', 0)}"
         )
+        if "fts_rebuilt" in result:
+            summary += f", fts_rebuilt={result['fts_rebuilt']}"
+        print(summary)
+        drift = result.get("fts_drift", 0)
+        if drift:
+            print(
+                f"{warn()} Search index out of sync with tasks ({drift:+d} rows); "
+                "run 'rt migrate --rebuild-fts'",
+                file=sys.stderr,
+            )
         return 0
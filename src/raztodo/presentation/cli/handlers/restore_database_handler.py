@@ -0,0 +1,66 @@
+import argparse
+from typing import Any
+
+from raztodo.presentation.cli.formatters import CLIHelpFormatter
+from raztodo.presentation.cli.helpers import (
+    clear_progress,
+    handle_command_error,
+    output_success,
+    progress_printer,
+)
+
+
+def add_parser(sub: Any) -> None:
+    """Add the 'restore' subcommand to the CLI parser."""
+    restore = sub.add_parser(
+        "restore",
+        help="Replace the database with a snapshot",
+        description=(
+            "Replace the whole database with a snapshot taken by 'rt backup'. The\n"
+            "snapshot is integrity-checked first. Every current task is overwritten,\n"
+            "so this command requires explicit confirmation using the --confirm flag.\n\n"
+            "Examples:\n"
+            "  rt restore ~/backups/tasks.db --confirm\n"
+            "  rt restore ~/backups/tasks.db --confirm --json"
+        ),
+        formatter_class=CLIHelpFormatter,
+    )
+    restore.add_argument("filepath", metavar="FILE", help="Path of the snapshot (required)")
+    restore.add_argument(
+        "--confirm",
+        action="store_true",
+        required=True,
+        help="Confirm that you want to overwrite all current tasks (required)",
+    )
+    restore.add_argument(
+        "--json",
+        action="store_true",
+        help="Output result as JSON instead of human-readable format",
+    )
+
+
+class RestoreDatabaseHandler:
+    """Callable class that executes the 'restore' command."""
+
+    def __init__(self, uc: Any) -> None:
+        self.uc = uc
+
+    def __call__(self, args: argparse.Namespace) -> int:
+        try:
+            json_mode: bool = getattr(args, "json", False)
+            try:
+                result = self.uc.execute(
+                    args.filepath,
+                    progress=None if json_mode else progress_printer("Restoring", "page(s)"),
+                )
+            finally:
+                if not json_mode:
+                    clear_progress()
+            output_success(
+                f"Database restored from {result['path']}",
+                json_mode=json_mode,
+                **result,
+            )
+            return 0
+        except Exception as e:
+            return handle_command_error(e, args, filepath=args.filepath)
@@ -5,7 +5,11 @@ from typing import Any
 from raztint import warn
 
 from raztodo.presentation.cli.formatters import CLIHelpFormatter
-from raztodo.presentation.cli.helpers import format_tasks_list, output_json, parse_tags
+from raztodo.presentation.cli.helpers import (
+    format_search_hits,
+    format_tasks_list,
+    parse_tags,
+)
 
 
 def add_parser(sub: Any) -> None:
@@ -18,7 +22,8 @@ def add_parser(sub: Any) -> None:
             "Examples:\n"
             "  rt search 'meeting' --pending\n"
             "  rt search 'project' --priority H --project work\n"
-            "  rt search 'urgent' --tags important,work"
+            "  rt search 'urgent' --tags important,work --all-tags\n"
+            "  rt search 'report' --limit 5"
         ),
         formatter_class=CLIHelpFormatter,
     )
@@ -53,11 +58,33 @@ def add_parser(sub: Any) -> None:
         metavar="TAGS",
         help="Filter results by tags (comma-separated, e.g., 'work,urgent')",
     )
+    search.add_argument(
+        "--all-tags",
+        action="store_true",
+        help="Require every tag given in --tags (default: match any of them)",
+    )
+    search.add_argument(
+        "--limit",
+        type=int,
+        metavar="N",
+        default=None,
+        help="Show only the N most relevant matches, with highlighted snippets",
+    )
     search.add_argument(
         "--json",
         action="store_true",
         help="Output results as JSON array instead of human-readable format",
     )
+    search.add_argument(
+        "--ndjson",
+        action="store_true",
+        help="Output one JSON object per line (NDJSON) instead of a JSON array",
+    )
+    search.add_argument(
+        "--compact",
+        action="store_true",
+        help="Show one line per task instead of the detailed layout",
+    )
 
 
 class SearchTasksHandler:
@@ -69,30 +96,64 @@ class SearchTasksHandler:
     def __call__(self, args: argparse.Namespace) -> int:
         tags: list[str] = parse_tags(getattr(args, "tags", None)) or []
 
-        tasks = self.uc.execute(
-            args.keyword,
-            priority=getattr(args, "priority", None),
-            project=getattr(args, "project", None),
-            tags=tags,
-        )
-
+        done: bool | None = None
         if getattr(args, "done", False) and getattr(args, "pending", False):
             print(
                 f"{warn()} Both --done and --pending specified; showing all matches",
                 file=sys.stderr,
             )
-        else:
-            if getattr(args, "done", False):
-                tasks = [t for t in tasks if getattr(t, "done", False)]
-            if getattr(args, "pending", False):
-                tasks = [t for t in tasks if not getattr(t, "done", False)]
+        elif getattr(args, "done", False):
+            done = True
+        elif getattr(args, "pending", False):
+            done = False
+
+        limit: int | None = getattr(args, "limit", None)
+        if limit is not None:
+            return self._ranked(args, tags, done, limit)
+
+        filters: dict[str, Any] = {
+            "priority": getattr(args, "priority", None),
+            "project": getattr(args, "project", None),
+            "tags": tags,
+            "all_tags": getattr(args, "all_tags", False),
+            "done": done,
+        }
+
+        json_mode: bool = getattr(args, "json", False)
+        ndjson: bool = getattr(args, "ndjson", False)
+        if json_mode or ndjson:
+            # Matches are written as they are read, so output starts at once
+            format_tasks_list(
+                self.uc.iterate(args.keyword, **filters), json_mode=json_mode, ndjson=ndjson
+            )
+            return 0
 
+        tasks = self.uc.execute(args.keyword, **filters)
         if not tasks:
-            if getattr(args, "json", False):
-                output_json([])
-            else:
-                print(f"{warn()} No tasks found for '{args.keyword}'")
+            print(f"{warn()} No tasks found for '{args.keyword}'")
+            return 0
+
+        format_tasks_list(tasks, compact=getattr(args, "compact", False))
+        return 0
+
+    def _ranked(
+        self, args: argparse.Namespace, tags: list[str], done: bool | None, limit: int
+    ) -> int:
+        hits = self.uc.ranked(
+            args.keyword,
+            limit=limit,
+            priority=getattr(args, "priority", None),
+            project=getattr(args, "project", None),
+            done=done,
+            tags=tags,
+            all_tags=getattr(args, "all_tags", False),
+        )
+
+        json_mode: bool = getattr(args, "json", False)
+        ndjson: bool = getattr(args, "ndjson", False)
+        if not hits and not (json_mode or ndjson):
+            print(f"{warn()} No tasks found for '{args.keyword}'")
             return 0
 
-        format_tasks_list(tasks, json_mode=getattr(args, "json", False))
+        format_search_hits(hits, json_mode=json_mode, ndjson=ndjson)
         return 0
@@ -1,16 +1,22 @@
 import json
-from collections.abc import Callable
+import sys
+from collections.abc import Callable, Iterable
 from typing import Any
 
 from raztint import paint
 
 from raztodo.domain.exceptions import ERROR_TYPE_MAP
+from raztodo.domain.json_stream import encode_json_array, encode_ndjson
+from raztodo.domain.search import SearchHit
 from raztodo.domain.task_entity import TaskEntity
 
 ERROR_TYPE_PAIRS: list[tuple[type[BaseException], str]] = [
     (exc_class, key) for key, exc_class in ERROR_TYPE_MAP.items()
 ]
 
+# Characters of rendered task text buffered before each write to stdout
+RENDER_BLOCK_SIZE = 64 * 1024
+
 
 def parse_tags(tags_str: str | None) -> list[str] | None:
     if not tags_str:
@@ -20,6 +26,9 @@ def parse_tags(tags_str: str | None) -> list[str] | None:
 
 
 def task_to_dict(task: TaskEntity) -> dict[str, Any]:
+    if type(task) is TaskEntity:
+        return task.to_dict()
+    # Duck-typed tasks may lack fields; fill them with the entity defaults
     fields: list[tuple[str, Any]] = [
         ("id", None),
         ("title", ""),
@@ -38,6 +47,36 @@ def output_json(data: Any) -> None:
     print(json.dumps(data, ensure_ascii=False))
 
 
+def write_json_stream(items: Iterable[Any], ndjson: bool = False) -> None:
+    # Chunks are flushed as they are encoded, so a reader on a pipe starts
+    # at once and memory stays bounded; the JSON text matches output_json
+    chunks = encode_ndjson(items) if ndjson else encode_json_array(items, indent=None)
+    for chunk in chunks:
+        sys.stdout.write(chunk)
+        sys.stdout.flush()
+    if not ndjson:
+        sys.stdout.write("\n")
+        sys.stdout.flush()
+
+
+def progress_printer(label: str, unit: str = "item(s)") -> Callable[[int], None] | None:
+    # Progress goes to stderr and only to a terminal, keeping stdout parseable
+    if not sys.stderr.isatty():
+        return None
+
+    def report(count: int) -> None:
+        sys.stderr.write(f"\r{label}: {count:,} {unit}")
+        sys.stderr.flush()
+
+    return report
+
+
+def clear_progress() -> None:
+    if sys.stderr.isatty():
+        sys.stderr.write("\r\033[K")
+        sys.stderr.flush()
+
+
 def output_success(message: str, json_mode: bool = False, **json_data: Any) -> None:
     if json_mode:
         output_json({"ok": True, **json_data})
@@ -86,47 +125,135 @@ def handle_command_error(
     return 1
 
 
-def format_task(task: TaskEntity) -> None:
-    done: bool = getattr(task, "done", False)
-    status_icon: str = paint("", icon="ok") if done else paint("", icon="err")
-    status_text: str = (
-        paint("[Done]", color="green") if done else paint("[Pending]", color="yellow")
-    )
+class TaskRenderer:
+    """
+    Renders tasks as text, with colours and icons resolved once per listing.
 
-    created_raw: str = getattr(task, "created_at", "")
-    created_date: str = created_raw.split(" ")[0] if created_raw else "N/A"
+    paint() only wraps text in colour codes, so each colour becomes a format
+    template up front and a task costs a few string joins instead of a
+    dozen paint() calls. card() is the layout format_task prints; row() is
+    the compact one-line layout.
+    """
 
-    priority: str = getattr(task, "priority", "") or ""
-    project: str = getattr(task, "project", None) or ""
-    tags: list[str] = getattr(task, "tags", []) or []
-    due_date: str = getattr(task, "due_date", None) or ""
+    def __init__(self) -> None:
+        green, yellow, gray, blue, cyan, magenta = (
+            paint("{}", color=color).format
+            for color in ("green", "yellow", "gray", "blue", "cyan", "magenta")
+        )
+        self._ok = paint("", icon="ok")
+        self._err = paint("", icon="err")
+        self._done = gray(green("[Done]"))
+        self._pending = gray(yellow("[Pending]"))
+        self._yellow = yellow
+        self._gray = gray
+        self._blue = blue
+        self._cyan = cyan
+        self._magenta = magenta
 
-    meta_fields: list[tuple[Any, Callable[[Any], str]]] = [
-        (priority, lambda v: f"Priority: {paint(v, color='yellow')}"),
-        (project, lambda v: f"Project: {paint(v, color='cyan')}"),
-        (tags, lambda v: f"Tags: {', '.join([paint(t, color='magenta') for t in v])}"),
-        (due_date, lambda v: f"Due: {paint(v, color='gray')}"),
-    ]
+    def card(self, task: TaskEntity) -> str:
+        gray = self._gray
+        meta: list[str] = []
+        if task.priority:
+            meta.append(f"Priority: {self._yellow(task.priority)}")
+        if task.project:
+            meta.append(f"Project: {self._cyan(task.project)}")
+        if task.tags:
+            meta.append(f"Tags: {', '.join(map(self._magenta, task.tags))}")
+        if task.due_date:
+            meta.append(f"Due: {gray(task.due_date)}")
+        created = task.created_at.partition(" ")[0] if task.created_at else "N/A"
+        meta.append(f"Created: {gray(created)}")
 
-    metadata_parts: list[str] = [fmt(value) for value, fmt in meta_fields if value]
-    metadata_parts.append(f"Created: {paint(created_date, color='gray')}")
+        icon, status = (self._ok, self._done) if task.done else (self._err, self._pending)
+        head = f"{icon} {self._blue(f'#{task.id}')} {task.title} {status}\n"
+        description = f"   {gray(task.description)}\n" if task.description else ""
+        return f"{head}{description}   {gray(' | '.join(meta))}\n\n"
 
-    print(
-        f"{status_icon} {paint(f'#{task.id}', color='blue')} {task.title} "
-        f"{paint(status_text, color='gray')}"
-    )
+    def row(self, task: TaskEntity) -> str:
+        extras: list[str] = []
+        if task.project:
+            extras.append(self._cyan(f"@{task.project}"))
+        if task.tags:
+            extras.extend(self._magenta(f"+{t}") for t in task.tags)
+        if task.due_date:
+            extras.append(self._gray(f"due:{task.due_date}"))
+        icon = self._ok if task.done else self._err
+        ident = self._blue(f"#{task.id}".ljust(6))
+        priority = self._yellow(task.priority) if task.priority else self._gray("-")
+        tail = f"  {' '.join(extras)}" if extras else ""
+        return f"{icon} {ident} {priority} {task.title}{tail}\n"
 
-    description: str = getattr(task, "description", "") or ""
-    if description:
-        print(f"   {paint(description, color='gray')}")
 
-    print(f"   {paint(' | '.join(metadata_parts), color='gray')}")
-    print()
+def write_blocks(texts: Iterable[str], block_size: int = RENDER_BLOCK_SIZE) -> None:
+    # One write per block instead of several print() calls per task
+    buf: list[str] = []
+    size = 0
+    for text in texts:
+        buf.append(text)
+        size += len(text)
+        if size >= block_size:
+            sys.stdout.write("".join(buf))
+            sys.stdout.flush()
+            buf = []
+            size = 0
+    if buf:
+        sys.stdout.write("".join(buf))
+    sys.stdout.flush()
 
 
-def format_tasks_list(tasks: list[TaskEntity], json_mode: bool = False) -> None:
-    if json_mode:
-        output_json([task_to_dict(t) for t in tasks])
+def format_task(task: TaskEntity) -> None:
+    sys.stdout.write(TaskRenderer().card(task))
+
+
+def format_tasks_list(
+    tasks: Iterable[TaskEntity],
+    json_mode: bool = False,
+    ndjson: bool = False,
+    compact: bool = False,
+) -> None:
+    if json_mode or ndjson:
+        write_json_stream((task_to_dict(t) for t in tasks), ndjson=ndjson)
     else:
-        for task in tasks:
-            format_task(task)
+        renderer = TaskRenderer()
+        write_blocks(map(renderer.row if compact else renderer.card, tasks))
+
+
+def search_hit_to_dict(hit: SearchHit) -> dict[str, Any]:
+    return {
+        **task_to_dict(hit.task),
+        "score": hit.score,
+        "snippet": hit.snippet,
+        "title_highlights": [list(span) for span in hit.title_highlights],
+        "snippet_highlights": [list(span) for span in hit.snippet_highlights],
+    }
+
+
+def highlight_spans(text: str, spans: list[tuple[int, int]], color: str = "yellow") -> str:
+    parts: list[str] = []
+    pos = 0
+    for start, end in spans:
+        parts.append(text[pos:start])
+        parts.append(paint(text[start:end], color=color, styles="bold"))
+        pos = end
+    parts.append(text[pos:])
+    return "".join(parts)
+
+
+def format_search_hits(
+    hits: Iterable[SearchHit], json_mode: bool = False, ndjson: bool = False
+) -> None:
+    if json_mode or ndjson:
+        write_json_stream((search_hit_to_dict(h) for h in hits), ndjson=ndjson)
+        return
+
+    for hit in hits:
+        task = hit.task
+        status_icon: str = paint("", icon="ok") if task.done else paint("", icon="err")
+        print(
+            f"{status_icon} {paint(f'#{task.id}', color='blue')} "
+            f"{highlight_spans(task.title, hit.title_highlights)} "
+            f"{paint(f'(score {hit.score:.3g})', color='gray')}"
+        )
+        if hit.snippet:
+            print(f"   {highlight_spans(hit.snippet, hit.snippet_highlights)}")
+        print()
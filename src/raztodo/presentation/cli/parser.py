@@ -3,6 +3,7 @@ import os
 
 from raztodo.infrastructure.version import get_version
 from raztodo.presentation.cli.handlers import (
+    backup_database_handler,
     clear_tasks_handler,
     completion_handler,
     create_task_handler,
@@ -13,6 +14,7 @@ from raztodo.presentation.cli.handlers import (
     list_tasks_handler,
     mark_task_done_handler,
     migrate_tasks_handler,
+    restore_database_handler,
     search_tasks_handler,
     update_task_handler,
 )
@@ -64,6 +66,8 @@ def get_parser() -> argparse.ArgumentParser:
     import_task_handler.add_parser(sub)
     mark_task_done_handler.add_parser(sub)
     migrate_tasks_handler.add_parser(sub)
+    backup_database_handler.add_parser(sub)
+    restore_database_handler.add_parser(sub)
     clear_tasks_handler.add_parser(sub)
     completion_handler.add_parser(sub)
     explain_task_handler.add_parser(sub)
@@ -16,6 +16,8 @@ class TaskRouter(HandlerProtocol):
         "import": "import_task_handler",
         "done": "mark_task_done_handler",
         "migrate": "migrate_tasks_handler",
+        "backup": "backup_database_handler",
+        "restore": "restore_database_handler",
         "clear": "clear_tasks_handler",
         "explain": "explain_task_handler",
     }
@@ -30,6 +32,8 @@ class TaskRouter(HandlerProtocol):
         "import": "import",
         "done": "mark_done",
         "migrate": "migrate",
+        "backup": "backup",
+        "restore": "restore",
         "clear": "clear",
         "explain": "explain",
     }
@@ -115,6 +119,8 @@ class TaskRouter(HandlerProtocol):
             "import": lambda: self.use_case_factory.create_import_tasks(self.storage),
             "mark_done": lambda: self.use_case_factory.create_mark_done(self.storage),
             "migrate": lambda: self.use_case_factory.create_migrate(self.connection_factory),
+            "backup": lambda: self.use_case_factory.create_backup(self.connection_factory),
+            "restore": lambda: self.use_case_factory.create_restore(self.connection_factory),
             "clear": lambda: self.use_case_factory.create_clear_tasks(self.storage),
             "explain": lambda: self.use_case_factory.create_explain_task(self.storage),
         }
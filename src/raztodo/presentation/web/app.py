@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI, HTTPException
@@ -7,6 +9,9 @@ from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
 
 from raztodo.infrastructure.version import get_version
+from raztodo.presentation.web.dependencies import close_pool
+from raztodo.presentation.web.routes.admin import router as admin_router
+from raztodo.presentation.web.routes.changes import router as changes_router
 from raztodo.presentation.web.routes.explain import router as explain_router
 from raztodo.presentation.web.routes.tasks import router as tasks_router
 
@@ -14,16 +19,27 @@ _STATIC_DIR = Path(__file__).parent / "static"
 _TEMPLATES_DIR = Path(__file__).parent / "templates"
 _INDEX_FILE = _TEMPLATES_DIR / "index.html"
 
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    yield
+    close_pool()
+
+
 app = FastAPI(
     title="RazTodo",
     description="Local web interface for RazTodo",
     version=get_version(),
+    lifespan=lifespan,
 )
 
 app.mount("/static", StaticFiles(directory=_STATIC_DIR), name="static")
 
+# Before tasks_router, whose /api/tasks/{task_id} would otherwise claim /api/tasks/changes
+app.include_router(changes_router)
 app.include_router(tasks_router)
 app.include_router(explain_router)
+app.include_router(admin_router)
 
 
 @app.get("/", response_class=FileResponse, include_in_schema=False)
@@ -1,41 +1,70 @@
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import Annotated, Any
 
 from fastapi import Depends
 
+from raztodo.application.async_use_case import AsyncUseCase
 from raztodo.application.factory import DefaultUseCaseFactory
 from raztodo.infrastructure.container import build_container
-from raztodo.infrastructure.sqlite.task_repository import SQLiteTaskRepository
+from raztodo.infrastructure.sqlite.executor import DatabaseExecutor
 
 _container = build_container()
 
 
-def get_storage() -> SQLiteTaskRepository:
-    return _container.repo_singleton()
+async def get_executor() -> DatabaseExecutor:
+    return _container.db_executor()
 
 
-def get_factory() -> DefaultUseCaseFactory:
+def close_pool() -> None:
+    _container.close_pool()
+
+
+def get_connection_factory() -> Callable[..., Any]:
+    return _container.connection_factory()
+
+
+async def get_factory() -> DefaultUseCaseFactory:
     return DefaultUseCaseFactory()
 
 
-StorageDep = Annotated[SQLiteTaskRepository, Depends(get_storage)]
+ExecutorDep = Annotated[DatabaseExecutor, Depends(get_executor)]
+ConnectionFactoryDep = Annotated[Callable[..., Any], Depends(get_connection_factory)]
 FactoryDep = Annotated[DefaultUseCaseFactory, Depends(get_factory)]
 
 
-def get_use_case(factory_method: str):
-    def _dependency(storage: StorageDep, factory: FactoryDep) -> Any:
-        return getattr(factory, factory_method)(storage)
+def get_use_case(factory_method: str, write: bool = False):
+    # Async dependencies run on the event loop instead of taking a worker thread;
+    # each call then leases a reader, or the writer for use cases that write
+    async def _dependency(executor: ExecutorDep, factory: FactoryDep) -> AsyncUseCase:
+        return AsyncUseCase(getattr(factory, factory_method), executor, write=write)
+
+    return _dependency
+
+
+def get_admin_use_case(factory_method: str):
+    # Admin use cases work on the database file rather than the repository
+    def _dependency(connection_factory: ConnectionFactoryDep, factory: FactoryDep) -> Any:
+        return getattr(factory, factory_method)(connection_factory)
 
     return _dependency
 
 
+async def get_explain_uc(executor: ExecutorDep, factory: FactoryDep) -> Any:
+    return factory.create_async_explain_task(executor)
+
+
 get_list_uc = get_use_case("create_list_tasks")
-get_create_uc = get_use_case("create_create_task")
-get_update_uc = get_use_case("create_update_task")
-get_delete_uc = get_use_case("create_delete_task")
-get_clear_uc = get_use_case("create_clear_tasks")
-get_mark_done_uc = get_use_case("create_mark_done")
+get_get_task_uc = get_use_case("create_get_task")
+get_change_counter_uc = get_use_case("create_get_change_counter")
+get_changes_uc = get_use_case("create_list_changes")
+get_search_uc = get_use_case("create_search_tasks")
+get_create_uc = get_use_case("create_create_task", write=True)
+get_update_uc = get_use_case("create_update_task", write=True)
+get_delete_uc = get_use_case("create_delete_task", write=True)
+get_clear_uc = get_use_case("create_clear_tasks", write=True)
+get_mark_done_uc = get_use_case("create_mark_done", write=True)
 get_export_uc = get_use_case("create_export_tasks")
-get_import_uc = get_use_case("create_import_tasks")
-get_explain_uc = get_use_case("create_explain_task")
+get_import_uc = get_use_case("create_import_tasks", write=True)
+get_backup_uc = get_admin_use_case("create_backup")
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import os
+import tempfile
+from datetime import datetime
+from typing import Any
+
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from fastapi.responses import FileResponse
+
+from raztodo.domain.exceptions import RazTodoException
+from raztodo.presentation.web.dependencies import get_backup_uc
+
+router = APIRouter(prefix="/api/admin", tags=["admin"])
+
+
+def _remove_file(path: str) -> None:
+    if os.path.exists(path):
+        os.unlink(path)
+
+
+@router.get("/backup")
+def backup_database(
+    background_tasks: BackgroundTasks,
+    uc: Any = Depends(get_backup_uc),  # noqa: B008
+) -> FileResponse:
+    """
+    Download a consistent snapshot of the database, taken with the SQLite
+    online backup API; writers are not blocked while it is copied.
+    """
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    try:
+        uc.execute(path)
+    except RazTodoException as e:
+        _remove_file(path)
+        raise HTTPException(status_code=500, detail=str(e)) from e
+    background_tasks.add_task(_remove_file, path)
+    return FileResponse(
+        path=path,
+        media_type="application/vnd.sqlite3",
+        filename=f"raztodo_backup_{datetime.now():%Y%m%d_%H%M%S}.db",
+    )
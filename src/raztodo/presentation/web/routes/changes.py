@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from typing import Any
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import StreamingResponse
+
+from raztodo.domain.exceptions import RazTodoException
+from raztodo.domain.task_change import DEFAULT_CHANGES_LIMIT
+from raztodo.presentation.web.dependencies import get_changes_uc
+from raztodo.presentation.web.schemas import ChangesResponse, TaskChangeResponse
+
+router = APIRouter(prefix="/api/tasks/changes", tags=["tasks"])
+
+# Seconds between changelog reads while a stream is idle
+POLL_INTERVAL = 1.0
+# Seconds of silence before a keep-alive comment, so proxies keep the stream open
+KEEPALIVE_INTERVAL = 15.0
+
+
+def _feed_to_response(feed: Any) -> ChangesResponse:
+    return ChangesResponse(
+        changes=[TaskChangeResponse(seq=c.seq, id=c.task_id, op=c.op) for c in feed.changes],
+        last_seq=feed.last_seq,
+        reset=feed.reset,
+    )
+
+
+@router.get("", response_model=ChangesResponse)
+async def list_changes(
+    since: int | None = Query(default=None, ge=0),
+    limit: int = Query(default=DEFAULT_CHANGES_LIMIT, ge=1, le=DEFAULT_CHANGES_LIMIT),
+    uc: Any = Depends(get_changes_uc),  # noqa: B008
+) -> ChangesResponse:
+    """
+    Changes recorded after `since`; pass the returned `last_seq` as the next
+    `since`. Without `since`, only the current position is returned.
+    """
+    try:
+        return _feed_to_response(await uc.execute(since, limit))
+    except RazTodoException as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+
+def _event(name: str, response: ChangesResponse) -> str:
+    return f"event: {name}\nid: {response.last_seq}\ndata: {response.model_dump_json()}\n\n"
+
+
+async def change_events(uc: Any, since: int | None) -> AsyncIterator[str]:
+    """
+    Yield SSE events for every batch of changes after since.
+
+    A "reset" event tells the client to reload all tasks and then apply the
+    "changes" events that follow; it is sent first when since is None and
+    whenever the client has fallen behind the kept changelog.
+    """
+    position = since
+    last_sent = time.monotonic()
+    while True:
+        feed = await uc.execute(position)
+        if position is None or feed.reset:
+            yield _event("reset", ChangesResponse(last_seq=feed.last_seq, reset=True))
+            last_sent = time.monotonic()
+        elif feed.changes:
+            yield _event("changes", _feed_to_response(feed))
+            last_sent = time.monotonic()
+        position = feed.last_seq
+        if len(feed.changes) == DEFAULT_CHANGES_LIMIT:
+            continue  # more are waiting
+        if time.monotonic() - last_sent >= KEEPALIVE_INTERVAL:
+            yield ": keepalive\n\n"
+            last_sent = time.monotonic()
+        await asyncio.sleep(POLL_INTERVAL)
+
+
+@router.get("/stream")
+async def stream_changes(
+    since: int | None = Query(default=None, ge=0),
+    last_event_id: str | None = Header(default=None),
+    uc: Any = Depends(get_changes_uc),  # noqa: B008
+) -> StreamingResponse:
+    """
+    Stream task changes as Server-Sent Events (SSE).
+    Each event: event: changes|reset, id: <last_seq>, data: <ChangesResponse JSON>
+    A reconnecting EventSource resumes from its Last-Event-ID.
+    """
+    if last_event_id and last_event_id.isdigit():
+        since = int(last_event_id)
+
+    async def _sse_generator() -> AsyncIterator[str]:
+        try:
+            async for event in change_events(uc, since):
+                yield event
+        except RazTodoException:
+            yield "event: error\ndata: An internal error occurred.\n\n"
+
+    return StreamingResponse(
+        _sse_generator(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -10,7 +10,7 @@ router = APIRouter(prefix="/api/tasks", tags=["tasks"])
 
 
 @router.get("/{task_id}/explain")
-def explain_task(
+async def explain_task(
     task_id: int,
     mode: str = "short",
     uc: Any = Depends(get_explain_uc),  # noqa: B008
@@ -23,9 +23,9 @@ def explain_task(
     if mode not in ("short", "deep", "plan"):
         raise HTTPException(status_code=422, detail="mode must be: short, deep, or plan")
 
-    def _sse_generator():
+    async def _sse_generator():
         try:
-            for token in uc.stream(task_id, mode=mode):
+            async for token in uc.stream(task_id, mode=mode):
                 safe = token.replace("\n", "\\n")
                 yield f"data: {safe}\n\n"
         except RazTodoException as _exc:
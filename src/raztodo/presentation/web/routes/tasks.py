@@ -3,25 +3,32 @@ from __future__ import annotations
 import json
 import os
 import tempfile
+from collections.abc import AsyncIterator
 from typing import Any
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 
-from raztodo.domain.exceptions import RazTodoException
+from raztodo.domain.exceptions import RazTodoException, TaskNotFoundError
+from raztodo.domain.pagination import encode_cursor
+from raztodo.domain.search import DEFAULT_DESCRIPTION_WEIGHT, DEFAULT_TITLE_WEIGHT
 from raztodo.presentation.web.dependencies import (
+    get_change_counter_uc,
     get_clear_uc,
     get_create_uc,
     get_delete_uc,
     get_export_uc,
+    get_get_task_uc,
     get_import_uc,
     get_list_uc,
     get_mark_done_uc,
+    get_search_uc,
     get_update_uc,
 )
 from raztodo.presentation.web.schemas import (
     ClearResponse,
     ImportResponse,
+    SearchHitResponse,
     TaskCreate,
     TaskResponse,
     TaskUpdate,
@@ -29,10 +36,12 @@ from raztodo.presentation.web.schemas import (
 
 router = APIRouter(prefix="/api/tasks", tags=["tasks"])
 
-
-def _remove_file(path: str) -> None:
-    if os.path.exists(path):
-        os.unlink(path)
+# Media type and file extension of each export format
+EXPORT_MEDIA_TYPES: dict[str, tuple[str, str]] = {
+    "json": ("application/json", "json"),
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "csv": ("text/csv; charset=utf-8", "csv"),
+}
 
 
 def _task_to_response(task: Any) -> TaskResponse:
@@ -53,34 +62,152 @@ def _domain_error(e: Exception) -> HTTPException:
     return HTTPException(status_code=400, detail=str(e))
 
 
+def _etag(counter: int) -> str:
+    return f'"{counter}"'
+
+
+def _not_modified(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag in tags
+
+
+async def _streaming_response(
+    chunks: AsyncIterator[str], media_type: str, headers: dict[str, str]
+) -> StreamingResponse:
+    try:
+        # Pull the first chunk here so a failing query is still an error response
+        first = await anext(chunks, "")
+    except RazTodoException as e:
+        raise _domain_error(e) from e
+
+    async def body() -> AsyncIterator[str]:
+        yield first
+        async for chunk in chunks:
+            yield chunk
+
+    return StreamingResponse(body(), media_type=media_type, headers=headers)
+
+
+async def _conditional(
+    response: Response, counter_uc: Any, if_none_match: str | None
+) -> Response | None:
+    """
+    Tag the response with the database change counter.
+
+    Returns a 304 response when the client already holds this version. The
+    counter is read before the tasks, so the tag never outlives the data.
+    """
+    etag = _etag(await counter_uc.execute())
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if _not_modified(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
+
+
 @router.get("", response_model=list[TaskResponse])
-def list_tasks(
+async def list_tasks(
+    response: Response,
     q: str | None = None,
-    uc: Any = Depends(get_list_uc),  # noqa: B008
-) -> list[TaskResponse]:
+    priority: str | None = Query(default=None, pattern="^[LMH]$"),
+    project: str | None = None,
+    done: bool | None = None,
+    tags: list[str] = Query(default=[]),  # noqa: B008
+    all_tags: bool = False,
+    due_before: str | None = None,
+    due_after: str | None = None,
+    limit: int | None = Query(default=None, ge=1),
+    cursor: str | None = None,
+    stream: bool = False,
+    if_none_match: str | None = Header(default=None),
+    list_uc: Any = Depends(get_list_uc),  # noqa: B008
+    search_uc: Any = Depends(get_search_uc),  # noqa: B008
+    counter_uc: Any = Depends(get_change_counter_uc),  # noqa: B008
+) -> list[TaskResponse] | list[dict[str, Any]] | Response:
+    filters: dict[str, Any] = {
+        "priority": priority,
+        "project": project,
+        "done": done,
+        "tags": tags or None,
+        "all_tags": all_tags,
+        "due_before": due_before,
+        "due_after": due_after,
+        "limit": limit,
+        "cursor": cursor,
+    }
+    try:
+        not_modified = await _conditional(response, counter_uc, if_none_match)
+        if not_modified is not None:
+            return not_modified
+        if stream:
+            # Sent as it is read, so no X-Next-Cursor: the page is not known yet
+            chunks = (
+                search_uc.stream(q, **filters) if q and q.strip() else list_uc.stream(**filters)
+            )
+            return await _streaming_response(chunks, "application/json", dict(response.headers))
+        # Both paths are id-ordered, so the same cursor format resumes either
+        if q and q.strip():
+            tasks = await search_uc.execute(q, **filters)
+            if limit is not None and len(tasks) == limit:
+                response.headers["X-Next-Cursor"] = encode_cursor(tasks[-1])
+            return [_task_to_response(t) for t in tasks]
+        # Listings can be large: read columns and build no TaskEntity per row
+        batch = await list_uc.execute_batch(**filters)
+        if limit is not None and len(batch) == limit:
+            response.headers["X-Next-Cursor"] = encode_cursor(batch[-1])
+        return batch.to_dicts()
+    except RazTodoException as e:
+        raise _domain_error(e) from e
+
+
+@router.get("/search", response_model=list[SearchHitResponse])
+async def search_tasks(
+    q: str = Query(min_length=1),
+    limit: int = Query(default=10, ge=1, le=100),
+    title_weight: float = Query(default=DEFAULT_TITLE_WEIGHT, ge=0),
+    description_weight: float = Query(default=DEFAULT_DESCRIPTION_WEIGHT, ge=0),
+    priority: str | None = Query(default=None, pattern="^[LMH]$"),
+    project: str | None = None,
+    done: bool | None = None,
+    tags: list[str] = Query(default=[]),  # noqa: B008
+    all_tags: bool = False,
+    uc: Any = Depends(get_search_uc),  # noqa: B008
+) -> list[SearchHitResponse]:
     try:
-        tasks = uc.execute()
-        if q:
-            q_lower = q.lower()
-            tasks = [
-                t
-                for t in tasks
-                if q_lower in t.title.lower()
-                or q_lower in (getattr(t, "description", "") or "").lower()
-            ]
-        return [_task_to_response(t) for t in tasks]
+        hits = await uc.ranked(
+            q,
+            limit=limit,
+            title_weight=title_weight,
+            description_weight=description_weight,
+            priority=priority,
+            project=project,
+            done=done,
+            tags=tags,
+            all_tags=all_tags,
+        )
+        return [
+            SearchHitResponse(
+                **_task_to_response(hit.task).model_dump(),
+                score=hit.score,
+                snippet=hit.snippet,
+                title_highlights=hit.title_highlights,
+                snippet_highlights=hit.snippet_highlights,
+            )
+            for hit in hits
+        ]
     except RazTodoException as e:
         raise _domain_error(e) from e
 
 
 @router.post("", response_model=TaskResponse, status_code=201)
-def create_task(
+async def create_task(
     body: TaskCreate,
-    list_uc: Any = Depends(get_list_uc),  # noqa: B008
     create_uc: Any = Depends(get_create_uc),  # noqa: B008
 ) -> TaskResponse:
     try:
-        task_id: int = create_uc.execute(
+        task = await create_uc.execute_returning(
             title=body.title,
             description=body.description,
             priority=body.priority or "",
@@ -88,36 +215,26 @@ def create_task(
             tags=body.tags or [],
             project=body.project,
         )
-        tasks = list_uc.execute()
-        task = next((t for t in tasks if t.id == task_id), None)
-        if task is None:
-            raise HTTPException(status_code=500, detail="Task created but could not be retrieved")
         return _task_to_response(task)
     except RazTodoException as e:
         raise _domain_error(e) from e
 
 
 @router.get("/export")
-def export_tasks(
-    background_tasks: BackgroundTasks,
+async def export_tasks(
+    file_format: str = Query(default="json", alias="format", pattern="^(json|ndjson|csv)$"),
     uc: Any = Depends(get_export_uc),  # noqa: B008
-) -> FileResponse:
-    try:
-        tmp = tempfile.NamedTemporaryFile(suffix=".json", delete=False, mode="w", encoding="utf-8")  # noqa: SIM115
-        tmp.close()
-        uc.execute(tmp.name)
-        background_tasks.add_task(_remove_file, tmp.name)
-        return FileResponse(
-            path=tmp.name,
-            media_type="application/json",
-            filename="raztodo_export.json",
-        )
-    except RazTodoException as e:
-        raise _domain_error(e) from e
+) -> StreamingResponse:
+    media_type, extension = EXPORT_MEDIA_TYPES[file_format]
+    return await _streaming_response(
+        uc.stream(file_format),
+        media_type,
+        {"Content-Disposition": f'attachment; filename="raztodo_export.{extension}"'},
+    )
 
 
 @router.post("/import", response_model=ImportResponse)
-def import_tasks(
+async def import_tasks(
     tasks: list[TaskCreate],
     uc: Any = Depends(get_import_uc),  # noqa: B008
 ) -> ImportResponse:
@@ -127,7 +244,7 @@ def import_tasks(
     try:
         json.dump([t.model_dump() for t in tasks], tmp, ensure_ascii=False)
         tmp.close()
-        result = uc.execute(tmp.name, upsert=True)
+        result = await uc.execute(tmp.name, upsert=True)
         if isinstance(result, dict):
             return ImportResponse(
                 inserted=result.get("inserted", 0),
@@ -145,23 +262,42 @@ def import_tasks(
 
 
 @router.post("/clear", response_model=ClearResponse)
-def clear_tasks(uc: Any = Depends(get_clear_uc)) -> ClearResponse:  # noqa: B008
+async def clear_tasks(uc: Any = Depends(get_clear_uc)) -> ClearResponse:  # noqa: B008
     try:
-        deleted: int = uc.execute(confirmed=True)
+        deleted: int = await uc.execute(confirmed=True)
         return ClearResponse(deleted=deleted)
     except RazTodoException as e:
         raise _domain_error(e) from e
 
 
+@router.get("/{task_id}", response_model=TaskResponse)
+async def get_task(
+    task_id: int,
+    response: Response,
+    if_none_match: str | None = Header(default=None),
+    uc: Any = Depends(get_get_task_uc),  # noqa: B008
+    counter_uc: Any = Depends(get_change_counter_uc),  # noqa: B008
+) -> TaskResponse | Response:
+    try:
+        not_modified = await _conditional(response, counter_uc, if_none_match)
+        if not_modified is not None:
+            return not_modified
+        task = await uc.execute(task_id)
+    except RazTodoException as e:
+        raise _domain_error(e) from e
+    if task is None:
+        raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
+    return _task_to_response(task)
+
+
 @router.put("/{task_id}", response_model=TaskResponse)
-def update_task(
+async def update_task(
     task_id: int,
     body: TaskUpdate,
-    list_uc: Any = Depends(get_list_uc),  # noqa: B008
     update_uc: Any = Depends(get_update_uc),  # noqa: B008
 ) -> TaskResponse:
     try:
-        update_uc.execute(
+        task = await update_uc.execute_returning(
             task_id,
             title=body.title,
             description=body.description,
@@ -170,42 +306,30 @@ def update_task(
             tags=body.tags if body.tags is not None else [],
             project=body.project if body.project is not None else "",
         )
-        tasks = list_uc.execute()
-        task = next((t for t in tasks if t.id == task_id), None)
-        if task is None:
-            raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
         return _task_to_response(task)
     except RazTodoException as e:
         raise _domain_error(e) from e
 
 
 @router.delete("/{task_id}", status_code=204)
-def delete_task(
+async def delete_task(
     task_id: int,
     uc: Any = Depends(get_delete_uc),  # noqa: B008
 ) -> None:
     try:
-        uc.execute(task_id)
+        await uc.execute(task_id)
     except RazTodoException as e:
         raise HTTPException(status_code=404, detail=str(e)) from e
 
 
 @router.patch("/{task_id}/done", response_model=TaskResponse)
-def toggle_done(
+async def toggle_done(
     task_id: int,
-    list_uc: Any = Depends(get_list_uc),  # noqa: B008
     mark_uc: Any = Depends(get_mark_done_uc),  # noqa: B008
 ) -> TaskResponse:
     try:
-        tasks = list_uc.execute()
-        task = next((t for t in tasks if t.id == task_id), None)
-        if task is None:
-            raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
-        mark_uc.execute(task_id, done=not task.done)
-        tasks = list_uc.execute()
-        task = next((t for t in tasks if t.id == task_id), None)
-        if task is None:
-            raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
-        return _task_to_response(task)
+        return _task_to_response(await mark_uc.toggle(task_id))
+    except TaskNotFoundError as e:
+        raise HTTPException(status_code=404, detail=f"Task {task_id} not found") from e
     except RazTodoException as e:
         raise _domain_error(e) from e
@@ -33,6 +33,25 @@ class TaskResponse(BaseModel):
     project: str | None = None
 
 
+class SearchHitResponse(TaskResponse):
+    score: float = 0.0
+    snippet: str = ""
+    title_highlights: list[tuple[int, int]] = Field(default_factory=list)
+    snippet_highlights: list[tuple[int, int]] = Field(default_factory=list)
+
+
+class TaskChangeResponse(BaseModel):
+    seq: int
+    id: int
+    op: str
+
+
+class ChangesResponse(BaseModel):
+    changes: list[TaskChangeResponse] = Field(default_factory=list)
+    last_seq: int
+    reset: bool = False
+
+
 class ImportPayload(BaseModel):
     """Raw JSON list of task dicts — validated at use-case level."""
 
@@ -1,7 +1,7 @@
 import { API, api } from "../shared/api.js";
 import { state } from "../shared/state.js";
 import { setStatus } from "../shared/toast.js";
-import { renderTasks } from "./render.js";
+import { removeTask, renderTasks, upsertTask } from "./render.js";
 
 function getCreatePayload() {
   return {
@@ -27,8 +27,12 @@ function resetCreateForm() {
   document.getElementById("new-priority").value = "";
 }
 
+export function searchQuery() {
+  return document.getElementById("search-input").value.trim();
+}
+
 export async function loadTasks() {
-  const query = document.getElementById("search-input").value.trim();
+  const query = searchQuery();
   const url = query ? `${API}?q=${encodeURIComponent(query)}` : API;
   try {
     renderTasks(await api(url));
@@ -37,6 +41,18 @@ export async function loadTasks() {
   }
 }
 
+// Apply a single changed task in place; search results are reloaded instead,
+// since the change may move the task in or out of them
+export async function showTask(task) {
+  if (searchQuery()) await loadTasks();
+  else upsertTask(task);
+}
+
+export async function hideTask(id) {
+  if (searchQuery()) await loadTasks();
+  else removeTask(id);
+}
+
 export async function addTask() {
   const payload = getCreatePayload();
   if (!payload.title) {
@@ -44,7 +60,7 @@ export async function addTask() {
     return;
   }
   try {
-    await api(API, {
+    const task = await api(API, {
       method: "POST",
       headers: { "Content-Type": "application/json" },
       body: JSON.stringify(payload),
@@ -52,7 +68,7 @@ export async function addTask() {
     resetCreateForm();
     document.getElementById("new-title").focus();
     setStatus("Task added.");
-    await loadTasks();
+    await showTask(task);
   } catch (error) {
     setStatus(error.message, true);
   }
@@ -60,9 +76,9 @@ export async function addTask() {
 
 export async function toggleDone(id, currentDone) {
   try {
-    await api(`${API}/${id}/done`, { method: "PATCH" });
+    const task = await api(`${API}/${id}/done`, { method: "PATCH" });
     setStatus(currentDone ? "Marked as pending." : "Marked as done.");
-    await loadTasks();
+    await showTask(task);
   } catch (error) {
     setStatus(error.message, true);
   }
@@ -73,7 +89,7 @@ export async function deleteTask(id) {
   try {
     await api(`${API}/${id}`, { method: "DELETE" });
     setStatus("Task deleted.");
-    await loadTasks();
+    await hideTask(id);
   } catch (error) {
     setStatus(error.message, true);
   }
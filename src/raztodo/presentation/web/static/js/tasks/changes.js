@@ -0,0 +1,46 @@
+import { API, api } from "../shared/api.js";
+import { setStatus } from "../shared/toast.js";
+import { hideTask, loadTasks, searchQuery, showTask } from "./actions.js";
+
+// Past this many changed tasks, reloading the list beats fetching each one
+const MAX_FETCHED_CHANGES = 50;
+
+let queue = Promise.resolve();
+
+function enqueue(work) {
+  // Applied one batch at a time, in the order the server sent them
+  queue = queue.then(work).catch((error) => setStatus(error.message, true));
+}
+
+async function applyChanges(changes) {
+  const latest = new Map();
+  changes.forEach((change) => latest.set(change.id, change.op));
+
+  if (searchQuery() || latest.size > MAX_FETCHED_CHANGES) {
+    await loadTasks();
+    return;
+  }
+
+  for (const [id, op] of latest) {
+    if (op === "delete") {
+      await hideTask(id);
+      continue;
+    }
+    try {
+      await showTask(await api(`${API}/${id}`));
+    } catch {
+      // Deleted again before we asked for it; its delete event follows
+      await hideTask(id);
+    }
+  }
+}
+
+export function watchChanges() {
+  if (!("EventSource" in window)) return;
+
+  const source = new EventSource(`${API}/changes/stream`);
+  source.addEventListener("reset", () => enqueue(loadTasks));
+  source.addEventListener("changes", (event) =>
+    enqueue(() => applyChanges(JSON.parse(event.data).changes)),
+  );
+}
@@ -2,7 +2,7 @@ import { API, api } from "../shared/api.js";
 import { state } from "../shared/state.js";
 import { setStatus } from "../shared/toast.js";
 import { renderTasks } from "./render.js";
-import { loadTasks } from "./actions.js";
+import { showTask } from "./actions.js";
 
 export function startEdit(id) {
   state.editingTaskId = id;
@@ -41,14 +41,14 @@ export async function saveEdit(id) {
   }
 
   try {
-    await api(`${API}/${id}`, {
+    const task = await api(`${API}/${id}`, {
       method: "PUT",
       headers: { "Content-Type": "application/json" },
       body: JSON.stringify(payload),
     });
     state.editingTaskId = null;
     setStatus("Task updated.");
-    await loadTasks();
+    await showTask(task);
   } catch (error) {
     setStatus(error.message, true);
   }
@@ -9,6 +9,7 @@ import {
   setFilter,
   toggleDone,
 } from "./actions.js";
+import { watchChanges } from "./changes.js";
 import { cancelEdit, saveEdit, startEdit } from "./edit.js";
 
 function initCreateForm() {
@@ -67,4 +68,5 @@ export function initTasks() {
   initTools();
   initTaskListActions();
   loadTasks();
+  watchChanges();
 }
@@ -112,6 +112,23 @@ export function renderTask(task) {
 </li>`;
 }
 
+function updateTasks(tasks) {
+  // Re-rendering would discard the open edit form; it renders on close
+  if (state.editingTaskId === null) renderTasks(tasks);
+  else state.tasks = tasks;
+}
+
+export function upsertTask(task) {
+  const tasks = state.tasks.filter((t) => t.id !== task.id);
+  tasks.push(task);
+  tasks.sort((a, b) => a.id - b.id);
+  updateTasks(tasks);
+}
+
+export function removeTask(id) {
+  updateTasks(state.tasks.filter((t) => t.id !== id));
+}
+
 export function renderTasks(tasks) {
   state.tasks = tasks;
   const filtered =
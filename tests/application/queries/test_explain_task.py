@@ -1,11 +1,14 @@
+import asyncio
 import json
 from collections.abc import Generator
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from raztodo.application.async_use_case import AsyncUseCase
 from raztodo.application.queries.explain_task import (
     MODE_PROMPTS,
+    AsyncExplainTaskUseCase,
     ExplainTaskUseCase,
     _task_to_json,
 )
@@ -96,34 +99,34 @@ class TestTaskToJson:
 
 class TestGetPrompt:
     def test_valid_mode_returns_prompt_containing_task_json(self, use_case, task):
-        prompt = use_case._get_prompt(task.id, "short")
+        prompt = use_case.prompt(task.id, "short")
         assert task.title in prompt
         assert "short" not in prompt
 
     @pytest.mark.parametrize("mode", ["short", "deep", "plan"])
     def test_all_modes_produce_non_empty_prompt(self, use_case, task, mode):
-        prompt = use_case._get_prompt(task.id, mode)
+        prompt = use_case.prompt(task.id, mode)
         assert len(prompt) > 0
 
     def test_unknown_mode_raises(self, use_case, task):
         with pytest.raises(RazTodoException, match="Unknown explain mode"):
-            use_case._get_prompt(task.id, "turbo")
+            use_case.prompt(task.id, "turbo")
 
     def test_unknown_task_id_raises(self, use_case):
         with pytest.raises(RazTodoException, match="TaskNotFoundError"):
-            use_case._get_prompt(999, "short")
+            use_case.prompt(999, "short")
 
     def test_prompt_contains_json_block(self, use_case, task):
-        prompt = use_case._get_prompt(task.id, "deep")
+        prompt = use_case.prompt(task.id, "deep")
         assert json.dumps(task.title) in prompt
 
     def test_repo_get_task_called_once(self, use_case, repo, task):
-        use_case._get_prompt(task.id, "plan")
+        use_case.prompt(task.id, "plan")
         repo.get_task.assert_called_once_with(task.id)
 
     def test_correct_mode_template_used(self, use_case, task):
         for mode, template in MODE_PROMPTS.items():
-            prompt = use_case._get_prompt(task.id, mode)
+            prompt = use_case.prompt(task.id, mode)
             assert template[:20] in prompt
 
 
@@ -255,6 +258,62 @@ class TestStream:
         assert result == tokens
 
 
+class InlineRunner:
+    def __init__(self, repo):
+        self.repo = repo
+
+    async def run(self, fn, write=False):
+        return fn(self.repo)
+
+
+class TestAsyncStream:
+    @pytest.fixture()
+    def async_use_case(self, repo):
+        return AsyncExplainTaskUseCase(AsyncUseCase(ExplainTaskUseCase, InlineRunner(repo)))
+
+    @staticmethod
+    def _collect(stream):
+        async def collect():
+            return [token async for token in stream]
+
+        return asyncio.run(collect())
+
+    def test_yields_tokens_from_astream_chat(self, async_use_case, task):
+        async def fake_astream(prompt, system=""):
+            assert MODE_PROMPTS["plan"][:20] in prompt
+            for token in ["Step", " one"]:
+                yield token
+
+        with patch(
+            "raztodo.application.queries.explain_task.astream_chat", side_effect=fake_astream
+        ):
+            result = self._collect(async_use_case.stream(task.id, mode="plan"))
+
+        assert result == ["Step", " one"]
+
+    def test_missing_task_raises_before_streaming(self, async_use_case):
+        with (
+            patch("raztodo.application.queries.explain_task.astream_chat") as mock_stream,
+            pytest.raises(RazTodoException, match="TaskNotFoundError"),
+        ):
+            self._collect(async_use_case.stream(999))
+
+        mock_stream.assert_not_called()
+
+    def test_ollama_error_wrapped_in_raztodo_exception(self, async_use_case, task):
+        from raztodo.infrastructure.llm.client import OllamaClientError
+
+        async def bad_stream(*_, **__):
+            raise OllamaClientError("timeout")
+            yield
+
+        with (
+            patch("raztodo.application.queries.explain_task.astream_chat", side_effect=bad_stream),
+            pytest.raises(RazTodoException, match="OllamaError"),
+        ):
+            self._collect(async_use_case.stream(task.id))
+
+
 class TestPromptConsistency:
     """Both execute() and stream() must send the same prompt for the same inputs."""
 
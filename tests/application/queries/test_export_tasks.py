@@ -74,3 +74,12 @@ class TestExportTasksUseCase:
         finally:
             if os.path.exists(temp_file):
                 os.unlink(temp_file)
+
+    def test_stream_yields_json_chunks(self, task_repo):
+        """Test streaming the export without a file."""
+        task_repo.add_task("Task 1")
+
+        use_case = ExportTasksUseCase(task_repo)
+        data = json.loads("".join(use_case.stream()))
+
+        assert [t["title"] for t in data] == ["Task 1"]
@@ -0,0 +1,13 @@
+from raztodo.application.queries.get_change_counter import GetChangeCounterUseCase
+
+
+class TestGetChangeCounterUseCase:
+    """Test cases for GetChangeCounterUseCase."""
+
+    def test_returns_repository_counter(self, mock_repo):
+        """Test returning the repository's change counter."""
+        mock_repo.change_counter.return_value = 42
+        use_case = GetChangeCounterUseCase(mock_repo)
+
+        assert use_case.execute() == 42
+        mock_repo.change_counter.assert_called_once_with()
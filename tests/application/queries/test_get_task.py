@@ -0,0 +1,20 @@
+from raztodo.application.queries.get_task import GetTaskUseCase
+
+
+class TestGetTaskUseCase:
+    """Test cases for GetTaskUseCase."""
+
+    def test_get_task_found(self, mock_repo, sample_task):
+        """Test returning the task stored under the given id."""
+        mock_repo.get_task.return_value = sample_task
+        use_case = GetTaskUseCase(mock_repo)
+
+        assert use_case.execute(1) is sample_task
+        mock_repo.get_task.assert_called_once_with(1)
+
+    def test_get_task_not_found(self, mock_repo):
+        """Test returning None for an unknown id."""
+        mock_repo.get_task.return_value = None
+        use_case = GetTaskUseCase(mock_repo)
+
+        assert use_case.execute(999) is None
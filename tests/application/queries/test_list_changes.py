@@ -0,0 +1,21 @@
+from raztodo.application.queries.list_changes import ListChangesUseCase
+from raztodo.domain.task_change import DEFAULT_CHANGES_LIMIT, ChangeFeed
+
+
+class TestListChangesUseCase:
+    """Test cases for ListChangesUseCase."""
+
+    def test_returns_repository_feed(self, mock_repo):
+        """Test passing the position and limit through to the repository."""
+        feed = ChangeFeed(last_seq=7)
+        mock_repo.get_changes.return_value = feed
+        use_case = ListChangesUseCase(mock_repo)
+
+        assert use_case.execute(3, limit=10) is feed
+        mock_repo.get_changes.assert_called_once_with(3, 10)
+
+    def test_defaults(self, mock_repo):
+        """Test that no position and the default limit are used by default."""
+        ListChangesUseCase(mock_repo).execute()
+
+        mock_repo.get_changes.assert_called_once_with(None, DEFAULT_CHANGES_LIMIT)
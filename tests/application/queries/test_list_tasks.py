@@ -1,4 +1,7 @@
+import json
+
 from raztodo.application.queries.list_tasks import ListTasksUseCase
+from raztodo.domain.task_batch import TaskBatch
 from raztodo.domain.task_entity import TaskEntity
 
 
@@ -23,6 +26,10 @@ class TestListTasksUseCase:
             tags=None,
             due_before=None,
             due_after=None,
+            all_tags=False,
+            cursor=None,
+            order_by="id",
+            descending=False,
         )
 
     def test_list_tasks_with_filters(self, mock_repo):
@@ -40,6 +47,10 @@ class TestListTasksUseCase:
             tags=["urgent"],
             due_before="2025-12-31",
             due_after="2025-01-01",
+            all_tags=True,
+            cursor="abc",
+            order_by="priority",
+            descending=True,
         )
 
         assert result == tasks
@@ -52,4 +63,54 @@ class TestListTasksUseCase:
             tags=["urgent"],
             due_before="2025-12-31",
             due_after="2025-01-01",
+            all_tags=True,
+            cursor="abc",
+            order_by="priority",
+            descending=True,
         )
+
+    def test_execute_batch_returns_repository_batch(self, mock_repo):
+        """Test that execute_batch passes the filters to get_task_batch."""
+        batch = TaskBatch.from_tasks([TaskEntity(id=1, title="Task 1")])
+        mock_repo.get_task_batch.return_value = batch
+        use_case = ListTasksUseCase(mock_repo)
+
+        result = use_case.execute_batch(done=True, order_by="title")
+
+        assert result is batch
+        mock_repo.get_task_batch.assert_called_once_with(
+            limit=None,
+            offset=None,
+            priority=None,
+            project=None,
+            done=True,
+            tags=None,
+            due_before=None,
+            due_after=None,
+            all_tags=False,
+            cursor=None,
+            order_by="title",
+            descending=False,
+        )
+
+    def test_iterate_returns_repository_iterator(self, mock_repo):
+        """Test that iterate hands back the lazy repository listing."""
+        tasks = iter([TaskEntity(id=1, title="Task 1")])
+        mock_repo.iter_tasks.return_value = tasks
+        use_case = ListTasksUseCase(mock_repo)
+
+        assert use_case.iterate(project="Work") is tasks
+        assert mock_repo.iter_tasks.call_args.kwargs["project"] == "Work"
+
+    def test_stream_encodes_json_array(self, mock_repo):
+        """Test that stream yields the listing as JSON text."""
+        mock_repo.iter_tasks.return_value = iter(
+            [TaskEntity(id=1, title="Task 1"), TaskEntity(id=2, title="Task 2", tags=["a"])]
+        )
+        use_case = ListTasksUseCase(mock_repo)
+
+        data = json.loads("".join(use_case.stream(limit=2)))
+
+        assert [t["id"] for t in data] == [1, 2]
+        assert data[1]["tags"] == ["a"]
+        assert mock_repo.iter_tasks.call_args.kwargs["limit"] == 2
@@ -1,4 +1,7 @@
+import json
+
 from raztodo.application.queries.search_tasks import SearchTasksUseCase
+from raztodo.domain.search import SearchHit
 from raztodo.domain.task_entity import TaskEntity
 
 
@@ -15,7 +18,16 @@ class TestSearchTasksUseCase:
 
         assert result == tasks
         mock_repo.search_tasks.assert_called_once_with(
-            "test", priority=None, project=None, tags=None
+            "test",
+            priority=None,
+            project=None,
+            tags=None,
+            all_tags=False,
+            done=None,
+            due_before=None,
+            due_after=None,
+            limit=None,
+            cursor=None,
         )
 
     def test_search_tasks_with_filters(self, mock_repo):
@@ -24,11 +36,31 @@ class TestSearchTasksUseCase:
         mock_repo.search_tasks.return_value = tasks
         use_case = SearchTasksUseCase(mock_repo)
 
-        result = use_case.execute("test", priority="H", project="Work", tags=["urgent"])
+        result = use_case.execute(
+            "test",
+            priority="H",
+            project="Work",
+            tags=["urgent"],
+            all_tags=True,
+            done=False,
+            due_before="2025-12-31",
+            due_after="2025-01-01",
+            limit=10,
+            cursor="abc",
+        )
 
         assert result == tasks
         mock_repo.search_tasks.assert_called_once_with(
-            "test", priority="H", project="Work", tags=["urgent"]
+            "test",
+            priority="H",
+            project="Work",
+            tags=["urgent"],
+            all_tags=True,
+            done=False,
+            due_before="2025-12-31",
+            due_after="2025-01-01",
+            limit=10,
+            cursor="abc",
         )
 
     def test_search_tasks_empty_keyword(self, mock_repo):
@@ -48,3 +80,50 @@ class TestSearchTasksUseCase:
 
         assert result == []
         mock_repo.search_tasks.assert_not_called()
+
+    def test_ranked_search(self, mock_repo):
+        """Test ranked search delegates limit, weights and filters."""
+        hits = [SearchHit(task=TaskEntity(id=1, title="Test Task"), score=2.0)]
+        mock_repo.search_ranked.return_value = hits
+        use_case = SearchTasksUseCase(mock_repo)
+
+        result = use_case.ranked("test", limit=5, title_weight=3.0, done=False, tags=["a"])
+
+        assert result == hits
+        mock_repo.search_ranked.assert_called_once_with(
+            "test",
+            limit=5,
+            title_weight=3.0,
+            description_weight=1.0,
+            priority=None,
+            project=None,
+            done=False,
+            tags=["a"],
+            all_tags=False,
+        )
+
+    def test_ranked_search_blank_keyword(self, mock_repo):
+        """Test ranked search with a blank keyword skips the repository."""
+        use_case = SearchTasksUseCase(mock_repo)
+
+        assert use_case.ranked("  ") == []
+        mock_repo.search_ranked.assert_not_called()
+
+    def test_stream_encodes_matches(self, mock_repo):
+        """Test that stream yields the lazy search results as JSON text."""
+        mock_repo.iter_search.return_value = iter([TaskEntity(id=1, title="Test Task")])
+        use_case = SearchTasksUseCase(mock_repo)
+
+        data = json.loads("".join(use_case.stream("test", done=True)))
+
+        assert data[0]["title"] == "Test Task"
+        assert mock_repo.iter_search.call_args.args == ("test",)
+        assert mock_repo.iter_search.call_args.kwargs["done"] is True
+
+    def test_iterate_blank_keyword_skips_repository(self, mock_repo):
+        """Test that a blank keyword yields nothing without a query."""
+        use_case = SearchTasksUseCase(mock_repo)
+
+        assert list(use_case.iterate("  ")) == []
+        assert json.loads("".join(use_case.stream(""))) == []
+        mock_repo.iter_search.assert_not_called()
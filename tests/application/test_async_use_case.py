@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+
+from raztodo.application.async_use_case import AsyncUseCase
+
+
+class FakeRunner:
+    """Runs repository work inline and records the lease kind."""
+
+    def __init__(self, repo):
+        self.repo = repo
+        self.writes: list[bool] = []
+
+    async def run(self, fn, write=False):
+        self.writes.append(write)
+        return fn(self.repo)
+
+    async def iterate(self, fn, write=False):
+        self.writes.append(write)
+        for item in fn(self.repo):
+            yield item
+
+
+class EchoUseCase:
+    def __init__(self, repo):
+        self.repo = repo
+
+    def execute(self, value, suffix=""):
+        return f"{self.repo}:{value}{suffix}"
+
+    def stream(self, count):
+        yield from range(count)
+
+
+class TestAsyncUseCase:
+    """Tests for AsyncUseCase."""
+
+    def test_methods_become_coroutines(self):
+        runner = FakeRunner("repo")
+        uc = AsyncUseCase(EchoUseCase, runner)
+
+        assert asyncio.run(uc.execute(1, suffix="!")) == "repo:1!"
+        assert runner.writes == [False]
+
+    def test_write_flag_is_passed_to_runner(self):
+        runner = FakeRunner("repo")
+        uc = AsyncUseCase(EchoUseCase, runner, write=True)
+
+        asyncio.run(uc.call("execute", 1))
+
+        assert runner.writes == [True]
+
+    def test_stream_is_iterated(self):
+        uc = AsyncUseCase(EchoUseCase, FakeRunner("repo"))
+
+        async def collect():
+            return [item async for item in uc.stream(3)]
+
+        assert asyncio.run(collect()) == [0, 1, 2]
+
+    def test_private_attributes_are_not_proxied(self):
+        uc = AsyncUseCase(EchoUseCase, FakeRunner("repo"))
+
+        with pytest.raises(AttributeError):
+            uc._missing  # noqa: B018
@@ -1,16 +1,21 @@
 from unittest.mock import MagicMock
 
 from raztodo.application.factory import DefaultUseCaseFactory
-from raztodo.application.queries.explain_task import ExplainTaskUseCase
+from raztodo.application.queries.explain_task import AsyncExplainTaskUseCase, ExplainTaskUseCase
 from raztodo.application.queries.export_tasks import ExportTasksUseCase
+from raztodo.application.queries.get_change_counter import GetChangeCounterUseCase
+from raztodo.application.queries.get_task import GetTaskUseCase
+from raztodo.application.queries.list_changes import ListChangesUseCase
 from raztodo.application.queries.list_tasks import ListTasksUseCase
 from raztodo.application.queries.search_tasks import SearchTasksUseCase
+from raztodo.application.use_cases.backup_database import BackupDatabaseUseCase
 from raztodo.application.use_cases.clear_tasks import ClearTasksUseCase
 from raztodo.application.use_cases.create_task import CreateTaskUseCase
 from raztodo.application.use_cases.delete_task import DeleteTaskUseCase
 from raztodo.application.use_cases.import_tasks import ImportTasksUseCase
 from raztodo.application.use_cases.mark_task_done import MarkDoneUseCase
 from raztodo.application.use_cases.migrate_tasks import MigrateUseCase
+from raztodo.application.use_cases.restore_database import RestoreDatabaseUseCase
 from raztodo.application.use_cases.update_task import UpdateTaskUseCase
 
 
@@ -25,6 +30,9 @@ class TestUseCaseFactory:
             (factory.create_create_task(mock_repo), CreateTaskUseCase),
             (factory.create_delete_task(mock_repo), DeleteTaskUseCase),
             (factory.create_list_tasks(mock_repo), ListTasksUseCase),
+            (factory.create_get_task(mock_repo), GetTaskUseCase),
+            (factory.create_get_change_counter(mock_repo), GetChangeCounterUseCase),
+            (factory.create_list_changes(mock_repo), ListChangesUseCase),
             (factory.create_update_task(mock_repo), UpdateTaskUseCase),
             (factory.create_search_tasks(mock_repo), SearchTasksUseCase),
             (factory.create_export_tasks(mock_repo), ExportTasksUseCase),
@@ -47,3 +55,26 @@ class TestUseCaseFactory:
 
         assert isinstance(migrate_use_case, MigrateUseCase)
         assert migrate_use_case._connection_factory is connection_factory
+
+    def test_factory_creates_backup_and_restore_with_connection_factory(self):
+        """Ensure backup and restore use cases receive the connection factory."""
+        factory = DefaultUseCaseFactory()
+        connection_factory = MagicMock(name="connection_factory")
+
+        backup = factory.create_backup(connection_factory)
+        restore = factory.create_restore(connection_factory)
+
+        assert isinstance(backup, BackupDatabaseUseCase)
+        assert isinstance(restore, RestoreDatabaseUseCase)
+        assert backup._connection_factory is connection_factory
+        assert restore._connection_factory is connection_factory
+
+    def test_factory_creates_async_explain_use_case_with_runner(self):
+        """Ensure the async explain use case reads through the given runner."""
+        factory = DefaultUseCaseFactory()
+        runner = MagicMock(name="runner")
+
+        use_case = factory.create_async_explain_task(runner)
+
+        assert isinstance(use_case, AsyncExplainTaskUseCase)
+        assert use_case.explain._runner is runner
@@ -0,0 +1,54 @@
+import pytest
+
+from raztodo.application.use_cases.backup_database import BackupDatabaseUseCase
+from raztodo.application.use_cases.restore_database import RestoreDatabaseUseCase
+from raztodo.domain.exceptions import RazTodoException
+from raztodo.infrastructure.sqlite.connection import sqlite_connection_factory
+from raztodo.infrastructure.sqlite.task_repository import SQLiteTaskRepository
+
+
+class TestBackupDatabaseUseCase:
+    """Test cases for BackupDatabaseUseCase and RestoreDatabaseUseCase."""
+
+    @pytest.fixture
+    def connection_factory(self, tmp_path):
+        return sqlite_connection_factory(tmp_path / "live.db")
+
+    def test_backup_and_restore(self, connection_factory, tmp_path):
+        """Test a snapshot round trip through both use cases."""
+        repo = SQLiteTaskRepository(connection_factory)
+        repo.add_task("Keep me")
+        snapshot = tmp_path / "snap.db"
+
+        result = BackupDatabaseUseCase(connection_factory).execute(str(snapshot))
+
+        assert result["path"] == str(snapshot.resolve())
+        assert result["bytes"] == snapshot.stat().st_size
+        assert result["pages"] > 0
+
+        repo.clear_all_tasks()
+        seen: list[int] = []
+        restored = RestoreDatabaseUseCase(connection_factory).execute(
+            str(snapshot), progress=seen.append
+        )
+
+        assert restored == {"path": str(snapshot.resolve()), "pages": result["pages"]}
+        assert seen[-1] == result["pages"]
+        assert [t.title for t in repo.get_tasks()] == ["Keep me"]
+        repo.close()
+
+    def test_backup_wraps_os_errors(self, connection_factory, tmp_path):
+        """Test that an unwritable destination is reported as RazTodoException."""
+        blocker = tmp_path / "file"
+        blocker.write_text("", encoding="utf-8")
+
+        with pytest.raises(RazTodoException, match="Failed to back up"):
+            BackupDatabaseUseCase(connection_factory).execute(str(blocker / "snap.db"))
+
+    def test_restore_invalid_snapshot(self, connection_factory, tmp_path):
+        """Test that an invalid snapshot is rejected."""
+        bogus = tmp_path / "bogus.db"
+        bogus.write_bytes(b"\0" * 1024)
+
+        with pytest.raises(RazTodoException):
+            RestoreDatabaseUseCase(connection_factory).execute(str(bogus))
@@ -86,3 +86,24 @@ class TestCreateTaskUseCase:
             or "duplicate" in str(exc_info.value).lower()
             or "already exists" in str(exc_info.value).lower()
         )
+
+    def test_execute_returning(self, mock_repo, sample_task):
+        """Test creating a task returns the stored entity from the repository."""
+        mock_repo.add_task_returning.return_value = sample_task
+        use_case = CreateTaskUseCase(mock_repo)
+
+        result = use_case.execute_returning("  Test Task  ", "Description", priority="M")
+
+        assert result is sample_task
+        mock_repo.add_task_returning.assert_called_once_with(
+            "Test Task", "Description", "M", None, None, None
+        )
+
+    def test_execute_returning_empty_title(self, mock_repo):
+        """Test execute_returning validates the title before touching the repository."""
+        use_case = CreateTaskUseCase(mock_repo)
+
+        with pytest.raises(RazTodoException, match="cannot be empty"):
+            use_case.execute_returning("   ")
+
+        mock_repo.add_task_returning.assert_not_called()
@@ -1,3 +1,4 @@
+import gzip
 import json
 from unittest.mock import mock_open
 
@@ -5,7 +6,6 @@ import pytest
 
 from raztodo.application.use_cases.import_tasks import ImportTasksUseCase
 from raztodo.domain.exceptions import RazTodoException
-from raztodo.domain.task_entity import TaskEntity
 
 
 class TestImportTasksUseCase:
@@ -27,9 +27,9 @@ class TestImportTasksUseCase:
         file_path = self.create_json_file(tmp_path, tasks_data)
 
         use_case = ImportTasksUseCase(task_repo)
-        count = use_case.execute(file_path)
+        result = use_case.execute(file_path)
 
-        assert count == 2
+        assert result == {"inserted": 2, "skipped": 0, "failed": 0}
         tasks = task_repo.get_tasks()
         assert len(tasks) == 2
         assert tasks[0].title == "Imported Task 1"
@@ -98,9 +98,9 @@ class TestImportTasksUseCase:
         file_path = self.create_json_file(tmp_path, [])
 
         use_case = ImportTasksUseCase(task_repo)
-        count = use_case.execute(file_path)
+        result = use_case.execute(file_path)
 
-        assert count == 0
+        assert result == {"inserted": 0, "skipped": 0, "failed": 0}
         assert len(task_repo.get_tasks()) == 0
 
     def test_import_with_missing_title(self, task_repo, tmp_path):
@@ -112,12 +112,32 @@ class TestImportTasksUseCase:
         file_path = self.create_json_file(tmp_path, tasks_data)
 
         use_case = ImportTasksUseCase(task_repo)
-        count = use_case.execute(file_path)
+        result = use_case.execute(file_path)
 
-        assert count == 1
+        assert result == {"inserted": 1, "skipped": 1, "failed": 0}
         tasks = task_repo.get_tasks()
         assert tasks[0].title == "Valid Task"
 
+    def test_import_reports_failed_rows_and_keeps_the_rest(self, task_repo, tmp_path):
+        """Test rows rejected by validation or constraints are counted, not fatal."""
+        task_repo.add_task("Existing Task")
+        tasks_data = [
+            {"title": "First", "tags": ["work"]},
+            {"title": "Existing Task"},
+            {"title": "x" * 61},
+            {"title": "Last", "done": True},
+        ]
+        file_path = self.create_json_file(tmp_path, tasks_data)
+
+        use_case = ImportTasksUseCase(task_repo)
+        result = use_case.execute(file_path)
+
+        assert result == {"inserted": 2, "skipped": 0, "failed": 2}
+        tasks = task_repo.get_tasks()
+        assert [t.title for t in tasks] == ["Existing Task", "First", "Last"]
+        assert tasks[2].done is True
+        assert [t.title for t in task_repo.get_tasks(tags=["work"])] == ["First"]
+
     def test_import_preserves_done_status(self, task_repo, tmp_path):
         """Test that import preserves done status."""
         tasks_data = [{"title": "Done Task", "done": True}]
@@ -152,38 +172,57 @@ class TestImportTasksUseCase:
         assert updated_task.description == "New Description"
         assert updated_task.done is True
 
-    def test_import_upsert_skips_invalid_items_and_empty_titles(self, mock_repo, tmp_path):
-        """Test upsert mode ignores non-dict items and empty titles."""
+    def test_import_upsert_skips_invalid_items_and_empty_titles(self, task_repo, tmp_path):
+        """Test upsert mode ignores non-dict items, empty titles and invalid items."""
         tasks_data = [
             "not a task",
             {"title": "   "},
+            {"title": "x" * 61},
             {"title": "Valid Task"},
         ]
         file_path = self.create_json_file(tmp_path, tasks_data)
-        mock_repo.add_task.return_value = None
-        mock_repo.search_tasks.return_value = []
 
-        use_case = ImportTasksUseCase(mock_repo)
+        use_case = ImportTasksUseCase(task_repo)
         result = use_case.execute(file_path, upsert=True)
 
-        assert result == {"inserted": 0, "updated": 0}
-        mock_repo.add_task.assert_called_once_with("Valid Task", "", "", None, [], None)
-        mock_repo.search_tasks.assert_called_once_with("Valid Task")
+        assert result == {"inserted": 1, "updated": 0, "skipped": 2, "failed": 1}
+        assert [t.title for t in task_repo.get_tasks()] == ["Valid Task"]
 
-    def test_import_upsert_inserts_without_done_status(self, mock_repo, tmp_path):
-        """Test upsert mode does not mark tasks done when done is absent."""
-        file_path = self.create_json_file(tmp_path, [{"title": "New Task"}])
-        mock_repo.add_task.return_value = 7
+    def test_import_upsert_streams_items_to_repository(self, mock_repo, tmp_path):
+        """Test upsert mode hands the decoded items to upsert_many in one call."""
+        file_path = self.create_json_file(tmp_path, [{"title": "A"}, {"title": "B"}])
+        seen = []
+
+        def upsert_many(items, progress=None):
+            seen.extend(items)
+            return {"inserted": 2, "updated": 0}
+
+        mock_repo.upsert_many.side_effect = upsert_many
+        progress = []
 
         use_case = ImportTasksUseCase(mock_repo)
-        result = use_case.execute(file_path, upsert=True)
+        result = use_case.execute(file_path, upsert=True, progress=progress.append)
 
-        assert result == {"inserted": 1, "updated": 0}
-        mock_repo.mark_done.assert_not_called()
+        assert result == {"inserted": 2, "updated": 0}
+        assert seen == [{"title": "A"}, {"title": "B"}]
+        assert mock_repo.upsert_many.call_args.kwargs["progress"] == progress.append
+        mock_repo.add_task.assert_not_called()
         mock_repo.search_tasks.assert_not_called()
 
-    def test_import_upsert_updates_when_add_task_fails(self, mock_repo, tmp_path):
-        """Test upsert mode updates the first exact title match when insert fails."""
+    def test_import_upsert_inserts_without_done_status(self, task_repo, tmp_path):
+        """Test upsert mode leaves new tasks pending when done is absent."""
+        file_path = self.create_json_file(tmp_path, [{"title": "New Task"}])
+
+        use_case = ImportTasksUseCase(task_repo)
+        result = use_case.execute(file_path, upsert=True)
+
+        assert result == {"inserted": 1, "updated": 0, "skipped": 0, "failed": 0}
+        assert task_repo.get_tasks()[0].done is False
+
+    def test_import_upsert_updates_all_fields(self, task_repo, tmp_path):
+        """Test upsert mode overwrites the matching task with the item's fields."""
+        task_id = task_repo.add_task("Existing Task", description="Old", tags=["home"])
+        task_repo.mark_done(task_id, True)
         tasks_data = [
             {
                 "title": "Existing Task",
@@ -196,38 +235,67 @@ class TestImportTasksUseCase:
             }
         ]
         file_path = self.create_json_file(tmp_path, tasks_data)
-        existing_task = TaskEntity(id=42, title="Existing Task")
-        mock_repo.add_task.side_effect = RazTodoException("duplicate")
-        mock_repo.search_tasks.return_value = [existing_task]
 
-        use_case = ImportTasksUseCase(mock_repo)
+        use_case = ImportTasksUseCase(task_repo)
         result = use_case.execute(file_path, upsert=True)
 
-        assert result == {"inserted": 0, "updated": 1}
-        mock_repo.update_task.assert_called_once_with(
-            42,
-            title="Existing Task",
-            description="New Description",
-            priority="H",
-            due_date="2026-07-05",
-            tags=["work"],
-            project="Ops",
+        assert result == {"inserted": 0, "updated": 1, "skipped": 0, "failed": 0}
+        task = task_repo.get_tasks()[0]
+        assert task.id == task_id
+        assert (task.description, task.priority, task.due_date) == (
+            "New Description",
+            "H",
+            "2026-07-05",
         )
-        mock_repo.mark_done.assert_called_once_with(42, False)
-
-    def test_import_upsert_updates_without_done_status(self, mock_repo, tmp_path):
-        """Test upsert mode does not mark updated tasks done when done is absent."""
+        assert (task.tags, task.project, task.done) == (["work"], "Ops", False)
+        assert [t.id for t in task_repo.get_tasks(tags=["work"])] == [task_id]
+        assert task_repo.get_tasks(tags=["home"]) == []
+
+    def test_import_upsert_updates_keep_missing_fields(self, task_repo, tmp_path):
+        """Test upsert mode keeps stored values for fields the item leaves out."""
+        task_id = task_repo.add_task(
+            "Existing Task", priority="L", due_date="2026-01-01", tags=["home"], project="Ops"
+        )
+        task_repo.mark_done(task_id, True)
         file_path = self.create_json_file(tmp_path, [{"title": "Existing Task"}])
-        existing_task = TaskEntity(id=42, title="Existing Task")
-        mock_repo.add_task.side_effect = RazTodoException("duplicate")
-        mock_repo.search_tasks.return_value = [existing_task]
 
-        use_case = ImportTasksUseCase(mock_repo)
+        use_case = ImportTasksUseCase(task_repo)
         result = use_case.execute(file_path, upsert=True)
 
-        assert result == {"inserted": 0, "updated": 1}
-        mock_repo.update_task.assert_called_once()
-        mock_repo.mark_done.assert_not_called()
+        assert result == {"inserted": 0, "updated": 1, "skipped": 0, "failed": 0}
+        task = task_repo.get_tasks()[0]
+        assert (task.priority, task.due_date, task.project) == ("L", "2026-01-01", "Ops")
+        assert task.tags == ["home"]
+        assert task.done is True
+
+    def test_import_upsert_counts_repeated_titles_as_updates(self, task_repo, tmp_path):
+        """Test a title repeated within the file is inserted once, then updated."""
+        tasks_data = [{"title": "Twice", "description": "first"}, {"title": "Twice"}]
+        file_path = self.create_json_file(tmp_path, tasks_data)
+
+        use_case = ImportTasksUseCase(task_repo)
+        result = use_case.execute(file_path, upsert=True)
+
+        assert result == {"inserted": 1, "updated": 1, "skipped": 0, "failed": 0}
+        assert len(task_repo.get_tasks()) == 1
+
+    def test_import_upsert_survives_unbindable_item(self, task_repo, tmp_path):
+        """Test upsert mode drops only an item SQLite cannot store, not the whole file."""
+        task_repo.add_task("Existing")
+        tasks_data = [
+            {"title": "Existing", "description": "updated"},
+            {"title": "Bad", "due_date": ["x"]},
+            {"title": "New"},
+            "junk",
+        ]
+        file_path = self.create_json_file(tmp_path, tasks_data)
+
+        use_case = ImportTasksUseCase(task_repo)
+        result = use_case.execute(file_path, upsert=True)
+
+        assert result == {"inserted": 1, "updated": 1, "skipped": 1, "failed": 1}
+        stored = {t.title: t.description for t in task_repo.get_tasks()}
+        assert stored == {"Existing": "updated", "New": ""}
 
     def test_import_upsert_invalid_json_syntax(self, task_repo, tmp_path):
         """Test upsert mode wraps JSON decode errors with file context."""
@@ -268,3 +336,52 @@ class TestImportTasksUseCase:
             use_case.execute(file_path, upsert=True)
 
         assert "i/o error" in str(exc_info.value).lower()
+
+    def test_import_upsert_reads_ndjson(self, task_repo, tmp_path):
+        """Test upsert mode streams NDJSON files line by line."""
+        task_repo.add_task("Existing Task", description="Old")
+        p = tmp_path / "tasks.jsonl"
+        p.write_text(
+            '{"title": "Existing Task", "description": "New"}\n{"title": "Fresh"}\n',
+            encoding="utf-8",
+        )
+
+        use_case = ImportTasksUseCase(task_repo)
+        result = use_case.execute(str(p), upsert=True)
+
+        assert result == {"inserted": 1, "updated": 1, "skipped": 0, "failed": 0}
+        assert [t.description for t in task_repo.get_tasks()] == ["New", ""]
+
+    def test_import_upsert_reads_compressed_csv(self, task_repo, tmp_path):
+        """Test upsert mode reads gzip-compressed CSV files."""
+        task_repo.add_task("Existing Task", description="Old")
+        p = tmp_path / "tasks.csv.gz"
+        with gzip.open(p, "wt", encoding="utf-8", newline="") as f:
+            f.write("title,description,done\r\nExisting Task,New,true\r\nFresh,,\r\n")
+
+        use_case = ImportTasksUseCase(task_repo)
+        result = use_case.execute(str(p), upsert=True)
+
+        assert result == {"inserted": 1, "updated": 1, "skipped": 0, "failed": 0}
+        existing, fresh = task_repo.get_tasks()
+        assert (existing.description, existing.done) == ("New", True)
+        assert (fresh.title, fresh.done) == ("Fresh", False)
+
+    def test_import_rejects_unknown_format(self, task_repo, tmp_path):
+        """Test an unknown format is reported before the file is read."""
+        file_path = self.create_json_file(tmp_path, [])
+
+        with pytest.raises(RazTodoException, match="Unknown format"):
+            ImportTasksUseCase(task_repo).execute(file_path, file_format="xml")
+
+    def test_import_passes_progress_to_repository(self, mock_repo, tmp_path):
+        """Test the progress callback reaches the streaming repository import."""
+        file_path = self.create_json_file(tmp_path, [])
+        mock_repo.import_tasks.return_value = {"inserted": 0, "skipped": 0, "failed": 0}
+        progress = print
+
+        ImportTasksUseCase(mock_repo).execute(file_path, progress=progress)
+
+        mock_repo.import_tasks.assert_called_once_with(
+            file_path, progress=progress, file_format="json"
+        )
@@ -37,3 +37,52 @@ class TestMarkDoneUseCase:
             use_case.execute(999)
 
         assert "999" in str(exc_info.value) or "not found" in str(exc_info.value).lower()
+
+    def test_execute_many_returns_updated_ids_in_request_order(self, mock_repo):
+        """Test bulk completion reports the ids that were updated."""
+        mock_repo.mark_done_many.return_value = [1, 3]
+        use_case = MarkDoneUseCase(mock_repo)
+
+        result = use_case.execute_many([3, 2, 1, 3], done=True)
+
+        assert result == [3, 1]
+        mock_repo.mark_done_many.assert_called_once_with([3, 2, 1, 3], True)
+
+    def test_execute_many_none_found(self, mock_repo):
+        """Test bulk completion raises when no id matched."""
+        mock_repo.mark_done_many.return_value = []
+        use_case = MarkDoneUseCase(mock_repo)
+
+        from raztodo.domain.exceptions import RazTodoException
+
+        with pytest.raises(RazTodoException, match="7, 8"):
+            use_case.execute_many([7, 8])
+
+    def test_execute_many_requires_ids(self, mock_repo):
+        """Test bulk completion rejects an empty id list."""
+        use_case = MarkDoneUseCase(mock_repo)
+
+        from raztodo.domain.exceptions import RazTodoException
+
+        with pytest.raises(RazTodoException):
+            use_case.execute_many([])
+
+        mock_repo.mark_done_many.assert_not_called()
+
+    def test_toggle(self, mock_repo, sample_task):
+        """Test toggling returns the task with its new status."""
+        mock_repo.toggle_done.return_value = sample_task
+        use_case = MarkDoneUseCase(mock_repo)
+
+        assert use_case.toggle(1) is sample_task
+        mock_repo.toggle_done.assert_called_once_with(1)
+
+    def test_toggle_nonexistent_task(self, mock_repo):
+        """Test toggling a nonexistent task raises TaskNotFoundError."""
+        mock_repo.toggle_done.return_value = None
+        use_case = MarkDoneUseCase(mock_repo)
+
+        from raztodo.domain.exceptions import TaskNotFoundError
+
+        with pytest.raises(TaskNotFoundError):
+            use_case.toggle(999)
@@ -3,6 +3,7 @@ import sqlite3
 import tempfile
 
 from raztodo.application.use_cases.migrate_tasks import MigrateUseCase
+from raztodo.infrastructure.sqlite.task_schema import ensure_schema
 
 
 class TestMigrateUseCase:
@@ -78,6 +79,7 @@ class TestMigrateUseCase:
 
             assert result["duplicates_fixed"] == 0
             assert result["unique_index"] is True
+            assert result["tags_backfilled"] == 0
 
         finally:
             if os.path.exists(temp_path):
@@ -117,3 +119,57 @@ class TestMigrateUseCase:
         finally:
             if os.path.exists(temp_path):
                 os.unlink(temp_path)
+
+    def test_migrate_rebuild_fts(self):
+        """Test that --rebuild-fts reindexes every task."""
+        fd, temp_path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+
+        try:
+
+            def connection_factory():
+                conn = sqlite3.connect(temp_path, check_same_thread=False)
+                conn.row_factory = sqlite3.Row
+                return conn
+
+            conn = connection_factory()
+            ensure_schema(conn)
+            conn.execute("INSERT INTO tasks (title) VALUES ('Indexed')")
+            conn.commit()
+            conn.close()
+
+            result = MigrateUseCase(connection_factory).execute(rebuild_fts_index=True)
+
+            assert result["fts_rebuilt"] == 1
+            assert "fts_drift" not in result
+
+        finally:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+
+    def test_migrate_reports_fts_drift(self):
+        """Test that migrate reports tasks missing from the search index."""
+        fd, temp_path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+
+        try:
+
+            def connection_factory():
+                conn = sqlite3.connect(temp_path, check_same_thread=False)
+                conn.row_factory = sqlite3.Row
+                return conn
+
+            conn = connection_factory()
+            ensure_schema(conn)
+            conn.execute("INSERT INTO tasks (title) VALUES ('Indexed')")
+            conn.execute("INSERT INTO tasks_fts(tasks_fts) VALUES ('delete-all')")
+            conn.commit()
+            conn.close()
+
+            result = MigrateUseCase(connection_factory).execute()
+
+            assert result["fts_drift"] == 1
+
+        finally:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
@@ -46,3 +46,23 @@ class TestUpdateTaskUseCase:
             use_case.execute(999, title="New Title")
 
         assert "999" in str(exc_info.value) or "not found" in str(exc_info.value).lower()
+
+    def test_execute_returning(self, mock_repo, sample_task):
+        """Test updating a task returns the updated entity."""
+        mock_repo.update_task_returning.return_value = sample_task
+        use_case = UpdateTaskUseCase(mock_repo)
+
+        result = use_case.execute_returning(1, title="Test Task")
+
+        assert result is sample_task
+        mock_repo.update_task_returning.assert_called_once_with(
+            1, "Test Task", None, None, None, None, None
+        )
+
+    def test_execute_returning_not_found(self, mock_repo):
+        """Test execute_returning raises when no task was updated."""
+        mock_repo.update_task_returning.return_value = None
+        use_case = UpdateTaskUseCase(mock_repo)
+
+        with pytest.raises(RazTodoException, match="No task found with id 999"):
+            use_case.execute_returning(999, title="X")
@@ -0,0 +1,98 @@
+import io
+
+import pytest
+
+from raztodo.domain.exceptions import TaskValidationError
+from raztodo.domain.file_formats import (
+    CSV_FIELDS,
+    detect_format,
+    encode_tasks,
+    iter_task_items,
+)
+
+TASKS = [
+    {
+        "id": 1,
+        "title": 'Quote "and", comma',
+        "description": "line one\nline two",
+        "done": True,
+        "created_at": "2025-01-01 10:00:00",
+        "priority": "H",
+        "due_date": "2025-02-01",
+        "tags": ["work", "a,b"],
+        "project": "Ops",
+    },
+    {
+        "id": 2,
+        "title": "Plain",
+        "description": "",
+        "done": False,
+        "created_at": "2025-01-02 10:00:00",
+        "priority": "",
+        "due_date": None,
+        "tags": [],
+        "project": None,
+    },
+]
+
+
+class TestDetectFormat:
+    """Test cases for choosing a task file format."""
+
+    @pytest.mark.parametrize(
+        "path, expected",
+        [
+            ("tasks.json", "json"),
+            ("tasks.json.gz", "json"),
+            ("tasks.ndjson.zst", "ndjson"),
+            ("tasks.jsonl", "ndjson"),
+            ("backup/tasks.csv.gz", "csv"),
+            ("tasks", "json"),
+        ],
+    )
+    def test_detects_from_extension(self, path, expected):
+        """Test that the format follows the extension, ignoring compression."""
+        assert detect_format(path) == expected
+
+    def test_explicit_format_wins(self):
+        """Test that an explicit format overrides the extension."""
+        assert detect_format("tasks.json", "csv") == "csv"
+
+    def test_rejects_unknown_format(self):
+        """Test that an unknown explicit format is a validation error."""
+        with pytest.raises(TaskValidationError, match="Unknown format 'xml'"):
+            detect_format("tasks.json", "xml")
+
+
+class TestEncodeAndRead:
+    """Test cases for encoding tasks and reading them back."""
+
+    @pytest.mark.parametrize("file_format", ["json", "ndjson", "csv"])
+    @pytest.mark.parametrize("chunk_size", [1, 65536])
+    def test_round_trip(self, file_format, chunk_size):
+        """Test that every format reads back the fields an import uses."""
+        text = "".join(encode_tasks(iter(TASKS), file_format, chunk_size=chunk_size))
+        items = list(iter_task_items(io.StringIO(text, newline=""), file_format))
+        keys = ("title", "description", "done", "priority", "due_date", "tags", "project")
+        assert [{k: item[k] for k in keys} for item in items] == [
+            {k: task[k] for k in keys} for task in TASKS
+        ]
+
+    def test_csv_has_header_row(self):
+        """Test that CSV output starts with the column names."""
+        text = "".join(encode_tasks([], "csv"))
+        assert text.splitlines() == [",".join(CSV_FIELDS)]
+
+    def test_csv_accepts_comma_separated_tags_and_partial_columns(self):
+        """Test that hand-written CSV files need only a title column."""
+        stream = io.StringIO('title,tags,done\nA,"x, y",yes\nB,,\n', newline="")
+        assert list(iter_task_items(stream, "csv")) == [
+            {"title": "A", "tags": ["x", "y"], "done": True},
+            {"title": "B", "tags": [], "done": False},
+        ]
+
+    def test_ndjson_is_one_compact_object_per_line(self):
+        """Test that NDJSON output has one task per line."""
+        lines = "".join(encode_tasks(iter(TASKS), "ndjson")).splitlines()
+        assert len(lines) == 2
+        assert lines[1].startswith('{"id":2,')
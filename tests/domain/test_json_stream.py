@@ -0,0 +1,137 @@
+import io
+import json
+
+import pytest
+
+from raztodo.domain.exceptions import InvalidFileFormatError
+from raztodo.domain.json_stream import (
+    encode_json_array,
+    is_ndjson_path,
+    iter_json_array,
+    iter_json_items,
+    iter_ndjson,
+)
+
+DOCUMENT = [
+    {"title": "Task 1", "tags": ["a", "]"], "done": True},
+    12345678901234,
+    -1.5e10,
+    'quoted "] [ string',
+    None,
+    [],
+    {},
+]
+
+
+class TestIterJsonArray:
+    """Test cases for incremental JSON array parsing."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 1024])
+    @pytest.mark.parametrize("indent", [None, 2])
+    def test_matches_json_loads_across_chunk_boundaries(self, chunk_size, indent):
+        """Test that elements split across reads decode exactly as json.loads does."""
+        text = json.dumps(DOCUMENT, indent=indent)
+        assert list(iter_json_array(io.StringIO(text), chunk_size)) == DOCUMENT
+
+    def test_empty_array(self):
+        """Test that an empty array yields nothing."""
+        assert list(iter_json_array(io.StringIO("  [ ]  "))) == []
+
+    def test_yields_before_reading_the_whole_stream(self):
+        """Test that the first element is available after a single chunk."""
+        stream = io.StringIO(json.dumps([{"title": str(i)} for i in range(1000)]))
+        items = iter_json_array(stream, chunk_size=64)
+        assert next(items) == {"title": "0"}
+        assert stream.tell() < 200
+
+    @pytest.mark.parametrize("text", ["", "[", "[1,", "[1 2]", "[1,]", "[1]x", "[\n1,\n2,\n}", "{"])
+    @pytest.mark.parametrize("chunk_size", [2, 1024])
+    def test_syntax_errors_match_json_loads(self, text, chunk_size):
+        """Test that syntax errors report the same position as json.loads."""
+        with pytest.raises(json.JSONDecodeError) as expected:
+            json.loads(text)
+        with pytest.raises(json.JSONDecodeError) as actual:
+            list(iter_json_array(io.StringIO(text), chunk_size))
+        if text.startswith("["):
+            assert (actual.value.lineno, actual.value.colno) == (
+                expected.value.lineno,
+                expected.value.colno,
+            )
+            assert str(actual.value) == str(expected.value)
+
+    @pytest.mark.parametrize(
+        "text, kind", [('{"not": "array"}', "dict"), ("12", "int"), ('"s"', "str")]
+    )
+    def test_rejects_non_array_documents(self, text, kind):
+        """Test that a valid document that is not an array is rejected."""
+        with pytest.raises(InvalidFileFormatError, match=f"Expected JSON array, got {kind}"):
+            list(iter_json_array(io.StringIO(text)))
+
+
+class TestIterNdjson:
+    """Test cases for newline-delimited JSON parsing."""
+
+    def test_yields_one_item_per_line_skipping_blanks(self):
+        """Test that each non-blank line is one item."""
+        stream = io.StringIO('{"title": "a"}\n\n  \n{"title": "b"}\n')
+        assert list(iter_ndjson(stream)) == [{"title": "a"}, {"title": "b"}]
+
+    def test_error_reports_stream_line(self):
+        """Test that a bad line is reported with its line number."""
+        stream = io.StringIO('{"title": "a"}\n\n{"title": \n')
+        with pytest.raises(json.JSONDecodeError) as exc_info:
+            list(iter_ndjson(stream))
+        assert exc_info.value.lineno == 3
+        assert "line 3" in str(exc_info.value)
+
+
+class TestFormatSelection:
+    """Test cases for choosing between JSON array and NDJSON."""
+
+    @pytest.mark.parametrize(
+        "path, expected",
+        [
+            ("tasks.json", False),
+            ("tasks.ndjson", True),
+            ("tasks.jsonl", True),
+            ("backup/tasks.ndjson.gz", True),
+            ("tasks", False),
+        ],
+    )
+    def test_is_ndjson_path(self, path, expected):
+        """Test that NDJSON is selected by file extension."""
+        assert is_ndjson_path(path) is expected
+
+    def test_iter_json_items_dispatches_on_flag(self):
+        """Test that iter_json_items reads either format."""
+        assert list(iter_json_items(io.StringIO("[1, 2]"))) == [1, 2]
+        assert list(iter_json_items(io.StringIO("1\n2\n"), ndjson=True)) == [1, 2]
+
+
+class TestEncodeJsonArray:
+    """Test cases for the chunked JSON array encoder."""
+
+    @pytest.mark.parametrize("indent", [2, None])
+    @pytest.mark.parametrize("chunk_size", [1, 16, 65536])
+    @pytest.mark.parametrize(
+        "items", [[], [1], [{"title": "Caf\u00e9", "tags": ["a", "b"]}, {}, [], "x"]]
+    )
+    def test_matches_json_dumps(self, items, indent, chunk_size):
+        """Test that the joined chunks equal a single json.dumps call."""
+        text = "".join(encode_json_array(iter(items), indent=indent, chunk_size=chunk_size))
+        assert text == json.dumps(items, ensure_ascii=False, indent=indent)
+
+    def test_yields_bounded_chunks_lazily(self):
+        """Test that items are consumed as chunks are requested, not up front."""
+        consumed = []
+
+        def items():
+            for i in range(100):
+                consumed.append(i)
+                yield {"n": i}
+
+        chunks = encode_json_array(items(), chunk_size=64)
+        first = next(chunks)
+        assert first.startswith("[")
+        assert len(consumed) < 100
+        assert json.loads(first + "".join(chunks)) == [{"n": i} for i in range(100)]
@@ -0,0 +1,64 @@
+import pytest
+
+from raztodo.domain.exceptions import TaskValidationError
+from raztodo.domain.pagination import (
+    Cursor,
+    decode_cursor,
+    encode_cursor,
+    sort_key,
+    validate_order_by,
+)
+from raztodo.domain.task_entity import TaskEntity
+
+
+class TestCursor:
+    """Test cases for pagination cursor encoding."""
+
+    def test_round_trip(self):
+        """Test that a cursor decodes back to the task position."""
+        token = encode_cursor(TaskEntity(id=42, title="Task"))
+        assert decode_cursor(token) == Cursor(key=42, id=42)
+
+    def test_token_is_url_safe(self):
+        """Test that tokens can be passed in query strings unescaped."""
+        token = encode_cursor(TaskEntity(id=123456789, title="Task"))
+        assert all(c.isalnum() or c in "-_" for c in token)
+
+    @pytest.mark.parametrize("token", ["", "not-a-cursor", "W10", "eyJpZCI6ICJ4In0"])
+    def test_invalid_token_raises(self, token):
+        """Test that malformed tokens raise a validation error."""
+        with pytest.raises(TaskValidationError) as exc_info:
+            decode_cursor(token)
+        assert exc_info.value.field == "cursor"
+
+    def test_round_trip_sorted(self):
+        """Test that a sorted cursor carries the sort key and order."""
+        task = TaskEntity(id=7, title="Task", priority="h")
+        token = encode_cursor(task, "priority", descending=True)
+        assert decode_cursor(token, "priority", descending=True) == Cursor(
+            key=3, id=7, order_by="priority", descending=True
+        )
+
+    def test_order_mismatch_raises(self):
+        """Test that a cursor cannot resume a differently ordered listing."""
+        token = encode_cursor(TaskEntity(id=1, title="Task"), "title")
+        with pytest.raises(TaskValidationError):
+            decode_cursor(token, "title", descending=True)
+
+
+class TestSortKey:
+    """Test cases for sort field helpers."""
+
+    def test_sort_key_values(self):
+        """Test that sort keys mirror the storage-side ordering."""
+        task = TaskEntity(id=1, title="Task", done=True, priority=None, due_date="")
+        assert sort_key(task, "done") == 1
+        assert sort_key(task, "priority") == 0
+        assert sort_key(task, "due_date") is None
+        assert sort_key(task, "title") == "Task"
+
+    def test_validate_order_by_rejects_unknown(self):
+        """Test that unknown sort fields raise a validation error."""
+        with pytest.raises(TaskValidationError) as exc_info:
+            validate_order_by("description")
+        assert exc_info.value.field == "order_by"
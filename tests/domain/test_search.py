@@ -0,0 +1,21 @@
+from raztodo.domain.search import MATCH_END, MATCH_START, split_highlights
+
+
+class TestSplitHighlights:
+    """Test cases for match-marker parsing."""
+
+    def test_offsets_point_at_matches(self):
+        """Test that offsets index the matched terms in the plain text."""
+        marked = f"Write {MATCH_START}report{MATCH_END} and {MATCH_START}rep{MATCH_END}ly"
+        text, spans = split_highlights(marked)
+        assert text == "Write report and reply"
+        assert [text[start:end] for start, end in spans] == ["report", "rep"]
+
+    def test_match_at_start(self):
+        """Test a match at offset zero."""
+        assert split_highlights(f"{MATCH_START}Report{MATCH_END} bug") == ("Report bug", [(0, 6)])
+
+    def test_plain_and_empty_text(self):
+        """Test that text without markers has no highlights."""
+        assert split_highlights("no matches") == ("no matches", [])
+        assert split_highlights(None) == ("", [])
@@ -0,0 +1,74 @@
+import sys
+
+import pytest
+
+from raztodo.domain.task_batch import TaskBatch
+from raztodo.domain.task_entity import TaskEntity
+
+
+@pytest.fixture
+def tasks():
+    return [
+        TaskEntity(id=1, title="One", priority="H", tags=["a", "b"], project="work"),
+        TaskEntity(id=2, title="Two", done=True, priority="L", due_date="2025-01-01"),
+        TaskEntity(id=3, title="Three", done=True, priority="H", project="work"),
+    ]
+
+
+class TestTaskBatch:
+    """Test cases for TaskBatch."""
+
+    def test_round_trips_tasks(self, tasks):
+        batch = TaskBatch.from_tasks(tasks)
+
+        assert len(batch) == 3
+        assert list(batch) == tasks
+        assert batch[0] == tasks[0]
+        assert batch[-1] == tasks[-1]
+
+    def test_entities_do_not_share_tags(self, tasks):
+        batch = TaskBatch.from_tasks(tasks)
+
+        batch[0].tags.append("c")
+
+        assert batch[0].tags == ["a", "b"]
+
+    def test_to_dicts_matches_entity_fields(self, tasks):
+        batch = TaskBatch.from_tasks(tasks)
+
+        dicts = batch.to_dicts()
+
+        assert dicts[1] == {
+            "id": 2,
+            "title": "Two",
+            "description": "",
+            "done": True,
+            "created_at": "",
+            "priority": "L",
+            "due_date": "2025-01-01",
+            "tags": [],
+            "project": None,
+        }
+        assert [d["tags"] for d in dicts] == [["a", "b"], [], []]
+
+    def test_columns(self, tasks):
+        batch = TaskBatch.from_tasks(tasks)
+
+        assert list(batch.ids) == [1, 2, 3]
+        assert bytes(batch.done) == b"\x00\x01\x01"
+        assert batch.tags[1] == ()
+
+    def test_strings_are_interned(self):
+        batch = TaskBatch()
+        project = "".join(["pro", "ject"])
+
+        batch.append(1, "One", project=project)
+
+        assert batch.projects[0] is sys.intern("project")
+
+    def test_empty(self):
+        batch = TaskBatch()
+
+        assert len(batch) == 0
+        assert list(batch) == []
+        assert batch.to_dicts() == []
@@ -1,3 +1,5 @@
+import pytest
+
 from raztodo.domain.task_entity import TaskEntity
 
 
@@ -74,3 +76,26 @@ class TestTaskEntity:
         task1 = TaskEntity(id=1, title="Task")
         task2 = TaskEntity(id=2, title="Task")
         assert task1 != task2
+
+    def test_task_has_slots_instead_of_dict(self):
+        """Test that instances carry no per-instance __dict__."""
+        task = TaskEntity(id=1, title="Task")
+        assert not hasattr(task, "__dict__")
+        with pytest.raises(AttributeError):
+            task.extra = 1
+
+    def test_task_to_dict(self):
+        """Test that to_dict returns every field in declaration order."""
+        task = TaskEntity(id=1, title="Task", tags=("a",), project="P")
+        assert task.to_dict() == {
+            "id": 1,
+            "title": "Task",
+            "description": "",
+            "done": False,
+            "created_at": "",
+            "priority": "",
+            "due_date": None,
+            "tags": ["a"],
+            "project": "P",
+        }
+        assert list(task.to_dict()) == list(TaskEntity.__dataclass_fields__)
@@ -1,3 +1,4 @@
+import asyncio
 import contextlib
 import json
 from unittest.mock import MagicMock, patch
@@ -7,7 +8,9 @@ import pytest
 from raztodo.infrastructure.llm.client import (
     OllamaClientError,
     _build_messages,
+    _chat_url,
     _get_connection,
+    astream_chat,
     chat,
     stream_chat,
 )
@@ -432,6 +435,94 @@ class TestStreamChat:
         assert tokens == []
 
 
+def _serve_async(status: int, body: bytes, chunked: bool, delay: float = 0.0, **cfg_kwargs):
+    """Run astream_chat against a one-shot local HTTP server; returns (tokens, request)."""
+    requests: list[bytes] = []
+
+    async def handle(reader, writer):
+        try:
+            requests.append(await reader.readuntil(b"\r\n\r\n"))
+            await asyncio.sleep(delay)
+            head = f"HTTP/1.1 {status} X\r\nContent-Type: application/x-ndjson\r\n"
+            if chunked:
+                writer.write(f"{head}Transfer-Encoding: chunked\r\n\r\n".encode())
+                # Split mid-line so lines must be reassembled across chunks
+                for i in range(0, len(body), 7):
+                    part = body[i : i + 7]
+                    writer.write(f"{len(part):x}\r\n".encode() + part + b"\r\n")
+                writer.write(b"0\r\n\r\n")
+            else:
+                writer.write(f"{head}Content-Length: {len(body)}\r\n\r\n".encode() + body)
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def run():
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        cfg = _make_cfg(host=f"http://127.0.0.1:{port}/prefix", **cfg_kwargs)
+        try:
+            return [token async for token in astream_chat("hi", cfg=cfg)]
+        finally:
+            server.close()
+            await server.wait_closed()
+
+    return asyncio.run(run()), requests
+
+
+STREAM_BODY = (
+    json.dumps({"message": {"content": "Hel"}, "done": False}).encode()
+    + b"\nnot json\n"
+    + json.dumps({"message": {"content": "lo"}, "done": False}).encode()
+    + b"\n"
+    + json.dumps({"message": {"content": ""}, "done": True}).encode()
+    + b"\n"
+)
+
+
+class TestAstreamChat:
+    @pytest.mark.parametrize("chunked", [True, False])
+    def test_yields_tokens_in_order(self, chunked):
+        tokens, requests = _serve_async(200, STREAM_BODY, chunked)
+        assert tokens == ["Hel", "lo"]
+        assert requests[0].startswith(b"POST /prefix/api/chat HTTP/1.1\r\n")
+
+    def test_404_raises_model_not_found(self):
+        with pytest.raises(OllamaClientError, match="not found"):
+            _serve_async(404, b"", chunked=False)
+
+    def test_error_status_includes_body(self):
+        with pytest.raises(OllamaClientError, match="HTTP 500: boom"):
+            _serve_async(500, b"boom\n", chunked=True)
+
+    def test_timeout_raises_client_error(self):
+        with pytest.raises(OllamaClientError, match="did not respond"):
+            _serve_async(200, STREAM_BODY, chunked=False, delay=0.5, timeout=0.05)
+
+    def test_connection_refused_raises_client_error(self):
+        async def run():
+            server = await asyncio.start_server(lambda r, w: None, "127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            server.close()
+            await server.wait_closed()
+            cfg = _make_cfg(host=f"http://127.0.0.1:{port}")
+            return [token async for token in astream_chat("hi", cfg=cfg)]
+
+        with pytest.raises(OllamaClientError, match="Cannot connect"):
+            asyncio.run(run())
+
+
+class TestChatUrl:
+    def test_appends_endpoint_to_prefix(self):
+        assert _chat_url("http://host:11434/prefix/") == "http://host:11434/prefix/api/chat"
+
+    def test_bare_host_defaults_to_http(self):
+        assert _chat_url("localhost:11434") == "http://localhost:11434/api/chat"
+
+    def test_ipv6_host_keeps_brackets(self):
+        assert _chat_url("http://[::1]:11434") == "http://[::1]:11434/api/chat"
+
+
 class TestOllamaClientError:
     def test_is_exception(self):
         err = OllamaClientError("boom")
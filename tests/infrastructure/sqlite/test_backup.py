@@ -0,0 +1,158 @@
+import sqlite3
+
+import pytest
+
+from raztodo.domain.exceptions import RazTodoException
+from raztodo.infrastructure.sqlite.backup import (
+    backup_database,
+    database_file,
+    restore_database,
+)
+from raztodo.infrastructure.sqlite.connection import sqlite_connection_factory
+from raztodo.infrastructure.sqlite.task_dao import TaskDAO
+from raztodo.infrastructure.sqlite.task_schema import read_change_counter, read_changelog_seq
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "live.db"
+    conn = sqlite_connection_factory(path)()
+    dao = TaskDAO(conn)
+    for i in range(50):
+        dao.insert(f"Task {i}", "x" * 150, tags=["work"])
+    conn.close()
+    return path
+
+
+def titles(path):
+    conn = sqlite3.connect(path)
+    try:
+        return [row[0] for row in conn.execute("SELECT title FROM tasks ORDER BY id")]
+    finally:
+        conn.close()
+
+
+class TestBackup:
+    """Test cases for online backup and restore."""
+
+    def test_database_file(self, db_path):
+        """Test that the main database file is found, and None in memory."""
+        conn = sqlite3.connect(db_path)
+        assert database_file(conn) == db_path.resolve()
+        conn.close()
+        assert database_file(sqlite3.connect(":memory:")) is None
+
+    def test_backup_copies_database_in_steps(self, db_path, tmp_path):
+        """Test that a stepped backup reports progress and copies every page."""
+        dest = tmp_path / "snapshots" / "snap.db"
+        seen: list[int] = []
+        conn = sqlite3.connect(db_path)
+        pages = backup_database(conn, dest, pages=2, progress=seen.append)
+        conn.close()
+
+        assert len(seen) > 1
+        assert seen[-1] == pages
+        assert titles(dest) == titles(db_path)
+        assert [p.name for p in dest.parent.iterdir()] == ["snap.db"]
+
+    def test_backup_of_wal_database_is_single_file(self, db_path, tmp_path):
+        """Test that a snapshot of a WAL database does not stay in WAL mode."""
+        dest = tmp_path / "snap.db"
+        conn = sqlite_connection_factory(db_path)()
+        backup_database(conn, dest)
+        conn.close()
+
+        snapshot = sqlite3.connect(dest)
+        assert snapshot.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+        snapshot.close()
+
+    def test_backup_refuses_own_file(self, db_path):
+        """Test that backing up onto the live file is rejected."""
+        conn = sqlite3.connect(db_path)
+        with pytest.raises(RazTodoException, match="onto itself"):
+            backup_database(conn, db_path)
+        conn.close()
+        assert len(titles(db_path)) == 50
+
+    def test_backup_failure_leaves_no_partial_file(self, db_path, tmp_path):
+        """Test that an aborted backup neither creates dest nor leaves temp files."""
+        dest = tmp_path / "out" / "snap.db"
+
+        def abort(copied):
+            raise KeyboardInterrupt
+
+        conn = sqlite3.connect(db_path)
+        with pytest.raises(KeyboardInterrupt):
+            backup_database(conn, dest, pages=1, progress=abort)
+        conn.close()
+        assert list(dest.parent.iterdir()) == []
+
+    def test_restore_replaces_live_database(self, db_path, tmp_path):
+        """Test that restore brings back the snapshot's tasks and indexes."""
+        dest = tmp_path / "snap.db"
+        conn = sqlite_connection_factory(db_path)()
+        backup_database(conn, dest)
+        conn.execute("DELETE FROM tasks")
+        conn.commit()
+
+        restore_database(conn, dest)
+        dao = TaskDAO(conn)
+        assert len(dao.fetch_all()) == 50
+        assert len(dao.fetch_all(tags=["work"])) == 50
+        assert dao.search("Task 7")
+        conn.close()
+
+    def test_restore_moves_change_counter_forward(self, db_path, tmp_path):
+        """Test that restoring an older snapshot never steps the change counter back."""
+        dest = tmp_path / "snap.db"
+        conn = sqlite_connection_factory(db_path)()
+        backup_database(conn, dest)
+        conn.execute("DELETE FROM tasks")
+        conn.commit()
+        before = read_change_counter(conn)
+
+        restore_database(conn, dest)
+        assert read_change_counter(conn) > before
+        conn.close()
+
+    def test_restore_resets_changelog(self, db_path, tmp_path):
+        """Test that positions taken before a restore are told to reload."""
+        dest = tmp_path / "snap.db"
+        conn = sqlite_connection_factory(db_path)()
+        backup_database(conn, dest)
+        conn.execute("DELETE FROM tasks")
+        conn.commit()
+        before = read_changelog_seq(conn)
+
+        restore_database(conn, dest)
+        assert read_changelog_seq(conn) > before
+        assert conn.execute("SELECT COUNT(*) FROM tasks_changelog").fetchone()[0] == 0
+        conn.close()
+
+    def test_restore_rejects_non_database(self, db_path, tmp_path):
+        """Test that a file that is not SQLite is rejected before copying."""
+        bogus = tmp_path / "bogus.db"
+        bogus.write_bytes(b"not a database" * 100)
+        conn = sqlite3.connect(db_path)
+        with pytest.raises(RazTodoException, match="not a SQLite database"):
+            restore_database(conn, bogus)
+        conn.close()
+        assert len(titles(db_path)) == 50
+
+    def test_restore_rejects_foreign_database(self, db_path, tmp_path):
+        """Test that a SQLite file without a tasks table is rejected."""
+        other = tmp_path / "other.db"
+        conn = sqlite3.connect(other)
+        conn.execute("CREATE TABLE notes (id INTEGER)")
+        conn.close()
+        conn = sqlite3.connect(db_path)
+        with pytest.raises(RazTodoException, match="no tasks table"):
+            restore_database(conn, other)
+        conn.close()
+
+    def test_restore_missing_file(self, db_path, tmp_path):
+        """Test that a missing snapshot is reported."""
+        conn = sqlite3.connect(db_path)
+        with pytest.raises(RazTodoException, match="TaskFileNotFoundError"):
+            restore_database(conn, tmp_path / "missing.db")
+        conn.close()
@@ -4,7 +4,11 @@ from pathlib import Path
 import pytest
 
 from raztodo.infrastructure.settings import Settings
-from raztodo.infrastructure.sqlite.connection import sqlite_connection_factory
+from raztodo.infrastructure.sqlite.connection import (
+    CONNECTION_PROFILES,
+    ConnectionProfile,
+    sqlite_connection_factory,
+)
 
 
 @pytest.fixture
@@ -69,6 +73,52 @@ class TestConnectionFactory:
         assert row["name"] == "Test"
         conn.close()
 
+    def test_default_profile_enables_wal(self, temp_db):
+        """Test that file connections use WAL and the balanced PRAGMAs."""
+        conn = sqlite_connection_factory(temp_db)()
+
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+        assert conn.execute("PRAGMA cache_size").fetchone()[0] == -16000
+        conn.close()
+
+    @pytest.mark.parametrize(
+        ("name", "synchronous"), [("durable", 2), ("balanced", 1), ("fast", 0)]
+    )
+    def test_named_profiles(self, temp_db, name, synchronous):
+        """Test that each preset applies its synchronous level."""
+        conn = sqlite_connection_factory(temp_db, CONNECTION_PROFILES[name])()
+
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == synchronous
+        conn.close()
+
+    def test_in_memory_skips_file_pragmas(self):
+        """Test that :memory: connections keep their journal mode."""
+        conn = sqlite_connection_factory(None, ConnectionProfile(busy_timeout=1234))()
+
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "memory"
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 1234
+        conn.close()
+
+    def test_reader_not_blocked_by_open_write(self, temp_db):
+        """Test that WAL lets a second connection read during a write transaction."""
+        factory = sqlite_connection_factory(temp_db)
+        writer = factory()
+        reader = factory()
+        writer.execute("CREATE TABLE test (id INTEGER)")
+        writer.commit()
+
+        writer.execute("INSERT INTO test VALUES (1)")
+        assert writer.in_transaction
+        assert reader.execute("SELECT COUNT(*) FROM test").fetchone()[0] == 0
+
+        writer.commit()
+        assert reader.execute("SELECT COUNT(*) FROM test").fetchone()[0] == 1
+        writer.close()
+        reader.close()
+
 
 class TestSettings:
     def test_linux_data_dir(self, monkeypatch):
@@ -0,0 +1,122 @@
+import asyncio
+import time
+
+import pytest
+
+from raztodo.domain.exceptions import RazTodoException
+from raztodo.infrastructure.sqlite.connection import sqlite_connection_factory
+from raztodo.infrastructure.sqlite.executor import DatabaseExecutor
+from raztodo.infrastructure.sqlite.pool import ConnectionPool
+from raztodo.infrastructure.sqlite.task_schema import ensure_schema
+
+
+@pytest.fixture
+def executor(tmp_path):
+    pool = ConnectionPool(sqlite_connection_factory(tmp_path / "exec.db"), max_readers=2)
+    with pool.writer() as conn:
+        ensure_schema(conn)
+    executor = DatabaseExecutor(pool)
+    yield executor
+    executor.shutdown()
+    pool.close()
+
+
+def add(repo, title):
+    return repo.add_task(title)
+
+
+def titles(repo):
+    return [t.title for t in repo.get_tasks()]
+
+
+class TestDatabaseExecutor:
+    """Test cases for the asyncio-facing database executor."""
+
+    def test_run_reads_and_writes(self, executor):
+        """Test that writes go through the writer and are visible to readers."""
+
+        async def scenario():
+            await executor.run(lambda repo: add(repo, "Buy milk"), write=True)
+            return await executor.run(titles)
+
+        assert asyncio.run(scenario()) == ["Buy milk"]
+
+    def test_run_without_write_is_read_only(self, executor):
+        """Test that a write through a reader lease is rejected."""
+        with pytest.raises(RazTodoException, match="readonly"):
+            asyncio.run(executor.run(lambda repo: add(repo, "Nope")))
+
+    def test_repository_is_reused_per_connection(self, executor):
+        """Test that repeated calls on one connection share its repository."""
+
+        async def scenario():
+            first = await executor.run(lambda repo: repo)
+            second = await executor.run(lambda repo: repo)
+            return first, second
+
+        first, second = asyncio.run(scenario())
+        assert first is second
+
+    def test_iterate_streams_items(self, executor):
+        """Test that iterate yields every item of a repository generator."""
+
+        async def scenario():
+            await executor.run(
+                lambda repo: repo.upsert_many({"title": f"T{i}"} for i in range(50)), write=True
+            )
+            return [chunk async for chunk in executor.iterate(lambda r: r.iter_export("ndjson"))]
+
+        chunks = asyncio.run(scenario())
+        assert "".join(chunks).count("\n") == 50
+
+    def test_reads_proceed_while_iterations_hold_every_reader(self, executor):
+        """Test that queued calls wait on the loop instead of starving the threads."""
+
+        async def scenario():
+            streams = [executor.iterate(lambda r: iter(range(3))) for _ in range(2)]
+            firsts = [await anext(s) for s in streams]
+            # Both readers are leased: these must queue without blocking the streams
+            reads = [asyncio.ensure_future(executor.run(lambda r: 1)) for _ in range(5)]
+            rests = []
+            for stream in streams:
+                rests.append([item async for item in stream])
+            return firsts, rests, await asyncio.gather(*reads)
+
+        firsts, rests, reads = asyncio.run(asyncio.wait_for(scenario(), 5))
+        assert firsts == [0, 0]
+        assert rests == [[1, 2], [1, 2]]
+        assert reads == [1] * 5
+
+    def test_abandoned_iteration_returns_its_lease(self, executor):
+        """Test that closing an iteration early hands the connection back."""
+
+        async def scenario():
+            stream = executor.iterate(lambda r: iter(range(10)))
+            await anext(stream)
+            await stream.aclose()
+            # Both readers are free again once the close has run
+            return await asyncio.gather(*(executor.run(lambda r: 1) for _ in range(2)))
+
+        assert asyncio.run(asyncio.wait_for(scenario(), 5)) == [1, 1]
+
+    def test_cancelled_iteration_returns_its_lease(self, executor):
+        """Test that cancelling a consumer mid-item still releases the lease."""
+
+        def slow():
+            yield 1
+            time.sleep(0.2)
+            yield 2
+
+        async def scenario():
+            async def consume():
+                async for _ in executor.iterate(lambda r: slow()):
+                    pass
+
+            task = asyncio.ensure_future(consume())
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            return await asyncio.gather(*(executor.run(lambda r: 1) for _ in range(2)))
+
+        assert asyncio.run(asyncio.wait_for(scenario(), 5)) == [1, 1]
@@ -1,7 +1,10 @@
 from raztodo.infrastructure.sqlite.migrations import (
+    backfill_task_tags,
     create_unique_title_index,
     deduplicate_titles,
+    rebuild_fts,
 )
+from raztodo.infrastructure.sqlite.task_schema import ensure_schema, fts_drift
 
 
 class TestMigrations:
@@ -104,3 +107,51 @@ class TestMigrations:
             assert cursor.fetchone() is not None
         finally:
             conn.close()
+
+    def test_backfill_task_tags(self, in_memory_db):
+        """Test rebuilding task_tags from JSON and legacy comma-separated tags."""
+        conn = in_memory_db()
+        try:
+            conn.execute("CREATE TABLE tasks (id INTEGER PRIMARY KEY, title TEXT, tags TEXT)")
+            conn.execute("""INSERT INTO tasks VALUES (1, 'a', '["work", "Work", " urgent "]')""")
+            conn.execute("INSERT INTO tasks VALUES (2, 'b', 'home, errands')")
+            conn.execute("INSERT INTO tasks VALUES (3, 'c', '')")
+
+            assert backfill_task_tags(conn) == 4
+
+            rows = conn.execute("SELECT task_id, tag FROM task_tags ORDER BY task_id, tag")
+            assert [tuple(r) for r in rows] == [
+                (1, "urgent"),
+                (1, "work"),
+                (2, "errands"),
+                (2, "home"),
+            ]
+            assert backfill_task_tags(conn) == 4  # Rebuild is idempotent
+        finally:
+            conn.close()
+
+    def test_backfill_task_tags_without_tags_column(self, in_memory_db):
+        """Test that databases predating the tags column backfill nothing."""
+        conn = in_memory_db()
+        try:
+            conn.execute("CREATE TABLE tasks (id INTEGER PRIMARY KEY, title TEXT NOT NULL)")
+            assert backfill_task_tags(conn) == 0
+        finally:
+            conn.close()
+
+    def test_rebuild_fts(self, in_memory_db):
+        """Test rebuilding the FTS index from the tasks table."""
+        conn = in_memory_db()
+        try:
+            ensure_schema(conn)
+            conn.execute("INSERT INTO tasks (title) VALUES ('First')")
+            conn.execute("INSERT INTO tasks (title) VALUES ('Second')")
+            conn.execute("INSERT INTO tasks_fts(tasks_fts) VALUES ('delete-all')")
+            conn.commit()
+
+            assert rebuild_fts(conn) == 2
+            assert fts_drift(conn) == 0
+            rows = conn.execute("SELECT rowid FROM tasks_fts WHERE tasks_fts MATCH 'second'")
+            assert [row[0] for row in rows] == [2]
+        finally:
+            conn.close()
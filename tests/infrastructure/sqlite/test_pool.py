@@ -0,0 +1,119 @@
+import sqlite3
+import threading
+
+import pytest
+
+from raztodo.domain.exceptions import RazTodoException
+from raztodo.infrastructure.sqlite.connection import sqlite_connection_factory
+from raztodo.infrastructure.sqlite.pool import ConnectionPool
+
+
+@pytest.fixture
+def pool(tmp_path):
+    factory = sqlite_connection_factory(tmp_path / "pool.db")
+    pool = ConnectionPool(factory, max_readers=2, timeout=0.2)
+    with pool.writer() as conn, conn:
+        conn.execute("CREATE TABLE test (id INTEGER)")
+    yield pool
+    pool.close()
+
+
+class TestConnectionPool:
+    """Test cases for the reader/writer connection pool."""
+
+    def test_reader_is_reused(self, pool):
+        """Test that a returned reader is handed out again."""
+        with pool.reader() as first:
+            pass
+        with pool.reader() as second:
+            assert second is first
+
+    def test_concurrent_readers_get_separate_connections(self, pool):
+        """Test that nested leases do not share a connection."""
+        with pool.reader() as first, pool.reader() as second:
+            assert first is not second
+
+    def test_readers_are_bounded(self, pool):
+        """Test that leasing past max_readers times out."""
+        with (
+            pool.reader(),
+            pool.reader(),
+            pytest.raises(RazTodoException, match="Timed out"),
+            pool.reader(),
+        ):
+            pass
+
+    def test_waiting_reader_gets_released_connection(self, tmp_path):
+        """Test that a blocked caller is woken when a reader is returned."""
+        pool = ConnectionPool(sqlite_connection_factory(tmp_path / "wait.db"), max_readers=1)
+        leased = []
+
+        def lease() -> None:
+            with pool.reader() as conn:
+                leased.append(conn)
+
+        with pool.reader() as first:
+            thread = threading.Thread(target=lease)
+            thread.start()
+            thread.join(0.1)
+            assert not leased
+        thread.join()
+        assert leased == [first]
+        pool.close()
+
+    def test_reader_is_query_only(self, pool):
+        """Test that writes through a reader fail."""
+        with pool.reader() as conn, pytest.raises(sqlite3.OperationalError, match="readonly"):
+            conn.execute("INSERT INTO test VALUES (1)")
+
+    def test_reader_sees_committed_writes_while_writer_is_held(self, pool):
+        """Test that readers are not blocked by an open write transaction."""
+        with pool.writer() as writer:
+            writer.execute("INSERT INTO test VALUES (1)")
+            writer.commit()
+            writer.execute("INSERT INTO test VALUES (2)")
+            with pool.reader() as reader:
+                assert reader.execute("SELECT COUNT(*) FROM test").fetchone()[0] == 1
+            writer.commit()
+
+    def test_single_writer(self, pool):
+        """Test that the writer is one connection leased by one caller at a time."""
+        with pool.writer() as first:
+            errors: list[Exception] = []
+
+            def lease() -> None:
+                try:
+                    with pool.writer():
+                        pass
+                except RazTodoException as e:
+                    errors.append(e)
+
+            blocked = threading.Thread(target=lease)
+            blocked.start()
+            blocked.join()
+            assert "writer" in str(errors[0])
+        with pool.writer() as second:
+            assert second is first
+
+    def test_open_transaction_rolled_back_on_release(self, pool):
+        """Test that an uncommitted write does not leak to the next caller."""
+        with pool.writer() as conn:
+            conn.execute("INSERT INTO test VALUES (1)")
+        with pool.reader() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM test").fetchone()[0] == 0
+
+    def test_closed_pool_rejects_leases(self, pool):
+        """Test that leases fail once the pool is closed."""
+        with pool.reader() as conn:
+            pool.close()
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+        with pytest.raises(RazTodoException, match="closed"), pool.reader():
+            pass
+        with pytest.raises(RazTodoException, match="closed"), pool.writer():
+            pass
+
+    def test_max_readers_must_be_positive(self, tmp_path):
+        """Test that a pool without readers is rejected."""
+        with pytest.raises(ValueError):
+            ConnectionPool(sqlite_connection_factory(tmp_path / "x.db"), max_readers=0)
@@ -2,7 +2,11 @@ import json
 
 import pytest
 
+from raztodo.domain.pagination import Cursor
+from raztodo.domain.search import MATCH_END, MATCH_START
+from raztodo.domain.task_entity import TaskEntity
 from raztodo.infrastructure.sqlite.task_dao import TaskDAO
+from raztodo.infrastructure.sqlite.task_mapper import task_row_factory
 
 
 class TestTaskDAO:
@@ -49,6 +53,157 @@ class TestTaskDAO:
         stored_tags = json.loads(row[0])
         assert stored_tags == tags
 
+    def test_insert_returning_returns_stored_row(self, dao):
+        """Test that insert_returning yields the new row with defaults filled in."""
+        row = dao.insert_returning("Task", priority="H", tags=["work"])
+        assert row["id"] > 0
+        assert row["title"] == "Task"
+        assert row["done"] == 0
+        assert row["created_at"]
+        assert json.loads(row["tags"]) == ["work"]
+        tags = dao._conn.execute("SELECT tag FROM task_tags WHERE task_id = ?", (row["id"],))
+        assert [r[0] for r in tags] == ["work"]
+
+    def test_update_returning_returns_fresh_row(self, dao):
+        """Test that update_returning yields the row as written."""
+        task_id = dao.insert("Task", tags=["old"])
+        row = dao.update_returning(task_id, title="Renamed", done=True, tags=["new"])
+        assert row["id"] == task_id
+        assert row["title"] == "Renamed"
+        assert row["done"] == 1
+        assert json.loads(row["tags"]) == ["new"]
+        tags = dao._conn.execute("SELECT tag FROM task_tags WHERE task_id = ?", (task_id,))
+        assert [r[0] for r in tags] == ["new"]
+
+    def test_insert_many_writes_rows_tags_and_done(self, dao):
+        """Test that insert_many stores every row, its done flag and its tags."""
+        rows = [
+            ("Task 1", "", "H", None, ["work", "home"], None, False),
+            ("Task 2", "desc", "", "2025-02-01", None, "Proj", True),
+        ]
+        inserted, failures = dao.insert_many(rows)
+        assert (inserted, failures) == (2, [])
+        stored = list(dao.fetch_all())
+        assert [(r["title"], r["done"]) for r in stored] == [("Task 1", 0), ("Task 2", 1)]
+        assert [r["id"] for r in dao.fetch_all(tags=["home"])] == [stored[0]["id"]]
+        assert not dao._conn.in_transaction
+
+    def test_insert_many_captures_rejected_rows_per_batch(self, dao):
+        """Test that a rejected row only drops itself, not the rest of its batch."""
+        dao.insert("Existing")
+        rows = [
+            ("A", "", "", None, ["a"], None, False),
+            ("Existing", "", "", None, None, None, False),
+            ("B", "", "", None, ["b"], None, False),
+            ("A", "", "", None, None, None, False),
+            ("C", "x" * 201, "", None, None, None, False),
+        ]
+        inserted, failures = dao.insert_many(rows, batch_size=2)
+        assert inserted == 2
+        assert [position for position, _ in failures] == [1, 3, 4]
+        assert "UNIQUE" in failures[0][1]
+        assert [r["title"] for r in dao.fetch_all()] == ["Existing", "A", "B"]
+        tags = dao._conn.execute("SELECT tag FROM task_tags ORDER BY tag").fetchall()
+        assert [r[0] for r in tags] == ["a", "b"]
+
+    def test_insert_many_empty(self, dao):
+        """Test that insert_many with no rows is a no-op."""
+        assert dao.insert_many([]) == (0, [])
+
+    def test_upsert_many_counts_inserts_and_updates(self, dao):
+        """Test that upsert_many updates matching titles and reports exact counts."""
+        existing = dao.insert("Existing", "old", "L", "2025-01-01", ["home"], "Proj")
+        rows = [
+            ("New", "", "", None, ["a"], None, None),
+            ("Existing", "new", "", None, ["work"], "", True),
+            ("New", "again", "H", None, None, None, None),
+        ]
+        assert dao.upsert_many(rows, batch_size=2) == (1, 2, [])
+        stored = {r["title"]: r for r in dao.fetch_all()}
+        assert stored["Existing"]["id"] == existing
+        assert stored["Existing"]["description"] == "new"
+        assert stored["Existing"]["priority"] == "L"
+        assert stored["Existing"]["due_date"] == "2025-01-01"
+        assert stored["Existing"]["project"] is None
+        assert stored["Existing"]["done"] == 1
+        assert (stored["New"]["description"], stored["New"]["priority"]) == ("again", "H")
+        assert stored["New"]["done"] == 0
+        tags = dao._conn.execute("SELECT task_id, tag FROM task_tags ORDER BY tag").fetchall()
+        assert [tuple(r) for r in tags] == [(stored["New"]["id"], "a"), (existing, "work")]
+        assert not dao._conn.in_transaction
+
+    def test_bulk_writes_store_empty_due_date_as_null(self, dao):
+        """Test that an empty due_date is stored as NULL by inserts and upserts alike."""
+        dao.insert("Existing", due_date="2025-01-01")
+        dao.insert_many([("Inserted", "", "", "", None, None, False)])
+        dao.upsert_many(
+            [
+                ("Existing", "", "", "", None, None, None),
+                ("Upserted", "", "", "", None, None, None),
+            ]
+        )
+        stored = {r["title"]: r["due_date"] for r in dao.fetch_all()}
+        assert stored == {"Existing": None, "Inserted": None, "Upserted": None}
+
+    def test_upsert_many_captures_rejected_rows_per_batch(self, dao):
+        """Test that a row SQLite cannot bind only drops itself, not its batch."""
+        rows = [
+            ("A", "", "", None, ["a"], None, None),
+            ("Bad", "", "", ["x"], None, None, None),
+            ("B", "", "", None, None, None, None),
+        ]
+        inserted, updated, failures = dao.upsert_many(rows, batch_size=2)
+        assert (inserted, updated) == (2, 0)
+        assert [position for position, _ in failures] == [1]
+        assert [r["title"] for r in dao.fetch_all()] == ["A", "B"]
+        tags = dao._conn.execute("SELECT tag FROM task_tags").fetchall()
+        assert [r[0] for r in tags] == ["a"]
+
+    def test_upsert_many_empty(self, dao):
+        """Test that upsert_many with no rows is a no-op."""
+        assert dao.upsert_many([]) == (0, 0, [])
+
+    def test_iter_all_reads_in_batches(self, dao):
+        """Test that iter_all yields every row in id order across fetchmany batches."""
+        ids = [dao.insert(f"Task {i}") for i in range(5)]
+        rows = dao.iter_all(batch_size=2)
+        assert next(rows)["id"] == ids[0]
+        assert [r["id"] for r in rows] == ids[1:]
+
+    def test_toggle_done_flips_and_returns_row(self, dao):
+        """Test that toggle_done flips the stored flag in one statement."""
+        task_id = dao.insert("Task")
+        assert dao.toggle_done(task_id)["done"] == 1
+        assert dao.toggle_done(task_id)["done"] == 0
+        assert dao.fetch_by_id(task_id)["done"] == 0
+
+    def test_toggle_done_missing(self, dao):
+        """Test that toggle_done yields None for unknown ids."""
+        assert dao.toggle_done(999) is None
+
+    def test_mark_done_many_returns_matched_ids(self, dao):
+        """Test that mark_done_many updates existing ids and reports them."""
+        ids = [dao.insert(f"Task {i}") for i in range(3)]
+        updated = dao.mark_done_many([ids[0], 999, ids[2]])
+        assert sorted(updated) == [ids[0], ids[2]]
+        assert [row["done"] for row in dao.fetch_all()] == [1, 0, 1]
+
+        assert dao.mark_done_many(ids, done=False) == ids
+        assert [row["done"] for row in dao.fetch_all()] == [0, 0, 0]
+
+    def test_mark_done_many_chunks_large_batches(self, dao, monkeypatch):
+        """Test that batches larger than one IN list are split across statements."""
+        monkeypatch.setattr("raztodo.infrastructure.sqlite.task_dao.IDS_PER_STATEMENT", 2)
+        ids = [dao.insert(f"Task {i}") for i in range(5)]
+        assert sorted(dao.mark_done_many(ids)) == ids
+        assert all(row["done"] == 1 for row in dao.fetch_all())
+
+    def test_update_returning_missing_or_empty(self, dao):
+        """Test that update_returning yields None for unknown ids and empty updates."""
+        task_id = dao.insert("Task")
+        assert dao.update_returning(999, title="X") is None
+        assert dao.update_returning(task_id) is None
+
     def test_fetch_all_empty(self, dao):
         """Test fetching from empty table."""
         rows = list(dao.fetch_all())
@@ -82,6 +237,65 @@ class TestTaskDAO:
         rows = list(dao.fetch_all(limit=2, offset=2))
         assert len(rows) == 2
 
+    def test_fetch_all_after_cursor(self, dao):
+        """Test keyset pagination seeks past the cursor position."""
+        ids = [dao.insert(f"Task {i}") for i in range(5)]
+        rows = list(dao.fetch_all(limit=2, after=Cursor(key=ids[1], id=ids[1])))
+        assert [row["id"] for row in rows] == ids[2:4]
+
+    def test_fetch_all_order_by_priority_descending(self, dao):
+        """Test ordering by priority rank, ties broken by id."""
+        for title, priority in [("a", "L"), ("b", "H"), ("c", None), ("d", "M"), ("e", "H")]:
+            dao.insert(title, priority=priority)
+        rows = list(dao.fetch_all(order_by="priority", descending=True))
+        assert [row["title"] for row in rows] == ["e", "b", "d", "a", "c"]
+
+    def test_fetch_all_order_by_due_date_nulls(self, dao):
+        """Test that tasks without a due date sort first ascending, last descending."""
+        dao.insert("late", due_date="2025-03-01")
+        dao.insert("none")
+        dao.insert("early", due_date="2025-01-01")
+        ascending = [row["title"] for row in dao.fetch_all(order_by="due_date")]
+        descending = [row["title"] for row in dao.fetch_all(order_by="due_date", descending=True)]
+        assert ascending == ["none", "early", "late"]
+        assert descending == ["late", "early", "none"]
+
+    @pytest.mark.parametrize("order_by", ["priority", "due_date", "title"])
+    @pytest.mark.parametrize("descending", [False, True])
+    def test_fetch_all_keyset_pages_match_full_sort(self, dao, order_by, descending):
+        """Test that walking sorted pages by cursor yields the full ordering."""
+        for i in range(7):
+            dao.insert(
+                f"Task {i % 3}-{i}",
+                priority=[None, "L", "H"][i % 3],
+                due_date=None if i % 2 else f"2025-01-0{i % 4 + 1}",
+            )
+        expected = [row["id"] for row in dao.fetch_all(order_by=order_by, descending=descending)]
+
+        seen: list[int] = []
+        after = None
+        while True:
+            page = list(
+                dao.fetch_all(limit=2, after=after, order_by=order_by, descending=descending)
+            )
+            if not page:
+                break
+            seen.extend(row["id"] for row in page)
+            last = page[-1]
+            key = (
+                last[order_by]
+                if order_by != "priority"
+                else {"H": 3, "L": 1}.get(last["priority"], 0)
+            )
+            after = Cursor(key=key, id=last["id"], order_by=order_by, descending=descending)
+
+        assert seen == expected
+
+    def test_fetch_all_unknown_order_by(self, dao):
+        """Test that an unknown sort field is rejected."""
+        with pytest.raises(ValueError):
+            list(dao.fetch_all(order_by="description"))
+
     def test_fetch_all_filter_done(self, dao):
         """Test filtering by done status."""
         task_id1 = dao.insert("Task 1")
@@ -199,6 +413,105 @@ class TestTaskDAO:
         rows = list(dao.search("Task", tags=["urgent"]))
         assert len(rows) == 1
 
+    def test_task_tags_kept_in_sync(self, dao):
+        """Test that insert/update/delete maintain the task_tags rows."""
+
+        def tag_rows():
+            return dao._conn.execute(
+                "SELECT task_id, tag FROM task_tags ORDER BY task_id, tag"
+            ).fetchall()
+
+        task_id = dao.insert("Task", tags=["work", "urgent"])
+        assert [tuple(r) for r in tag_rows()] == [(task_id, "urgent"), (task_id, "work")]
+
+        dao.update(task_id, tags=["home"])
+        assert [tuple(r) for r in tag_rows()] == [(task_id, "home")]
+
+        dao.update(task_id, tags=[])
+        assert tag_rows() == []
+
+        dao.update(task_id, tags=["home"])
+        dao.delete(task_id)
+        assert tag_rows() == []
+
+    def test_fetch_all_tags_any_and_all(self, dao):
+        """Test ANY and ALL tag matching."""
+        both = dao.insert("Both", tags=["work", "urgent"])
+        work = dao.insert("Work", tags=["work"])
+        dao.insert("Home", tags=["home"])
+
+        any_rows = dao.fetch_all(tags=["urgent", "work"])
+        all_rows = dao.fetch_all(tags=["urgent", "work"], all_tags=True)
+        assert [row["id"] for row in any_rows] == [both, work]
+        assert [row["id"] for row in all_rows] == [both]
+
+    def test_fetch_all_tags_exact_and_case_insensitive(self, dao):
+        """Test that tags match whole values, ignoring ASCII case."""
+        task_id = dao.insert("Task", tags=["Work"])
+        dao.insert("Other", tags=["workshop"])
+
+        rows = dao.fetch_all(tags=["work"])
+        assert [row["id"] for row in rows] == [task_id]
+
+    def test_fetch_all_tags_uses_index(self, dao):
+        """Test that tag filters are served by the task_tags index."""
+        plan = dao._conn.execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM tasks WHERE id IN "
+            "(SELECT task_id FROM task_tags WHERE tag IN (?, ?))",
+            ["a", "b"],
+        ).fetchall()
+        details = " ".join(row[3] for row in plan)
+        assert "idx_task_tags_tag" in details
+        assert "SCAN task_tags" not in details
+
+    def test_search_tasks_all_tags(self, dao):
+        """Test searching with every tag required."""
+        dao.insert("Task 1", tags=["urgent", "work"])
+        dao.insert("Task 2", tags=["urgent"])
+
+        rows = list(dao.search("Task", tags=["urgent", "work"], all_tags=True))
+        assert [row["title"] for row in rows] == ["Task 1"]
+
+    def test_search_tasks_done_due_and_paging(self, dao):
+        """Test search filters on status and due date, with keyset paging."""
+        ids = [dao.insert(f"Task {i}", due_date=f"2025-01-0{i + 1}") for i in range(5)]
+        dao.update(ids[0], done=True)
+
+        assert [r["id"] for r in dao.search("Task", done=False)] == ids[1:]
+        assert [r["id"] for r in dao.search("Task", due_after="2025-01-04")] == ids[3:]
+        assert [r["id"] for r in dao.search("Task", due_before="2025-01-02")] == ids[:2]
+        assert [r["id"] for r in dao.search("Task", limit=2, after_id=ids[1])] == ids[2:4]
+
+    def test_search_ranked_orders_by_weighted_relevance(self, dao):
+        """Test that title matches outrank description matches by default."""
+        in_desc = dao.insert("Call Bob", description="talk about the report")
+        in_title = dao.insert("Report bug")
+
+        rows = dao.search_ranked("report")
+        assert [row["id"] for row in rows] == [in_title, in_desc]
+        assert rows[0]["score"] > rows[1]["score"]
+
+        rows = dao.search_ranked("report", title_weight=0.0, description_weight=1.0)
+        assert rows[0]["id"] == in_desc
+
+    def test_search_ranked_marks_matches(self, dao):
+        """Test that highlight and snippet wrap matches in the markers."""
+        dao.insert("Write report", description="the quarterly report")
+
+        row = dao.search_ranked("report")[0]
+        assert row["title_marked"] == f"Write {MATCH_START}report{MATCH_END}"
+        assert row["snippet_marked"] == f"the quarterly {MATCH_START}report{MATCH_END}"
+
+    def test_search_ranked_limit_and_filters(self, dao):
+        """Test LIMIT and metadata filters on ranked search."""
+        for i in range(5):
+            dao.insert(f"Task {i}", priority="H" if i % 2 else "L")
+        dao.update(2, done=True)
+
+        assert len(dao.search_ranked("Task", limit=3)) == 3
+        assert {row["id"] for row in dao.search_ranked("Task", priority="H")} == {2, 4}
+        assert [row["id"] for row in dao.search_ranked("Task", done=True)] == [2]
+
     def test_clear_all(self, dao):
         """Test clearing all tasks."""
         dao.insert("Task 1")
@@ -214,7 +527,70 @@ class TestTaskDAO:
         rows_after = list(dao.fetch_all())
         assert len(rows_after) == 0
 
+    def test_clear_all_removes_tags(self, dao):
+        """Test that clearing tasks also clears task_tags."""
+        dao.insert("Task", tags=["work"])
+        dao.clear_all()
+        assert dao._conn.execute("SELECT COUNT(*) FROM task_tags").fetchone()[0] == 0
+
     def test_clear_all_empty(self, dao):
         """Test clearing when database is empty."""
         count = dao.clear_all()
         assert count == 0
+
+
+class TestTaskDAOTaskFactory:
+    """Test cases for TaskDAO with a task row factory."""
+
+    @pytest.fixture
+    def dao(self, in_memory_db):
+        conn = in_memory_db()
+        dao = TaskDAO(conn, task_factory=task_row_factory)
+        yield dao
+        conn.close()
+
+    def test_task_queries_build_entities(self, dao):
+        task = dao.insert_returning("Task", tags=["work"])
+        assert isinstance(task, TaskEntity)
+        assert task.tags == ["work"]
+        tagged = dao._conn.execute("SELECT task_id FROM task_tags WHERE tag = 'work'")
+        assert [r[0] for r in tagged] == [task.id]
+
+        assert dao.fetch_by_id(task.id) == task
+        assert dao.fetch_all() == [task]
+        assert list(dao.iter_all()) == [task]
+        assert dao.search("Task") == [task]
+        assert dao.toggle_done(task.id).done is True
+        assert dao.update_returning(task.id, title="Renamed").title == "Renamed"
+
+    def test_insert_still_returns_id(self, dao):
+        task_id = dao.insert("Task", tags=["work"])
+
+        assert dao.fetch_by_id(task_id).tags == ["work"]
+
+    def test_iterators_match_list_queries(self, dao):
+        for i in range(5):
+            dao.insert(f"Task {i}", priority="H" if i % 2 else "L")
+
+        tasks = dao.iter_tasks(priority="H", order_by="title", descending=True, batch_size=1)
+        assert list(tasks) == dao.fetch_all(priority="H", order_by="title", descending=True)
+        assert list(dao.iter_search("Task", after_id=2, batch_size=2)) == dao.search(
+            "Task", after_id=2
+        )
+
+    def test_iter_rows_yields_plain_tuples(self, dao):
+        ids = [dao.insert(f"Task {i}", priority="H" if i % 2 else "L") for i in range(5)]
+
+        rows = list(dao.iter_rows(priority="H", batch_size=1))
+
+        assert [type(r) for r in rows] == [tuple, tuple]
+        assert [r[0] for r in rows] == [ids[1], ids[3]]
+        assert rows[0][1:3] == ("Task 1", "")
+
+    def test_other_queries_keep_connection_rows(self, dao):
+        dao.insert("Task")
+
+        row = dao.search_ranked("Task")[0]
+
+        assert row["title"] == "Task"
+        assert row["score"] is not None
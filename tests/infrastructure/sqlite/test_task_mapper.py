@@ -1,8 +1,11 @@
 import json
 import sqlite3
 from contextlib import closing
+from dataclasses import fields
 
-from raztodo.infrastructure.sqlite.task_mapper import row_to_task
+from raztodo.domain.task_entity import TaskEntity
+from raztodo.infrastructure.sqlite.task_dao import TASK_COLUMNS
+from raztodo.infrastructure.sqlite.task_mapper import row_to_task, rows_to_batch, task_row_factory
 
 
 class TestRowToTask:
@@ -136,3 +139,76 @@ class TestRowToTask:
             assert task.due_date is None
             assert task.tags == []
             assert task.project is None
+
+
+class TestTaskRowFactory:
+    """Test cases for the positional task_row_factory."""
+
+    def _fetch(self, *values):
+        with closing(sqlite3.connect(":memory:")) as conn:
+            conn.row_factory = task_row_factory
+            conn.execute(f"CREATE TABLE tasks ({TASK_COLUMNS})")
+            conn.execute("INSERT INTO tasks VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", values)
+            return conn.execute(f"SELECT {TASK_COLUMNS} FROM tasks").fetchone()
+
+    def test_task_columns_follow_entity_fields(self):
+        """The factory maps by position, so the SELECT order must match TaskEntity."""
+        columns = [c.strip() for c in TASK_COLUMNS.split(",")]
+        assert columns == [f.name for f in fields(TaskEntity)]
+
+    def test_maps_all_fields(self):
+        task = self._fetch(
+            1, "Task", "Desc", 1, "2025-01-31 12:00:00", "H", "2025-02-01", '["a", "b"]', "P"
+        )
+
+        assert task == TaskEntity(
+            id=1,
+            title="Task",
+            description="Desc",
+            done=True,
+            created_at="2025-01-31 12:00:00",
+            priority="H",
+            due_date="2025-02-01",
+            tags=["a", "b"],
+            project="P",
+        )
+
+    def test_normalizes_empty_columns_like_row_to_task(self):
+        values = (1, "Task", None, 0, None, None, "", "[]", "")
+
+        task = self._fetch(*values)
+
+        assert task.tags == []
+        with closing(sqlite3.connect(":memory:")) as conn:
+            conn.row_factory = sqlite3.Row
+            conn.execute(f"CREATE TABLE tasks ({TASK_COLUMNS})")
+            conn.execute("INSERT INTO tasks VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", values)
+            assert task == row_to_task(conn.execute("SELECT * FROM tasks").fetchone())
+
+    def test_decodes_legacy_comma_separated_tags(self):
+        task = self._fetch(1, "Task", "", 0, "", "", None, "a, b", None)
+
+        assert task.tags == ["a", "b"]
+
+    def test_tasks_do_not_share_cached_tags(self):
+        first = self._fetch(1, "Task", "", 0, "", "", None, '["a"]', None)
+        second = self._fetch(2, "Task", "", 0, "", "", None, '["a"]', None)
+
+        first.tags.append("b")
+
+        assert second.tags == ["a"]
+
+
+class TestRowsToBatch:
+    """Test cases for rows_to_batch."""
+
+    def test_builds_same_tasks_as_row_factory(self):
+        rows = [
+            (1, "One", "Desc", 1, "2025-01-31", "H", "2025-02-01", '["a"]', "P"),
+            (2, "Two", None, 0, None, None, "", "[]", ""),
+        ]
+
+        batch = rows_to_batch(rows)
+
+        assert list(batch) == [task_row_factory(None, row) for row in rows]
+        assert batch.tags == [("a",), ()]
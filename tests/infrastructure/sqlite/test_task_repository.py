@@ -1,9 +1,13 @@
+import json
+
 import pytest
 
 from raztodo.domain.exceptions import RazTodoException
+from raztodo.domain.pagination import encode_cursor
 from raztodo.infrastructure.sqlite.task_repository import (
     SQLiteTaskRepository,
 )
+from raztodo.infrastructure.sqlite.task_schema import ensure_schema
 
 
 class TestSQLiteTaskRepository:
@@ -88,6 +92,114 @@ class TestSQLiteTaskRepository:
         tasks = task_repo.get_tasks(offset=2)
         assert len(tasks) == 3  # Should return remaining tasks
 
+    def test_get_tasks_with_cursor(self, task_repo):
+        """Test that a cursor resumes right after the previous page."""
+        for i in range(5):
+            task_repo.add_task(f"Task {i}")
+        first_page = task_repo.get_tasks(limit=2)
+        second_page = task_repo.get_tasks(limit=2, cursor=encode_cursor(first_page[-1]))
+        assert [t.title for t in second_page] == ["Task 2", "Task 3"]
+
+    def test_get_task_batch_matches_get_tasks(self, task_repo):
+        """Test that the columnar batch holds the same tasks as get_tasks."""
+        for i, priority in enumerate("LHMHL"):
+            task_repo.add_task(f"Task {i}", priority=priority, tags=["t"] if i % 2 else None)
+        kwargs = {"limit": 3, "order_by": "priority", "descending": True}
+        first_page = task_repo.get_tasks(**kwargs)
+        cursor = encode_cursor(first_page[-1], "priority", True)
+
+        assert list(task_repo.get_task_batch(**kwargs)) == first_page
+        assert list(task_repo.get_task_batch(cursor=cursor, **kwargs)) == task_repo.get_tasks(
+            cursor=cursor, **kwargs
+        )
+        assert list(task_repo.get_task_batch(priority="H")) == task_repo.get_tasks(priority="H")
+
+    def test_iter_tasks_matches_get_tasks(self, task_repo):
+        """Test that the lazy listing yields the same tasks as get_tasks."""
+        for i in range(5):
+            task_repo.add_task(f"Task {i}")
+        cursor = encode_cursor(task_repo.get_tasks(limit=2)[-1])
+
+        assert list(task_repo.iter_tasks()) == task_repo.get_tasks()
+        assert list(task_repo.iter_tasks(limit=2, cursor=cursor)) == task_repo.get_tasks(
+            limit=2, cursor=cursor
+        )
+
+    def test_iter_tasks_checks_arguments_eagerly(self, task_repo):
+        """Test that a bad cursor fails on the call, before iteration starts."""
+        with pytest.raises(RazTodoException):
+            task_repo.iter_tasks(cursor="garbage")
+
+    def test_iter_tasks_wraps_database_errors(self, task_repo):
+        """Test that errors while iterating surface as domain errors."""
+        task_repo.add_task("Task")
+        tasks = task_repo.iter_tasks()
+        task_repo.close()
+
+        with pytest.raises(RazTodoException, match="DatabaseError during iter_tasks"):
+            next(tasks)
+
+    def test_iter_search_matches_search_tasks(self, task_repo):
+        """Test that the lazy search yields the same tasks as search_tasks."""
+        for title in ("Python basics", "Go basics", "Advanced Python"):
+            task_repo.add_task(title)
+
+        assert list(task_repo.iter_search("python")) == task_repo.search_tasks("python")
+        assert list(task_repo.iter_search("  ")) == []
+
+    def test_get_tasks_with_invalid_cursor(self, task_repo):
+        """Test that a malformed cursor raises a domain error."""
+        with pytest.raises(RazTodoException):
+            task_repo.get_tasks(cursor="garbage")
+
+    def test_get_tasks_sorted_with_cursor(self, task_repo):
+        """Test that a cursor resumes a sorted listing in the same order."""
+        for i, priority in enumerate("LHMHL"):
+            task_repo.add_task(f"Task {i}", priority=priority)
+        first_page = task_repo.get_tasks(limit=2, order_by="priority", descending=True)
+        cursor = encode_cursor(first_page[-1], "priority", True)
+        second_page = task_repo.get_tasks(
+            limit=2, cursor=cursor, order_by="priority", descending=True
+        )
+        assert [t.title for t in first_page] == ["Task 3", "Task 1"]
+        assert [t.title for t in second_page] == ["Task 2", "Task 4"]
+
+    @pytest.mark.parametrize("descending", [False, True])
+    def test_get_tasks_pages_through_missing_due_dates(self, task_repo, descending):
+        """Test that due_date cursors visit every task once, whether '', NULL or dated."""
+        for i in range(12):
+            task_repo.add_task(f"Task {i}", due_date=("", None, f"2025-01-{i + 1:02d}")[i % 3])
+        # A row written as '' before empty due dates were stored as NULL
+        task_repo._conn.execute("UPDATE tasks SET due_date = '' WHERE title = 'Task 1'")
+        ensure_schema(task_repo._conn)
+
+        seen: list[int] = []
+        cursor = None
+        for _ in range(12):
+            page = task_repo.get_tasks(
+                limit=3, cursor=cursor, order_by="due_date", descending=descending
+            )
+            if not page:
+                break
+            seen.extend(t.id for t in page)
+            cursor = encode_cursor(page[-1], "due_date", descending)
+
+        expected = [t.id for t in task_repo.get_tasks(order_by="due_date", descending=descending)]
+        assert seen == expected
+        assert len(set(seen)) == 12
+
+    def test_get_tasks_invalid_order_by(self, task_repo):
+        """Test that an unknown sort field raises a domain error."""
+        with pytest.raises(RazTodoException):
+            task_repo.get_tasks(order_by="description")
+
+    def test_get_tasks_cursor_for_other_order(self, task_repo):
+        """Test that a cursor from a differently sorted listing is rejected."""
+        task_repo.add_task("Task")
+        cursor = encode_cursor(task_repo.get_tasks()[0])
+        with pytest.raises(RazTodoException):
+            task_repo.get_tasks(cursor=cursor, order_by="title")
+
     def test_get_tasks_filter_done(self, task_repo):
         """Test filtering tasks by done status."""
         task_id1 = task_repo.add_task("Task 1")
@@ -129,6 +241,14 @@ class TestSQLiteTaskRepository:
         urgent_tasks = task_repo.get_tasks(tags=["urgent"])
         assert len(urgent_tasks) == 1
 
+    def test_get_tasks_filter_all_tags(self, task_repo):
+        """Test requiring every tag."""
+        task_repo.add_task("Task 1", tags=["urgent", "work"])
+        task_repo.add_task("Task 2", tags=["urgent"])
+
+        tasks = task_repo.get_tasks(tags=["urgent", "work"], all_tags=True)
+        assert [t.title for t in tasks] == ["Task 1"]
+
     def test_update_task_title(self, task_repo):
         """Test updating task title."""
         task_id = task_repo.add_task("Old Title")
@@ -173,6 +293,197 @@ class TestSQLiteTaskRepository:
         tasks = task_repo.get_tasks()
         assert tasks[0].project is None
 
+    def test_add_task_returning(self, task_repo):
+        """Test creating a task returns the stored entity."""
+        task = task_repo.add_task_returning("  Task  ", priority="h", tags=[" work ", ""])
+        assert task.id > 0
+        assert task.title == "Task"
+        assert task.priority == "H"
+        assert task.tags == ["work"]
+        assert task.created_at
+        assert task_repo.get_task(task.id) == task
+
+    def test_add_task_returning_duplicate_title(self, task_repo):
+        """Test creating a duplicate task via add_task_returning raises error."""
+        task_repo.add_task_returning("Task")
+        with pytest.raises(RazTodoException, match="DuplicateTaskError"):
+            task_repo.add_task_returning("Task")
+
+    def test_update_task_returning(self, task_repo):
+        """Test updating a task returns the updated entity."""
+        task_id = task_repo.add_task("Task", project="Work", due_date="2025-02-01")
+        task = task_repo.update_task_returning(task_id, title="New Title", project="")
+        assert task is not None
+        assert task.title == "New Title"
+        assert task.project is None
+        assert task.due_date == "2025-02-01"
+
+    def test_import_tasks_ndjson(self, task_repo, tmp_path):
+        """Test importing one task per line from an NDJSON file."""
+        path = tmp_path / "tasks.ndjson"
+        path.write_text('{"title": "A", "done": true}\n\n{"title": "B"}\n', encoding="utf-8")
+        assert task_repo.import_tasks(str(path)) == {"inserted": 2, "skipped": 0, "failed": 0}
+        assert [(t.title, t.done) for t in task_repo.get_tasks()] == [("A", True), ("B", False)]
+
+    def test_import_tasks_reports_progress(self, task_repo, tmp_path, monkeypatch):
+        """Test that the progress callback sees the running and final item counts."""
+        monkeypatch.setattr("raztodo.infrastructure.sqlite.task_repository.PROGRESS_INTERVAL", 2)
+        path = tmp_path / "tasks.json"
+        path.write_text(json.dumps([{"title": f"T{i}"} for i in range(5)]), encoding="utf-8")
+        seen: list[int] = []
+        task_repo.import_tasks(str(path), progress=seen.append)
+        assert seen == [2, 4, 5]
+
+    def test_import_tasks_numbers_failures_by_item(self, task_repo, tmp_path):
+        """Test that rejected rows are reported by their position in the file."""
+        task_repo.add_task("Dup")
+        path = tmp_path / "tasks.json"
+        items = ["junk", {"title": ""}, {"title": "Dup"}, {"title": "Dup"}]
+        path.write_text(json.dumps(items), encoding="utf-8")
+        with pytest.raises(RazTodoException) as exc_info:
+            task_repo.import_tasks(str(path))
+        message = str(exc_info.value)
+        assert "Item 2:" in message
+        assert "Item 3:" in message
+        assert "Item 4:" in message
+
+    def test_import_tasks_rolls_back_on_malformed_tail(self, task_repo, tmp_path):
+        """Test that a syntax error late in the file leaves no partial import."""
+        path = tmp_path / "tasks.json"
+        path.write_text('[{"title": "A"}, {"title": "B"}, {"title": ', encoding="utf-8")
+        with pytest.raises(RazTodoException, match="InvalidFileFormatError"):
+            task_repo.import_tasks(str(path))
+        assert task_repo.get_tasks() == []
+
+    def test_upsert_many(self, task_repo):
+        """Test upserting validates items and keeps omitted fields on update."""
+        task_id = task_repo.add_task("Existing", priority="H", tags=["home"])
+        items = [
+            {"title": "Existing", "description": "New"},
+            {"title": "Fresh", "priority": "m", "tags": [" a ", ""], "done": True},
+            {"title": "x" * 61},
+            "junk",
+        ]
+        assert task_repo.upsert_many(items) == {
+            "inserted": 1,
+            "updated": 1,
+            "skipped": 1,
+            "failed": 1,
+        }
+        existing, fresh = task_repo.get_tasks()
+        assert (existing.id, existing.description, existing.priority) == (task_id, "New", "H")
+        assert existing.tags == ["home"]
+        assert (fresh.priority, fresh.tags, fresh.done) == ("M", ["a"], True)
+
+    def test_upsert_many_missing_keeps_and_empty_clears(self, task_repo):
+        """Test that a missing due_date/project keeps the stored value and '' clears it."""
+        for title in ("Kept", "Cleared"):
+            task_repo.add_task(title, priority="H", due_date="2025-01-01", project="Work")
+        items = [
+            {"title": "Kept", "priority": "", "tags": []},
+            {"title": "Cleared", "priority": "", "due_date": "", "project": ""},
+        ]
+        task_repo.upsert_many(items)
+        stored = {t.title: (t.priority, t.due_date, t.project) for t in task_repo.get_tasks()}
+        assert stored == {"Kept": ("H", "2025-01-01", "Work"), "Cleared": ("H", None, None)}
+
+    def test_upsert_many_reports_progress(self, task_repo, monkeypatch):
+        """Test that the progress callback sees the running and final item counts."""
+        monkeypatch.setattr("raztodo.infrastructure.sqlite.task_repository.PROGRESS_INTERVAL", 2)
+        seen: list[int] = []
+        task_repo.upsert_many(({"title": f"T{i}"} for i in range(3)), progress=seen.append)
+        assert seen == [2, 3]
+
+    def test_upsert_many_without_unique_title_index(self, task_repo):
+        """Test that a missing title index surfaces as a RazTodoException."""
+        task_repo._conn.execute("DROP INDEX idx_tasks_title_unique")
+        with pytest.raises(RazTodoException, match="DatabaseError during upsert_many"):
+            task_repo.upsert_many([{"title": "A"}])
+        assert task_repo.get_tasks() == []
+
+    def test_iter_export_streams_json_array(self, task_repo):
+        """Test that the streamed export decodes to every task with all fields."""
+        task_repo.add_task("A", tags=["x"], project="P")
+        task_repo.add_task("B", priority="H")
+        text = "".join(task_repo.iter_export())
+        data = json.loads(text)
+        assert [(d["title"], d["tags"], d["project"]) for d in data] == [
+            ("A", ["x"], "P"),
+            ("B", [], None),
+        ]
+        assert set(data[0]) == {
+            "id",
+            "title",
+            "description",
+            "done",
+            "created_at",
+            "priority",
+            "due_date",
+            "tags",
+            "project",
+        }
+
+    @pytest.mark.parametrize("filename", ["tasks.csv", "tasks.ndjson.gz", "tasks.json.gz"])
+    def test_export_import_round_trip(self, task_repo, tmp_path, filename):
+        """Test that each format and compression reads back what was exported."""
+        first = task_repo.add_task("A", "desc, with comma", "H", "2025-02-01", ["x"], "P")
+        task_repo.mark_done(first, True)
+        task_repo.add_task("B")
+        path = tmp_path / filename
+        task_repo.export_tasks(str(path))
+        task_repo.clear_all_tasks()
+
+        assert task_repo.import_tasks(str(path)) == {"inserted": 2, "skipped": 0, "failed": 0}
+        a, b = task_repo.get_tasks()
+        assert (a.title, a.description, a.priority, a.due_date) == (
+            "A",
+            "desc, with comma",
+            "H",
+            "2025-02-01",
+        )
+        assert (a.tags, a.project, a.done) == (["x"], "P", True)
+        assert (b.title, b.tags, b.project, b.done) == ("B", [], None, False)
+
+    def test_export_explicit_format(self, task_repo, tmp_path):
+        """Test that an explicit format overrides the file extension."""
+        task_repo.add_task("A")
+        path = tmp_path / "tasks.txt"
+        task_repo.export_tasks(str(path), file_format="ndjson")
+        assert json.loads(path.read_text(encoding="utf-8"))["title"] == "A"
+
+    def test_import_truncated_gzip(self, task_repo, tmp_path):
+        """Test that a truncated compressed file is reported as a format error."""
+        task_repo.add_task("A")
+        path = tmp_path / "tasks.json.gz"
+        task_repo.export_tasks(str(path))
+        path.write_bytes(path.read_bytes()[:-10])
+        task_repo.clear_all_tasks()
+        with pytest.raises(RazTodoException, match="InvalidFileFormatError"):
+            task_repo.import_tasks(str(path))
+        assert task_repo.get_tasks() == []
+
+    def test_toggle_done(self, task_repo):
+        """Test toggling a task flips and returns its status."""
+        task_id = task_repo.add_task("Task")
+        assert task_repo.toggle_done(task_id).done is True
+        assert task_repo.toggle_done(task_id).done is False
+
+    def test_toggle_done_nonexistent(self, task_repo):
+        """Test toggling a nonexistent task returns None."""
+        assert task_repo.toggle_done(999) is None
+
+    def test_mark_done_many(self, task_repo):
+        """Test marking several tasks done, ignoring duplicates and unknown ids."""
+        first = task_repo.add_task("Task 1")
+        second = task_repo.add_task("Task 2")
+        updated = task_repo.mark_done_many([second, first, second, 999])
+        assert sorted(updated) == [first, second]
+        assert all(t.done for t in task_repo.get_tasks())
+
+    def test_update_task_returning_nonexistent(self, task_repo):
+        """Test updating a nonexistent task returns None."""
+        assert task_repo.update_task_returning(999, title="X") is None
+
     def test_remove_task(self, task_repo):
         """Test removing a task."""
         task_id = task_repo.add_task("Task")
@@ -236,6 +547,38 @@ class TestSQLiteTaskRepository:
         results = task_repo.search_tasks("Task", priority="H", project="Work")
         assert len(results) == 1
 
+    def test_search_tasks_with_cursor(self, task_repo):
+        """Test that a cursor resumes id-ordered search results."""
+        for i in range(5):
+            task_repo.add_task(f"Task {i}")
+        first_page = task_repo.search_tasks("Task", limit=2)
+        second_page = task_repo.search_tasks("Task", limit=2, cursor=encode_cursor(first_page[-1]))
+        assert [t.title for t in second_page] == ["Task 2", "Task 3"]
+
+    def test_search_ranked(self, task_repo):
+        """Test ranked search returns hits with highlight offsets."""
+        task_repo.add_task("Write report", description="the quarterly report")
+        task_repo.add_task("Unrelated")
+
+        hits = task_repo.search_ranked("report")
+
+        assert len(hits) == 1
+        hit = hits[0]
+        assert hit.task.title == "Write report"
+        assert hit.score > 0
+        assert [hit.task.title[s:e] for s, e in hit.title_highlights] == ["report"]
+        assert hit.snippet == "the quarterly report"
+        assert [hit.snippet[s:e] for s, e in hit.snippet_highlights] == ["report"]
+
+    def test_search_ranked_empty_keyword(self, task_repo):
+        """Test ranked search with a blank keyword returns nothing."""
+        assert task_repo.search_ranked("  ") == []
+
+    def test_search_ranked_invalid_limit(self, task_repo):
+        """Test that a non-positive limit raises a domain error."""
+        with pytest.raises(RazTodoException):
+            task_repo.search_ranked("report", limit=0)
+
     def test_context_manager(self, in_memory_db):
         """Test repository as context manager."""
         with SQLiteTaskRepository(connection_factory=in_memory_db) as repo:
@@ -290,3 +633,55 @@ class TestSQLiteTaskRepository:
         # Verify search returns nothing
         search_results = task_repo.search_tasks("Task")
         assert len(search_results) == 0
+
+    def test_get_changes_without_position(self, task_repo):
+        """Test that no position returns only the latest one."""
+        task_repo.add_task("Task 1")
+
+        feed = task_repo.get_changes()
+
+        assert feed.changes == []
+        assert feed.last_seq == 1
+        assert feed.reset is False
+
+    def test_get_changes_after_position(self, task_repo):
+        """Test that inserts, updates and deletes are listed in order."""
+        start = task_repo.get_changes().last_seq
+        task_id = task_repo.add_task("Task 1")
+        task_repo.mark_done(task_id)
+        task_repo.remove_task(task_id)
+
+        feed = task_repo.get_changes(start)
+
+        assert [(c.task_id, c.op) for c in feed.changes] == [
+            (task_id, "insert"),
+            (task_id, "update"),
+            (task_id, "delete"),
+        ]
+        assert feed.last_seq == feed.changes[-1].seq
+        assert task_repo.get_changes(feed.last_seq).changes == []
+
+    def test_get_changes_limit(self, task_repo):
+        """Test that the limit pages through the changelog."""
+        for i in range(3):
+            task_repo.add_task(f"Task {i}")
+
+        first = task_repo.get_changes(0, limit=2)
+        rest = task_repo.get_changes(first.last_seq, limit=2)
+
+        assert [c.seq for c in first.changes] == [1, 2]
+        assert [c.seq for c in rest.changes] == [3]
+
+    def test_get_changes_resets_after_pruning(self, task_repo):
+        """Test that a position older than the kept changelog asks for a reload."""
+        task_repo.upsert_many({"title": f"Task {i}"} for i in range(11_000))
+
+        feed = task_repo.get_changes(5)
+
+        assert feed.reset is True
+        assert feed.changes == []
+        assert feed.last_seq == 11_000
+
+    def test_get_changes_resets_when_ahead(self, task_repo):
+        """Test that a position from another database asks for a reload."""
+        assert task_repo.get_changes(50).reset is True
@@ -2,7 +2,31 @@ import sqlite3
 from contextlib import closing
 from unittest.mock import MagicMock, patch
 
-from raztodo.infrastructure.sqlite.task_schema import ensure_schema
+from raztodo.infrastructure.sqlite.task_schema import (
+    CHANGELOG_PRUNE_EVERY,
+    CHANGELOG_RETAIN,
+    advance_change_counter,
+    ensure_schema,
+    fts_drift,
+    read_change_counter,
+    read_changelog_seq,
+    reset_changelog,
+)
+
+
+def mock_conn_failing_on(fragment: str) -> MagicMock:
+    """Return a mock connection whose execute fails for SQL containing fragment."""
+    conn = MagicMock()
+    conn.__enter__.return_value = conn
+    conn.__exit__.return_value = None
+
+    def execute(sql, *args):
+        if fragment in sql:
+            raise sqlite3.Error(f"{fragment} error")
+        return MagicMock()
+
+    conn.execute.side_effect = execute
+    return conn
 
 
 class TestSchema:
@@ -61,6 +85,20 @@ class TestSchema:
             assert any("idx_tasks_priority" in idx for idx in indexes)
             assert any("idx_tasks_done" in idx for idx in indexes)
 
+    def test_ensure_schema_sorted_listing_uses_index(self, in_memory_db):
+        """Test that sorted listings are served by an index, not a temp sort."""
+        with closing(in_memory_db()) as conn:
+            ensure_schema(conn)
+
+            for order in (
+                "CASE priority WHEN 'H' THEN 3 WHEN 'M' THEN 2 WHEN 'L' THEN 1 ELSE 0 END DESC, id DESC",
+                "title COLLATE NOCASE, id",
+                "created_at, id",
+            ):
+                plan = conn.execute(f"EXPLAIN QUERY PLAN SELECT * FROM tasks ORDER BY {order}")
+                details = " ".join(row[3] for row in plan.fetchall())
+                assert "TEMP B-TREE" not in details, order
+
     def test_ensure_schema_migration_adds_columns(self, in_memory_db):
         """Test that ensure_schema creates table with all required columns."""
         with closing(in_memory_db()) as conn:
@@ -91,6 +129,20 @@ class TestSchema:
             assert row[0] is not None
             assert row[0] != ""
 
+    def test_ensure_schema_stores_empty_due_dates_as_null(self, in_memory_db):
+        """Test that due dates stored as '' by older versions become NULL."""
+        with closing(in_memory_db()) as conn:
+            ensure_schema(conn)
+            conn.execute(
+                "INSERT INTO tasks (title, due_date) VALUES ('A', ''), ('B', '2025-01-01')"
+            )
+            conn.commit()
+
+            ensure_schema(conn)
+
+            rows = conn.execute("SELECT title, due_date FROM tasks ORDER BY id").fetchall()
+            assert [tuple(r) for r in rows] == [("A", None), ("B", "2025-01-01")]
+
     def test_ensure_schema_creates_triggers(self, in_memory_db):
         """Test that ensure_schema creates triggers."""
         with closing(in_memory_db()) as conn:
@@ -104,6 +156,144 @@ class TestSchema:
             assert any("desc_len_update" in t for t in triggers)
             assert any("created_at_insert" in t for t in triggers)
 
+    def test_ensure_schema_fts_triggers_sync_index(self, in_memory_db):
+        """Test that inserts, updates and deletes are mirrored into tasks_fts."""
+        with closing(in_memory_db()) as conn:
+            ensure_schema(conn)
+
+            def matches(term):
+                sql = "SELECT rowid FROM tasks_fts WHERE tasks_fts MATCH ?"
+                return [row[0] for row in conn.execute(sql, (term,))]
+
+            conn.execute("INSERT INTO tasks (title, description) VALUES ('Alpha', 'first')")
+            assert matches("alpha") == [1]
+
+            conn.execute("UPDATE tasks SET title = 'Beta' WHERE id = 1")
+            assert matches("alpha") == []
+            assert matches("beta") == [1]
+
+            conn.execute("DELETE FROM tasks WHERE id = 1")
+            assert matches("beta") == []
+            assert fts_drift(conn) == 0
+
+    def test_change_counter_advances_on_every_change(self, in_memory_db):
+        """Test that inserts, updates and deletes each bump the change counter."""
+        with closing(in_memory_db()) as conn:
+            ensure_schema(conn)
+            start = read_change_counter(conn)
+            assert start > 0
+
+            conn.execute("INSERT INTO tasks (title) VALUES ('Alpha')")
+            conn.execute("UPDATE tasks SET done = 1 WHERE id = 1")
+            conn.execute("DELETE FROM tasks WHERE id = 1")
+            assert read_change_counter(conn) == start + 3
+
+            ensure_schema(conn)
+            assert read_change_counter(conn) == start + 3
+
+    def test_change_counter_missing_table(self, in_memory_db):
+        """Test that a database without the meta table reads as 0."""
+        with closing(in_memory_db()) as conn:
+            assert read_change_counter(conn) == 0
+
+    def test_advance_change_counter(self, in_memory_db):
+        """Test that the counter moves past the given floor, and never back."""
+        with closing(in_memory_db()) as conn:
+            ensure_schema(conn)
+            start = read_change_counter(conn)
+
+            advance_change_counter(conn, start + 10)
+            assert read_change_counter(conn) == start + 11
+
+            advance_change_counter(conn, 0)
+            assert read_change_counter(conn) == start + 12
+
+    def test_changelog_records_changes(self, in_memory_db):
+        """Test that every change to tasks is appended to the changelog."""
+        with closing(in_memory_db()) as conn:
+            ensure_schema(conn)
+
+            conn.execute("INSERT INTO tasks (title) VALUES ('Alpha')")
+            conn.execute("UPDATE tasks SET done = 1 WHERE id = 1")
+            conn.execute("DELETE FROM tasks WHERE id = 1")
+
+            rows = conn.execute("SELECT seq, task_id, op FROM tasks_changelog").fetchall()
+            assert [tuple(r) for r in rows] == [
+                (1, 1, "insert"),
+                (2, 1, "update"),
+                (3, 1, "delete"),
+            ]
+            assert read_changelog_seq(conn) == 3
+
+    def test_changelog_is_pruned(self, in_memory_db):
+        """Test that only the most recent entries are kept."""
+        with closing(in_memory_db()) as conn:
+            ensure_schema(conn)
+            conn.executemany(
+                "INSERT INTO tasks (title) VALUES (?)",
+                ((f"Task {i}",) for i in range(CHANGELOG_RETAIN + 2 * CHANGELOG_PRUNE_EVERY)),
+            )
+
+            count, oldest = conn.execute(
+                "SELECT COUNT(*), MIN(seq) FROM tasks_changelog"
+            ).fetchone()
+            assert count == CHANGELOG_RETAIN
+            assert oldest == 2 * CHANGELOG_PRUNE_EVERY + 1
+
+    def test_reset_changelog(self, in_memory_db):
+        """Test that resetting empties the changelog and moves past the floor."""
+        with closing(in_memory_db()) as conn:
+            ensure_schema(conn)
+            conn.execute("INSERT INTO tasks (title) VALUES ('Alpha')")
+
+            reset_changelog(conn, 10)
+
+            assert conn.execute("SELECT COUNT(*) FROM tasks_changelog").fetchone()[0] == 0
+            assert read_changelog_seq(conn) == 11
+            conn.execute("INSERT INTO tasks (title) VALUES ('Beta')")
+            assert read_changelog_seq(conn) == 12
+
+    def test_ensure_schema_indexes_existing_rows_for_fts(self, in_memory_db):
+        """Test that rows written before the sync triggers existed get indexed."""
+        with closing(in_memory_db()) as conn:
+            ensure_schema(conn)
+            for name in ("insert", "update", "delete"):
+                conn.execute(f"DROP TRIGGER trg_tasks_fts_{name}")
+            conn.execute("INSERT INTO tasks (title) VALUES ('Legacy task')")
+            conn.execute("INSERT INTO tasks_fts(tasks_fts) VALUES ('delete-all')")
+            conn.commit()
+            assert fts_drift(conn) == 1
+
+            ensure_schema(conn)
+
+            assert fts_drift(conn) == 0
+
+    def test_ensure_schema_skips_fts_drift_check(self, in_memory_db):
+        """Test that startup never counts the tasks and FTS tables once triggers exist."""
+        with closing(in_memory_db()) as conn:
+            ensure_schema(conn)
+
+            with patch("raztodo.infrastructure.sqlite.task_schema.fts_drift") as drift:
+                ensure_schema(conn)
+                drift.assert_not_called()
+
+    def test_ensure_schema_backfills_task_tags(self, in_memory_db):
+        """Test that task_tags is seeded from existing tags when first created."""
+        with closing(in_memory_db()) as conn:
+            conn.execute(
+                "CREATE TABLE tasks (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "title TEXT NOT NULL, description TEXT, done INTEGER NOT NULL DEFAULT 0, "
+                "created_at TEXT, priority TEXT, due_date TEXT, tags TEXT, project TEXT)"
+            )
+            conn.execute("""INSERT INTO tasks (title, tags) VALUES ('a', '["work", "home"]')""")
+            conn.execute("INSERT INTO tasks (title, tags) VALUES ('b', '')")
+            conn.commit()
+
+            ensure_schema(conn)
+
+            rows = conn.execute("SELECT task_id, tag FROM task_tags ORDER BY tag").fetchall()
+            assert [tuple(r) for r in rows] == [(1, "home"), (1, "work")]
+
     def test_ensure_schema_creates_unique_index(self, in_memory_db):
         """Test that ensure_schema creates unique index on title."""
         with closing(in_memory_db()) as conn:
@@ -116,24 +306,7 @@ class TestSchema:
 
     def test_ensure_schema_unique_index_error_logged(self):
         """Unique index creation failure should be logged but not raised."""
-        conn = MagicMock()
-        conn.__enter__.return_value = conn
-        conn.__exit__.return_value = None
-
-        conn.execute.side_effect = [
-            None,  # CREATE TABLE
-            sqlite3.Error("index error"),  # UNIQUE INDEX
-            None,
-            None,
-            None,
-            None,
-            None,
-            None,  # INDEXES
-            None,
-            None,
-            None,  # TRIGGERS
-            None,  # FTS
-        ]
+        conn = mock_conn_failing_on("idx_tasks_title_unique")
 
         with patch("raztodo.infrastructure.sqlite.task_schema.logger.warning") as warning:
             ensure_schema(conn)
@@ -141,26 +314,7 @@ class TestSchema:
 
     def test_ensure_schema_index_error_logged(self):
         """Index creation failure should be logged."""
-        conn = MagicMock()
-        conn.__enter__.return_value = conn
-        conn.__exit__.return_value = None
-
-        side_effects = [
-            None,
-            None,  # TABLE + UNIQUE INDEX
-            sqlite3.Error("index"),  # first additional index
-            None,
-            None,
-            None,
-            None,
-            None,
-            None,
-            None,
-            None,
-            None,
-        ]
-
-        conn.execute.side_effect = side_effects
+        conn = mock_conn_failing_on("idx_tasks_priority ")
 
         with patch("raztodo.infrastructure.sqlite.task_schema.logger.warning") as warning:
             ensure_schema(conn)
@@ -168,26 +322,7 @@ class TestSchema:
 
     def test_ensure_schema_trigger_error_logged(self):
         """Trigger creation failure should be logged."""
-        conn = MagicMock()
-        conn.__enter__.return_value = conn
-        conn.__exit__.return_value = None
-
-        side_effects = [
-            None,
-            None,
-            None,
-            None,
-            None,
-            None,
-            None,
-            None,
-            sqlite3.Error("trigger"),  # first trigger
-            None,
-            None,
-            None,
-        ]
-
-        conn.execute.side_effect = side_effects
+        conn = mock_conn_failing_on("trg_tasks_desc_len_insert")
 
         with patch("raztodo.infrastructure.sqlite.task_schema.logger.warning") as warning:
             ensure_schema(conn)
@@ -195,13 +330,7 @@ class TestSchema:
 
     def test_ensure_schema_fts_error_logged(self):
         """FTS table creation failure should be logged."""
-        conn = MagicMock()
-        conn.__enter__.return_value = conn
-        conn.__exit__.return_value = None
-
-        side_effects = [None] * 11 + [sqlite3.Error("fts")]
-
-        conn.execute.side_effect = side_effects
+        conn = mock_conn_failing_on("USING fts5")
 
         with patch("raztodo.infrastructure.sqlite.task_schema.logger.warning") as warning:
             ensure_schema(conn)
@@ -0,0 +1,216 @@
+from unittest.mock import patch
+
+import pytest
+
+from raztodo.infrastructure.cached_task_repository import CachedTaskRepository, TaskCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock):
+    return TaskCache(max_size=4, ttl=10, clock=clock)
+
+
+@pytest.fixture
+def cached_repo(task_repo, cache):
+    return CachedTaskRepository(task_repo, cache)
+
+
+class TestTaskCache:
+    """Test cases for TaskCache."""
+
+    def test_second_load_is_a_hit(self, cache):
+        loads = []
+
+        for _ in range(2):
+            value = cache.get_or_load(("task", 1), lambda: loads.append(1) or "task")
+
+        assert value == "task"
+        assert len(loads) == 1
+        assert cache.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+    def test_none_is_not_cached(self, cache):
+        cache.get_or_load(("task", 1), lambda: None)
+
+        assert len(cache) == 0
+
+    def test_entries_expire_after_ttl(self, cache, clock):
+        cache.get_or_load(("task", 1), lambda: "old")
+        clock.now = 10
+
+        assert cache.get_or_load(("task", 1), lambda: "new") == "new"
+
+    def test_least_recently_used_entry_is_evicted(self, cache):
+        for i in range(4):
+            cache.get_or_load(("task", i), lambda i=i: i)
+        cache.get_or_load(("task", 0), lambda: "reloaded")
+        cache.get_or_load(("task", 4), lambda: 4)
+
+        assert len(cache) == 4
+        assert cache.get_or_load(("task", 0), lambda: "reloaded") == 0
+        assert cache.get_or_load(("task", 1), lambda: "reloaded") == "reloaded"
+
+    def test_invalidate_drops_listings_and_given_tasks(self, cache):
+        cache.get_or_load(("task", 1), lambda: "one")
+        cache.get_or_load(("task", 2), lambda: "two")
+        cache.get_or_load(("list", None), lambda: ["one", "two"])
+
+        cache.invalidate([1])
+
+        assert cache.get_or_load(("task", 2), lambda: "reloaded") == "two"
+        assert cache.get_or_load(("task", 1), lambda: "reloaded") == "reloaded"
+        assert cache.get_or_load(("list", None), lambda: []) == []
+
+    def test_load_racing_an_invalidation_is_not_stored(self, cache):
+        def load():
+            cache.invalidate([1])
+            return "stale"
+
+        assert cache.get_or_load(("task", 1), load) == "stale"
+        assert len(cache) == 0
+
+    def test_sync_clears_when_counter_moves(self, cache):
+        cache.sync(1)
+        cache.get_or_load(("task", 1), lambda: "one")
+
+        cache.sync(1)
+        assert len(cache) == 1
+
+        cache.sync(2)
+        assert len(cache) == 0
+
+    def test_invalid_size(self):
+        with pytest.raises(ValueError):
+            TaskCache(max_size=0)
+
+
+class TestCachedTaskRepository:
+    """Test cases for CachedTaskRepository."""
+
+    def test_repeated_reads_skip_the_database(self, cached_repo, task_repo):
+        task_id = cached_repo.add_task("Cached")
+        cached_repo.get_task(task_id)
+        cached_repo.get_tasks(done=False)
+
+        with (
+            patch.object(task_repo, "get_task") as get_task,
+            patch.object(task_repo, "get_tasks") as get_tasks,
+        ):
+            task = cached_repo.get_task(task_id)
+            tasks = cached_repo.get_tasks(done=False)
+
+        get_task.assert_not_called()
+        get_tasks.assert_not_called()
+        assert task.title == "Cached"
+        assert [t.id for t in tasks] == [task_id]
+
+    def test_batches_are_cached_and_invalidated(self, cached_repo, task_repo):
+        task_id = cached_repo.add_task("Before")
+        cached_repo.get_task_batch()
+
+        with patch.object(task_repo, "get_task_batch") as get_task_batch:
+            assert cached_repo.get_task_batch().titles == ["Before"]
+        get_task_batch.assert_not_called()
+
+        cached_repo.update_task(task_id, title="After")
+        assert cached_repo.get_task_batch().titles == ["After"]
+
+    def test_iterators_are_not_cached(self, cached_repo):
+        task_id = cached_repo.add_task("Python")
+        assert [t.id for t in cached_repo.iter_tasks()] == [task_id]
+
+        cached_repo.add_task("Python again")
+
+        assert len(list(cached_repo.iter_tasks())) == 2
+        assert len(list(cached_repo.iter_search("python"))) == 2
+
+    def test_listing_is_a_copy(self, cached_repo):
+        cached_repo.add_task("One")
+        cached_repo.get_tasks().clear()
+
+        assert len(cached_repo.get_tasks()) == 1
+
+    def test_update_invalidates_task_and_listings(self, cached_repo):
+        task_id = cached_repo.add_task("Before")
+        cached_repo.get_task(task_id)
+        cached_repo.get_tasks()
+
+        cached_repo.update_task(task_id, title="After")
+
+        assert cached_repo.get_task(task_id).title == "After"
+        assert cached_repo.get_tasks()[0].title == "After"
+
+    def test_add_invalidates_listings(self, cached_repo):
+        cached_repo.add_task("One")
+        cached_repo.get_tasks()
+
+        cached_repo.add_task_returning("Two")
+
+        assert [t.title for t in cached_repo.get_tasks()] == ["One", "Two"]
+
+    def test_mark_done_and_remove_invalidate(self, cached_repo):
+        task_id = cached_repo.add_task("Task")
+        cached_repo.get_task(task_id)
+
+        cached_repo.mark_done(task_id)
+        assert cached_repo.get_task(task_id).done is True
+
+        cached_repo.toggle_done(task_id)
+        assert cached_repo.get_task(task_id).done is False
+
+        cached_repo.mark_done_many([task_id])
+        assert cached_repo.get_task(task_id).done is True
+
+        cached_repo.remove_task(task_id)
+        assert cached_repo.get_task(task_id) is None
+
+    def test_clear_all_empties_cache(self, cached_repo, cache):
+        task_id = cached_repo.add_task("Task")
+        cached_repo.get_task(task_id)
+
+        cached_repo.clear_all_tasks()
+
+        assert len(cache) == 0
+        assert cached_repo.get_tasks() == []
+
+    def test_failed_write_still_invalidates(self, cached_repo, task_repo, cache):
+        task_id = cached_repo.add_task("Task")
+        cached_repo.get_task(task_id)
+
+        with (
+            patch.object(task_repo, "update_task", side_effect=RuntimeError("boom")),
+            pytest.raises(RuntimeError),
+        ):
+            cached_repo.update_task(task_id, title="New")
+
+        assert len(cache) == 0
+
+    def test_change_counter_notices_external_writes(self, cached_repo, task_repo):
+        task_id = cached_repo.add_task("Before")
+        cached_repo.change_counter()
+        cached_repo.get_task(task_id)
+
+        # Written behind the cache, as another process would
+        task_repo.update_task(task_id, title="After")
+
+        assert cached_repo.get_task(task_id).title == "Before"
+        cached_repo.change_counter()
+        assert cached_repo.get_task(task_id).title == "After"
+
+    def test_searches_are_not_cached(self, cached_repo, cache):
+        cached_repo.add_task("Searchable")
+
+        assert len(cached_repo.search_tasks("Searchable")) == 1
+        assert len(cache) == 0
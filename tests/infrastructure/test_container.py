@@ -69,3 +69,37 @@ class TestAppContainer:
         assert new_repo is not repo
 
         container.close_singleton()
+
+    def test_container_connection_pool(self, tmp_path):
+        container = AppContainer(db_name=str(tmp_path / "pool.db"))
+
+        pool = container.connection_pool()
+        assert container.connection_pool() is pool
+
+        # The schema exists before the first read-only lease
+        with pool.reader() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0] == 0
+
+        container.close_pool()
+        assert container.connection_pool() is not pool
+
+        container.close_pool()
+
+    def test_container_db_executor(self, tmp_path):
+        container = AppContainer(db_name=str(tmp_path / "exec.db"))
+
+        executor = container.db_executor()
+        assert container.db_executor() is executor
+
+        container.close_pool()
+        assert container.db_executor() is not executor
+
+        container.close_pool()
+
+    def test_container_cache_disabled(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("RAZTODO_CACHE_SIZE", "0")
+        container = AppContainer(db_name=str(tmp_path / "nocache.db"))
+
+        assert container.db_executor().cache is None
+
+        container.close_pool()
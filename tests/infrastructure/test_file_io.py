@@ -0,0 +1,34 @@
+import gzip
+
+import pytest
+
+from raztodo.domain.exceptions import RazTodoException
+from raztodo.infrastructure.file_io import open_task_file
+
+
+class TestOpenTaskFile:
+    """Test cases for opening plain and compressed task files."""
+
+    def test_gzip_by_extension(self, tmp_path):
+        """Test that .gz files are written and read compressed."""
+        path = tmp_path / "tasks.csv.gz"
+        with open_task_file(path, "w", "csv") as f:
+            f.write("title\r\nA\r\n")
+        assert gzip.decompress(path.read_bytes()) == b"title\r\nA\r\n"
+        with open_task_file(path, "r", "csv") as f:
+            assert f.read() == "title\r\nA\r\n"
+
+    def test_zstd_without_module(self, tmp_path, monkeypatch):
+        """Test that .zst files need a Zstandard module."""
+        import builtins
+
+        real_import = builtins.__import__
+
+        def fake_import(name, *args, **kwargs):
+            if name in ("compression", "zstandard"):
+                raise ImportError(name)
+            return real_import(name, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, "__import__", fake_import)
+        with pytest.raises(RazTodoException, match="zstandard"):
+            open_task_file(tmp_path / "tasks.json.zst", "w")
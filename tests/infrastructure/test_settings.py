@@ -2,7 +2,10 @@ import sys
 import tempfile
 from pathlib import Path
 
+from raztodo.infrastructure.cached_task_repository import DEFAULT_CACHE_TTL
 from raztodo.infrastructure.settings import Settings
+from raztodo.infrastructure.sqlite.connection import CONNECTION_PROFILES
+from raztodo.infrastructure.sqlite.pool import DEFAULT_MAX_READERS
 
 
 def test_linux_data_dir(tmp_path, monkeypatch):
@@ -99,3 +102,58 @@ def test_data_dir_is_created(monkeypatch, tmp_path):
 
     assert s.data_dir.exists()
     assert s.data_dir.is_dir()
+
+
+def test_default_connection_profile(monkeypatch):
+    monkeypatch.delenv("RAZTODO_DB_PROFILE", raising=False)
+
+    s = Settings()
+
+    assert s.db_profile == "balanced"
+    assert s.connection_profile() == CONNECTION_PROFILES["balanced"]
+
+
+def test_env_connection_profile_with_overrides(monkeypatch):
+    monkeypatch.setenv("RAZTODO_DB_PROFILE", "Durable")
+    monkeypatch.setenv("RAZTODO_DB_BUSY_TIMEOUT", "250")
+    monkeypatch.setenv("RAZTODO_DB_CACHE_SIZE", "not-a-number")
+
+    profile = Settings().connection_profile()
+
+    assert profile.synchronous == "FULL"
+    assert profile.busy_timeout == 250
+    assert profile.cache_size == CONNECTION_PROFILES["durable"].cache_size
+
+
+def test_unknown_connection_profile_falls_back(monkeypatch):
+    monkeypatch.setenv("RAZTODO_DB_PROFILE", "turbo")
+
+    assert Settings().connection_profile() == CONNECTION_PROFILES["balanced"]
+
+
+def test_pool_size_from_env(monkeypatch):
+    monkeypatch.setenv("RAZTODO_DB_POOL_SIZE", "3")
+
+    assert Settings().db_pool_size == 3
+
+
+def test_invalid_pool_size_uses_default(monkeypatch):
+    monkeypatch.setenv("RAZTODO_DB_POOL_SIZE", "0")
+
+    assert Settings().db_pool_size == DEFAULT_MAX_READERS
+
+
+def test_cache_settings_from_env(monkeypatch):
+    monkeypatch.setenv("RAZTODO_CACHE_SIZE", "0")
+    monkeypatch.setenv("RAZTODO_CACHE_TTL", "30")
+
+    settings = Settings()
+
+    assert settings.cache_size == 0
+    assert settings.cache_ttl == 30
+
+
+def test_invalid_cache_ttl_uses_default(monkeypatch):
+    monkeypatch.setenv("RAZTODO_CACHE_TTL", "0")
+
+    assert Settings().cache_ttl == DEFAULT_CACHE_TTL
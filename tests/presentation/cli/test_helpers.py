@@ -1,10 +1,14 @@
 """Tests for helper functions."""
 
+import io
 import json
 from unittest.mock import MagicMock
 
+from raztodo.domain.search import SearchHit
 from raztodo.domain.task_entity import TaskEntity
 from raztodo.presentation.cli.helpers import (
+    clear_progress,
+    format_search_hits,
     format_task,
     format_tasks_list,
     handle_command_error,
@@ -12,10 +16,18 @@ from raztodo.presentation.cli.helpers import (
     output_json,
     output_success,
     parse_tags,
+    progress_printer,
     task_to_dict,
+    write_blocks,
+    write_json_stream,
 )
 
 
+class _Terminal(io.StringIO):
+    def isatty(self) -> bool:
+        return True
+
+
 class TestParseTags:
     """Test cases for parse_tags function."""
 
@@ -81,6 +93,14 @@ class TestTaskToDict:
         assert result["tags"] == ["tag1"]
         assert result["project"] == "Work"
 
+    def test_task_to_dict_duck_typed_matches_entity(self):
+        """Test that other task-like objects get the same keys, defaults filled in."""
+        duck = MagicMock(spec=["id", "title"])
+        duck.id = 1
+        duck.title = "Test"
+
+        assert task_to_dict(duck) == task_to_dict(TaskEntity(id=1, title="Test"))
+
 
 class TestOutputJson:
     """Test cases for output_json function."""
@@ -94,6 +114,27 @@ class TestOutputJson:
         assert json.loads(captured.out) == data
 
 
+class TestProgress:
+    """Test cases for progress_printer and clear_progress."""
+
+    def test_progress_printer_disabled_without_terminal(self, monkeypatch):
+        """Test that progress is not printed when stderr is not a terminal."""
+        monkeypatch.setattr("sys.stderr", io.StringIO())
+        assert progress_printer("Importing") is None
+
+    def test_progress_printer_rewrites_one_line(self, monkeypatch):
+        """Test that progress updates overwrite a single stderr line."""
+        terminal = _Terminal()
+        monkeypatch.setattr("sys.stderr", terminal)
+        report = progress_printer("Importing")
+        report(1000)
+        report(12000)
+        clear_progress()
+        assert terminal.getvalue() == (
+            "\rImporting: 1,000 item(s)\rImporting: 12,000 item(s)\r\033[K"
+        )
+
+
 class TestOutputSuccess:
     """Test cases for output_success function."""
 
@@ -237,3 +278,113 @@ class TestFormatTasksList:
         assert isinstance(data, list)
         assert len(data) == 2
         assert data[0]["title"] == "Task 1"
+
+    def test_format_tasks_list_json_mode_streams_iterators(self, capsys):
+        """Test that JSON mode consumes an iterator and prints what output_json would."""
+        tasks = [TaskEntity(id=i, title=f"Täsk {i}", tags=["x"]) for i in range(3)]
+        format_tasks_list(iter(tasks), json_mode=True)
+        streamed = capsys.readouterr().out
+
+        output_json([task_to_dict(t) for t in tasks])
+
+        assert streamed == capsys.readouterr().out
+
+    def test_format_tasks_list_matches_format_task(self, capsys):
+        """Test that the buffered listing prints what format_task prints per task."""
+        tasks = [
+            TaskEntity(id=1, title="Task {1}"),
+            TaskEntity(
+                id=2,
+                title="Task 2",
+                description="Desc",
+                done=True,
+                created_at="2025-01-01 10:00:00",
+                priority="H",
+                due_date="2025-02-01",
+                tags=["a", "b"],
+                project="Work",
+            ),
+        ]
+        format_tasks_list(iter(tasks))
+        listed = capsys.readouterr().out
+
+        for task in tasks:
+            format_task(task)
+
+        assert listed == capsys.readouterr().out
+
+    def test_format_tasks_list_compact(self, capsys):
+        """Test that compact mode prints one line per task."""
+        tasks = [
+            TaskEntity(id=1, title="Task 1"),
+            TaskEntity(id=2, title="Task 2", priority="H", tags=["x"], project="Work"),
+        ]
+        format_tasks_list(tasks, compact=True)
+
+        lines = capsys.readouterr().out.splitlines()
+        assert len(lines) == 2
+        assert "#1" in lines[0] and "Task 1" in lines[0]
+        assert "@Work" in lines[1] and "+x" in lines[1]
+
+
+class TestWriteBlocks:
+    """Test cases for write_blocks function."""
+
+    def test_write_blocks_writes_once_per_block(self, monkeypatch):
+        """Test that texts are joined into blocks of at least block_size."""
+        out = MagicMock()
+        monkeypatch.setattr("sys.stdout", out)
+
+        write_blocks(["ab", "cd", "ef", "g"], block_size=4)
+
+        assert [c.args[0] for c in out.write.call_args_list] == ["abcd", "efg"]
+
+
+class TestWriteJsonStream:
+    """Test cases for write_json_stream function."""
+
+    def test_write_json_stream_matches_output_json(self, capsys):
+        """Test that array mode prints exactly what output_json would."""
+        items = [{"id": i, "title": f"Täsk {i}"} for i in range(3)]
+        write_json_stream(iter(items))
+        streamed = capsys.readouterr().out
+
+        output_json(items)
+
+        assert streamed == capsys.readouterr().out
+
+    def test_write_json_stream_ndjson(self, capsys):
+        """Test that NDJSON mode writes one compact object per line."""
+        write_json_stream(iter([{"id": 1}, {"id": 2}]), ndjson=True)
+
+        assert capsys.readouterr().out == '{"id":1}\n{"id":2}\n'
+
+    def test_write_json_stream_empty(self, capsys):
+        """Test that nothing to write is an empty array, or no lines at all."""
+        write_json_stream(iter(()))
+        assert capsys.readouterr().out == "[]\n"
+
+        write_json_stream(iter(()), ndjson=True)
+        assert capsys.readouterr().out == ""
+
+
+class TestFormatNdjson:
+    """Test cases for NDJSON output of task lists and search hits."""
+
+    def test_format_tasks_list_ndjson(self, capsys):
+        """Test that each task is written as one JSON line."""
+        tasks = [TaskEntity(id=1, title="Task 1"), TaskEntity(id=2, title="Task 2", tags=["x"])]
+        format_tasks_list(iter(tasks), ndjson=True)
+
+        lines = capsys.readouterr().out.splitlines()
+        assert [json.loads(line) for line in lines] == [t.to_dict() for t in tasks]
+
+    def test_format_search_hits_ndjson(self, capsys):
+        """Test that each hit is written as one JSON line with its score."""
+        hit = SearchHit(task=TaskEntity(id=1, title="Report"), score=1.5, snippet="")
+        format_search_hits([hit], ndjson=True)
+
+        (line,) = capsys.readouterr().out.splitlines()
+        data = json.loads(line)
+        assert data["id"] == 1
+        assert data["score"] == 1.5
@@ -24,6 +24,8 @@ class TestTaskRouter:
             "import",
             "done",
             "migrate",
+            "backup",
+            "restore",
             "clear",
             "explain",
         ]:
@@ -53,6 +55,8 @@ class TestTaskRouter:
             ("import", "create_import_tasks"),
             ("done", "create_mark_done"),
             ("migrate", "create_migrate"),
+            ("backup", "create_backup"),
+            ("restore", "create_restore"),
             ("clear", "create_clear_tasks"),
             ("explain", "create_explain_task"),
         ],
@@ -73,7 +77,7 @@ class TestTaskRouter:
 
         method = getattr(factory, factory_method)
 
-        if command == "migrate":
+        if command in ("migrate", "backup", "restore"):
             method.assert_called_once_with(router.connection_factory)
         else:
             method.assert_called_once_with(router.storage)
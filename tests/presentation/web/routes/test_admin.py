@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import os
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from raztodo.domain.exceptions import RazTodoException
+from raztodo.presentation.web.app import app
+from raztodo.presentation.web.routes.admin import _remove_file
+
+
+@pytest.fixture
+def client():
+    """TestClient with the backup use case mocked via dependency overrides."""
+    from raztodo.presentation.web import dependencies as deps
+
+    uc = MagicMock()
+    app.dependency_overrides = {deps.get_backup_uc: lambda: uc}
+    yield TestClient(app), uc
+    app.dependency_overrides = {}
+
+
+class TestBackup:
+    def test_remove_file_ignores_missing_path(self, tmp_path):
+        _remove_file(str(tmp_path / "missing.db"))
+
+    def test_downloads_snapshot_and_removes_temp_file(self, client):
+        c, uc = client
+        written: list[str] = []
+
+        def fake_backup(path: str) -> dict[str, object]:
+            with open(path, "wb") as f:
+                f.write(b"SQLite format 3\0")
+            written.append(path)
+            return {"path": path, "pages": 1, "bytes": 16}
+
+        uc.execute.side_effect = fake_backup
+        res = c.get("/api/admin/backup")
+
+        assert res.status_code == 200
+        assert res.content == b"SQLite format 3\0"
+        assert res.headers["content-type"] == "application/vnd.sqlite3"
+        assert "raztodo_backup_" in res.headers["content-disposition"]
+        assert not os.path.exists(written[0])
+
+    def test_backup_failure_returns_500(self, client):
+        c, uc = client
+        uc.execute.side_effect = RazTodoException("disk full")
+
+        res = c.get("/api/admin/backup")
+
+        assert res.status_code == 500
+        assert res.json()["detail"] == "disk full"
+        assert not os.path.exists(uc.execute.call_args.args[0])
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+import raztodo.presentation.web.routes.changes as changes
+from raztodo.domain.exceptions import RazTodoException
+from raztodo.domain.task_change import DEFAULT_CHANGES_LIMIT, ChangeFeed, TaskChange
+from raztodo.presentation.web.app import app
+
+
+def feed(*changes: tuple[int, int, str], last_seq: int = 0, reset: bool = False) -> ChangeFeed:
+    entries = [TaskChange(seq=s, task_id=i, op=op) for s, i, op in changes]
+    return ChangeFeed(
+        changes=entries, last_seq=entries[-1].seq if entries else last_seq, reset=reset
+    )
+
+
+def parse_events(text: str) -> list[dict[str, str]]:
+    events = []
+    for block in text.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines() if ": " in line)
+        events.append(fields)
+    return events
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """TestClient with the changes use case mocked via dependency overrides."""
+    from raztodo.presentation.web import dependencies as deps
+
+    monkeypatch.setattr(changes, "POLL_INTERVAL", 0)
+    uc = AsyncMock()
+    app.dependency_overrides = {deps.get_changes_uc: lambda: uc}
+    yield TestClient(app), uc
+    app.dependency_overrides = {}
+
+
+class TestListChanges:
+    def test_returns_changes(self, client):
+        c, uc = client
+        uc.execute.return_value = feed((4, 1, "insert"), (5, 1, "update"))
+
+        res = c.get("/api/tasks/changes", params={"since": 3})
+
+        assert res.status_code == 200
+        assert res.json() == {
+            "changes": [
+                {"seq": 4, "id": 1, "op": "insert"},
+                {"seq": 5, "id": 1, "op": "update"},
+            ],
+            "last_seq": 5,
+            "reset": False,
+        }
+        uc.execute.assert_called_once_with(3, DEFAULT_CHANGES_LIMIT)
+
+    def test_without_since_returns_position(self, client):
+        c, uc = client
+        uc.execute.return_value = feed(last_seq=9)
+
+        res = c.get("/api/tasks/changes")
+
+        assert res.json() == {"changes": [], "last_seq": 9, "reset": False}
+        uc.execute.assert_called_once_with(None, DEFAULT_CHANGES_LIMIT)
+
+    def test_not_shadowed_by_task_route(self, client):
+        c, uc = client
+        uc.execute.return_value = feed(last_seq=1)
+
+        assert c.get("/api/tasks/changes").status_code == 200
+
+    def test_invalid_limit_returns_422(self, client):
+        c, _ = client
+
+        assert c.get("/api/tasks/changes", params={"limit": 0}).status_code == 422
+
+    def test_domain_error_returns_400(self, client):
+        c, uc = client
+        uc.execute.side_effect = RazTodoException("db error")
+
+        assert c.get("/api/tasks/changes", params={"since": 1}).status_code == 400
+
+
+class TestStreamChanges:
+    def test_streams_reset_then_changes(self, client):
+        c, uc = client
+        uc.execute.side_effect = [
+            feed(last_seq=3),
+            feed(last_seq=3),
+            feed((4, 2, "delete")),
+            RazTodoException("stop"),
+        ]
+
+        res = c.get("/api/tasks/changes/stream")
+
+        assert res.headers["content-type"].startswith("text/event-stream")
+        events = parse_events(res.text)
+        assert [e["event"] for e in events] == ["reset", "changes", "error"]
+        assert events[0]["id"] == "3"
+        assert json.loads(events[0]["data"])["reset"] is True
+        assert events[1]["id"] == "4"
+        assert json.loads(events[1]["data"])["changes"] == [{"seq": 4, "id": 2, "op": "delete"}]
+        assert [call.args for call in uc.execute.call_args_list] == [(None,), (3,), (3,), (4,)]
+
+    def test_resumes_from_last_event_id(self, client):
+        c, uc = client
+        uc.execute.side_effect = [feed((8, 1, "update")), RazTodoException("stop")]
+
+        c.get("/api/tasks/changes/stream", headers={"Last-Event-ID": "7"})
+
+        assert uc.execute.call_args_list[0].args == (7,)
+
+    def test_fallen_behind_client_gets_reset(self, client):
+        c, uc = client
+        uc.execute.side_effect = [feed(last_seq=20_000, reset=True), RazTodoException("stop")]
+
+        res = c.get("/api/tasks/changes/stream", params={"since": 1})
+
+        assert parse_events(res.text)[0]["event"] == "reset"
+
+
+def test_change_events_sends_keepalive_when_idle(monkeypatch):
+    monkeypatch.setattr(changes, "POLL_INTERVAL", 0)
+    monkeypatch.setattr(changes, "KEEPALIVE_INTERVAL", 0)
+    uc = AsyncMock()
+    uc.execute.return_value = feed(last_seq=1)
+
+    async def first_two():
+        events = changes.change_events(uc, 1)
+        try:
+            return [await anext(events), await anext(events)]
+        finally:
+            await events.aclose()
+
+    assert asyncio.run(first_two()) == [": keepalive\n\n", ": keepalive\n\n"]
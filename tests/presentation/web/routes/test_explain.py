@@ -9,6 +9,11 @@ from raztodo.domain.exceptions import RazTodoException
 from raztodo.presentation.web.app import app
 
 
+async def async_iter(items):
+    for item in items:
+        yield item
+
+
 @pytest.fixture
 def client():
     """TestClient with the explain use case mocked via dependency overrides."""
@@ -28,7 +33,7 @@ class TestExplainTask:
     @pytest.mark.parametrize("mode", ["short", "deep", "plan"])
     def test_stream_tokens_for_valid_modes(self, client, mode):
         c, uc = client
-        uc.stream.return_value = [f"token-{mode}-1", f"token-{mode}-2"]
+        uc.stream.return_value = async_iter([f"token-{mode}-1", f"token-{mode}-2"])
 
         response = c.get(f"/api/tasks/1/explain?mode={mode}")
 
@@ -43,7 +48,7 @@ class TestExplainTask:
 
     def test_default_mode_is_short(self, client):
         c, uc = client
-        uc.stream.return_value = ["hello"]
+        uc.stream.return_value = async_iter(["hello"])
 
         response = c.get("/api/tasks/1/explain")
 
@@ -76,7 +81,7 @@ class TestExplainTask:
 
     def test_newline_in_token_is_escaped(self, client):
         c, uc = client
-        uc.stream.return_value = ["line1\nline2"]
+        uc.stream.return_value = async_iter(["line1\nline2"])
 
         response = c.get("/api/tasks/1/explain")
 
@@ -1,14 +1,16 @@
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from fastapi.testclient import TestClient
 
-from raztodo.domain.exceptions import RazTodoException
+from raztodo.domain.exceptions import RazTodoException, TaskNotFoundError
+from raztodo.domain.pagination import encode_cursor
+from raztodo.domain.search import SearchHit
+from raztodo.domain.task_batch import TaskBatch
 from raztodo.domain.task_entity import TaskEntity
 from raztodo.presentation.web.app import app
-from raztodo.presentation.web.routes.tasks import _remove_file
 
 
 def make_task(
@@ -35,6 +37,16 @@ def make_task(
     )
 
 
+async def async_iter(items):
+    for item in items:
+        yield item
+
+
+async def failing_iter(exc):
+    raise exc
+    yield
+
+
 def mock_use_cases(
     list_tasks=None,
     create_task=None,
@@ -44,26 +56,40 @@ def mock_use_cases(
     mark_done=None,
     export_tasks=None,
     import_tasks=None,
+    search_hits=None,
+    get_task=None,
 ):
     """Return a dict of mock use case instances."""
-    list_uc = MagicMock()
+    list_uc = AsyncMock()
     list_uc.execute.return_value = list_tasks or []
-    create_uc = MagicMock()
+    list_uc.execute_batch.return_value = TaskBatch.from_tasks(list_tasks or [])
+    get_uc = AsyncMock()
+    get_uc.execute.return_value = get_task
+    create_uc = AsyncMock()
     create_uc.execute.return_value = create_task or 1
-    update_uc = MagicMock()
+    create_uc.execute_returning.return_value = make_task(create_task or 1)
+    update_uc = AsyncMock()
     update_uc.execute.return_value = True
-    delete_uc = MagicMock()
+    update_uc.execute_returning.return_value = make_task(1)
+    delete_uc = AsyncMock()
     delete_uc.execute.return_value = True
-    clear_uc = MagicMock()
+    clear_uc = AsyncMock()
     clear_uc.execute.return_value = clear_tasks or 0
-    mark_uc = MagicMock()
+    mark_uc = AsyncMock()
     mark_uc.execute.return_value = True
-    export_uc = MagicMock()
+    export_uc = AsyncMock()
+    # stream() is iterated, not awaited
+    export_uc.stream = MagicMock(return_value=async_iter([]))
     export_uc.execute.return_value = True
-    import_uc = MagicMock()
+    import_uc = AsyncMock()
     import_uc.execute.return_value = import_tasks or {"inserted": 0, "updated": 0}
+    search_uc = AsyncMock()
+    search_uc.ranked.return_value = search_hits or []
+    counter_uc = AsyncMock()
+    counter_uc.execute.return_value = 7
     return {
         "list": list_uc,
+        "get": get_uc,
         "create": create_uc,
         "update": update_uc,
         "delete": delete_uc,
@@ -71,6 +97,8 @@ def mock_use_cases(
         "mark": mark_uc,
         "export": export_uc,
         "import": import_uc,
+        "search": search_uc,
+        "counter": counter_uc,
     }
 
 
@@ -80,10 +108,11 @@ def client():
     from raztodo.presentation.web import dependencies as deps
 
     tasks = [make_task(1, "Buy milk"), make_task(2, "Write tests", done=True)]
-    uc = mock_use_cases(list_tasks=tasks)
+    uc = mock_use_cases(list_tasks=tasks, get_task=tasks[0])
 
     app.dependency_overrides = {
         deps.get_list_uc: lambda: uc["list"],
+        deps.get_get_task_uc: lambda: uc["get"],
         deps.get_create_uc: lambda: uc["create"],
         deps.get_update_uc: lambda: uc["update"],
         deps.get_delete_uc: lambda: uc["delete"],
@@ -91,6 +120,8 @@ def client():
         deps.get_mark_done_uc: lambda: uc["mark"],
         deps.get_export_uc: lambda: uc["export"],
         deps.get_import_uc: lambda: uc["import"],
+        deps.get_search_uc: lambda: uc["search"],
+        deps.get_change_counter_uc: lambda: uc["counter"],
     }
     yield TestClient(app), uc
     app.dependency_overrides = {}
@@ -113,29 +144,162 @@ class TestListTasks:
 
     def test_filters_by_q_param(self, client):
         c, uc = client
-        uc["list"].execute.return_value = [
-            make_task(1, "Buy milk"),
-            make_task(2, "Write tests"),
-        ]
+        uc["search"].execute.return_value = [make_task(1, "Buy milk")]
         res = c.get("/api/tasks?q=milk")
         assert res.status_code == 200
         data = res.json()
         assert len(data) == 1
         assert data[0]["title"] == "Buy milk"
+        uc["list"].execute_batch.assert_not_called()
+        assert uc["search"].execute.call_args.args == ("milk",)
+
+    def test_blank_q_lists_all(self, client):
+        c, uc = client
+        res = c.get("/api/tasks?q=%20")
+        assert len(res.json()) == 2
+        uc["search"].execute.assert_not_called()
+
+    def test_passes_limit_and_cursor(self, client):
+        c, uc = client
+        c.get("/api/tasks?limit=5&cursor=abc")
+        kwargs = uc["list"].execute_batch.call_args.kwargs
+        assert kwargs["limit"] == 5
+        assert kwargs["cursor"] == "abc"
+
+    def test_passes_all_filters(self, client):
+        c, uc = client
+        query = (
+            "priority=H&project=work&done=false&tags=a&tags=b&all_tags=true"
+            "&due_before=2025-12-31&due_after=2025-01-01&limit=5&cursor=abc"
+        )
+        expected = {
+            "priority": "H",
+            "project": "work",
+            "done": False,
+            "tags": ["a", "b"],
+            "all_tags": True,
+            "due_before": "2025-12-31",
+            "due_after": "2025-01-01",
+            "limit": 5,
+            "cursor": "abc",
+        }
+        c.get(f"/api/tasks?{query}")
+        uc["list"].execute_batch.assert_called_once_with(**expected)
+        c.get(f"/api/tasks?q=milk&{query}")
+        uc["search"].execute.assert_called_once_with("milk", **expected)
+
+    def test_invalid_priority_returns_422(self, client):
+        c, _ = client
+        assert c.get("/api/tasks?priority=X").status_code == 422
+
+    def test_full_page_sets_next_cursor_header(self, client):
+        c, _ = client
+        res = c.get("/api/tasks?limit=2")
+        assert res.status_code == 200
+        assert res.headers["X-Next-Cursor"] == encode_cursor(make_task(2, "Write tests"))
+
+    def test_partial_page_has_no_next_cursor(self, client):
+        c, _ = client
+        res = c.get("/api/tasks?limit=3")
+        assert "X-Next-Cursor" not in res.headers
+
+    def test_invalid_limit_returns_422(self, client):
+        c, _ = client
+        res = c.get("/api/tasks?limit=0")
+        assert res.status_code == 422
 
     def test_empty_list_returns_empty_array(self, client):
         c, uc = client
-        uc["list"].execute.return_value = []
+        uc["list"].execute_batch.return_value = TaskBatch()
         res = c.get("/api/tasks")
         assert res.status_code == 200
         assert res.json() == []
 
     def test_domain_error_returns_400(self, client):
         c, uc = client
-        uc["list"].execute.side_effect = RazTodoException("db error")
+        uc["list"].execute_batch.side_effect = RazTodoException("db error")
         res = c.get("/api/tasks")
         assert res.status_code == 400
 
+    def test_stream_sends_json_array_as_read(self, client):
+        c, uc = client
+        uc["list"].stream = MagicMock(return_value=async_iter(['[{"id": 1}', ", ", '{"id": 2}]']))
+        res = c.get("/api/tasks?stream=true&done=true&limit=2")
+        assert res.status_code == 200
+        assert res.headers["content-type"] == "application/json"
+        assert res.headers["etag"] == '"7"'
+        assert "X-Next-Cursor" not in res.headers
+        assert res.json() == [{"id": 1}, {"id": 2}]
+        assert uc["list"].stream.call_args.kwargs["done"] is True
+        uc["list"].execute_batch.assert_not_called()
+
+    def test_stream_search(self, client):
+        c, uc = client
+        uc["search"].stream = MagicMock(return_value=async_iter(['[{"id": 1}]']))
+        res = c.get("/api/tasks?stream=true&q=milk")
+        assert res.json() == [{"id": 1}]
+        assert uc["search"].stream.call_args.args == ("milk",)
+
+    def test_stream_domain_error_returns_400(self, client):
+        c, uc = client
+        uc["list"].stream = MagicMock(return_value=failing_iter(RazTodoException("db error")))
+        res = c.get("/api/tasks?stream=true")
+        assert res.status_code == 400
+
+
+# ---------------------------------------------------------------------------
+# GET /api/tasks/search
+# ---------------------------------------------------------------------------
+
+
+class TestSearchTasks:
+    def test_returns_ranked_hits_with_highlights(self, client):
+        c, uc = client
+        uc["search"].ranked.return_value = [
+            SearchHit(
+                task=make_task(3, "Write report", description="quarterly report"),
+                score=1.5,
+                snippet="quarterly report",
+                title_highlights=[(6, 12)],
+                snippet_highlights=[(10, 16)],
+            )
+        ]
+        res = c.get("/api/tasks/search?q=report")
+        assert res.status_code == 200
+        data = res.json()
+        assert data[0]["id"] == 3
+        assert data[0]["score"] == 1.5
+        assert data[0]["snippet"] == "quarterly report"
+        assert data[0]["title_highlights"] == [[6, 12]]
+        assert data[0]["snippet_highlights"] == [[10, 16]]
+
+    def test_passes_limit_weights_and_filters(self, client):
+        c, uc = client
+        c.get(
+            "/api/tasks/search?q=report&limit=3&title_weight=2&description_weight=0.5"
+            "&priority=H&done=false&tags=a&tags=b&all_tags=true"
+        )
+        uc["search"].ranked.assert_called_once_with(
+            "report",
+            limit=3,
+            title_weight=2.0,
+            description_weight=0.5,
+            priority="H",
+            project=None,
+            done=False,
+            tags=["a", "b"],
+            all_tags=True,
+        )
+
+    def test_missing_query_returns_422(self, client):
+        c, _ = client
+        assert c.get("/api/tasks/search").status_code == 422
+
+    def test_domain_error_returns_400(self, client):
+        c, uc = client
+        uc["search"].ranked.side_effect = RazTodoException("boom")
+        assert c.get("/api/tasks/search?q=x").status_code == 400
+
 
 # ---------------------------------------------------------------------------
 # POST /api/tasks
@@ -145,17 +309,16 @@ class TestListTasks:
 class TestCreateTask:
     def test_creates_task_and_returns_201(self, client):
         c, uc = client
-        new_task = make_task(3, "New task")
-        uc["create"].execute.return_value = 3
-        uc["list"].execute.return_value = [new_task]
+        uc["create"].execute_returning.return_value = make_task(3, "New task")
         res = c.post("/api/tasks", json={"title": "New task"})
         assert res.status_code == 201
+        assert res.json()["id"] == 3
         assert res.json()["title"] == "New task"
+        assert not uc["list"].method_calls
 
     def test_passes_all_fields_to_use_case(self, client):
         c, uc = client
-        uc["create"].execute.return_value = 5
-        uc["list"].execute.return_value = [make_task(5, "Full task")]
+        uc["create"].execute_returning.return_value = make_task(5, "Full task")
         c.post(
             "/api/tasks",
             json={
@@ -167,7 +330,7 @@ class TestCreateTask:
                 "project": "proj",
             },
         )
-        uc["create"].execute.assert_called_once_with(
+        uc["create"].execute_returning.assert_called_once_with(
             title="Full task",
             description="desc",
             priority="H",
@@ -193,16 +356,83 @@ class TestCreateTask:
 
     def test_domain_error_returns_400(self, client):
         c, uc = client
-        uc["create"].execute.side_effect = RazTodoException("duplicate title")
+        uc["create"].execute_returning.side_effect = RazTodoException("duplicate title")
         res = c.post("/api/tasks", json={"title": "Dup"})
         assert res.status_code == 400
 
-    def test_returns_500_when_created_task_cannot_be_loaded(self, client):
+
+# ---------------------------------------------------------------------------
+# GET /api/tasks/{id}
+# ---------------------------------------------------------------------------
+
+
+class TestGetTask:
+    def test_returns_task(self, client):
+        c, uc = client
+        uc["get"].execute.return_value = make_task(2, "Write tests", done=True)
+        res = c.get("/api/tasks/2")
+        assert res.status_code == 200
+        assert res.json()["title"] == "Write tests"
+        uc["get"].execute.assert_called_once_with(2)
+        assert not uc["list"].method_calls
+
+    def test_not_found_returns_404(self, client):
+        c, uc = client
+        uc["get"].execute.return_value = None
+        res = c.get("/api/tasks/99")
+        assert res.status_code == 404
+
+    def test_domain_error_returns_400(self, client):
+        c, uc = client
+        uc["get"].execute.side_effect = RazTodoException("db error")
+        res = c.get("/api/tasks/1")
+        assert res.status_code == 400
+
+    def test_etag_header(self, client):
+        c, _ = client
+        res = c.get("/api/tasks/1")
+        assert res.headers["etag"] == '"7"'
+
+    def test_matching_etag_returns_304_without_reading(self, client):
         c, uc = client
-        uc["create"].execute.return_value = 99
-        uc["list"].execute.return_value = []
-        res = c.post("/api/tasks", json={"title": "Missing after create"})
-        assert res.status_code == 500
+        res = c.get("/api/tasks/1", headers={"If-None-Match": '"7"'})
+        assert res.status_code == 304
+        uc["get"].execute.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# Conditional GET /api/tasks
+# ---------------------------------------------------------------------------
+
+
+class TestConditionalList:
+    def test_response_carries_etag(self, client):
+        c, _ = client
+        res = c.get("/api/tasks")
+        assert res.headers["etag"] == '"7"'
+        assert res.headers["cache-control"] == "no-cache"
+
+    def test_matching_etag_returns_304_without_reading(self, client):
+        c, uc = client
+        res = c.get("/api/tasks", headers={"If-None-Match": '"7"'})
+        assert res.status_code == 304
+        assert res.content == b""
+        assert res.headers["etag"] == '"7"'
+        uc["list"].execute_batch.assert_not_called()
+
+    @pytest.mark.parametrize("header", ['"3", W/"7"', "*"])
+    def test_weak_and_listed_etags_match(self, client, header):
+        c, _ = client
+        res = c.get("/api/tasks", headers={"If-None-Match": header})
+        assert res.status_code == 304
+
+    def test_changed_counter_returns_200(self, client):
+        c, uc = client
+        uc["counter"].execute.return_value = 8
+        res = c.get("/api/tasks", headers={"If-None-Match": '"7"'})
+        assert res.status_code == 200
+        assert res.headers["etag"] == '"8"'
+        assert len(res.json()) == 2
 
 
 # ---------------------------------------------------------------------------
@@ -213,24 +443,18 @@ class TestCreateTask:
 class TestUpdateTask:
     def test_updates_task(self, client):
         c, uc = client
-        updated = make_task(1, "Updated title")
-        uc["list"].execute.return_value = [updated]
+        uc["update"].execute_returning.return_value = make_task(1, "Updated title")
         res = c.put("/api/tasks/1", json={"title": "Updated title"})
         assert res.status_code == 200
         assert res.json()["title"] == "Updated title"
+        assert not uc["list"].method_calls
 
     def test_domain_error_returns_400(self, client):
         c, uc = client
-        uc["update"].execute.side_effect = RazTodoException("not found")
+        uc["update"].execute_returning.side_effect = RazTodoException("not found")
         res = c.put("/api/tasks/99", json={"title": "X"})
         assert res.status_code == 400
 
-    def test_returns_404_when_updated_task_cannot_be_loaded(self, client):
-        c, uc = client
-        uc["list"].execute.return_value = []
-        res = c.put("/api/tasks/99", json={"title": "X"})
-        assert res.status_code == 404
-
 
 # ---------------------------------------------------------------------------
 # DELETE /api/tasks/{id}
@@ -282,41 +506,25 @@ class TestClearTasks:
 
 
 class TestToggleDone:
-    def test_toggles_pending_to_done(self, client):
+    def test_returns_toggled_task(self, client):
         c, uc = client
-        pending = make_task(1, "Buy milk", done=False)
-        completed = make_task(1, "Buy milk", done=True)
-        uc["list"].execute.side_effect = [[pending], [completed]]
+        uc["mark"].toggle.return_value = make_task(1, "Buy milk", done=True)
         res = c.patch("/api/tasks/1/done")
         assert res.status_code == 200
         assert res.json()["done"] is True
-        uc["mark"].execute.assert_called_once_with(1, done=True)
-
-    def test_toggles_done_to_pending(self, client):
-        c, uc = client
-        completed = make_task(1, "Buy milk", done=True)
-        pending = make_task(1, "Buy milk", done=False)
-        uc["list"].execute.side_effect = [[completed], [pending]]
-        res = c.patch("/api/tasks/1/done")
-        assert res.status_code == 200
-        uc["mark"].execute.assert_called_once_with(1, done=False)
+        uc["mark"].toggle.assert_called_once_with(1)
+        uc["get"].execute.assert_not_called()
+        assert not uc["list"].method_calls
 
     def test_not_found_returns_404(self, client):
         c, uc = client
-        uc["list"].execute.return_value = []
+        uc["mark"].toggle.side_effect = TaskNotFoundError(99)
         res = c.patch("/api/tasks/99/done")
         assert res.status_code == 404
 
-    def test_returns_404_when_task_disappears_after_marking_done(self, client):
-        c, uc = client
-        uc["list"].execute.side_effect = [[make_task(1, "Buy milk")], []]
-        res = c.patch("/api/tasks/1/done")
-        assert res.status_code == 404
-        uc["mark"].execute.assert_called_once_with(1, done=True)
-
     def test_domain_error_returns_400(self, client):
         c, uc = client
-        uc["mark"].execute.side_effect = RazTodoException("mark failed")
+        uc["mark"].toggle.side_effect = RazTodoException("mark failed")
         res = c.patch("/api/tasks/1/done")
         assert res.status_code == 400
 
@@ -327,28 +535,43 @@ class TestToggleDone:
 
 
 class TestExportTasks:
-    def test_remove_file_ignores_missing_path(self, tmp_path):
-        _remove_file(str(tmp_path / "missing.json"))
-
-    def test_export_returns_json_file(self, client, tmp_path):
+    def test_export_streams_json(self, client):
         c, uc = client
-        export_file = tmp_path / "tasks.json"
-        export_file.write_text('[{"id": 1, "title": "Buy milk"}]')
+        uc["export"].stream.return_value = async_iter(
+            ['[\n  {"id": 1', ', "title": "Buy milk"}', "\n]"]
+        )
+        res = c.get("/api/tasks/export")
+        assert res.status_code == 200
+        assert "application/json" in res.headers["content-type"]
+        assert "raztodo_export.json" in res.headers["content-disposition"]
+        assert res.json() == [{"id": 1, "title": "Buy milk"}]
+        uc["export"].execute.assert_not_called()
 
-        def fake_export(path: str) -> bool:
-            import shutil
+    def test_export_csv(self, client):
+        c, uc = client
+        uc["export"].stream.return_value = async_iter(["id,title\r\n1,Buy milk\r\n"])
+        res = c.get("/api/tasks/export?format=csv")
+        assert res.status_code == 200
+        assert res.headers["content-type"].startswith("text/csv")
+        assert "raztodo_export.csv" in res.headers["content-disposition"]
+        assert res.text == "id,title\r\n1,Buy milk\r\n"
+        uc["export"].stream.assert_called_once_with("csv")
 
-            shutil.copy(str(export_file), path)
-            return True
+    def test_export_unknown_format_returns_422(self, client):
+        c, _ = client
+        res = c.get("/api/tasks/export?format=xml")
+        assert res.status_code == 422
 
-        uc["export"].execute.side_effect = fake_export
+    def test_export_empty_database(self, client):
+        c, uc = client
+        uc["export"].stream.return_value = async_iter(["[]"])
         res = c.get("/api/tasks/export")
         assert res.status_code == 200
-        assert "application/json" in res.headers["content-type"]
+        assert res.json() == []
 
     def test_domain_error_returns_400(self, client):
         c, uc = client
-        uc["export"].execute.side_effect = RazTodoException("export failed")
+        uc["export"].stream.return_value = failing_iter(RazTodoException("export failed"))
         res = c.get("/api/tasks/export")
         assert res.status_code == 400
 
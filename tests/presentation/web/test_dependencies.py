@@ -1,82 +1,154 @@
+import asyncio
 from unittest.mock import MagicMock, Mock
 
 import pytest
+from fastapi.testclient import TestClient
 
 import raztodo.presentation.web.dependencies as deps
 from raztodo.application.factory import DefaultUseCaseFactory
+from raztodo.application.queries.explain_task import AsyncExplainTaskUseCase
+from raztodo.infrastructure.cached_task_repository import CachedTaskRepository
+from raztodo.infrastructure.container import AppContainer
 from raztodo.infrastructure.sqlite.task_repository import SQLiteTaskRepository
+from raztodo.presentation.web.app import app
 
 
 def test_get_factory_returns_new_instances():
-    f1 = deps.get_factory()
-    f2 = deps.get_factory()
+    f1 = asyncio.run(deps.get_factory())
+    f2 = asyncio.run(deps.get_factory())
 
     assert isinstance(f1, DefaultUseCaseFactory)
     assert isinstance(f2, DefaultUseCaseFactory)
     assert f1 is not f2
 
 
-def test_get_storage_uses_container_singleton(monkeypatch):
-    fake_repo = object()
-
-    fake_container = Mock()
-    fake_container.repo_singleton.return_value = fake_repo
+@pytest.fixture
+def pooled_container(tmp_path, monkeypatch):
+    container = AppContainer(db_name=str(tmp_path / "web.db"))
+    monkeypatch.setattr(deps, "_container", container)
+    yield container
+    container.close_pool()
 
-    monkeypatch.setattr(deps, "_container", fake_container)
 
-    result = deps.get_storage()
+def test_get_executor_uses_container(pooled_container):
+    executor = asyncio.run(deps.get_executor())
 
-    fake_container.repo_singleton.assert_called_once()
-    assert result is fake_repo
+    assert executor is pooled_container.db_executor()
 
 
-@pytest.fixture
-def storage():
-    return object()
+@pytest.mark.parametrize(
+    "dep, method_name, query_only",
+    [
+        (deps.get_list_uc, "create_list_tasks", 1),
+        (deps.get_get_task_uc, "create_get_task", 1),
+        (deps.get_search_uc, "create_search_tasks", 1),
+        (deps.get_change_counter_uc, "create_get_change_counter", 1),
+        (deps.get_changes_uc, "create_list_changes", 1),
+        (deps.get_export_uc, "create_export_tasks", 1),
+        (deps.get_create_uc, "create_create_task", 0),
+        (deps.get_update_uc, "create_update_task", 0),
+        (deps.get_delete_uc, "create_delete_task", 0),
+        (deps.get_clear_uc, "create_clear_tasks", 0),
+        (deps.get_mark_done_uc, "create_mark_done", 0),
+        (deps.get_import_uc, "create_import_tasks", 0),
+    ],
+)
+def test_use_case_leases_reader_or_writer(pooled_container, dep, method_name, query_only):
+    factory = MagicMock()
+    getattr(factory, method_name).side_effect = lambda repo: Mock(
+        execute=lambda: repo._repo._conn.execute("PRAGMA query_only").fetchone()[0]
+    )
 
+    async def run():
+        uc = await dep(pooled_container.db_executor(), factory)
+        return await uc.execute()
 
-@pytest.fixture
-def factory():
-    factory = MagicMock()
+    assert asyncio.run(run()) == query_only
 
-    factory.create_list_tasks.return_value = "list_uc"
-    factory.create_create_task.return_value = "create_uc"
-    factory.create_update_task.return_value = "update_uc"
-    factory.create_delete_task.return_value = "delete_uc"
-    factory.create_clear_tasks.return_value = "clear_uc"
-    factory.create_mark_done.return_value = "mark_done_uc"
-    factory.create_export_tasks.return_value = "export_uc"
-    factory.create_import_tasks.return_value = "import_uc"
 
-    return factory
+def test_use_cases_read_through_shared_cache(pooled_container):
+    repos = []
+    factory = MagicMock()
+    factory.create_get_task.side_effect = lambda repo: (
+        repos.append(repo) or Mock(execute=lambda task_id: repo.get_task(task_id))
+    )
+    factory.create_create_task.side_effect = lambda repo: Mock(
+        execute=lambda title: repo.add_task_returning(title)
+    )
 
+    async def run():
+        executor = pooled_container.db_executor()
+        created = await (await deps.get_create_uc(executor, factory)).execute("cached")
+        get_uc = await deps.get_get_task_uc(executor, factory)
+        await get_uc.execute(created.id)
+        return await get_uc.execute(created.id)
 
-@pytest.mark.parametrize(
-    "dep, method_name, expected",
-    [
-        (deps.get_list_uc, "create_list_tasks", "list_uc"),
-        (deps.get_create_uc, "create_create_task", "create_uc"),
-        (deps.get_update_uc, "create_update_task", "update_uc"),
-        (deps.get_delete_uc, "create_delete_task", "delete_uc"),
-        (deps.get_clear_uc, "create_clear_tasks", "clear_uc"),
-        (deps.get_mark_done_uc, "create_mark_done", "mark_done_uc"),
-        (deps.get_export_uc, "create_export_tasks", "export_uc"),
-        (deps.get_import_uc, "create_import_tasks", "import_uc"),
-    ],
-)
-def test_use_case_dispatch(dep, method_name, expected, storage, factory):
-    result = dep(storage, factory)
+    task = asyncio.run(run())
 
-    getattr(factory, method_name).assert_called_once_with(storage)
-    assert result == expected
+    assert task.title == "cached"
+    assert all(isinstance(repo, CachedTaskRepository) for repo in repos)
+    assert pooled_container.db_executor().cache.stats()["hits"] == 1
 
 
 def test_invalid_factory_method_raises():
-    storage = Mock(spec=SQLiteTaskRepository)
-
     factory = Mock(spec=[])
 
     dep = deps.get_use_case("non_existent_method")
 
     with pytest.raises(AttributeError):
-        dep(storage, factory)
+        asyncio.run(dep(Mock(), factory))
+
+
+def test_explain_use_case_is_async(pooled_container):
+    uc = asyncio.run(deps.get_explain_uc(pooled_container.db_executor(), DefaultUseCaseFactory()))
+
+    assert isinstance(uc, AsyncExplainTaskUseCase)
+
+
+def test_streamed_export_reads_from_leased_connection(pooled_container):
+    with pooled_container.connection_pool().writer() as conn:
+        SQLiteTaskRepository(connection_factory=lambda: conn).upsert_many(
+            {"title": f"Task {i}"} for i in range(3000)
+        )
+
+    with TestClient(app) as client:
+        response = client.get("/api/tasks/export", params={"format": "ndjson"})
+
+    assert response.status_code == 200
+    assert len(response.text.splitlines()) == 3000
+
+
+def test_conditional_list_follows_writes(pooled_container):
+    with TestClient(app) as client:
+        first = client.get("/api/tasks")
+        etag = first.headers["etag"]
+        assert client.get("/api/tasks", headers={"If-None-Match": etag}).status_code == 304
+
+        client.post("/api/tasks", json={"title": "New"})
+        changed = client.get("/api/tasks", headers={"If-None-Match": etag})
+
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert [t["title"] for t in changed.json()] == ["New"]
+
+
+@pytest.fixture
+def factory():
+    return MagicMock()
+
+
+def test_get_connection_factory_uses_container(monkeypatch):
+    fake_container = Mock()
+    monkeypatch.setattr(deps, "_container", fake_container)
+
+    assert deps.get_connection_factory() is fake_container.connection_factory.return_value
+
+
+def test_admin_use_case_receives_connection_factory(factory):
+    connection_factory = object()
+    factory.create_backup.return_value = "backup_uc"
+
+    result = deps.get_backup_uc(connection_factory, factory)
+
+    factory.create_backup.assert_called_once_with(connection_factory)
+    assert result == "backup_uc"